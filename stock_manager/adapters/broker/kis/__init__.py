@@ -1,3 +1,4 @@
+from stock_manager.adapters.broker.kis.async_client import AsyncKISRestClient, BlockingKISClient
 from stock_manager.adapters.broker.kis.broker_adapter import KISBrokerAdapter
 from stock_manager.adapters.broker.kis.client import KISRestClient
 from stock_manager.adapters.broker.kis.websocket_client import (
@@ -10,10 +11,16 @@ from stock_manager.adapters.broker.kis.websocket_client import (
     get_default_execution_notice_tr_id,
     get_kis_websocket_url,
 )
+from stock_manager.adapters.broker.kis.websocket_pool import (
+    KISWebSocketPool,
+    WebSocketSessionHealth,
+)
 
 __version__ = "0.1.0"
 
 __all__ = [
+    "AsyncKISRestClient",
+    "BlockingKISClient",
     "DEFAULT_EXECUTION_TR_ID",
     "DEFAULT_QUOTE_TR_ID",
     "KISBrokerAdapter",
@@ -22,6 +29,8 @@ __all__ = [
     "KISWebSocketLifecycleEvent",
     "KISRestClient",
     "KISWebSocketClient",
+    "KISWebSocketPool",
+    "WebSocketSessionHealth",
     "get_default_execution_notice_tr_id",
     "get_kis_websocket_url",
 ]
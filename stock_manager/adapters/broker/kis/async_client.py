@@ -0,0 +1,359 @@
+"""Asynchronous KIS REST client.
+
+Why:
+- ``KISRestClient`` blocks one thread per in-flight request, so fanning out
+  hundreds of quote or fundamentals calls needs hundreds of threads.
+- ``AsyncKISRestClient`` runs the same auth / re-auth / retry / rate-limit
+  policy (shared via ``_KISClientBase``) on ``httpx.AsyncClient``. It uses a
+  tuned connection pool, and HTTP/2 multiplexing when ``h2`` is installed
+  (``pip install 'stock-manager[http2]'``).
+
+Rate limiting goes through the same process-wide ``KISRateLimiter`` as the
+sync client, so async and sync traffic on one app key share a budget.
+Coroutines queue FIFO on an ``asyncio.Lock``. Only the head ever waits on the
+shared bucket, in a worker thread, so the event loop never blocks.
+
+``BlockingKISClient`` is a sync facade: it runs the async client on a
+private event-loop thread and exposes ``make_request`` / ``authenticate`` /
+``config`` / ``state``, so the existing ``apis/domestic_stock/*`` functions
+work with it unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Literal, TypeVar
+
+import httpx
+
+from stock_manager.adapters.broker.kis.client import _KISClientBase
+from stock_manager.adapters.broker.kis.config import (
+    KISAccessToken,
+    KISConfig,
+    KISConnectionState,
+)
+from stock_manager.adapters.broker.kis.exceptions import KISAPIError, KISRateLimitError
+from stock_manager.adapters.broker.kis.rate_limit import KISRateLimiter, shared_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+def http2_available() -> bool:
+    """True when the optional ``h2`` package (httpx HTTP/2 support) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class AsyncKISRestClient(_KISClientBase):
+    """Async REST client for KIS API with the same semantics as ``KISRestClient``.
+
+    Args:
+        config: KIS configuration instance
+        timeout: Default request timeout in seconds (default: 30.0)
+        limits: Connection-pool limits (default: ``DEFAULT_POOL_LIMITS``)
+        http2: Negotiate HTTP/2. ``None`` enables it when ``h2`` is
+            installed; ``True`` requires it.
+        client: Optional custom httpx.AsyncClient for testing/advanced use
+
+    Use one instance from a single event loop (or through
+    ``BlockingKISClient``, which owns its loop).
+
+    Example:
+        >>> async with AsyncKISRestClient(config) as client:
+        ...     await client.authenticate()
+        ...     quotes = await asyncio.gather(*(
+        ...         client.make_request("GET", path, params=p) for p in params_list
+        ...     ))
+    """
+
+    def __init__(
+        self,
+        config: KISConfig,
+        *,
+        timeout: float = 30.0,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.config = config
+        self.state = KISConnectionState(config=config)
+        self.timeout = timeout
+        # Shared with every other live (sync or async) client on the same app key.
+        self._request_rate_limiter = shared_rate_limiter(config)
+        self._rate_gate = asyncio.Lock()
+        self._auth_lock = asyncio.Lock()
+
+        if http2 is None:
+            http2 = http2_available()
+        elif http2 and not http2_available():
+            raise ImportError(
+                "HTTP/2 requires the 'h2' package. Install with: "
+                "pip install 'stock-manager[http2]'"
+            )
+        self.http2 = http2
+
+        if client is not None:
+            self._http_client = client
+        else:
+            self._http_client = httpx.AsyncClient(
+                base_url=config.api_base_url,
+                timeout=timeout,
+                headers=self._get_default_headers(),
+                limits=limits or DEFAULT_POOL_LIMITS,
+                http2=http2,
+            )
+
+    async def authenticate(self, force_refresh: bool = False) -> KISAccessToken:
+        """Authenticate with KIS API and obtain access token.
+
+        Concurrent callers share one token request.
+
+        Raises:
+            KISAuthenticationError: If authentication fails
+            KISAPIError: If the API request fails
+        """
+        token = self._reusable_token(force_refresh)
+        if token is not None:
+            return token
+
+        async with self._auth_lock:
+            if not force_refresh:
+                token = self._reusable_token(False)
+                if token is not None:
+                    return token
+            return await self._issue_token()
+
+    async def _issue_token(self) -> KISAccessToken:
+        """Request a new token (``_auth_lock`` held)."""
+        url, headers, payload = self._token_request()
+        try:
+            response = await self._http_client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            return self._accept_token_response(response.json())
+        except httpx.HTTPStatusError as e:
+            raise self._authentication_error(e) from e
+        except httpx.RequestError as e:
+            raise KISAPIError(f"Network error during authentication: {e}") from e
+
+    async def make_request(
+        self,
+        method: Literal["GET", "POST", "PUT", "DELETE"],
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        require_auth: bool = True,
+        retry_enabled: bool | None = None,
+    ) -> dict[str, Any]:
+        """Make an API request; see ``KISRestClient.make_request``.
+
+        Raises:
+            KISAuthenticationError: If authentication is required but not available
+            KISAPIError: If the API request fails
+            KISRateLimitError: If rate limit is exceeded
+        """
+        self._validate_request_path(path)
+
+        max_attempts = self._max_attempts(retry_enabled)
+        reauth_attempted = False
+
+        for attempt in range(1, max_attempts + 1):
+            await self._acquire_rate_limit(path, (headers or {}).get("tr_id"))
+            request_headers = self._request_headers(headers, require_auth)
+            sent_token = self.state.access_token
+            can_reauth = self._can_reauth(require_auth, reauth_attempted)
+
+            try:
+                response = await self._http_client.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    json=json_data,
+                    headers=request_headers,
+                )
+                data = self._check_response(response, can_reauth=can_reauth)
+                if data is None:
+                    reauth_attempted = True
+                    await self._force_reauthenticate(sent_token)
+                    continue
+                return data
+
+            except KISRateLimitError:
+                if self._should_retry_status(429, attempt, max_attempts):
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                raise
+            except httpx.HTTPStatusError as e:
+                action = self._handle_status_error(
+                    e, can_reauth=can_reauth, attempt=attempt, max_attempts=max_attempts
+                )
+                if action == "reauth":
+                    reauth_attempted = True
+                    await self._force_reauthenticate(sent_token)
+                    continue
+                await asyncio.sleep(self._retry_delay(attempt))
+                continue
+            except httpx.RequestError as e:
+                if self._should_retry_network(attempt, max_attempts):
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+                raise KISAPIError(f"Network error during API request: {e}") from e
+
+        raise KISAPIError("API request failed after maximum retry attempts")
+
+    async def _acquire_rate_limit(self, path: str, tr_id: str | None) -> None:
+        async with self._rate_gate:
+            limiter = self._request_rate_limiter
+            if not limiter.try_acquire(path, tr_id=tr_id):
+                await asyncio.to_thread(limiter.acquire, path, tr_id=tr_id)
+
+    async def _force_reauthenticate(self, stale: KISAccessToken | None) -> KISAccessToken:
+        """Refresh the token once for a burst of concurrent auth failures."""
+        async with self._auth_lock:
+            current = self.state.access_token
+            if current is not None and current is not stale:
+                return current  # another request already refreshed it
+            self._invalidate_current_auth_state()
+            return await self._issue_token()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and release pooled connections."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> AsyncKISRestClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        await self.aclose()
+
+
+class BlockingKISClient:
+    """Synchronous facade over ``AsyncKISRestClient``.
+
+    Runs the async client on a private daemon event-loop thread. It is
+    duck-type compatible with ``KISRestClient`` for the ``apis`` modules
+    (``make_request``, ``authenticate``, ``config``, ``state``). ``run``
+    lets sync code await a batch of concurrent requests in one call.
+
+    Example:
+        >>> client = BlockingKISClient(AsyncKISRestClient(config))
+        >>> client.authenticate()
+        >>> inquire_current_price(client, fid_input_iscd="005930")
+        >>> async def fetch_all():
+        ...     return await asyncio.gather(*(
+        ...         client.async_client.make_request("GET", path, params=p) for p in batch
+        ...     ))
+        >>> prices = client.run(fetch_all())
+    """
+
+    def __init__(self, async_client: AsyncKISRestClient) -> None:
+        self.async_client = async_client
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="kis-async-client",
+            daemon=True,
+        )
+        self._thread.start()
+        self._closed = False
+
+    @property
+    def config(self) -> KISConfig:
+        return self.async_client.config
+
+    @property
+    def state(self) -> KISConnectionState:
+        return self.async_client.state
+
+    @property
+    def request_rate_limiter(self) -> KISRateLimiter:
+        return self.async_client.request_rate_limiter
+
+    @property
+    def request_rate_limiter_available(self) -> int:
+        return self.async_client.request_rate_limiter_available
+
+    def run(self, awaitable: Awaitable[T], timeout: float | None = None) -> T:
+        """Run *awaitable* on the client's loop and return its result."""
+        if self._closed:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError("BlockingKISClient is closed")
+
+        async def _wrap() -> T:
+            return await awaitable
+
+        future: Future[T] = asyncio.run_coroutine_threadsafe(_wrap(), self._loop)
+        return future.result(timeout)
+
+    def authenticate(self, force_refresh: bool = False) -> KISAccessToken:
+        return self.run(self.async_client.authenticate(force_refresh=force_refresh))
+
+    def make_request(
+        self,
+        method: Literal["GET", "POST", "PUT", "DELETE"],
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        require_auth: bool = True,
+        retry_enabled: bool | None = None,
+    ) -> dict[str, Any]:
+        return self.run(
+            self.async_client.make_request(
+                method,
+                path,
+                params=params,
+                json_data=json_data,
+                headers=headers,
+                require_auth=require_auth,
+                retry_enabled=retry_enabled,
+            )
+        )
+
+    def is_authenticated(self) -> bool:
+        return self.async_client.is_authenticated()
+
+    def get_access_token(self) -> KISAccessToken | None:
+        return self.async_client.get_access_token()
+
+    def close(self) -> None:
+        """Close the async client and stop the loop thread."""
+        if self._closed:
+            return
+        try:
+            self.run(self.async_client.aclose())
+        finally:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+
+    def __enter__(self) -> BlockingKISClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        self.close()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any, Literal
 import re
 
@@ -16,6 +17,11 @@ from stock_manager.adapters.broker.kis.apis.oauth.oauth import approve_websocket
 from stock_manager.adapters.broker.kis.client import KISRestClient
 from stock_manager.adapters.broker.kis.config import KISAccessToken, KISConfig
 from stock_manager.adapters.broker.kis.exceptions import KISAPIError
+from stock_manager.adapters.broker.kis.quote_board import (
+    SOURCE_REST,
+    QuoteBoard,
+    get_quote_board,
+)
 from stock_manager.adapters.broker.kis.websocket_client import (
     DEFAULT_QUOTE_TR_ID,
     ExecutionCallback,
@@ -24,6 +30,7 @@ from stock_manager.adapters.broker.kis.websocket_client import (
     get_default_execution_notice_tr_id,
     get_kis_websocket_url,
 )
+from stock_manager.adapters.broker.kis.websocket_pool import KISWebSocketPool
 from stock_manager.types import BrokerTruthSnapshot
 
 _ACCOUNT_NUMBER_PATTERN = re.compile(r"^\d{8}$")
@@ -53,7 +60,8 @@ class KISBrokerAdapter:
         account_number: str,
         account_product_code: str = "01",
         rest_client: KISRestClient | None = None,
-        websocket_client: KISWebSocketClient | None = None,
+        websocket_client: KISWebSocketClient | KISWebSocketPool | None = None,
+        quote_board: QuoteBoard | None = None,
     ) -> None:
         """KISBrokerAdapter를 초기화한다.
 
@@ -62,7 +70,9 @@ class KISBrokerAdapter:
             account_number: 8자리 계좌번호 (숫자만).
             account_product_code: 2자리 계좌상품코드 (기본값: "01").
             rest_client: 주입할 KISRestClient 인스턴스. None이면 내부에서 생성.
-            websocket_client: 주입할 KISWebSocketClient 인스턴스. None이면 내부에서 생성.
+            websocket_client: 주입할 KISWebSocketClient 또는 KISWebSocketPool 인스턴스.
+                None이면 설정의 세션 한도에 맞춰 KISWebSocketPool을 생성.
+            quote_board: 실시간 시세 보드. None이면 프로세스 공유 보드를 사용.
 
         Raises:
             ValueError: account_number가 8자리 숫자가 아닌 경우.
@@ -80,9 +90,15 @@ class KISBrokerAdapter:
         self.account_number = normalized_account
         self.account_product_code = normalized_product_code
         self.rest_client = rest_client or KISRestClient(config=config)
-        self.websocket_client = websocket_client or KISWebSocketClient(
+        self.quote_board = quote_board if quote_board is not None else get_quote_board()
+        self.websocket_client = websocket_client or KISWebSocketPool(
             websocket_url=get_kis_websocket_url(is_paper_trading=config.use_mock),
             is_paper_trading=config.use_mock,
+            max_sessions=config.websocket_max_sessions,
+            max_subscriptions_per_session=config.websocket_max_subscriptions_per_session,
+            subscription_interval_sec=config.websocket_subscription_interval_ms / 1000,
+            approval_key_provider=self.get_websocket_approval_key,
+            quote_board=self.quote_board,
         )
 
     @property
@@ -94,6 +110,25 @@ class KISBrokerAdapter:
         """
         return self.websocket_client.is_connected
 
+    def websocket_health(self) -> tuple[dict[str, Any], ...]:
+        """웹소켓 세션별 연결 상태와 구독 수를 반환한다.
+
+        Returns:
+            세션별 상태 딕셔너리 튜플. 단일 클라이언트를 주입한 경우 세션 하나로 보고한다.
+        """
+        health = getattr(self.websocket_client, "health", None)
+        if callable(health):
+            return tuple(item.as_dict() for item in health())
+        return (
+            {
+                "session": 0,
+                "connected": self.websocket_connected,
+                "subscriptions": getattr(self.websocket_client, "subscription_count", None),
+                "capacity": None,
+                "last_message_age_sec": None,
+            },
+        )
+
     def authenticate(self, force_refresh: bool = False) -> KISAccessToken:
         """KIS API에 인증하여 액세스 토큰을 반환한다.
 
@@ -153,11 +188,20 @@ class KISBrokerAdapter:
             retry_enabled=retry_enabled,
         )
 
-    def inquire_current_price(self, stock_code: str) -> dict[str, Any]:
+    def inquire_current_price(
+        self,
+        stock_code: str,
+        *,
+        max_age: float | None = None,
+    ) -> dict[str, Any]:
         """국내 주식 현재가를 조회한다.
 
+        max_age가 주어지고 시세 보드의 값이 그 이내로 신선하면 REST 호출 없이
+        보드 값으로 최소 응답(output.stck_prpr, acml_vol)을 구성해 반환한다.
+
         Args:
             stock_code: 종목코드 (예: "005930").
+            max_age: 시세 보드 값을 허용할 최대 경과 시간(초). None이면 항상 REST 조회.
 
         Returns:
             현재가 정보가 담긴 JSON 응답 데이터.
@@ -166,11 +210,36 @@ class KISBrokerAdapter:
             KISAuthenticationError: 인증되지 않은 경우.
             KISAPIError: API 요청이 실패한 경우.
         """
-        return inquire_current_price(
+        if max_age is not None:
+            quote = self.quote_board.get(stock_code)
+            price = self.quote_board.price(stock_code, max_age)
+            if quote is not None and price is not None:
+                return {
+                    "rt_cd": "0",
+                    "msg_cd": "QUOTE_BOARD",
+                    "msg1": f"served from quote board ({quote.source})",
+                    "output": {
+                        "stck_prpr": str(price),
+                        "acml_vol": str(quote.volume) if quote.volume is not None else "",
+                    },
+                }
+
+        response = inquire_current_price(
             client=self.rest_client,
             stock_code=stock_code,
             is_paper_trading=self.config.use_mock,
         )
+        output = response.get("output") if isinstance(response, dict) else None
+        if isinstance(output, dict) and output.get("stck_prpr") not in (None, "", "0"):
+            try:
+                self.quote_board.update(
+                    stock_code,
+                    last=Decimal(str(output["stck_prpr"])),
+                    source=SOURCE_REST,
+                )
+            except ArithmeticError:
+                pass
+        return response
 
     def place_cash_order(
         self,
@@ -429,7 +498,7 @@ class KISBrokerAdapter:
         symbols: list[str],
         callback: QuoteCallback,
         tr_id: str = DEFAULT_QUOTE_TR_ID,
-    ) -> None:
+    ) -> list[str]:
         """종목 실시간 호가를 구독한다.
 
         웹소켓이 연결되어 있지 않으면 자동으로 연결한 후 구독을 시작한다.
@@ -439,6 +508,9 @@ class KISBrokerAdapter:
             callback: 호가 데이터 수신 시 호출할 콜백 함수.
             tr_id: 호가 조회 TR ID (기본값: DEFAULT_QUOTE_TR_ID).
 
+        Returns:
+            세션 구독 한도를 넘어 등록하지 못한 종목코드 목록 (REST 폴링 대상).
+
         Raises:
             KISAuthenticationError: 웹소켓 연결 중 인증에 실패한 경우.
             KISAPIError: 웹소켓 연결 또는 구독 요청이 실패한 경우.
@@ -446,11 +518,22 @@ class KISBrokerAdapter:
         if not self.websocket_connected:
             self.connect_websocket()
 
-        self.websocket_client.subscribe_quotes(
+        overflow = self.websocket_client.subscribe_quotes(
             symbols,
             callback=callback,
             tr_id=tr_id,
         )
+        return list(overflow or [])
+
+    def unsubscribe_quotes(self, *, symbols: list[str]) -> None:
+        """종목 실시간 호가 구독을 해제한다.
+
+        풀을 사용하는 경우 비게 된 세션은 정리(rebalance)된다.
+
+        Args:
+            symbols: 구독 해제할 종목코드 목록.
+        """
+        self.websocket_client.unsubscribe_quotes(symbols)
 
     def subscribe_executions(
         self,
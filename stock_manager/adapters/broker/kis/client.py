@@ -8,7 +8,6 @@ import logging
 import random
 import time
 from datetime import datetime, timedelta, timezone
-from threading import Lock
 from typing import Any, Literal
 from urllib.parse import urlparse
 
@@ -19,6 +18,7 @@ from stock_manager.adapters.broker.kis.config import (
     KISConfig,
     KISConnectionState,
 )
+from stock_manager.adapters.broker.kis.rate_limit import KISRateLimiter, shared_rate_limiter
 from stock_manager.adapters.broker.kis.token_cache import (
     invalidate_cached_token,
     load_cached_token,
@@ -33,104 +33,34 @@ from stock_manager.adapters.broker.kis.exceptions import (
 logger = logging.getLogger(__name__)
 
 
-class _RequestRateLimiter:
-    """Simple thread-safe sliding-window rate limiter for client-wide requests."""
+class _KISClientBase:
+    """Transport-independent request policy shared by the sync and async clients.
 
-    def __init__(self, max_requests: int, window_seconds: float = 1.0) -> None:
-        self.max_requests = max(1, int(max_requests))
-        self.window_seconds = float(window_seconds)
-        self._requests: list[float] = []
-        self._lock = Lock()
-
-    def acquire(self) -> None:
-        while True:
-            with self._lock:
-                now = time.monotonic()
-                self._requests = [
-                    t for t in self._requests if (now - t) < self.window_seconds
-                ]
-                if len(self._requests) < self.max_requests:
-                    self._requests.append(now)
-                    return
-                oldest = self._requests[0]
-                sleep_for = max(0.0, oldest + self.window_seconds - now)
-
-            if sleep_for > 0:
-                time.sleep(min(sleep_for, 0.1))
-
-    @property
-    def available(self) -> int:
-        with self._lock:
-            now = time.monotonic()
-            self._requests = [
-                t for t in self._requests if (now - t) < self.window_seconds
-            ]
-            return self.max_requests - len(self._requests)
-
-
-class KISRestClient:
-    """Base REST client for KIS API.
-
-    This client handles HTTP communication with the KIS (Korea Investment Securities)
-    API, including authentication token management, request signing, and error handling.
-
-    The client uses synchronous operations with httpx.
-
-    Attributes:
-        config: KIS configuration instance
-        state: Current connection state including access token
-        timeout: Default request timeout in seconds
-
-    Example:
-        >>> config = KISConfig()
-        >>> client = KISRestClient(config)
-        >>> client.authenticate()
-        >>> response = client.make_request("GET", "/uapi/domestic-stock/v1/quotations/inquire-price")
+    Subclasses set ``config``, ``state`` and ``_request_rate_limiter`` and
+    provide the HTTP calls; header building, token caching, response
+    classification and retry decisions live here so both clients behave
+    identically.
     """
 
-    # API version header
-    API_VERSION = "1.0"
-
-    def __init__(
-        self,
-        config: KISConfig,
-        *,
-        timeout: float = 30.0,
-        client: httpx.Client | None = None,
-    ) -> None:
-        """Initialize KIS REST client.
-
-        Args:
-            config: KIS configuration instance
-            timeout: Default request timeout in seconds (default: 30.0)
-            client: Optional custom httpx.Client for testing/advanced use
-
-        Raises:
-            KISConfigurationError: If configuration is invalid
-        """
-        self.config = config
-        self.state = KISConnectionState(config=config)
-        self.timeout = timeout
-        self._request_rate_limiter = _RequestRateLimiter(
-            max_requests=max(1, self.config.request_rate_limit_per_sec),
-            window_seconds=1.0,
-        )
+    config: KISConfig
+    state: KISConnectionState
+    _request_rate_limiter: KISRateLimiter
 
-        # HTTP client setup
-        if client is not None:
-            self._http_client = client
-        else:
-            self._http_client = httpx.Client(
-                base_url=config.api_base_url,
-                timeout=timeout,
-                headers=self._get_default_headers(),
-            )
+    @property
+    def request_rate_limiter(self) -> KISRateLimiter:
+        """Per-app-key limiter every request from this client waits on."""
+        return self._request_rate_limiter
 
     @property
     def request_rate_limiter_available(self) -> int:
         """Expose available slots in the global client rate limiter."""
         return self._request_rate_limiter.available
 
+    @property
+    def request_rate_limiter_capacity(self) -> int:
+        """Burst size of the global client rate limiter."""
+        return self._request_rate_limiter.max_requests
+
     def _get_default_headers(self) -> dict[str, str]:
         """Get default HTTP headers for all requests.
 
@@ -161,31 +91,18 @@ class KISRestClient:
             "appsecret": self.config.effective_app_secret.get_secret_value(),
         }
 
-    def authenticate(self, force_refresh: bool = False) -> KISAccessToken:
-        """Authenticate with KIS API and obtain access token.
-
-        Makes a POST request to the OAuth token endpoint to retrieve an
-        access token for authenticated API requests.
-
-        Returns:
-            KISAccessToken instance containing the access token
+    # ------------------------------------------------------------------
+    # Authentication helpers
+    # ------------------------------------------------------------------
 
-        Raises:
-            KISAuthenticationError: If authentication fails
-            KISAPIError: If the API request fails
+    def _reusable_token(self, force_refresh: bool) -> KISAccessToken | None:
+        """Return a still-valid in-memory or disk-cached token, if any."""
+        if force_refresh:
+            return None
 
-        Example:
-            >>> client = KISRestClient(config)
-            >>> token = client.authenticate()
-            >>> print(token.access_token)
-        """
         # Fast-path: reuse in-memory token if still valid.
         now = datetime.now(timezone.utc)
-        if (
-            not force_refresh
-            and self.state.is_authenticated
-            and self.state.access_token is not None
-        ):
+        if self.state.is_authenticated and self.state.access_token is not None:
             # If we don't know expiry, assume valid to avoid unnecessary re-issuance.
             if self.state.access_token_expires_at is None:
                 return self.state.access_token
@@ -193,7 +110,7 @@ class KISRestClient:
                 return self.state.access_token
 
         # Disk cache: reuse token across processes/restarts (avoids KIS OAuth rate limits).
-        if self.config.token_cache_enabled and not force_refresh:
+        if self.config.token_cache_enabled:
             cached = load_cached_token(
                 self.config.get_token_cache_path(),
                 app_key=self.config.effective_app_key.get_secret_value(),
@@ -204,280 +121,220 @@ class KISRestClient:
                 self.state.update_token(cached.token)
                 self.state.access_token_expires_at = cached.expires_at
                 return cached.token
+        return None
 
-        url = self.config.oauth_path
+    def _token_request(self) -> tuple[str, dict[str, str], dict[str, str]]:
+        """OAuth token endpoint, headers and payload."""
         headers = {
             "Content-Type": "application/json; charset=utf-8",
             "appkey": self.config.effective_app_key.get_secret_value(),
             "appsecret": self.config.effective_app_secret.get_secret_value(),
             "custtype": self.config.custtype,
         }
-
         payload = {
             "grant_type": "client_credentials",
             "appkey": self.config.effective_app_key.get_secret_value(),
             "appsecret": self.config.effective_app_secret.get_secret_value(),
         }
+        return self.config.oauth_path, headers, payload
 
+    def _accept_token_response(self, data: dict[str, Any]) -> KISAccessToken:
+        """Store a token response in state (and the disk cache)."""
         mode = "mock" if self.config.use_mock else "real"
 
-        try:
-            response = self._http_client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Handle KIS API response structure
-            # The response may have different structures depending on the endpoint
-            if "access_token" not in data:
-                raise KISAuthenticationError(
-                    f"Invalid token response ({mode}): missing access_token"
-                )
-
-            token = KISAccessToken(
-                access_token=data["access_token"],
-                token_type=data.get("token_type", "Bearer"),
-                expires_in=data.get("expires_in", 86400),
-                token_type_bearer=data.get("token_type_bearer", "Bearer"),
+        # Handle KIS API response structure
+        # The response may have different structures depending on the endpoint
+        if "access_token" not in data:
+            raise KISAuthenticationError(
+                f"Invalid token response ({mode}): missing access_token"
             )
 
-            self.state.update_token(token)
-            # KIS returns expires_in in seconds (typically 86400).
-            expires_in = int(data.get("expires_in", 86400))
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
-            self.state.access_token_expires_at = expires_at
-
-            if self.config.token_cache_enabled:
-                try:
-                    save_cached_token(
-                        self.config.get_token_cache_path(),
-                        token=token,
-                        expires_at=expires_at,
-                        app_key=self.config.effective_app_key.get_secret_value(),
-                        api_base_url=self.config.api_base_url,
-                        oauth_path=self.config.oauth_path,
-                        access_token_token_expired=data.get("access_token_token_expired"),
-                    )
-                except Exception:
-                    # Cache is best-effort; never fail auth because we couldn't write.
-                    pass
-            logger.info("Successfully authenticated with KIS API")
+        token = KISAccessToken(
+            access_token=data["access_token"],
+            token_type=data.get("token_type", "Bearer"),
+            expires_in=data.get("expires_in", 86400),
+            token_type_bearer=data.get("token_type_bearer", "Bearer"),
+        )
 
-            return token
+        self.state.update_token(token)
+        # KIS returns expires_in in seconds (typically 86400).
+        expires_in = int(data.get("expires_in", 86400))
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        self.state.access_token_expires_at = expires_at
 
-        except httpx.HTTPStatusError as e:
-            # KIS often returns useful error details in JSON body.
-            details = ""
+        if self.config.token_cache_enabled:
             try:
-                data = e.response.json()
-                parts = []
-                for k in ["rt_cd", "msg_cd", "msg1", "error", "error_description"]:
-                    if k in data and data.get(k) not in (None, ""):
-                        parts.append(f"{k}={data.get(k)}")
-                if parts:
-                    details = " (" + ", ".join(parts) + ")"
+                save_cached_token(
+                    self.config.get_token_cache_path(),
+                    token=token,
+                    expires_at=expires_at,
+                    app_key=self.config.effective_app_key.get_secret_value(),
+                    api_base_url=self.config.api_base_url,
+                    oauth_path=self.config.oauth_path,
+                    access_token_token_expired=data.get("access_token_token_expired"),
+                )
             except Exception:
+                # Cache is best-effort; never fail auth because we couldn't write.
                 pass
-            raise KISAuthenticationError(
-                f"Authentication failed ({mode}): {e.response.status_code}{details}",
-                error_code=str(e.response.status_code),
-            ) from e
-        except httpx.RequestError as e:
-            raise KISAPIError(f"Network error during authentication: {e}") from e
+        logger.info("Successfully authenticated with KIS API")
 
-    def make_request(
-        self,
-        method: Literal["GET", "POST", "PUT", "DELETE"],
-        path: str,
-        *,
-        params: dict[str, Any] | None = None,
-        json_data: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-        require_auth: bool = True,
-        retry_enabled: bool | None = None,
-    ) -> dict[str, Any]:
-        """Make an authenticated API request to KIS API.
+        return token
 
-        Args:
-            method: HTTP method (GET, POST, PUT, DELETE)
-            path: API endpoint path (e.g., "/uapi/domestic-stock/v1/quotations/inquire-price")
-            params: URL query parameters
-            json_data: JSON request body for POST/PUT requests
-            headers: Additional HTTP headers (merged with auth headers)
-            require_auth: Whether to include authentication headers (default: True)
+    def _authentication_error(self, e: httpx.HTTPStatusError) -> KISAuthenticationError:
+        """Build the error for a failed token request."""
+        mode = "mock" if self.config.use_mock else "real"
+        # KIS often returns useful error details in JSON body.
+        details = ""
+        try:
+            data = e.response.json()
+            parts = []
+            for k in ["rt_cd", "msg_cd", "msg1", "error", "error_description"]:
+                if k in data and data.get(k) not in (None, ""):
+                    parts.append(f"{k}={data.get(k)}")
+            if parts:
+                details = " (" + ", ".join(parts) + ")"
+        except Exception:
+            pass
+        return KISAuthenticationError(
+            f"Authentication failed ({mode}): {e.response.status_code}{details}",
+            error_code=str(e.response.status_code),
+        )
 
-        Returns:
-            Parsed JSON response data
+    # ------------------------------------------------------------------
+    # Request helpers
+    # ------------------------------------------------------------------
 
-        Raises:
-            KISAuthenticationError: If authentication is required but not available
-            KISAPIError: If the API request fails
-            KISRateLimitError: If rate limit is exceeded
+    def _request_headers(
+        self,
+        headers: dict[str, str] | None,
+        require_auth: bool,
+    ) -> dict[str, str]:
+        # Prepare headers per-attempt to include refreshed token after reauth.
+        request_headers = self._get_default_headers()
+        if require_auth:
+            auth_headers = self._get_auth_headers()
+            request_headers.update(auth_headers)
+        if headers:
+            request_headers.update(headers)
+        return request_headers
+
+    def _check_response(
+        self,
+        response: httpx.Response,
+        *,
+        can_reauth: bool,
+    ) -> dict[str, Any] | None:
+        """Parse a response, or return None when a forced re-auth should be tried.
 
-        Example:
-            >>> response = client.make_request(
-            ...     "GET",
-            ...     "/uapi/domestic-stock/v1/quotations/inquire-price",
-            ...     params={"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"}
-            ... )
-            >>> print(response["output"])
+        Raises:
+            KISRateLimitError: For HTTP 429 or an EGW00201 payload
+            KISAPIError: For other KIS error payloads
+            httpx.HTTPStatusError: For remaining HTTP errors
         """
-        self._validate_request_path(path)
-
-        effective_retry_enabled = self.config.request_retry_enabled
-        if retry_enabled is not None:
-            effective_retry_enabled = retry_enabled
-
-        max_attempts = max(1, self.config.request_max_attempts) if effective_retry_enabled else 1
-        reauth_attempted = False
-
-        for attempt in range(1, max_attempts + 1):
-            self._request_rate_limiter.acquire()
+        if response.status_code in (401, 403) and can_reauth:
+            return None
 
-            # Prepare headers per-attempt to include refreshed token after reauth.
-            request_headers = self._get_default_headers()
-            if require_auth:
-                auth_headers = self._get_auth_headers()
-                request_headers.update(auth_headers)
-            if headers:
-                request_headers.update(headers)
+        if response.status_code == 429:
+            raise KISRateLimitError(
+                "API rate limit exceeded. Please retry later.",
+                status_code=429,
+            )
 
+        if response.status_code >= 400:
+            error_data = None
             try:
-                response = self._http_client.request(
-                    method=method,
-                    url=path,
-                    params=params,
-                    json=json_data,
-                    headers=request_headers,
-                )
-
-                if response.status_code in (401, 403):
-                    if (
-                        require_auth
-                        and self.config.auto_reauth_enabled
-                        and not reauth_attempted
-                    ):
-                        reauth_attempted = True
-                        self._force_reauthenticate()
-                        continue
-
-                if response.status_code == 429:
-                    raise KISRateLimitError(
-                        "API rate limit exceeded. Please retry later.",
-                        status_code=429,
-                    )
-
-                if response.status_code >= 400:
-                    error_data = None
-                    try:
-                        parsed = response.json()
-                        if isinstance(parsed, dict):
-                            error_data = parsed
-                    except Exception:
-                        error_data = None
-
-                    if self._is_rate_limit_payload(error_data):
-                        raise KISRateLimitError(
-                            "API rate limit exceeded. Please retry later.",
-                            status_code=response.status_code,
-                            response_data=error_data,
-                        )
-                    if (
-                        require_auth
-                        and self.config.auto_reauth_enabled
-                        and not reauth_attempted
-                        and self._should_force_reauth(
-                            status_code=response.status_code,
-                            data=error_data,
-                        )
-                    ):
-                        reauth_attempted = True
-                        self._force_reauthenticate()
-                        continue
-
-                response.raise_for_status()
-                data = response.json()
-
-                if self._is_error_response(data):
-                    if self._is_rate_limit_payload(data):
-                        raise KISRateLimitError(
-                            "API rate limit exceeded. Please retry later.",
-                            status_code=response.status_code,
-                            response_data=data,
-                        )
-                    if (
-                        require_auth
-                        and self.config.auto_reauth_enabled
-                        and not reauth_attempted
-                        and self._should_force_reauth(status_code=response.status_code, data=data)
-                    ):
-                        reauth_attempted = True
-                        self._force_reauthenticate()
-                        continue
-                    raise self._create_api_error_from_response(data)
-
-                return data
+                parsed = response.json()
+                if isinstance(parsed, dict):
+                    error_data = parsed
+            except Exception:
+                error_data = None
 
-            except KISRateLimitError:
-                if self._should_retry_status(429, attempt, max_attempts):
-                    self._sleep_before_retry(attempt)
-                    continue
-                raise
-            except httpx.HTTPStatusError as e:
-                status_code = e.response.status_code
+            if self._is_rate_limit_payload(error_data):
+                raise KISRateLimitError(
+                    "API rate limit exceeded. Please retry later.",
+                    status_code=response.status_code,
+                    response_data=error_data,
+                )
+            if can_reauth and self._should_force_reauth(
+                status_code=response.status_code,
+                data=error_data,
+            ):
+                return None
+
+        response.raise_for_status()
+        data = response.json()
+
+        if self._is_error_response(data):
+            if self._is_rate_limit_payload(data):
+                raise KISRateLimitError(
+                    "API rate limit exceeded. Please retry later.",
+                    status_code=response.status_code,
+                    response_data=data,
+                )
+            if can_reauth and self._should_force_reauth(
+                status_code=response.status_code, data=data
+            ):
+                return None
+            raise self._create_api_error_from_response(data)
 
-                error_data = None
-                try:
-                    error_data = e.response.json()
-                except Exception:
-                    pass
-
-                if (
-                    require_auth
-                    and self.config.auto_reauth_enabled
-                    and not reauth_attempted
-                    and self._should_force_reauth(status_code=status_code, data=error_data)
-                ):
-                    reauth_attempted = True
-                    self._force_reauthenticate()
-                    continue
+        return data
 
-                if self._is_rate_limit_payload(error_data):
-                    if self._should_retry_status(429, attempt, max_attempts):
-                        self._sleep_before_retry(attempt)
-                        continue
-                    raise KISRateLimitError(
-                        "API rate limit exceeded. Please retry later.",
-                        status_code=status_code,
-                        response_data=error_data,
-                    ) from e
-
-                if self._should_retry_status(status_code, attempt, max_attempts):
-                    self._sleep_before_retry(attempt)
-                    continue
+    def _handle_status_error(
+        self,
+        e: httpx.HTTPStatusError,
+        *,
+        can_reauth: bool,
+        attempt: int,
+        max_attempts: int,
+    ) -> Literal["reauth", "retry"]:
+        """Decide how to recover from an HTTP error, or raise the final error."""
+        status_code = e.response.status_code
+
+        error_data = None
+        try:
+            error_data = e.response.json()
+        except Exception:
+            pass
+
+        if can_reauth and self._should_force_reauth(status_code=status_code, data=error_data):
+            return "reauth"
+
+        if self._is_rate_limit_payload(error_data):
+            if self._should_retry_status(429, attempt, max_attempts):
+                return "retry"
+            raise KISRateLimitError(
+                "API rate limit exceeded. Please retry later.",
+                status_code=status_code,
+                response_data=error_data,
+            ) from e
 
-                details = ""
-                if isinstance(error_data, dict):
-                    detail_parts = []
-                    for key in ("rt_cd", "msg_cd", "msg1"):
-                        value = error_data.get(key)
-                        if value not in (None, ""):
-                            detail_parts.append(f"{key}={value}")
-                    if detail_parts:
-                        details = " (" + ", ".join(detail_parts) + ")"
-
-                raise KISAPIError(
-                    f"API request failed: {e.response.status_code} {e.response.reason_phrase}{details}",
-                    status_code=e.response.status_code,
-                    response_data=error_data,
-                ) from e
-            except httpx.RequestError as e:
-                if self._should_retry_network(attempt, max_attempts):
-                    self._sleep_before_retry(attempt)
-                    continue
-                raise KISAPIError(f"Network error during API request: {e}") from e
+        if self._should_retry_status(status_code, attempt, max_attempts):
+            return "retry"
+
+        details = ""
+        if isinstance(error_data, dict):
+            detail_parts = []
+            for key in ("rt_cd", "msg_cd", "msg1"):
+                value = error_data.get(key)
+                if value not in (None, ""):
+                    detail_parts.append(f"{key}={value}")
+            if detail_parts:
+                details = " (" + ", ".join(detail_parts) + ")"
+
+        raise KISAPIError(
+            f"API request failed: {e.response.status_code} {e.response.reason_phrase}{details}",
+            status_code=e.response.status_code,
+            response_data=error_data,
+        ) from e
+
+    def _max_attempts(self, retry_enabled: bool | None) -> int:
+        effective_retry_enabled = self.config.request_retry_enabled
+        if retry_enabled is not None:
+            effective_retry_enabled = retry_enabled
+        return max(1, self.config.request_max_attempts) if effective_retry_enabled else 1
 
-        raise KISAPIError("API request failed after maximum retry attempts")
+    def _can_reauth(self, require_auth: bool, reauth_attempted: bool) -> bool:
+        return require_auth and self.config.auto_reauth_enabled and not reauth_attempted
 
     def _validate_request_path(self, path: str) -> None:
         """Validate endpoint path to prevent cross-environment absolute URL calls."""
@@ -584,10 +441,6 @@ class KISRestClient:
             return
         invalidate_cached_token(self.config.get_token_cache_path())
 
-    def _force_reauthenticate(self) -> KISAccessToken:
-        self._invalidate_current_auth_state()
-        return self.authenticate(force_refresh=True)
-
     def _is_rate_limit_payload(self, data: dict[str, Any] | None) -> bool:
         """Detect KIS rate-limit payloads regardless of HTTP status code."""
         if not isinstance(data, dict):
@@ -615,12 +468,209 @@ class KISRestClient:
     def _should_retry_network(self, attempt: int, max_attempts: int) -> bool:
         return self.config.request_retry_enabled and attempt < max_attempts
 
-    def _sleep_before_retry(self, attempt: int) -> None:
+    def _retry_delay(self, attempt: int) -> float:
         base = max(1, self.config.request_initial_backoff_ms) / 1000.0
         multiplier = max(1.0, self.config.request_backoff_multiplier)
         delay = base * (multiplier ** max(0, attempt - 1))
         delay += random.uniform(0.0, base)
-        time.sleep(delay)
+        return delay
+
+    def is_authenticated(self) -> bool:
+        """Check if the client is authenticated.
+
+        Returns:
+            True if authenticated, False otherwise
+        """
+        return self.state.is_authenticated
+
+    def get_access_token(self) -> KISAccessToken | None:
+        """Get the current access token.
+
+        Returns:
+            Current KISAccessToken or None if not authenticated
+        """
+        return self.state.access_token
+
+
+class KISRestClient(_KISClientBase):
+    """Base REST client for KIS API.
+
+    This client handles HTTP communication with the KIS (Korea Investment Securities)
+    API, including authentication token management, request signing, and error handling.
+
+    The client uses synchronous operations with httpx.
+
+    Attributes:
+        config: KIS configuration instance
+        state: Current connection state including access token
+        timeout: Default request timeout in seconds
+
+    Example:
+        >>> config = KISConfig()
+        >>> client = KISRestClient(config)
+        >>> client.authenticate()
+        >>> response = client.make_request("GET", "/uapi/domestic-stock/v1/quotations/inquire-price")
+    """
+
+    # API version header
+    API_VERSION = "1.0"
+
+    def __init__(
+        self,
+        config: KISConfig,
+        *,
+        timeout: float = 30.0,
+        client: httpx.Client | None = None,
+    ) -> None:
+        """Initialize KIS REST client.
+
+        Args:
+            config: KIS configuration instance
+            timeout: Default request timeout in seconds (default: 30.0)
+            client: Optional custom httpx.Client for testing/advanced use
+
+        Raises:
+            KISConfigurationError: If configuration is invalid
+        """
+        self.config = config
+        self.state = KISConnectionState(config=config)
+        self.timeout = timeout
+        # Shared with every other live client on the same app key.
+        self._request_rate_limiter = shared_rate_limiter(config)
+
+        # HTTP client setup
+        if client is not None:
+            self._http_client = client
+        else:
+            self._http_client = httpx.Client(
+                base_url=config.api_base_url,
+                timeout=timeout,
+                headers=self._get_default_headers(),
+            )
+
+    def authenticate(self, force_refresh: bool = False) -> KISAccessToken:
+        """Authenticate with KIS API and obtain access token.
+
+        Makes a POST request to the OAuth token endpoint to retrieve an
+        access token for authenticated API requests.
+
+        Returns:
+            KISAccessToken instance containing the access token
+
+        Raises:
+            KISAuthenticationError: If authentication fails
+            KISAPIError: If the API request fails
+
+        Example:
+            >>> client = KISRestClient(config)
+            >>> token = client.authenticate()
+            >>> print(token.access_token)
+        """
+        token = self._reusable_token(force_refresh)
+        if token is not None:
+            return token
+
+        url, headers, payload = self._token_request()
+        try:
+            response = self._http_client.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            return self._accept_token_response(response.json())
+        except httpx.HTTPStatusError as e:
+            raise self._authentication_error(e) from e
+        except httpx.RequestError as e:
+            raise KISAPIError(f"Network error during authentication: {e}") from e
+
+    def make_request(
+        self,
+        method: Literal["GET", "POST", "PUT", "DELETE"],
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        require_auth: bool = True,
+        retry_enabled: bool | None = None,
+    ) -> dict[str, Any]:
+        """Make an authenticated API request to KIS API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API endpoint path (e.g., "/uapi/domestic-stock/v1/quotations/inquire-price")
+            params: URL query parameters
+            json_data: JSON request body for POST/PUT requests
+            headers: Additional HTTP headers (merged with auth headers)
+            require_auth: Whether to include authentication headers (default: True)
+
+        Returns:
+            Parsed JSON response data
+
+        Raises:
+            KISAuthenticationError: If authentication is required but not available
+            KISAPIError: If the API request fails
+            KISRateLimitError: If rate limit is exceeded
+
+        Example:
+            >>> response = client.make_request(
+            ...     "GET",
+            ...     "/uapi/domestic-stock/v1/quotations/inquire-price",
+            ...     params={"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"}
+            ... )
+            >>> print(response["output"])
+        """
+        self._validate_request_path(path)
+
+        max_attempts = self._max_attempts(retry_enabled)
+        reauth_attempted = False
+
+        for attempt in range(1, max_attempts + 1):
+            self._request_rate_limiter.acquire(path, tr_id=(headers or {}).get("tr_id"))
+            request_headers = self._request_headers(headers, require_auth)
+            can_reauth = self._can_reauth(require_auth, reauth_attempted)
+
+            try:
+                response = self._http_client.request(
+                    method=method,
+                    url=path,
+                    params=params,
+                    json=json_data,
+                    headers=request_headers,
+                )
+                data = self._check_response(response, can_reauth=can_reauth)
+                if data is None:
+                    reauth_attempted = True
+                    self._force_reauthenticate()
+                    continue
+                return data
+
+            except KISRateLimitError:
+                if self._should_retry_status(429, attempt, max_attempts):
+                    self._sleep_before_retry(attempt)
+                    continue
+                raise
+            except httpx.HTTPStatusError as e:
+                action = self._handle_status_error(
+                    e, can_reauth=can_reauth, attempt=attempt, max_attempts=max_attempts
+                )
+                if action == "reauth":
+                    reauth_attempted = True
+                    self._force_reauthenticate()
+                    continue
+                self._sleep_before_retry(attempt)
+                continue
+            except httpx.RequestError as e:
+                if self._should_retry_network(attempt, max_attempts):
+                    self._sleep_before_retry(attempt)
+                    continue
+                raise KISAPIError(f"Network error during API request: {e}") from e
+
+        raise KISAPIError("API request failed after maximum retry attempts")
+
+    def _force_reauthenticate(self) -> KISAccessToken:
+        self._invalidate_current_auth_state()
+        return self.authenticate(force_refresh=True)
+
+    def _sleep_before_retry(self, attempt: int) -> None:
+        time.sleep(self._retry_delay(attempt))
 
     def close(self) -> None:
         """Close the HTTP client and release resources.
@@ -653,22 +703,6 @@ class KISRestClient:
         """
         self.close()
 
-    def is_authenticated(self) -> bool:
-        """Check if the client is authenticated.
-
-        Returns:
-            True if authenticated, False otherwise
-        """
-        return self.state.is_authenticated
-
-    def get_access_token(self) -> KISAccessToken | None:
-        """Get the current access token.
-
-        Returns:
-            Current KISAccessToken or None if not authenticated
-        """
-        return self.state.access_token
-
 
 def build_real_data_client(config: "KISConfig") -> "KISRestClient | None":
     """Create a real-server client for financial data APIs in mock mode.
@@ -694,6 +728,10 @@ def build_real_data_client(config: "KISConfig") -> "KISRestClient | None":
         mock_account_number=None,
         token_cache_enabled=config.token_cache_enabled,
         request_rate_limit_per_sec=config.request_rate_limit_per_sec,
+        request_order_rate_limit_per_sec=config.request_order_rate_limit_per_sec,
+        request_quotation_rate_limit_per_sec=config.request_quotation_rate_limit_per_sec,
+        request_tr_id_rate_limits_per_sec=config.request_tr_id_rate_limits_per_sec,
+        request_rate_limit_state_dir=config.request_rate_limit_state_dir,
         request_retry_enabled=config.request_retry_enabled,
         request_max_attempts=config.request_max_attempts,
         _env_file=None,  # type: ignore[call-arg]
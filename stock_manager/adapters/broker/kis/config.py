@@ -76,11 +76,22 @@ class KISConfig(BaseSettings):
     token_cache_path: str | None = None
     # Request stabilization controls
     request_rate_limit_per_sec: int = 8
+    # Optional per-endpoint-class and per-TR_ID budgets (within the global
+    # one) and a directory for cross-process bucket state; see rate_limit.py.
+    request_order_rate_limit_per_sec: int | None = None
+    request_quotation_rate_limit_per_sec: int | None = None
+    request_tr_id_rate_limits_per_sec: dict[str, float] | None = None
+    request_rate_limit_state_dir: str | None = None
     request_retry_enabled: bool = True
     request_max_attempts: int = 3
     request_initial_backoff_ms: int = 200
     request_backoff_multiplier: float = 2.0
     auto_reauth_enabled: bool = True
+    # Real-time WebSocket sharding; see websocket_pool.py. Symbols beyond
+    # max_sessions * per-session cap are polled over REST instead.
+    websocket_max_sessions: int = 1
+    websocket_max_subscriptions_per_session: int = 41
+    websocket_subscription_interval_ms: int = 50
 
     _effective_app_key: SecretStr = PrivateAttr(default=SecretStr(""))
     _effective_app_secret: SecretStr = PrivateAttr(default=SecretStr(""))
@@ -0,0 +1,152 @@
+"""Process-wide board of the latest quote per symbol.
+
+Why:
+- Order pricing (``TradingEngine._get_current_price``) and
+  ``KISBrokerAdapter.inquire_current_price`` made a 50-200 ms REST round trip
+  even while the WebSocket or ``PriceMonitor`` was already streaming the
+  same symbol.
+
+The board is written by ``KISWebSocketClient`` (order book and trade ticks)
+and ``PriceMonitor`` (REST polls), and read with a freshness bound. Callers
+fall back to REST only when the entry is missing or stale.
+
+Reads take no lock. Each symbol maps to an immutable ``Quote``, and swapping
+a dict entry is atomic. Writers hold a lock only to merge partial updates
+(an order-book tick does not clear the last trade price).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable
+
+SOURCE_WEBSOCKET = "websocket"
+SOURCE_REST = "rest"
+
+
+@dataclass(frozen=True, slots=True)
+class Quote:
+    """Latest known market data for one symbol.
+
+    ``last_at`` / ``book_at`` are monotonic timestamps of the last trade-price
+    and bid/ask updates (0.0 when never set).
+    """
+
+    symbol: str
+    last: Decimal | None = None
+    bid: Decimal | None = None
+    ask: Decimal | None = None
+    volume: int | None = None
+    last_at: float = 0.0
+    book_at: float = 0.0
+    source: str = ""
+
+    @property
+    def updated_at(self) -> float:
+        return max(self.last_at, self.book_at)
+
+    def price(self, now: float, max_age: float) -> Decimal | None:
+        """Fresh trade price, else fresh ask/bid, else None."""
+        if self.last is not None and now - self.last_at <= max_age:
+            return self.last
+        if now - self.book_at <= max_age:
+            return self.ask if self.ask is not None else self.bid
+        return None
+
+
+class QuoteBoard:
+    """Thread-safe symbol -> ``Quote`` map with lock-free reads.
+
+    Args:
+        clock: Monotonic time source (seconds).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._quotes: dict[str, Quote] = {}
+        self._write_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def symbols(self) -> list[str]:
+        return list(self._quotes)
+
+    def update(
+        self,
+        symbol: str,
+        *,
+        last: Decimal | None = None,
+        bid: Decimal | None = None,
+        ask: Decimal | None = None,
+        volume: int | None = None,
+        source: str = "",
+    ) -> Quote | None:
+        """Merge new fields into the symbol's quote; None fields are kept."""
+        symbol = symbol.strip().upper()
+        if not symbol or (last is None and bid is None and ask is None):
+            return None
+        now = self._clock()
+        with self._write_lock:
+            old = self._quotes.get(symbol) or Quote(symbol=symbol)
+            book_changed = bid is not None or ask is not None
+            quote = Quote(
+                symbol=symbol,
+                last=last if last is not None else old.last,
+                bid=bid if bid is not None else old.bid,
+                ask=ask if ask is not None else old.ask,
+                volume=volume if volume is not None else old.volume,
+                last_at=now if last is not None else old.last_at,
+                book_at=now if book_changed else old.book_at,
+                source=source or old.source,
+            )
+            self._quotes[symbol] = quote
+        return quote
+
+    def get(self, symbol: str, max_age: float | None = None) -> Quote | None:
+        """Quote for *symbol*, or None if unknown or older than ``max_age``."""
+        quote = self._quotes.get(symbol.strip().upper())
+        if quote is None:
+            return None
+        if max_age is not None and self._clock() - quote.updated_at > max_age:
+            return None
+        return quote
+
+    def price(self, symbol: str, max_age: float) -> Decimal | None:
+        """Freshest usable price for *symbol* within ``max_age`` seconds."""
+        quote = self._quotes.get(symbol.strip().upper())
+        if quote is None:
+            return None
+        return quote.price(self._clock(), max_age)
+
+    def get_or_fetch(
+        self,
+        symbol: str,
+        fetch: Callable[[str], Decimal | int | None],
+        max_age: float,
+    ) -> Decimal | None:
+        """Fresh board price, else ``fetch(symbol)`` (recorded as a REST update)."""
+        price = self.price(symbol, max_age)
+        if price is not None:
+            return price
+        fetched = fetch(symbol)
+        if fetched is None:
+            return None
+        price = Decimal(fetched)
+        self.update(symbol, last=price, source=SOURCE_REST)
+        return price
+
+    def clear(self) -> None:
+        with self._write_lock:
+            self._quotes.clear()
+
+
+_board = QuoteBoard()
+
+
+def get_quote_board() -> QuoteBoard:
+    """The process-wide quote board."""
+    return _board
@@ -0,0 +1,429 @@
+"""Token-bucket request budgets for the KIS REST API.
+
+Why:
+- KIS enforces one requests-per-second budget per app key (EGW00201 when
+  exceeded), but every ``KISRestClient`` used to carry its own sliding-window
+  limiter, so two clients on the same key could together exceed it.
+- The old limiters rebuilt a list on every ``acquire()`` and busy-polled in
+  100 ms sleeps, adding up to 100 ms of jitter to a throttled request.
+
+``TokenBucket`` takes and refills tokens in O(1). Blocked callers queue FIFO,
+and each one waits on its own condition variable. Only the head of the queue
+sleeps, and for exactly its token deficit. When it leaves, it wakes the next
+waiter.
+
+``KISRateLimiter`` combines a global per-app-key bucket with optional
+per-endpoint-class buckets (orders vs quotations) and per-TR_ID buckets.
+``shared_rate_limiter(config)`` returns the limiter shared by every live
+client with the same app key and settings. Setting
+``KIS_REQUEST_RATE_LIMIT_STATE_DIR`` switches the buckets to
+``FileTokenBucket``, which keeps bucket state in a small ``flock``-guarded
+file so separate processes (e.g. the bot and a CLI run) share one budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import struct
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Mapping
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from stock_manager.adapters.broker.kis.config import KISConfig
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT_ORDER = "order"
+ENDPOINT_QUOTATION = "quotation"
+ENDPOINT_OTHER = "other"
+
+
+def classify_endpoint(path: str) -> str:
+    """Map a REST path to its budget class (order / quotation / other)."""
+    if "/trading/order" in path:
+        return ENDPOINT_ORDER
+    if "/quotations/" in path:
+        return ENDPOINT_QUOTATION
+    return ENDPOINT_OTHER
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    """Requests per second, with a burst ``capacity`` (defaults to ``rate``)."""
+
+    rate: float
+    capacity: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.capacity is not None and self.capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {self.capacity}")
+
+    @property
+    def burst(self) -> float:
+        return float(self.capacity) if self.capacity is not None else max(1.0, float(self.rate))
+
+
+# ---------------------------------------------------------------------------
+# Buckets
+# ---------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Thread-safe token bucket with FIFO waiters.
+
+    Args:
+        budget: Refill rate and burst capacity.
+        clock: Time source (seconds); monotonic by default.
+    """
+
+    def __init__(
+        self,
+        budget: RateBudget,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.budget = budget
+        self.rate = float(budget.rate)
+        self.capacity = budget.burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._waiters: deque[threading.Condition] = deque()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def acquire(self, tokens: float = 1.0, timeout: float | None = None) -> bool:
+        """Block until *tokens* are taken, in arrival order.
+
+        Returns False without taking anything if ``timeout`` expires first,
+        or immediately when the wait is already known to exceed it.
+        """
+        self._check_tokens(tokens)
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._lock:
+            waiter = threading.Condition(self._lock)
+            self._waiters.append(waiter)
+            try:
+                while True:
+                    now = self._clock()
+                    wait: float | None = None
+                    if self._waiters[0] is waiter:
+                        wait = self._take(tokens, now)
+                        if wait <= 0:
+                            return True
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0 or (wait is not None and wait > remaining):
+                            return False
+                        if wait is None:
+                            wait = remaining
+                    elif wait == math.inf:  # no capacity at all
+                        wait = None
+                    waiter.wait(wait)
+            finally:
+                was_head = self._waiters[0] is waiter
+                self._waiters.remove(waiter)
+                if was_head and self._waiters:
+                    self._waiters[0].notify()
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take *tokens* only if available now and nobody is queued ahead."""
+        self._check_tokens(tokens)
+        with self._lock:
+            if self._waiters:
+                return False
+            return self._take(tokens, self._clock()) <= 0
+
+    @property
+    def available(self) -> int:
+        """Whole tokens available right now."""
+        with self._lock:
+            return max(0, int(self._peek(self._clock())))
+
+    def release(self, tokens: float = 1.0) -> None:
+        """Return *tokens* taken by an acquire whose request did not go out."""
+        self._check_tokens(tokens)
+        with self._lock:
+            self._give(tokens, self._clock())
+            if self._waiters:
+                self._waiters[0].notify()
+
+    def reset(self) -> None:
+        """Refill the bucket to capacity."""
+        with self._lock:
+            self._tokens = self.capacity
+            self._updated = self._clock()
+            if self._waiters:
+                self._waiters[0].notify()
+
+    # ------------------------------------------------------------------
+    # State (called with ``_lock`` held; overridden by subclasses such as
+    # FileTokenBucket)
+    # ------------------------------------------------------------------
+
+    def _take(self, tokens: float, now: float) -> float:
+        """Take *tokens* and return 0, or return the seconds until possible."""
+        self._tokens = self._refilled(self._tokens, self._updated, now)
+        self._updated = now
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    def _give(self, tokens: float, now: float) -> None:
+        self._tokens = min(self.capacity, self._refilled(self._tokens, self._updated, now) + tokens)
+        self._updated = now
+
+    def _peek(self, now: float) -> float:
+        return self._refilled(self._tokens, self._updated, now)
+
+    def _refilled(self, tokens: float, updated: float, now: float) -> float:
+        elapsed = max(0.0, now - updated)
+        return min(self.capacity, tokens + elapsed * self.rate)
+
+    def _check_tokens(self, tokens: float) -> None:
+        if tokens <= 0 or tokens > self.capacity:
+            raise ValueError(f"tokens must be in (0, {self.capacity}], got {tokens}")
+
+
+_STATE = struct.Struct("=dd")  # tokens, last refill (epoch seconds)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is shared across processes through a file.
+
+    Threads within a process still queue FIFO on the in-process lock; only
+    the queue head touches the file, under an exclusive ``flock``. Wall-clock
+    time is used so the state stays meaningful across processes.
+    """
+
+    def __init__(self, budget: RateBudget, path: Path) -> None:
+        if fcntl is None:  # pragma: no cover - non-POSIX platforms
+            raise RuntimeError("FileTokenBucket requires POSIX fcntl.flock")
+        super().__init__(budget, clock=time.time)
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def __del__(self) -> None:
+        fd = getattr(self, "_fd", None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def reset(self) -> None:
+        with self._lock:
+            self._with_state(lambda tokens, now: (self.capacity, 0.0), self._clock())
+            if self._waiters:
+                self._waiters[0].notify()
+
+    def _take(self, tokens: float, now: float) -> float:
+        def update(current: float, _now: float) -> tuple[float, float]:
+            if current >= tokens:
+                return current - tokens, 0.0
+            return current, (tokens - current) / self.rate
+
+        return self._with_state(update, now)
+
+    def _give(self, tokens: float, now: float) -> None:
+        self._with_state(lambda current, _now: (min(self.capacity, current + tokens), 0.0), now)
+
+    def _peek(self, now: float) -> float:
+        captured: list[float] = []
+
+        def update(current: float, _now: float) -> tuple[float, float]:
+            captured.append(current)
+            return current, 0.0
+
+        self._with_state(update, now)
+        return captured[0]
+
+    def _with_state(
+        self,
+        update: Callable[[float, float], tuple[float, float]],
+        now: float,
+    ) -> float:
+        """Read, refill and rewrite the shared state under ``flock``."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            raw = os.pread(self._fd, _STATE.size, 0)
+            if len(raw) == _STATE.size:
+                tokens, updated = _STATE.unpack(raw)
+                tokens = self._refilled(tokens, updated, now)
+            else:
+                tokens = self.capacity
+            tokens, result = update(tokens, now)
+            os.pwrite(self._fd, _STATE.pack(tokens, now), 0)
+            return result
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+# ---------------------------------------------------------------------------
+# KIS limiter
+# ---------------------------------------------------------------------------
+
+
+class KISRateLimiter:
+    """Global per-app-key budget plus optional endpoint-class / TR_ID budgets.
+
+    A request takes one token from its most specific bucket (TR_ID, else
+    endpoint class) and one from the global bucket. If the global bucket
+    times out, the specific token is released again.
+
+    Args:
+        global_budget: Budget shared by every request on the app key.
+        endpoint_budgets: Budgets keyed by ``classify_endpoint`` result.
+        tr_id_budgets: Budgets keyed by KIS TR_ID (e.g. ``"TTTC0802U"``).
+        state_dir: When set, buckets persist in this directory as
+            ``FileTokenBucket`` files so processes share them.
+        namespace: File name prefix used with ``state_dir``.
+    """
+
+    def __init__(
+        self,
+        global_budget: RateBudget,
+        *,
+        endpoint_budgets: Mapping[str, RateBudget] | None = None,
+        tr_id_budgets: Mapping[str, RateBudget] | None = None,
+        state_dir: Path | None = None,
+        namespace: str = "kis",
+    ) -> None:
+        self._state_dir = Path(state_dir).expanduser() if state_dir is not None else None
+        self._namespace = namespace
+        self.global_bucket = self._bucket("global", global_budget)
+        self.endpoint_buckets = {
+            name: self._bucket(f"endpoint-{name}", budget)
+            for name, budget in (endpoint_budgets or {}).items()
+        }
+        self.tr_id_buckets = {
+            tr_id: self._bucket(f"tr-{tr_id}", budget)
+            for tr_id, budget in (tr_id_budgets or {}).items()
+        }
+
+    @property
+    def max_requests(self) -> int:
+        """Global requests-per-second budget."""
+        return int(self.global_bucket.rate)
+
+    @property
+    def available(self) -> int:
+        """Tokens left in the global bucket."""
+        return self.global_bucket.available
+
+    def bucket_for(self, path: str = "", tr_id: str | None = None) -> TokenBucket | None:
+        """Most specific non-global bucket for a request, if any."""
+        if tr_id and tr_id in self.tr_id_buckets:
+            return self.tr_id_buckets[tr_id]
+        return self.endpoint_buckets.get(classify_endpoint(path))
+
+    def acquire(
+        self,
+        path: str = "",
+        *,
+        tr_id: str | None = None,
+        timeout: float | None = None,
+    ) -> bool:
+        """Block until the request fits every applicable budget."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        specific = self.bucket_for(path, tr_id)
+        if specific is not None and not specific.acquire(timeout=timeout):
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if self.global_bucket.acquire(timeout=remaining):
+            return True
+        if specific is not None:
+            specific.release()
+        return False
+
+    def try_acquire(self, path: str = "", *, tr_id: str | None = None) -> bool:
+        """Non-blocking ``acquire``; takes nothing if the global bucket is empty."""
+        if self.global_bucket.available < 1:
+            return False
+        specific = self.bucket_for(path, tr_id)
+        if specific is not None and not specific.try_acquire():
+            return False
+        if self.global_bucket.try_acquire():
+            return True
+        if specific is not None:
+            specific.release()
+        return False
+
+    def _bucket(self, name: str, budget: RateBudget) -> TokenBucket:
+        if self._state_dir is None:
+            return TokenBucket(budget)
+        return FileTokenBucket(budget, self._state_dir / f"{self._namespace}-{name}.bucket")
+
+
+def client_rate_limiter(client: object) -> KISRateLimiter | None:
+    """Shared limiter *client* already waits on for every request, if any.
+
+    Callers in front of such a client need no limiter of their own; one
+    would only add a second, uncoordinated budget.
+    """
+    limiter = getattr(client, "request_rate_limiter", None)
+    return limiter if isinstance(limiter, KISRateLimiter) else None
+
+
+_shared_lock = threading.Lock()
+_shared: weakref.WeakValueDictionary[tuple, KISRateLimiter] = weakref.WeakValueDictionary()
+
+
+def shared_rate_limiter(config: KISConfig) -> KISRateLimiter:
+    """Limiter shared by all live clients with the same app key and budgets.
+
+    Entries are weakly held: once the last client using a limiter is gone,
+    the next client starts with a full bucket.
+    """
+    app_key = config.effective_app_key.get_secret_value()
+    key_digest = hashlib.sha256(app_key.encode("utf-8")).hexdigest()[:16]
+    mode = "paper" if config.is_mock_trading else "real"
+    endpoint_budgets: dict[str, RateBudget] = {}
+    if config.request_order_rate_limit_per_sec:
+        endpoint_budgets[ENDPOINT_ORDER] = RateBudget(config.request_order_rate_limit_per_sec)
+    if config.request_quotation_rate_limit_per_sec:
+        endpoint_budgets[ENDPOINT_QUOTATION] = RateBudget(
+            config.request_quotation_rate_limit_per_sec
+        )
+    tr_id_budgets = {
+        tr_id: RateBudget(rate)
+        for tr_id, rate in (config.request_tr_id_rate_limits_per_sec or {}).items()
+    }
+    state_dir = config.request_rate_limit_state_dir
+    key = (
+        key_digest,
+        mode,
+        max(1, config.request_rate_limit_per_sec),
+        tuple(sorted((name, b.rate) for name, b in endpoint_budgets.items())),
+        tuple(sorted((tr_id, b.rate) for tr_id, b in tr_id_budgets.items())),
+        state_dir,
+    )
+    with _shared_lock:
+        limiter = _shared.get(key)
+        if limiter is None:
+            limiter = KISRateLimiter(
+                RateBudget(max(1, config.request_rate_limit_per_sec)),
+                endpoint_budgets=endpoint_budgets,
+                tr_id_budgets=tr_id_budgets,
+                state_dir=Path(state_dir) if state_dir else None,
+                namespace=f"kis-{mode}-{key_digest}",
+            )
+            _shared[key] = limiter
+            logger.debug("Created shared KIS rate limiter (%s, %s/s)", mode, key[2])
+        return limiter
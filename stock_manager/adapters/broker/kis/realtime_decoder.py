@@ -0,0 +1,296 @@
+"""Decoder for KIS real-time caret frames.
+
+Why:
+- KIS streams real-time data as ``flag|TR_ID|count|f1^f2^...`` text frames,
+  not JSON. ``KISWebSocketClient._decode_message`` used to drop them.
+- At market open, 40+ subscribed symbols send hundreds of frames per
+  second, so decoding must not build a name -> value dict per record.
+
+Each supported TR_ID gets a precompiled ``FrameLayout``, built once from
+``apis.domestic_stock.realtime.TR_IDS``. The layout holds the field indices
+the client reads. ``decode`` splits a frame into per-record field slices,
+and callers index them directly.
+
+Frames with flag ``1`` are AES-256-CBC encrypted. This applies to execution
+notices (H0STCNI0/H0STCNI9). The key and IV arrive in the JSON subscribe
+response and are registered with ``register_key``. Decryption needs the
+optional ``cryptography`` package (``pip install 'stock-manager[realtime]'``).
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+from dataclasses import dataclass
+from typing import Callable, Literal, Sequence
+
+from stock_manager.adapters.broker.kis.apis.domestic_stock.realtime import TR_IDS
+
+logger = logging.getLogger(__name__)
+
+FrameKind = Literal["orderbook", "trade", "notice"]
+
+# ---------------------------------------------------------------------------
+# Column layouts (KIS OpenAPI real-time specs)
+# ---------------------------------------------------------------------------
+
+TRADE_COLUMNS: tuple[str, ...] = (
+    "MKSC_SHRN_ISCD", "STCK_CNTG_HOUR", "STCK_PRPR", "PRDY_VRSS_SIGN", "PRDY_VRSS",
+    "PRDY_CTRT", "WGHN_AVRG_STCK_PRC", "STCK_OPRC", "STCK_HGPR", "STCK_LWPR",
+    "ASKP1", "BIDP1", "CNTG_VOL", "ACML_VOL", "ACML_TR_PBMN",
+    "SELN_CNTG_CSNU", "SHNU_CNTG_CSNU", "NTBY_CNTG_CSNU", "CTTR", "SELN_CNTG_SMTN",
+    "SHNU_CNTG_SMTN", "CCLD_DVSN", "SHNU_RATE", "PRDY_VOL_VRSS_ACML_VOL_RATE", "OPRC_HOUR",
+    "OPRC_VRSS_PRPR_SIGN", "OPRC_VRSS_PRPR", "HGPR_HOUR", "HGPR_VRSS_PRPR_SIGN",
+    "HGPR_VRSS_PRPR", "LWPR_HOUR", "LWPR_VRSS_PRPR_SIGN", "LWPR_VRSS_PRPR", "BSOP_DATE",
+    "NEW_MKOP_CLS_CODE", "TRHT_YN", "ASKP_RSQN1", "BIDP_RSQN1", "TOTAL_ASKP_RSQN",
+    "TOTAL_BIDP_RSQN", "VOL_TNRT", "PRDY_SMNS_HOUR_ACML_VOL",
+    "PRDY_SMNS_HOUR_ACML_VOL_RATE", "HOUR_CLS_CODE", "MRKT_TRTM_CLS_CODE", "VI_STND_PRC",
+)
+
+
+def orderbook_columns(depth: int) -> tuple[str, ...]:
+    """Leading columns of an order-book frame with *depth* levels per side."""
+    levels = range(1, depth + 1)
+    return (
+        ("MKSC_SHRN_ISCD", "BSOP_HOUR", "HOUR_CLS_CODE")
+        + tuple(f"ASKP{i}" for i in levels)
+        + tuple(f"BIDP{i}" for i in levels)
+        + tuple(f"ASKP_RSQN{i}" for i in levels)
+        + tuple(f"BIDP_RSQN{i}" for i in levels)
+    )
+
+
+# Only the leading, version-stable columns are listed; newer spec revisions
+# append fields, which the decoder tolerates.
+NOTICE_COLUMNS: tuple[str, ...] = (
+    "CUST_ID", "ACNT_NO", "ODER_NO", "OODER_NO", "SELN_BYOV_CLS", "RCTF_CLS",
+    "ODER_KIND", "ODER_COND", "STCK_SHRN_ISCD", "CNTG_QTY", "CNTG_UNPR",
+    "STCK_CNTG_HOUR", "RFUS_YN", "CNTG_YN", "ACPT_YN", "BRNC_NO", "ODER_QTY",
+)
+
+_MISSING = -1
+
+
+@dataclass(frozen=True, slots=True)
+class FrameLayout:
+    """Field indices for one TR_ID, resolved once at import time.
+
+    ``_MISSING`` (-1) marks a column the layout does not carry.
+    """
+
+    tr_id: str
+    kind: FrameKind
+    columns: tuple[str, ...]
+    symbol: int
+    last: int = _MISSING
+    volume: int = _MISSING
+    trade_volume: int = _MISSING
+    ask: int = _MISSING
+    bid: int = _MISSING
+    ask_quantity: int = _MISSING
+    bid_quantity: int = _MISSING
+    order_no: int = _MISSING
+    side: int = _MISSING
+    filled_quantity: int = _MISSING
+    filled_price: int = _MISSING
+    order_quantity: int = _MISSING
+    refused: int = _MISSING
+    filled_flag: int = _MISSING
+
+    @classmethod
+    def compile(
+        cls, tr_id: str, kind: FrameKind, columns: Sequence[str], **fields: str
+    ) -> FrameLayout:
+        """Build a layout, mapping each attribute to its column's index."""
+        columns = tuple(columns)
+        index = {name: i for i, name in enumerate(columns)}
+        return cls(
+            tr_id=tr_id,
+            kind=kind,
+            columns=columns,
+            **{attr: index[column] for attr, column in fields.items()},
+        )
+
+
+def _trade_layout(tr_id: str) -> FrameLayout:
+    return FrameLayout.compile(
+        tr_id,
+        "trade",
+        TRADE_COLUMNS,
+        symbol="MKSC_SHRN_ISCD",
+        last="STCK_PRPR",
+        trade_volume="CNTG_VOL",
+        volume="ACML_VOL",
+        ask="ASKP1",
+        bid="BIDP1",
+    )
+
+
+def _orderbook_layout(tr_id: str, depth: int) -> FrameLayout:
+    return FrameLayout.compile(
+        tr_id,
+        "orderbook",
+        orderbook_columns(depth),
+        symbol="MKSC_SHRN_ISCD",
+        ask="ASKP1",
+        bid="BIDP1",
+        ask_quantity="ASKP_RSQN1",
+        bid_quantity="BIDP_RSQN1",
+    )
+
+
+def _notice_layout(tr_id: str) -> FrameLayout:
+    return FrameLayout.compile(
+        tr_id,
+        "notice",
+        NOTICE_COLUMNS,
+        symbol="STCK_SHRN_ISCD",
+        order_no="ODER_NO",
+        side="SELN_BYOV_CLS",
+        filled_quantity="CNTG_QTY",
+        filled_price="CNTG_UNPR",
+        order_quantity="ODER_QTY",
+        refused="RFUS_YN",
+        filled_flag="CNTG_YN",
+    )
+
+
+# TR_ID key -> layout factory. ELW and index feeds use different columns and
+# are not decoded.
+_LAYOUT_FACTORIES: dict[str, Callable[[str], FrameLayout]] = {
+    "H0STCNT0": _trade_layout,
+    "H0NXCNT0": _trade_layout,
+    "H0UNCNT0": _trade_layout,
+    "H0STOUP0": _trade_layout,
+    "H0STASP0": lambda tr_id: _orderbook_layout(tr_id, 10),
+    "H0NXASP0": lambda tr_id: _orderbook_layout(tr_id, 10),
+    "H0UNASP0": lambda tr_id: _orderbook_layout(tr_id, 10),
+    "H0STOAA0": lambda tr_id: _orderbook_layout(tr_id, 9),
+    "H0STCNI0": _notice_layout,
+}
+
+
+def _compile_layouts() -> dict[str, FrameLayout]:
+    layouts: dict[str, FrameLayout] = {}
+    for key, factory in _LAYOUT_FACTORIES.items():
+        info = TR_IDS[key]
+        for tr_id in (info["real"], info["paper"]):
+            if tr_id:
+                layouts[tr_id] = factory(tr_id)
+    return layouts
+
+
+LAYOUTS: dict[str, FrameLayout] = _compile_layouts()
+
+
+def layout_for(tr_id: str) -> FrameLayout | None:
+    return LAYOUTS.get(tr_id)
+
+
+# ---------------------------------------------------------------------------
+# Frames
+# ---------------------------------------------------------------------------
+
+
+def is_caret_frame(message: str) -> bool:
+    """True for ``0|...`` / ``1|...`` real-time frames (as opposed to JSON)."""
+    return len(message) > 2 and message[1] == "|" and message[0] in "01"
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedFrame:
+    """One caret frame split into records.
+
+    ``records`` are list slices of the caret-split payload, one per record,
+    in frame order.
+    """
+
+    layout: FrameLayout
+    records: list[list[str]]
+
+    @property
+    def tr_id(self) -> str:
+        return self.layout.tr_id
+
+
+def split_records(data: str, count: int) -> list[list[str]]:
+    """Split ``f1^f2^...`` into *count* equal-width records."""
+    values = data.split("^")
+    if count <= 1:
+        return [values]
+    width, extra = divmod(len(values), count)
+    if width == 0 or extra:
+        raise ValueError(f"{len(values)} fields do not split into {count} records")
+    return [values[i : i + width] for i in range(0, len(values), width)]
+
+
+def _aes_decryptor(key: str, iv: str) -> Callable[[str], str]:
+    try:
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    except ImportError as e:
+        raise ImportError(
+            "Decrypting KIS execution notices requires 'cryptography'. "
+            "Install with: pip install 'stock-manager[realtime]'"
+        ) from e
+
+    cipher = Cipher(algorithms.AES(key.encode("utf-8")), modes.CBC(iv.encode("utf-8")))
+
+    def decrypt(payload: str) -> str:
+        decryptor = cipher.decryptor()
+        padded = decryptor.update(base64.b64decode(payload)) + decryptor.finalize()
+        unpadder = padding.PKCS7(128).unpadder()
+        return (unpadder.update(padded) + unpadder.finalize()).decode("utf-8")
+
+    return decrypt
+
+
+class RealtimeFrameDecoder:
+    """Splits KIS caret frames into records, decrypting them when flagged.
+
+    One instance per WebSocket connection: AES keys are per subscription.
+    """
+
+    def __init__(self) -> None:
+        self._decryptors: dict[str, Callable[[str], str]] = {}
+
+    def register_key(self, tr_id: str, key: str, iv: str) -> None:
+        """Install the AES key/IV from a subscribe response for *tr_id*.
+
+        Raises:
+            ImportError: If ``cryptography`` is not installed
+        """
+        self._decryptors[tr_id] = _aes_decryptor(key, iv)
+
+    def has_key(self, tr_id: str) -> bool:
+        return tr_id in self._decryptors
+
+    def decode(self, message: str) -> DecodedFrame | None:
+        """Decode one caret frame; None for unsupported or undecodable frames."""
+        parts = message.split("|", 3)
+        if len(parts) != 4:
+            logger.debug("Ignoring malformed realtime frame")
+            return None
+        encrypted, tr_id, count, data = parts
+        layout = LAYOUTS.get(tr_id)
+        if layout is None:
+            logger.debug("Ignoring realtime frame for unsupported TR_ID %s", tr_id)
+            return None
+
+        if encrypted == "1":
+            decrypt = self._decryptors.get(tr_id)
+            if decrypt is None:
+                logger.warning("Dropping encrypted %s frame: no AES key registered", tr_id)
+                return None
+            try:
+                data = decrypt(data)
+            except Exception:
+                logger.warning("Failed to decrypt %s frame", tr_id, exc_info=True)
+                return None
+
+        try:
+            records = split_records(data, int(count))
+        except ValueError:
+            logger.debug("Ignoring realtime frame with bad record count", exc_info=True)
+            return None
+        return DecodedFrame(layout=layout, records=records)
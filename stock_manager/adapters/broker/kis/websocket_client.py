@@ -12,6 +12,17 @@ from typing import Any, Callable, Literal, Protocol
 import websocket
 
 from stock_manager.adapters.broker.kis.exceptions import KISAPIError
+from stock_manager.adapters.broker.kis.quote_board import (
+    SOURCE_WEBSOCKET,
+    QuoteBoard,
+    get_quote_board,
+)
+from stock_manager.adapters.broker.kis.realtime_decoder import (
+    DecodedFrame,
+    FrameLayout,
+    RealtimeFrameDecoder,
+    is_caret_frame,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +50,19 @@ _EXECUTION_TR_IDS = {
     "H0STCNI9",
 }
 
+# SELN_BYOV_CLS in execution notices.
+_NOTICE_SIDES: dict[str, Literal["buy", "sell"]] = {"01": "sell", "02": "buy"}
+
+
+def _price_field(value: str) -> Decimal | None:
+    """Caret price field; KIS sends "0" for an empty book level."""
+    if not value or value == "0":
+        return None
+    try:
+        return Decimal(value)
+    except ArithmeticError:
+        return None
+
 
 WebSocketLifecycleStatus = Literal["connected", "closed", "reconnect_exhausted"]
 
@@ -86,6 +110,7 @@ class KISWebSocketLifecycleEvent:
     status: WebSocketLifecycleStatus
     timestamp: datetime
     reconnect_attempts: int | None = None
+    session: int = 0
 
 
 QuoteCallback = Callable[[KISQuoteEvent], None]
@@ -125,14 +150,20 @@ class KISWebSocketClient:
         websocket_app_factory: _WebSocketAppFactory | None = None,
         reconnect_max_attempts: int = 5,
         reconnect_base_delay_sec: float = 1.0,
+        quote_board: QuoteBoard | None = None,
+        subscription_interval_sec: float = 0.0,
     ) -> None:
         self._websocket_url = websocket_url
+        self._quote_board = quote_board if quote_board is not None else get_quote_board()
         self._is_paper_trading = (
             websocket_url == KIS_WS_URL_MOCK if is_paper_trading is None else is_paper_trading
         )
         self._websocket_app_factory = websocket_app_factory or websocket.WebSocketApp
         self._reconnect_max_attempts = max(1, reconnect_max_attempts)
         self._reconnect_base_delay_sec = max(0.1, reconnect_base_delay_sec)
+        self._subscription_interval_sec = max(0.0, subscription_interval_sec)
+        self._frame_decoder = RealtimeFrameDecoder()
+        self._last_message_at: float | None = None
 
         self._ws: _WebSocketAppLike | None = None
         self._thread: threading.Thread | None = None
@@ -156,6 +187,21 @@ class KISWebSocketClient:
     def is_connected(self) -> bool:
         return self._connected
 
+    @property
+    def quote_subscriptions(self) -> dict[str, str]:
+        """Copy of the symbol -> TR_ID quote registrations."""
+        return dict(self._quote_subscriptions)
+
+    @property
+    def subscription_count(self) -> int:
+        """Registrations this session holds (quotes plus execution notice)."""
+        return len(self._quote_subscriptions) + (self._execution_subscription is not None)
+
+    @property
+    def last_message_at(self) -> float | None:
+        """Monotonic time of the last frame received, or None."""
+        return self._last_message_at
+
     def connect(
         self,
         *,
@@ -207,15 +253,28 @@ class KISWebSocketClient:
         if callback is not None:
             self.register_quote_callback(callback)
 
+        added: list[tuple[str, str]] = []
         for symbol in symbols:
             normalized = symbol.strip().upper()
-            if not normalized:
+            if not normalized or self._quote_subscriptions.get(normalized) == tr_id:
                 continue
             self._quote_subscriptions[normalized] = tr_id
+            added.append((tr_id, normalized))
+
+        # Only new registrations go out; existing ones are already live.
+        if self._connected:
+            self._send_subscriptions(added)
+
+    def unsubscribe_quotes(self, symbols: list[str]) -> None:
+        removed: list[tuple[str, str]] = []
+        for symbol in symbols:
+            normalized = symbol.strip().upper()
+            tr_id = self._quote_subscriptions.pop(normalized, None)
+            if tr_id is not None:
+                removed.append((tr_id, normalized))
 
         if self._connected:
-            for symbol, symbol_tr_id in self._quote_subscriptions.items():
-                self._send_subscription(tr_id=symbol_tr_id, tr_key=symbol)
+            self._send_subscriptions(removed, tr_type="2")
 
     def subscribe_executions(
         self,
@@ -326,9 +385,18 @@ class KISWebSocketClient:
     def _on_message(self, _ws: Any, message: str, generation: int | None = None) -> None:
         if generation is not None and generation != self._connection_generation:
             return
+        self._last_message_at = time.monotonic()
+        if is_caret_frame(message):
+            frame = self._frame_decoder.decode(message)
+            if frame is not None:
+                self._dispatch_frame(frame)
+            return
+
         payload = self._decode_message(message)
         if payload is None:
             return
+        if self._handle_subscribe_response(payload):
+            return
 
         tr_id = self._extract_tr_id(payload)
         if not tr_id:
@@ -380,14 +448,39 @@ class KISWebSocketClient:
         )
 
     def _replay_subscriptions(self) -> None:
-        for symbol, tr_id in self._quote_subscriptions.items():
-            self._send_subscription(tr_id=tr_id, tr_key=symbol)
-
+        pending = [(tr_id, symbol) for symbol, tr_id in self._quote_subscriptions.items()]
         if self._execution_subscription is not None:
-            tr_id, tr_key = self._execution_subscription
-            self._send_subscription(tr_id=tr_id, tr_key=tr_key)
+            pending.append(self._execution_subscription)
+
+        if self._subscription_interval_sec <= 0 or len(pending) <= 1:
+            self._send_subscriptions(pending)
+            return
+
+        # Paced replay must not block the socket thread that delivers frames.
+        threading.Thread(
+            target=self._send_subscriptions,
+            args=(pending,),
+            kwargs={"generation": self._connection_generation},
+            daemon=True,
+            name="KISWebSocketReplay",
+        ).start()
 
-    def _send_subscription(self, *, tr_id: str, tr_key: str) -> None:
+    def _send_subscriptions(
+        self,
+        registrations: list[tuple[str, str]],
+        *,
+        tr_type: str = "1",
+        generation: int | None = None,
+    ) -> None:
+        """Send (tr_id, tr_key) registrations, ``subscription_interval_sec`` apart."""
+        for index, (tr_id, tr_key) in enumerate(registrations):
+            if index and self._subscription_interval_sec > 0:
+                time.sleep(self._subscription_interval_sec)
+            if generation is not None and generation != self._connection_generation:
+                return  # superseded by a newer connection's replay
+            self._send_subscription(tr_id=tr_id, tr_key=tr_key, tr_type=tr_type)
+
+    def _send_subscription(self, *, tr_id: str, tr_key: str, tr_type: str = "1") -> None:
         ws = self._ws
         if ws is None or not self._connected:
             return
@@ -396,7 +489,7 @@ class KISWebSocketClient:
             "header": {
                 "approval_key": self._approval_key,
                 "custtype": self._custtype,
-                "tr_type": "1",
+                "tr_type": tr_type,
                 "content-type": "utf-8",
             },
             "body": {
@@ -418,6 +511,25 @@ class KISWebSocketClient:
             return data
         return None
 
+    def _handle_subscribe_response(self, payload: dict[str, Any]) -> bool:
+        """Consume a subscribe ack, installing its AES key if present."""
+        body = payload.get("body")
+        if not isinstance(body, dict) or "msg_cd" not in body:
+            return False
+
+        output = body.get("output")
+        tr_id = self._extract_tr_id(payload)
+        if isinstance(output, dict) and output.get("key") and output.get("iv") and tr_id:
+            try:
+                self._frame_decoder.register_key(tr_id, str(output["key"]), str(output["iv"]))
+            except ImportError as e:
+                logger.warning("Encrypted %s frames will be dropped: %s", tr_id, e)
+        if body.get("rt_cd") not in (None, "0"):
+            logger.warning(
+                "KIS WebSocket subscription failed: %s %s", body.get("msg_cd"), body.get("msg1")
+            )
+        return True
+
     @staticmethod
     def _extract_tr_id(payload: dict[str, Any]) -> str:
         direct = payload.get("tr_id")
@@ -502,7 +614,16 @@ class KISWebSocketClient:
             tr_id=tr_id,
             raw_payload=payload,
         )
+        if symbol:
+            self._quote_board.update(
+                symbol,
+                bid=event.bid_price,
+                ask=event.ask_price,
+                source=SOURCE_WEBSOCKET,
+            )
+        self._emit_quote(event)
 
+    def _emit_quote(self, event: KISQuoteEvent) -> None:
         for callback in self._quote_callbacks:
             try:
                 callback(event)
@@ -526,6 +647,18 @@ class KISWebSocketClient:
         executed_price = self._to_decimal(record.get("cntg_pr") or record.get("price"))
         executed_quantity = self._to_decimal(record.get("cntg_qty") or record.get("qty"))
 
+        # Market trade ticks (H0STCNT0 etc.) carry the last print; own-order
+        # notices do not have stck_prpr.
+        last_price = self._to_decimal(record.get("stck_prpr"))
+        if symbol and last_price is not None:
+            volume = self._to_decimal(record.get("acml_vol"))
+            self._quote_board.update(
+                symbol,
+                last=last_price,
+                volume=int(volume) if volume is not None else None,
+                source=SOURCE_WEBSOCKET,
+            )
+
         event = KISExecutionEvent(
             symbol=symbol,
             broker_order_id=broker_order_id,
@@ -566,13 +699,133 @@ class KISWebSocketClient:
             tr_id=tr_id,
             raw_payload=payload,
         )
+        self._emit_execution(event)
 
+    def _emit_execution(self, event: KISExecutionEvent) -> None:
         for callback in self._execution_callbacks:
             try:
                 callback(event)
             except Exception:
                 logger.debug("Execution callback error", exc_info=True)
 
+    # ------------------------------------------------------------------
+    # Caret frames
+    # ------------------------------------------------------------------
+
+    def _dispatch_frame(self, frame: DecodedFrame) -> None:
+        layout = frame.layout
+        width = len(layout.columns)
+        timestamp = datetime.now(timezone.utc)
+        for fields in frame.records:
+            if len(fields) < width:
+                logger.debug("Ignoring short %s record (%s fields)", layout.tr_id, len(fields))
+                continue
+            raw_payload = {"tr_id": layout.tr_id, "fields": fields}
+            if layout.kind == "orderbook":
+                self._dispatch_orderbook_fields(fields, layout, timestamp, raw_payload)
+            elif layout.kind == "trade":
+                self._dispatch_trade_fields(fields, layout, timestamp, raw_payload)
+            else:
+                self._dispatch_notice_fields(fields, layout, timestamp, raw_payload)
+
+    def _dispatch_orderbook_fields(
+        self,
+        fields: list[str],
+        layout: FrameLayout,
+        timestamp: datetime,
+        raw_payload: dict[str, Any],
+    ) -> None:
+        symbol = fields[layout.symbol]
+        bid = _price_field(fields[layout.bid])
+        ask = _price_field(fields[layout.ask])
+        if symbol:
+            self._quote_board.update(symbol, bid=bid, ask=ask, source=SOURCE_WEBSOCKET)
+        self._emit_quote(
+            KISQuoteEvent(
+                symbol=symbol,
+                bid_price=bid,
+                ask_price=ask,
+                bid_quantity=self._to_decimal(fields[layout.bid_quantity]),
+                ask_quantity=self._to_decimal(fields[layout.ask_quantity]),
+                timestamp=timestamp,
+                tr_id=layout.tr_id,
+                raw_payload=raw_payload,
+            )
+        )
+
+    def _dispatch_trade_fields(
+        self,
+        fields: list[str],
+        layout: FrameLayout,
+        timestamp: datetime,
+        raw_payload: dict[str, Any],
+    ) -> None:
+        symbol = fields[layout.symbol]
+        last = _price_field(fields[layout.last])
+        quantity = self._to_decimal(fields[layout.trade_volume])
+        if symbol:
+            volume = fields[layout.volume]
+            self._quote_board.update(
+                symbol,
+                last=last,
+                bid=_price_field(fields[layout.bid]),
+                ask=_price_field(fields[layout.ask]),
+                volume=int(volume) if volume.isdigit() else None,
+                source=SOURCE_WEBSOCKET,
+            )
+        self._emit_execution(
+            KISExecutionEvent(
+                symbol=symbol,
+                broker_order_id=None,
+                order_id=None,
+                side=None,
+                executed_price=last,
+                price=last,
+                executed_quantity=quantity,
+                quantity=quantity,
+                cumulative_quantity=None,
+                remaining_quantity=None,
+                event_status=None,
+                timestamp=timestamp,
+                tr_id=layout.tr_id,
+                raw_payload=raw_payload,
+            )
+        )
+
+    def _dispatch_notice_fields(
+        self,
+        fields: list[str],
+        layout: FrameLayout,
+        timestamp: datetime,
+        raw_payload: dict[str, Any],
+    ) -> None:
+        # CNTG_YN "1" is an order accept/modify/cancel ack, "2" a fill. Only
+        # fills carry an executed quantity the engine can apply.
+        if fields[layout.filled_flag] != "2" or fields[layout.refused] == "Y":
+            logger.debug("Ignoring non-fill %s notice", layout.tr_id)
+            return
+        broker_order_id = fields[layout.order_no].strip() or None
+        price = _price_field(fields[layout.filled_price])
+        quantity = self._to_decimal(fields[layout.filled_quantity])
+        self._emit_execution(
+            KISExecutionEvent(
+                symbol=fields[layout.symbol],
+                broker_order_id=broker_order_id,
+                order_id=broker_order_id,
+                side=_NOTICE_SIDES.get(fields[layout.side]),
+                executed_price=price,
+                price=price,
+                executed_quantity=quantity,
+                quantity=quantity,
+                cumulative_quantity=None,
+                remaining_quantity=None,
+                event_status="filled",
+                timestamp=timestamp,
+                tr_id=layout.tr_id,
+                raw_payload=raw_payload,
+            )
+        )
+
     def _dispatch_lifecycle_event(
         self,
         *,
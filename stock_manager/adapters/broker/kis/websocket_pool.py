@@ -0,0 +1,365 @@
+"""Sharded KIS WebSocket subscription manager.
+
+Why:
+- KIS caps real-time registrations per WebSocket session (41), so a single
+  ``KISWebSocketClient`` cannot stream a large watchlist. The rest of the
+  symbols silently fell back to REST polling.
+
+``KISWebSocketPool`` spreads quote subscriptions across up to
+``max_sessions`` ``KISWebSocketClient`` sessions, each holding at most
+``max_subscriptions_per_session`` registrations. Session 0 also carries
+the execution-notice subscription. New symbols go to the least-loaded
+session that has room. When symbols are removed, trailing sessions are
+drained into the remaining ones and closed. A symbol is subscribed on its
+new session before it is released from the old one, so its quotes never
+stop.
+
+The pool is duck-type compatible with ``KISWebSocketClient``: the broker
+adapter and engine use either interchangeably. ``subscribe_quotes`` returns
+the symbols that did not fit, so callers can poll exactly those.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Callable, Literal
+
+from stock_manager.adapters.broker.kis.exceptions import KISAPIError
+from stock_manager.adapters.broker.kis.quote_board import QuoteBoard
+from stock_manager.adapters.broker.kis.websocket_client import (
+    DEFAULT_QUOTE_TR_ID,
+    ExecutionCallback,
+    KISExecutionEvent,
+    KISQuoteEvent,
+    KISWebSocketClient,
+    KISWebSocketLifecycleEvent,
+    LifecycleCallback,
+    QuoteCallback,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SUBSCRIPTIONS_PER_SESSION = 41
+
+
+@dataclass(frozen=True)
+class WebSocketSessionHealth:
+    """Point-in-time health of one pooled WebSocket session."""
+
+    session: int
+    connected: bool
+    subscriptions: int
+    capacity: int
+    last_message_age_sec: float | None
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class KISWebSocketPool:
+    """Shards real-time subscriptions over several KIS WebSocket sessions.
+
+    Args:
+        websocket_url: KIS WebSocket endpoint.
+        is_paper_trading: Paper/real mode (inferred from the URL when None).
+        max_sessions: Upper bound on concurrent sessions.
+        max_subscriptions_per_session: Registrations allowed per session.
+        subscription_interval_sec: Delay between subscribe frames on a
+            session, including reconnect replays.
+        approval_key_provider: Issues an approval key for each additional
+            session. When None, every session reuses the key given to
+            ``connect``.
+        client_factory: Builds a session; defaults to ``KISWebSocketClient``
+            with the remaining arguments.
+    """
+
+    def __init__(
+        self,
+        *,
+        websocket_url: str,
+        is_paper_trading: bool | None = None,
+        max_sessions: int = 1,
+        max_subscriptions_per_session: int = DEFAULT_MAX_SUBSCRIPTIONS_PER_SESSION,
+        subscription_interval_sec: float = 0.0,
+        approval_key_provider: Callable[[], str] | None = None,
+        client_factory: Callable[[], KISWebSocketClient] | None = None,
+        websocket_app_factory: Any | None = None,
+        reconnect_max_attempts: int = 5,
+        reconnect_base_delay_sec: float = 1.0,
+        quote_board: QuoteBoard | None = None,
+    ) -> None:
+        if max_subscriptions_per_session < 2:
+            raise ValueError("max_subscriptions_per_session must be at least 2")
+
+        self._max_sessions = max(1, max_sessions)
+        self._capacity = max_subscriptions_per_session
+        self._approval_key_provider = approval_key_provider
+        if client_factory is None:
+
+            def client_factory() -> KISWebSocketClient:
+                return KISWebSocketClient(
+                    websocket_url=websocket_url,
+                    is_paper_trading=is_paper_trading,
+                    websocket_app_factory=websocket_app_factory,
+                    reconnect_max_attempts=reconnect_max_attempts,
+                    reconnect_base_delay_sec=reconnect_base_delay_sec,
+                    quote_board=quote_board,
+                    subscription_interval_sec=subscription_interval_sec,
+                )
+
+        self._client_factory = client_factory
+        self._lock = threading.RLock()
+        self._approval_key = ""
+        self._custtype: Literal["P", "B"] = "P"
+        self._connect_timeout_sec = 5.0
+        self._connected = False
+
+        self._quote_callbacks: list[QuoteCallback] = []
+        self._execution_callbacks: list[ExecutionCallback] = []
+        self._lifecycle_callbacks: list[LifecycleCallback] = []
+        self._sessions: list[KISWebSocketClient] = []
+        self._assignments: dict[str, int] = {}
+        self._add_session()
+
+    # ------------------------------------------------------------------
+    # KISWebSocketClient-compatible surface
+    # ------------------------------------------------------------------
+
+    @property
+    def is_connected(self) -> bool:
+        return self._sessions[0].is_connected
+
+    @property
+    def sessions(self) -> tuple[KISWebSocketClient, ...]:
+        return tuple(self._sessions)
+
+    def connect(
+        self,
+        *,
+        approval_key: str,
+        custtype: Literal["P", "B"] = "P",
+        timeout_sec: float = 5.0,
+    ) -> None:
+        """Connect session 0 plus any session that already holds symbols."""
+        with self._lock:
+            self._approval_key = approval_key
+            self._custtype = custtype
+            self._connect_timeout_sec = timeout_sec
+            self._sessions[0].connect(
+                approval_key=approval_key, custtype=custtype, timeout_sec=timeout_sec
+            )
+            self._connected = True
+            for index, session in enumerate(self._sessions[1:], start=1):
+                if not session.is_connected:
+                    self._connect_session(index, session)
+
+    def disconnect(self, *, join_timeout: float = 2.0) -> None:
+        with self._lock:
+            self._connected = False
+            for session in self._sessions:
+                session.disconnect(join_timeout=join_timeout)
+
+    def register_quote_callback(self, callback: QuoteCallback) -> None:
+        self._quote_callbacks.append(callback)
+
+    def register_execution_callback(self, callback: ExecutionCallback) -> None:
+        self._execution_callbacks.append(callback)
+
+    def register_lifecycle_callback(self, callback: LifecycleCallback) -> None:
+        self._lifecycle_callbacks.append(callback)
+
+    def subscribe_quotes(
+        self,
+        symbols: list[str],
+        *,
+        callback: QuoteCallback | None = None,
+        tr_id: str = DEFAULT_QUOTE_TR_ID,
+    ) -> list[str]:
+        """Subscribe *symbols*; returns the ones no session had room for."""
+        if callback is not None:
+            self.register_quote_callback(callback)
+
+        overflow: list[str] = []
+        with self._lock:
+            batches: dict[int, list[str]] = {}
+            for symbol in symbols:
+                normalized = symbol.strip().upper()
+                if not normalized:
+                    continue
+                index = self._assignments.get(normalized)
+                if index is None:
+                    index = self._session_with_room(pending=batches)
+                if index is None:
+                    overflow.append(normalized)
+                    continue
+                self._assignments[normalized] = index
+                batches.setdefault(index, []).append(normalized)
+
+            for index, batch in batches.items():
+                self._sessions[index].subscribe_quotes(batch, tr_id=tr_id)
+
+        if overflow:
+            logger.warning(
+                "WebSocket subscription capacity exhausted",
+                extra={"overflow": len(overflow), "sessions": len(self._sessions)},
+            )
+        return overflow
+
+    def unsubscribe_quotes(self, symbols: list[str]) -> None:
+        """Release *symbols* and compact sessions that are no longer needed."""
+        with self._lock:
+            batches: dict[int, list[str]] = {}
+            for symbol in symbols:
+                normalized = symbol.strip().upper()
+                index = self._assignments.pop(normalized, None)
+                if index is not None:
+                    batches.setdefault(index, []).append(normalized)
+            for index, batch in batches.items():
+                self._sessions[index].unsubscribe_quotes(batch)
+            if batches:
+                self.rebalance()
+
+    def subscribe_executions(
+        self,
+        *,
+        callback: ExecutionCallback | None = None,
+        tr_id: str | None = None,
+        tr_key: str = "ALL",
+    ) -> None:
+        """Execution notices always ride on session 0."""
+        if callback is not None:
+            self.register_execution_callback(callback)
+        self._sessions[0].subscribe_executions(tr_id=tr_id, tr_key=tr_key)
+
+    # ------------------------------------------------------------------
+    # Sharding
+    # ------------------------------------------------------------------
+
+    def session_for(self, symbol: str) -> int | None:
+        return self._assignments.get(symbol.strip().upper())
+
+    def health(self) -> tuple[WebSocketSessionHealth, ...]:
+        """Per-session connection state and load."""
+        now = time.monotonic()
+        report = []
+        for index, session in enumerate(self._sessions):
+            last = session.last_message_at
+            report.append(
+                WebSocketSessionHealth(
+                    session=index,
+                    connected=session.is_connected,
+                    subscriptions=session.subscription_count,
+                    capacity=self._capacity,
+                    last_message_age_sec=None if last is None else round(now - last, 3),
+                )
+            )
+        return tuple(report)
+
+    def rebalance(self) -> None:
+        """Drain and close trailing sessions whose symbols fit elsewhere."""
+        with self._lock:
+            while len(self._sessions) > 1:
+                last_index = len(self._sessions) - 1
+                last = self._sessions[last_index]
+                moving = last.quote_subscriptions
+                spare = sum(
+                    self._capacity - session.subscription_count
+                    for session in self._sessions[:last_index]
+                )
+                if len(moving) > spare:
+                    return
+
+                for symbol, tr_id in moving.items():
+                    target = self._session_with_room(exclude=last_index)
+                    if target is None:
+                        # The spare check should prevent this; keep the session open.
+                        logger.warning(
+                            "No WebSocket session has room while draining; rebalance stopped",
+                            extra={"session": last_index, "symbol": symbol},
+                        )
+                        return
+                    self._sessions[target].subscribe_quotes([symbol], tr_id=tr_id)
+                    self._assignments[symbol] = target
+                    last.unsubscribe_quotes([symbol])
+
+                last.disconnect(join_timeout=0.5)
+                self._sessions.pop()
+                logger.info("Closed drained WebSocket session", extra={"session": last_index})
+
+    def _session_with_room(
+        self,
+        *,
+        pending: dict[int, list[str]] | None = None,
+        exclude: int | None = None,
+    ) -> int | None:
+        best: int | None = None
+        best_load = self._capacity
+        for index, session in enumerate(self._sessions):
+            if index == exclude:
+                continue
+            load = session.subscription_count + len((pending or {}).get(index, ()))
+            if load < best_load:
+                best, best_load = index, load
+        if best is not None:
+            return best
+        if exclude is None and len(self._sessions) < self._max_sessions:
+            return self._add_session()
+        return None
+
+    def _add_session(self) -> int | None:
+        index = len(self._sessions)
+        session = self._client_factory()
+        session.register_quote_callback(self._forward_quote)
+        session.register_execution_callback(self._forward_execution)
+        session.register_lifecycle_callback(functools.partial(self._forward_lifecycle, index))
+        if index and self._connected and not self._connect_session(index, session):
+            return None
+        self._sessions.append(session)
+        return index
+
+    def _connect_session(self, index: int, session: KISWebSocketClient) -> bool:
+        try:
+            approval_key = (
+                self._approval_key_provider()
+                if self._approval_key_provider is not None
+                else self._approval_key
+            )
+            session.connect(
+                approval_key=approval_key,
+                custtype=self._custtype,
+                timeout_sec=self._connect_timeout_sec,
+            )
+            return True
+        except KISAPIError:
+            logger.warning("Failed to open WebSocket session %s", index, exc_info=True)
+            return False
+
+    # ------------------------------------------------------------------
+    # Callback fan-in
+    # ------------------------------------------------------------------
+
+    def _forward_quote(self, event: KISQuoteEvent) -> None:
+        for callback in self._quote_callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.debug("Quote callback error", exc_info=True)
+
+    def _forward_execution(self, event: KISExecutionEvent) -> None:
+        for callback in self._execution_callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.debug("Execution callback error", exc_info=True)
+
+    def _forward_lifecycle(self, index: int, event: KISWebSocketLifecycleEvent) -> None:
+        event = replace(event, session=index)
+        for callback in self._lifecycle_callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.debug("Lifecycle callback error", exc_info=True)
@@ -4,6 +4,8 @@ Replays historical OHLCV data through the persona consensus pipeline
 to evaluate trading system performance.
 """
 
+from .bar_store import BarColumns, OHLCVStore
+from .columnar import ColumnarMarketData, SymbolColumns
 from .config import BacktestConfig
 from .data_loader import HistoricalBar, HistoricalDataLoader
 from .engine import BacktestEngine, BacktestResult
@@ -11,19 +13,41 @@ from .metrics import PerformanceMetrics, compute_metrics
 from .portfolio import Position, SimulatedPortfolio, Trade
 from .report import generate_json_report, generate_summary
 from .snapshot_builder import build_snapshot_from_bars
+from .sweep import (
+    SweepParams,
+    SweepResult,
+    SweepRunner,
+    WalkForwardResult,
+    WalkForwardWindow,
+    parameter_grid,
+    random_parameter_sample,
+    walk_forward_windows,
+)
 
 __all__ = [
     "BacktestConfig",
     "BacktestEngine",
     "BacktestResult",
+    "BarColumns",
+    "ColumnarMarketData",
     "HistoricalBar",
     "HistoricalDataLoader",
+    "OHLCVStore",
     "PerformanceMetrics",
     "Position",
     "SimulatedPortfolio",
+    "SweepParams",
+    "SweepResult",
+    "SweepRunner",
+    "SymbolColumns",
     "Trade",
+    "WalkForwardResult",
+    "WalkForwardWindow",
     "build_snapshot_from_bars",
     "compute_metrics",
     "generate_json_report",
     "generate_summary",
+    "parameter_grid",
+    "random_parameter_sample",
+    "walk_forward_windows",
 ]
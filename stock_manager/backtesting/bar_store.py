@@ -0,0 +1,345 @@
+"""Memory-mapped on-disk OHLCV store for backtesting.
+
+``HistoricalDataLoader.load_from_records`` builds a frozen ``HistoricalBar``
+of ``Decimal`` fields for every bar up front, which is slow and memory-heavy
+for a full KRX daily history. ``OHLCVStore`` keeps bars on disk instead, as
+fixed-width columns per symbol:
+
+    <root>/<symbol>/date.bin     int64   YYYYMMDD
+    <root>/<symbol>/open.bin     float64
+    <root>/<symbol>/high.bin     float64
+    <root>/<symbol>/low.bin      float64
+    <root>/<symbol>/close.bin    float64
+    <root>/<symbol>/volume.bin   int64
+
+Columns are memory-mapped read-only on first access and exposed as typed
+``memoryview`` objects, so opening a symbol costs a few syscalls and a
+date-range query is a bisect plus zero-copy slices. Pages live in the OS
+page cache and are shared by every process that maps the same files (e.g.
+sweep workers). Values use the host's native byte order.
+
+Appends, and repairs of columns left uneven by an interrupted append, hold
+an exclusive ``flock`` on ``<root>/<symbol>/.lock`` so writers in different
+processes never interleave.
+
+New bars are appended from KIS ``inquire_period_price`` /
+``inquire_daily_chart_price`` responses (or ``HistoricalBar`` lists); bars
+not newer than the last stored date are skipped, so overlapping responses
+can be appended repeatedly.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+from stock_manager.pipeline.indicators import parse_kis_ohlcv
+
+from .data_loader import HistoricalBar
+
+logger = logging.getLogger(__name__)
+
+_INT_COLUMNS = ("date", "volume")
+COLUMNS: tuple[str, ...] = ("date", "open", "high", "low", "close", "volume")
+_ITEM_SIZE = 8
+_LOCK_NAME = ".lock"
+_SYMBOL_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+def date_to_int(value: date) -> int:
+    """Encode a date as YYYYMMDD."""
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+def int_to_date(value: int) -> date:
+    """Decode a YYYYMMDD integer."""
+    return date(value // 10000, value // 100 % 100, value % 100)
+
+
+def _to_decimal(value: float) -> Decimal:
+    # KRX prices are whole won; keep them integral like load_from_records.
+    return Decimal(int(value)) if value.is_integer() else Decimal(str(value))
+
+
+@dataclass(frozen=True)
+class BarColumns:
+    """Zero-copy column views over a symbol's bars (oldest first).
+
+    ``dates`` holds YYYYMMDD integers; slicing any column, or calling
+    ``between``, never copies bar data.
+    """
+
+    symbol: str
+    dates: memoryview[int]
+    open: memoryview[float]
+    high: memoryview[float]
+    low: memoryview[float]
+    close: memoryview[float]
+    volume: memoryview[int]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def between(self, start: date, end: date) -> BarColumns:
+        """Rows with ``start <= date <= end`` (inclusive)."""
+        lo = bisect_left(self.dates, date_to_int(start))
+        hi = bisect_right(self.dates, date_to_int(end))
+        return self[lo:hi]
+
+    def __getitem__(self, rows: slice) -> BarColumns:
+        return BarColumns(
+            symbol=self.symbol,
+            dates=self.dates[rows],
+            open=self.open[rows],
+            high=self.high[rows],
+            low=self.low[rows],
+            close=self.close[rows],
+            volume=self.volume[rows],
+        )
+
+    def to_bars(self) -> list[HistoricalBar]:
+        """Materialize rows as ``HistoricalBar`` objects."""
+        return [
+            HistoricalBar(
+                date=int_to_date(d),
+                open=_to_decimal(o),
+                high=_to_decimal(h),
+                low=_to_decimal(lo),
+                close=_to_decimal(c),
+                volume=v,
+            )
+            for d, o, h, lo, c, v in zip(
+                self.dates, self.open, self.high, self.low, self.close, self.volume
+            )
+        ]
+
+
+@contextmanager
+def _directory_lock(directory: Path) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on *directory*'s lock file.
+
+    ``flock`` is per open file, so this is not re-entrant within a process.
+    """
+    if fcntl is None:  # pragma: no cover - non-POSIX platforms
+        yield
+        return
+    fd = os.open(directory / _LOCK_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # releases the lock
+
+
+def _column_sizes(directory: Path) -> list[int]:
+    return [
+        path.stat().st_size if path.exists() else 0
+        for path in (directory / f"{name}.bin" for name in COLUMNS)
+    ]
+
+
+def _truncate_to_common_length(directory: Path) -> None:
+    """Repair columns left uneven by an interrupted append.
+
+    Call with the directory lock held and before mapping the files here.
+    Only bytes past the shortest column are cut; those rows were never
+    visible through any map, so views held elsewhere are not affected.
+    """
+    sizes = _column_sizes(directory)
+    common = min(sizes) - min(sizes) % _ITEM_SIZE
+    for name, size in zip(COLUMNS, sizes):
+        if size != common:
+            with open(directory / f"{name}.bin", "ab") as f:
+                f.truncate(common)
+
+
+def _map_column(path: Path) -> memoryview:
+    """Read-only byte view of the whole items in *path* (empty if missing)."""
+    size = path.stat().st_size if path.exists() else 0
+    if size < _ITEM_SIZE:
+        return memoryview(b"")
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mm)[: size - size % _ITEM_SIZE]
+
+
+def _map_columns(symbol: str, directory: Path) -> BarColumns:
+    """Map one symbol's column files read-only.
+
+    Uneven columns are repaired under the directory lock first; an append
+    in progress elsewhere holds that lock, so it is waited for rather than
+    truncated. The maps are never closed explicitly: the views keep them
+    alive, and they are unmapped once the last view (including caller-held
+    slices) is garbage collected. Appending to a mapped file is safe;
+    existing maps simply do not see the new rows.
+    """
+    if directory.is_dir() and len(set(_column_sizes(directory))) > 1:
+        with _directory_lock(directory):
+            _truncate_to_common_length(directory)
+    raw = {name: _map_column(directory / f"{name}.bin") for name in COLUMNS}
+
+    # A concurrent append can leave columns momentarily uneven; only rows
+    # present in every column are visible.
+    count = min(len(view) for view in raw.values()) // _ITEM_SIZE
+    return BarColumns(
+        symbol=symbol,
+        dates=raw["date"].cast("q")[:count],
+        open=raw["open"].cast("d")[:count],
+        high=raw["high"].cast("d")[:count],
+        low=raw["low"].cast("d")[:count],
+        close=raw["close"].cast("d")[:count],
+        volume=raw["volume"].cast("q")[:count],
+    )
+
+
+class OHLCVStore:
+    """Per-symbol, memory-mapped, append-only daily bar store.
+
+    Args:
+        root: Directory holding one sub-directory per symbol.
+
+    Usage:
+        store = OHLCVStore(Path("~/.stock_manager/bars"))
+        store.append_kis_output("005930", response["output2"])
+        cols = store.columns("005930").between(date(2020, 1, 1), date(2024, 12, 31))
+        closes = cols.close            # memoryview of float64, no copy
+
+    Thread-safe; instances can be pickled to worker processes, which
+    re-map the files lazily.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root).expanduser()
+        self._lock = threading.RLock()
+        self._mapped: dict[str, BarColumns] = {}
+
+    def __reduce__(self) -> tuple[type[OHLCVStore], tuple[Path]]:
+        # Unpickle as a fresh store; maps are re-opened lazily.
+        return (OHLCVStore, (self.root,))
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def symbols(self) -> list[str]:
+        """Symbols with a column directory, sorted."""
+        if not self.root.is_dir():
+            return []
+        return sorted(
+            p.name for p in self.root.iterdir() if p.is_dir() and (p / "date.bin").exists()
+        )
+
+    def has_symbol(self, symbol: str) -> bool:
+        return _SYMBOL_RE.match(symbol) is not None and (self._dir(symbol) / "date.bin").exists()
+
+    def columns(self, symbol: str) -> BarColumns:
+        """Mapped columns for *symbol* (empty if the symbol is unknown)."""
+        with self._lock:
+            columns = self._mapped.get(symbol)
+            if columns is None:
+                columns = _map_columns(symbol, self._dir(symbol))
+                self._mapped[symbol] = columns
+            return columns
+
+    def get_bars(self, symbol: str, start: date, end: date) -> list[HistoricalBar]:
+        """Materialize only the bars in ``[start, end]``."""
+        return self.columns(symbol).between(start, end).to_bars()
+
+    def last_date(self, symbol: str) -> date | None:
+        cols = self.columns(symbol)
+        return int_to_date(cols.dates[-1]) if len(cols) else None
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def append(self, symbol: str, bars: Iterable[HistoricalBar]) -> int:
+        """Append bars newer than the last stored date. Returns rows written."""
+        rows = [
+            (
+                date_to_int(b.date),
+                float(b.open),
+                float(b.high),
+                float(b.low),
+                float(b.close),
+                int(b.volume),
+            )
+            for b in bars
+        ]
+        rows.sort(key=lambda r: r[0])
+        return self._append_rows(symbol, rows)
+
+    def append_kis_output(self, symbol: str, output: list[dict]) -> int:
+        """Append a KIS daily-price response (``output`` / ``output2`` list)."""
+        rows = []
+        for bar in parse_kis_ohlcv(output):
+            try:
+                day = int(bar.date)
+            except ValueError:
+                continue
+            rows.append((day, bar.open, bar.high, bar.low, bar.close, bar.volume))
+        rows.sort(key=lambda r: r[0])
+        return self._append_rows(symbol, rows)
+
+    def close(self) -> None:
+        """Drop cached maps (re-opened lazily on next read)."""
+        with self._lock:
+            self._mapped.clear()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _dir(self, symbol: str) -> Path:
+        if not _SYMBOL_RE.match(symbol):
+            raise ValueError(f"Invalid symbol for bar store: {symbol!r}")
+        return self.root / symbol
+
+    def _append_rows(self, symbol: str, rows: list[tuple]) -> int:
+        directory = self._dir(symbol)
+        if not rows:
+            return 0
+        with self._lock:
+            directory.mkdir(parents=True, exist_ok=True)
+            with _directory_lock(directory):
+                _truncate_to_common_length(directory)
+                # Re-map so rows appended by other processes set the cutoff;
+                # cached views would not see the new rows either.
+                self._mapped.pop(symbol, None)
+                last = self.last_date(symbol)
+                self._mapped.pop(symbol, None)
+                cutoff = date_to_int(last) if last is not None else 0
+                fresh: list[tuple] = []
+                for row in rows:
+                    if row[0] > cutoff:
+                        fresh.append(row)
+                        cutoff = row[0]
+                if not fresh:
+                    return 0
+
+                for index, name in enumerate(COLUMNS):
+                    values = array(
+                        "q" if name in _INT_COLUMNS else "d", (r[index] for r in fresh)
+                    )
+                    with open(directory / f"{name}.bin", "ab") as f:
+                        f.write(values.tobytes())
+                        f.flush()
+                        os.fsync(f.fileno())
+            logger.debug("Appended %d bar(s) for %s", len(fresh), symbol)
+            return len(fresh)
@@ -0,0 +1,202 @@
+"""Columnar market data for the backtest engine.
+
+The original replay loop located each day's bar with a linear scan of every
+symbol's bar list (twice on rebalance days) and rebuilt moving averages,
+RSI and 52-week extremes from Python slices for every snapshot, which made a
+run O(days² × symbols).
+
+``ColumnarMarketData`` loads the requested range once and lays each symbol
+out as parallel columns (date, OHLC, volume) plus a row index aligned to a
+shared trading calendar, so "bar for symbol S on calendar day D" is a list
+lookup. Snapshot features are precomputed per symbol from prefix sums and
+sliding-window extremes:
+
+    sma_20 / sma_50 / sma_200   prefix sums of closes       O(1) per row
+    rsi_14 (simple average)     prefix sums of gains/losses O(1) per row
+    avg_volume_20d              integer prefix sums         exact
+    52-week high / low          monotonic deques            exact
+
+Values match ``build_snapshot_from_bars`` (SMA/RSI to float rounding).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from stock_manager.trading.personas.models import MarketSnapshot
+
+from .data_loader import HistoricalBar, HistoricalDataLoader
+
+_RSI_PERIOD = 14
+_AVG_VOLUME_WINDOW = 20
+_EXTREME_WINDOW = 250  # ~52 weeks of KRX sessions
+
+
+def _prefix_sums(values: list, zero=0):
+    """``sums[i]`` = sum of ``values[:i]`` (length ``len(values) + 1``)."""
+    sums = [zero]
+    total = zero
+    for v in values:
+        total += v
+        sums.append(total)
+    return sums
+
+
+def _sliding_extreme(values: list[Decimal], window: int, use_max: bool) -> list[Decimal]:
+    """Max (or min) of ``values[max(0, i - window + 1) : i + 1]`` for every i."""
+    result: list[Decimal] = []
+    candidates: deque[int] = deque()
+    for i, v in enumerate(values):
+        while candidates and (
+            values[candidates[-1]] <= v if use_max else values[candidates[-1]] >= v
+        ):
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        result.append(values[candidates[0]])
+    return result
+
+
+class SymbolColumns:
+    """One symbol's bars as parallel columns with precomputed features.
+
+    Rows are ordered by date; ``row_of`` maps a date to its row.
+    """
+
+    def __init__(self, symbol: str, bars: list[HistoricalBar]) -> None:
+        self.symbol = symbol
+        self.dates: list[date] = [b.date for b in bars]
+        self.open: list[Decimal] = [b.open for b in bars]
+        self.high: list[Decimal] = [b.high for b in bars]
+        self.low: list[Decimal] = [b.low for b in bars]
+        self.close: list[Decimal] = [b.close for b in bars]
+        self.volume: list[int] = [b.volume for b in bars]
+        self.row_of: dict[date, int] = {d: i for i, d in enumerate(self.dates)}
+
+        closes = [float(c) for c in self.close]
+        changes = [0.0] + [closes[i] - closes[i - 1] for i in range(1, len(closes))]
+        self._close_sums = _prefix_sums(closes, 0.0)
+        self._gain_sums = _prefix_sums([max(c, 0.0) for c in changes], 0.0)
+        self._loss_sums = _prefix_sums([max(-c, 0.0) for c in changes], 0.0)
+        self._loss_days = _prefix_sums([1 if c < 0 else 0 for c in changes])
+        self._volume_sums = _prefix_sums(self.volume)
+        self._high_52w = _sliding_extreme(self.high, _EXTREME_WINDOW, use_max=True)
+        self._low_52w = _sliding_extreme(self.low, _EXTREME_WINDOW, use_max=False)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def bar(self, row: int) -> HistoricalBar:
+        """Materialize a single row as a HistoricalBar."""
+        return HistoricalBar(
+            date=self.dates[row],
+            open=self.open[row],
+            high=self.high[row],
+            low=self.low[row],
+            close=self.close[row],
+            volume=self.volume[row],
+        )
+
+    # ------------------------------------------------------------------
+    # Features
+    # ------------------------------------------------------------------
+
+    def sma(self, row: int, window: int) -> float:
+        """Mean close of the last ``window`` rows (fewer near the start)."""
+        span = min(window, row + 1)
+        return (self._close_sums[row + 1] - self._close_sums[row + 1 - span]) / span
+
+    def rsi(self, row: int, period: int = _RSI_PERIOD) -> float:
+        """Simple-average RSI over the last ``period`` changes (50.0 if short)."""
+        if row < period:
+            return 50.0
+        lo, hi = row + 1 - period, row + 1
+        if self._loss_days[hi] - self._loss_days[lo] == 0:
+            return 100.0
+        avg_gain = (self._gain_sums[hi] - self._gain_sums[lo]) / period
+        avg_loss = (self._loss_sums[hi] - self._loss_sums[lo]) / period
+        return round(100.0 - (100.0 / (1.0 + avg_gain / avg_loss)), 2)
+
+    def avg_volume(self, row: int, window: int = _AVG_VOLUME_WINDOW) -> int:
+        span = min(window, row + 1)
+        return (self._volume_sums[row + 1] - self._volume_sums[row + 1 - span]) // span
+
+    def snapshot(self, row: int) -> MarketSnapshot:
+        """Equivalent of ``build_snapshot_from_bars(symbol, bars, row)``."""
+        if row < 0 or row >= len(self.dates):
+            return MarketSnapshot()
+        return MarketSnapshot(
+            symbol=self.symbol,
+            timestamp=datetime.now(timezone.utc),
+            current_price=self.close[row],
+            open_price=self.open[row],
+            high_price=self.high[row],
+            low_price=self.low[row],
+            prev_close=self.close[row - 1] if row > 0 else self.open[row],
+            volume=self.volume[row],
+            avg_volume_20d=self.avg_volume(row),
+            sma_20=self.sma(row, 20),
+            sma_50=self.sma(row, 50),
+            sma_200=self.sma(row, 200),
+            rsi_14=self.rsi(row),
+            price_52w_high=self._high_52w[row],
+            price_52w_low=self._low_52w[row],
+        )
+
+
+class ColumnarMarketData:
+    """Symbols aligned to a shared trading calendar for one backtest range.
+
+    Attributes:
+        calendar: Sorted union of trading dates across all loaded symbols.
+        columns: Per-symbol columns, in the order symbols were requested.
+        rows: ``rows[symbol][day]`` is the symbol's row on calendar day
+            ``day``, or -1 when the symbol did not trade that day.
+    """
+
+    def __init__(self, columns: dict[str, SymbolColumns]) -> None:
+        self.columns = columns
+        self.calendar: list[date] = sorted({d for c in columns.values() for d in c.dates})
+        day_of = {d: i for i, d in enumerate(self.calendar)}
+        self.rows: dict[str, list[int]] = {}
+        for symbol, col in columns.items():
+            aligned = [-1] * len(self.calendar)
+            for row, d in enumerate(col.dates):
+                day = day_of[d]
+                if aligned[day] < 0:  # duplicate dates: first bar wins
+                    aligned[day] = row
+            self.rows[symbol] = aligned
+
+    @classmethod
+    def from_loader(
+        cls,
+        loader: HistoricalDataLoader,
+        symbols: list[str],
+        start: date,
+        end: date,
+    ) -> ColumnarMarketData:
+        """Load ``[start, end]`` for each symbol; symbols without bars are dropped."""
+        columns: dict[str, SymbolColumns] = {}
+        for symbol in symbols:
+            if symbol in columns:
+                continue
+            bars = loader.get_bars(symbol, start, end)
+            if bars:
+                columns[symbol] = SymbolColumns(symbol, bars)
+        return cls(columns)
+
+    def row(self, symbol: str, day: int) -> int:
+        """Row of *symbol* on calendar day index *day*, or -1."""
+        return self.rows[symbol][day]
+
+    def closes_on(self, day: int) -> dict[str, Decimal]:
+        """Close price of every symbol that traded on calendar day *day*."""
+        prices: dict[str, Decimal] = {}
+        for symbol, col in self.columns.items():
+            row = self.rows[symbol][day]
+            if row >= 0:
+                prices[symbol] = col.close[row]
+        return prices
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bar_store import OHLCVStore
 
 
 @dataclass(frozen=True)
@@ -22,12 +27,19 @@ class HistoricalBar:
 class HistoricalDataLoader:
     """Loads historical OHLCV data for backtesting.
 
-    Currently supports loading from list of dicts (in-memory).
-    Future: CSV files, database, API.
+    Sources:
+        - ``load_from_records``: list of dicts, held in memory.
+        - ``store``: an ``OHLCVStore`` of memory-mapped columns. Symbols not
+          loaded from records are read from the store on demand, and only
+          the requested date range is materialized. Symbols in neither
+          source (or not valid store names) have no bars.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, store: OHLCVStore | None = None) -> None:
         self._cache: dict[str, list[HistoricalBar]] = {}
+        # Sorted date column per symbol, for bisect range lookups.
+        self._dates: dict[str, list[date]] = {}
+        self._store = store
 
     def load_from_records(self, symbol: str, records: list[dict]) -> None:
         """Load bars from list of dicts with keys: date, open, high, low, close, volume."""
@@ -47,20 +59,32 @@ class HistoricalDataLoader:
             )
         bars.sort(key=lambda b: b.date)
         self._cache[symbol] = bars
+        self._dates[symbol] = [b.date for b in bars]
 
     def get_bars(self, symbol: str, start: date, end: date) -> list[HistoricalBar]:
         """Get bars for symbol within date range (inclusive)."""
+        store = self._store
+        if symbol not in self._cache and store is not None and store.has_symbol(symbol):
+            return store.get_bars(symbol, start, end)
         all_bars = self._cache.get(symbol, [])
-        return [b for b in all_bars if start <= b.date <= end]
+        dates = self._dates.get(symbol, [])
+        return all_bars[bisect_left(dates, start) : bisect_right(dates, end)]
 
     def get_bar_on_date(self, symbol: str, target: date) -> HistoricalBar | None:
         """Get single bar for exact date, or None."""
-        bars = self._cache.get(symbol, [])
-        for b in bars:
-            if b.date == target:
-                return b
+        store = self._store
+        if symbol not in self._cache and store is not None and store.has_symbol(symbol):
+            bars = store.get_bars(symbol, target, target)
+            return bars[0] if bars else None
+        dates = self._dates.get(symbol, [])
+        i = bisect_left(dates, target)
+        if i < len(dates) and dates[i] == target:
+            return self._cache[symbol][i]
         return None
 
     def available_symbols(self) -> list[str]:
         """Return list of symbols with loaded data."""
-        return list(self._cache.keys())
+        symbols = list(self._cache.keys())
+        if self._store is not None:
+            symbols.extend(s for s in self._store.symbols() if s not in self._cache)
+        return symbols
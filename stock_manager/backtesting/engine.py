@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
 from decimal import Decimal
 
+from stock_manager.trading.consensus.aggregator import VoteAggregator
+
+from .columnar import ColumnarMarketData
 from .config import BacktestConfig
 from .data_loader import HistoricalDataLoader
 from .metrics import PerformanceMetrics, compute_metrics
 from .portfolio import SimulatedPortfolio
-from .snapshot_builder import build_snapshot_from_bars
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,10 @@ class BacktestResult:
 class BacktestEngine:
     """Runs backtests by replaying historical data through personas.
 
+    Entry decision: a simple majority of BUY votes, or, when an
+    ``aggregator`` (VoteAggregator) is given, its ``passes_threshold``
+    verdict so consensus parameters can be backtested.
+
     Usage:
         loader = HistoricalDataLoader()
         loader.load_from_records("005930", records)
@@ -40,41 +45,30 @@ class BacktestEngine:
     """
 
     def __init__(
-        self, data_loader: HistoricalDataLoader, personas: list | None = None
+        self,
+        data_loader: HistoricalDataLoader,
+        personas: list | None = None,
+        aggregator: VoteAggregator | None = None,
     ) -> None:
         self._loader = data_loader
         self._personas = personas or []
+        self._aggregator = aggregator
 
     def run(self, config: BacktestConfig) -> BacktestResult:
         """Run backtest with given configuration."""
         portfolio = SimulatedPortfolio(config.initial_capital, config.commission_rate)
 
-        # Get all trading dates across all symbols
-        all_dates: set[date] = set()
-        symbol_bars: dict[str, list] = {}
-        for symbol in config.symbols:
-            bars = self._loader.get_bars(symbol, config.start_date, config.end_date)
-            if bars:
-                symbol_bars[symbol] = bars
-                for b in bars:
-                    all_dates.add(b.date)
-
-        if not all_dates:
+        # Columnar view of every symbol, aligned to the union trading calendar
+        market = ColumnarMarketData.from_loader(
+            self._loader, config.symbols, config.start_date, config.end_date
+        )
+        if not market.calendar:
             metrics = compute_metrics([], [])
             return BacktestResult(config, portfolio, metrics)
 
-        sorted_dates = sorted(all_dates)
-        day_count = 0
-
-        for current_date in sorted_dates:
-            day_count += 1
-            current_prices: dict[str, Decimal] = {}
-
-            # Get current prices
-            for symbol, bars in symbol_bars.items():
-                bar = next((b for b in bars if b.date == current_date), None)
-                if bar:
-                    current_prices[symbol] = bar.close
+        for day, current_date in enumerate(market.calendar):
+            day_count = day + 1
+            current_prices: dict[str, Decimal] = market.closes_on(day)
 
             # Check exits for existing positions
             for symbol in list(portfolio.positions.keys()):
@@ -90,36 +84,19 @@ class BacktestEngine:
 
             # Evaluate new entries on rebalance days
             if day_count % config.rebalance_interval_days == 0:
-                for symbol, bars in symbol_bars.items():
+                for symbol, columns in market.columns.items():
                     if symbol in portfolio.positions:
                         continue
                     if portfolio.position_count >= config.max_positions:
                         break
 
-                    # Find current bar index
-                    bar_idx = next(
-                        (i for i, b in enumerate(bars) if b.date == current_date),
-                        None,
-                    )
-                    if bar_idx is None or bar_idx < 20:
+                    bar_idx = market.row(symbol, day)
+                    if bar_idx < 20:  # not trading today, or too little history
                         continue
 
-                    # Build snapshot and evaluate
-                    snapshot = build_snapshot_from_bars(symbol, bars, bar_idx)
-                    buy_votes = 0
-                    for persona in self._personas:
-                        try:
-                            vote = persona.screen_rule(snapshot)
-                            if vote.action.value == "buy":
-                                buy_votes += 1
-                        except Exception:
-                            pass
-
-                    # Simple threshold: majority buy
-                    if (
-                        len(self._personas) > 0
-                        and buy_votes > len(self._personas) // 2
-                    ):
+                    # Build snapshot from precomputed features and evaluate
+                    snapshot = columns.snapshot(bar_idx)
+                    if self._should_buy(snapshot):
                         price = current_prices[symbol]
                         max_value = portfolio.cash * Decimal(
                             str(config.position_size_pct / 100)
@@ -132,3 +109,22 @@ class BacktestEngine:
 
         metrics = compute_metrics(portfolio.equity_curve, portfolio.trades)
         return BacktestResult(config, portfolio, metrics)
+
+    def _should_buy(self, snapshot) -> bool:
+        """Collect persona votes for *snapshot* and apply the entry rule."""
+        votes = []
+        buy_votes = 0
+        for persona in self._personas:
+            try:
+                vote = persona.screen_rule(snapshot)
+                if vote.action.value == "buy":
+                    buy_votes += 1
+                votes.append(vote)
+            except Exception:
+                pass
+
+        if self._aggregator is not None:
+            return bool(votes) and self._aggregator.aggregate(votes).passes_threshold
+
+        # Simple threshold: majority buy
+        return len(self._personas) > 0 and buy_votes > len(self._personas) // 2
@@ -0,0 +1,416 @@
+"""Parallel parameter sweeps and walk-forward evaluation for backtests.
+
+``BacktestEngine`` runs one ``BacktestConfig`` at a time and
+``consensus/ab_comparison.py`` compares two aggregator configs on a single
+vote set. Tuning the consensus threshold, position sizing and persona mix
+therefore meant a manual loop of single runs.
+
+``SweepRunner`` evaluates many ``SweepParams`` combinations, built with
+``parameter_grid`` or ``random_parameter_sample``, on a process pool. Bar
+data is handed to each worker once through the pool initializer; under the
+default fork start method it is inherited read-only rather than pickled per
+task. Results come back ranked by a metric and can be written as a table.
+
+Walk-forward mode splits the trading calendar into rolling train/test
+windows. Every combination runs on each train window, and the best one is
+then scored on the following out-of-sample test window.
+
+Usage:
+    params = parameter_grid(threshold=[5, 6, 7], position_size_pct=[5.0, 10.0])
+    runner = SweepRunner(loader, max_workers=8)
+    ranked = runner.run(base_config, params)
+    write_sweep_csv(ranked, Path("sweep.csv"))
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import logging
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+
+from stock_manager.trading.consensus.aggregator import VoteAggregator
+
+from .config import BacktestConfig
+from .data_loader import HistoricalDataLoader
+from .engine import BacktestEngine
+from .metrics import PerformanceMetrics
+
+logger = logging.getLogger(__name__)
+
+PersonaFactory = Callable[[], list]
+"""Zero-argument, picklable callable returning persona instances."""
+
+_LOWER_IS_BETTER = frozenset({"max_drawdown_pct", "max_consecutive_losses"})
+
+
+def default_backtest_personas() -> list:
+    """Rule-based personas usable offline.
+
+    Soros is excluded because its boom-bust detector needs a live KIS client.
+    """
+    from stock_manager.trading.personas.buffett_persona import BuffettPersona
+    from stock_manager.trading.personas.dalio_persona import DalioPersona
+    from stock_manager.trading.personas.fisher_persona import FisherPersona
+    from stock_manager.trading.personas.graham_persona import GrahamPersona
+    from stock_manager.trading.personas.livermore_persona import LivermorePersona
+    from stock_manager.trading.personas.lynch_persona import LynchPersona
+    from stock_manager.trading.personas.munger_persona import MungerPersona
+    from stock_manager.trading.personas.simons_persona import SimonsPersona
+    from stock_manager.trading.personas.templeton_persona import TempletonPersona
+
+    return [
+        BuffettPersona(),
+        GrahamPersona(),
+        LynchPersona(),
+        MungerPersona(),
+        DalioPersona(),
+        FisherPersona(),
+        TempletonPersona(),
+        LivermorePersona(),
+        SimonsPersona(),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Parameters
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SweepParams:
+    """One combination of consensus and portfolio parameters.
+
+    Attributes mirror ``VoteAggregator`` and ``BacktestConfig``; ``personas``
+    restricts the voting panel to the named personas (None = all).
+    """
+
+    threshold: int = 6
+    quorum_pct: float = 0.70
+    min_conviction: float = 0.60
+    min_category_diversity: int = 3
+    position_size_pct: float = 10.0
+    rebalance_interval_days: int = 5
+    personas: tuple[str, ...] | None = None
+
+    def aggregator(self) -> VoteAggregator:
+        return VoteAggregator(
+            threshold=self.threshold,
+            quorum_pct=self.quorum_pct,
+            min_conviction=self.min_conviction,
+            min_category_diversity=self.min_category_diversity,
+        )
+
+    def apply(self, config: BacktestConfig) -> BacktestConfig:
+        """Return *config* with this combination's portfolio settings."""
+        return replace(
+            config,
+            position_size_pct=self.position_size_pct,
+            rebalance_interval_days=self.rebalance_interval_days,
+        )
+
+    def select_personas(self, personas: list) -> list:
+        if self.personas is None:
+            return list(personas)
+        wanted = set(self.personas)
+        return [p for p in personas if getattr(p, "name", None) in wanted]
+
+    def label(self) -> str:
+        panel = "all" if self.personas is None else "+".join(self.personas)
+        return (
+            f"t={self.threshold} q={self.quorum_pct:g} c={self.min_conviction:g} "
+            f"d={self.min_category_diversity} size={self.position_size_pct:g}% "
+            f"rebal={self.rebalance_interval_days} personas={panel}"
+        )
+
+
+_PARAM_FIELDS = tuple(f.name for f in fields(SweepParams))
+
+
+def _check_axes(axes: dict[str, Sequence[Any]]) -> None:
+    unknown = sorted(set(axes) - set(_PARAM_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown sweep parameter(s): {', '.join(unknown)}")
+    for name, values in axes.items():
+        if len(values) == 0:
+            raise ValueError(f"Sweep axis '{name}' has no values")
+
+
+def _normalize(name: str, value: Any) -> Any:
+    if name == "personas" and value is not None:
+        return tuple(value)
+    return value
+
+
+def parameter_grid(**axes: Sequence[Any]) -> list[SweepParams]:
+    """Full cartesian product over the given axes (others keep defaults)."""
+    _check_axes(axes)
+    names = list(axes)
+    return [
+        SweepParams(**{n: _normalize(n, v) for n, v in zip(names, combo)})
+        for combo in itertools.product(*(axes[n] for n in names))
+    ]
+
+
+def random_parameter_sample(
+    n: int, *, seed: int | None = None, **axes: Sequence[Any]
+) -> list[SweepParams]:
+    """Up to *n* distinct combinations drawn uniformly from the grid."""
+    _check_axes(axes)
+    grid = parameter_grid(**axes)
+    if n >= len(grid):
+        return grid
+    return random.Random(seed).sample(grid, n)
+
+
+# ---------------------------------------------------------------------------
+# Walk-forward windows
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """In-sample (train) and following out-of-sample (test) date ranges."""
+
+    train_start: date
+    train_end: date
+    test_start: date
+    test_end: date
+
+
+def walk_forward_windows(
+    calendar: Sequence[date],
+    train_days: int,
+    test_days: int,
+    step_days: int | None = None,
+) -> list[WalkForwardWindow]:
+    """Rolling windows over a sorted trading calendar (counts in sessions).
+
+    ``step_days`` defaults to ``test_days`` so test windows tile the calendar.
+    """
+    if train_days <= 0 or test_days <= 0:
+        raise ValueError("train_days and test_days must be positive")
+    step = step_days or test_days
+    windows: list[WalkForwardWindow] = []
+    start = 0
+    while start + train_days + test_days <= len(calendar):
+        test_first = start + train_days
+        windows.append(
+            WalkForwardWindow(
+                train_start=calendar[start],
+                train_end=calendar[test_first - 1],
+                test_start=calendar[test_first],
+                test_end=calendar[test_first + test_days - 1],
+            )
+        )
+        start += step
+    return windows
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """Metrics for one parameter combination over one date range."""
+
+    params: SweepParams
+    metrics: PerformanceMetrics
+    start_date: date
+    end_date: date
+
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    """Best in-sample combination for a window and its out-of-sample score."""
+
+    window: WalkForwardWindow
+    best: SweepResult
+    test: SweepResult
+
+
+def rank_results(
+    results: Iterable[SweepResult], rank_by: str = "sharpe_ratio"
+) -> list[SweepResult]:
+    """Sort best-first by a ``PerformanceMetrics`` field."""
+    if rank_by not in PerformanceMetrics.__dataclass_fields__:
+        raise ValueError(f"Unknown ranking metric: {rank_by}")
+    return sorted(
+        results,
+        key=lambda r: getattr(r.metrics, rank_by),
+        reverse=rank_by not in _LOWER_IS_BETTER,
+    )
+
+
+def _result_row(rank: int, result: SweepResult) -> dict[str, Any]:
+    params = asdict(result.params)
+    params["personas"] = "all" if result.params.personas is None else "+".join(
+        result.params.personas
+    )
+    return {
+        "rank": rank,
+        "start_date": result.start_date.isoformat(),
+        "end_date": result.end_date.isoformat(),
+        **params,
+        **asdict(result.metrics),
+    }
+
+
+def write_sweep_csv(results: Sequence[SweepResult], path: Path) -> None:
+    """Write ranked results (in the given order) as CSV."""
+    rows = [_result_row(i, r) for i, r in enumerate(results, start=1)]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if not rows:
+            return
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_sweep_table(results: Sequence[SweepResult], top: int | None = 20) -> str:
+    """Human-readable ranked table."""
+    lines = [f"{'#':>3}  {'Sharpe':>7}  {'Return%':>8}  {'MaxDD%':>7}  {'Trades':>6}  Params"]
+    for i, r in enumerate(results[:top] if top else results, start=1):
+        m = r.metrics
+        lines.append(
+            f"{i:>3}  {m.sharpe_ratio:>7.2f}  {m.total_return_pct:>8.2f}  "
+            f"{m.max_drawdown_pct:>7.2f}  {m.total_trades:>6}  {r.params.label()}"
+        )
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(loader: HistoricalDataLoader, persona_factory: PersonaFactory) -> None:
+    _worker_state["loader"] = loader
+    _worker_state["personas"] = persona_factory()
+
+
+def _run_one(config: BacktestConfig, params: SweepParams) -> PerformanceMetrics:
+    engine = BacktestEngine(
+        _worker_state["loader"],
+        personas=params.select_personas(_worker_state["personas"]),
+        aggregator=params.aggregator(),
+    )
+    return engine.run(params.apply(config)).metrics
+
+
+class SweepRunner:
+    """Runs parameter combinations in parallel over shared bar data.
+
+    Args:
+        loader: Historical data (read-only during the sweep).
+        persona_factory: Builds the full persona panel once per worker.
+            Must be picklable (a module-level function) when
+            ``max_workers > 1``.
+        max_workers: Worker processes. ``None`` or ``1`` runs in-process.
+        rank_by: ``PerformanceMetrics`` field used for ranking and for
+            picking the walk-forward winner.
+    """
+
+    def __init__(
+        self,
+        loader: HistoricalDataLoader,
+        persona_factory: PersonaFactory = default_backtest_personas,
+        *,
+        max_workers: int | None = None,
+        rank_by: str = "sharpe_ratio",
+    ) -> None:
+        if rank_by not in PerformanceMetrics.__dataclass_fields__:
+            raise ValueError(f"Unknown ranking metric: {rank_by}")
+        self._loader = loader
+        self._persona_factory = persona_factory
+        self.max_workers = max_workers
+        self.rank_by = rank_by
+
+    def run(self, base_config: BacktestConfig, params: Sequence[SweepParams]) -> list[SweepResult]:
+        """Run every combination over ``base_config``'s date range, ranked."""
+        tasks = [(base_config, p) for p in params]
+        return rank_results(self._execute(tasks), self.rank_by)
+
+    def walk_forward(
+        self,
+        base_config: BacktestConfig,
+        params: Sequence[SweepParams],
+        *,
+        train_days: int,
+        test_days: int,
+        step_days: int | None = None,
+    ) -> list[WalkForwardResult]:
+        """Optimize on each train window, then score the winner out of sample."""
+        windows = walk_forward_windows(
+            self._calendar(base_config), train_days, test_days, step_days
+        )
+        if not windows or not params:
+            return []
+
+        train_tasks = [
+            (replace(base_config, start_date=w.train_start, end_date=w.train_end), p)
+            for w in windows
+            for p in params
+        ]
+        train_results = self._execute(train_tasks)
+
+        winners: list[SweepResult] = []
+        for i in range(len(windows)):
+            chunk = train_results[i * len(params) : (i + 1) * len(params)]
+            winners.append(rank_results(chunk, self.rank_by)[0])
+
+        test_tasks = [
+            (replace(base_config, start_date=w.test_start, end_date=w.test_end), best.params)
+            for w, best in zip(windows, winners)
+        ]
+        test_results = self._execute(test_tasks)
+        return [
+            WalkForwardResult(window=w, best=best, test=test)
+            for w, best, test in zip(windows, winners, test_results)
+        ]
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _calendar(self, config: BacktestConfig) -> list[date]:
+        dates: set[date] = set()
+        for symbol in config.symbols:
+            bars = self._loader.get_bars(symbol, config.start_date, config.end_date)
+            dates.update(b.date for b in bars)
+        return sorted(dates)
+
+    def _execute(self, tasks: list[tuple[BacktestConfig, SweepParams]]) -> list[SweepResult]:
+        """Run tasks and return results in task order."""
+        if not tasks:
+            return []
+        if not self.max_workers or self.max_workers <= 1 or len(tasks) == 1:
+            _init_worker(self._loader, self._persona_factory)
+            try:
+                metrics = [_run_one(config, p) for config, p in tasks]
+            finally:
+                _worker_state.clear()
+        else:
+            configs, param_list = zip(*tasks)
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(tasks)),
+                initializer=_init_worker,
+                initargs=(self._loader, self._persona_factory),
+            ) as pool:
+                metrics = list(pool.map(_run_one, configs, param_list))
+        logger.info("Sweep finished %d backtest(s)", len(tasks))
+        return [
+            SweepResult(params=p, metrics=m, start_date=config.start_date, end_date=config.end_date)
+            for (config, p), m in zip(tasks, metrics)
+        ]
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from stock_manager.trading.logging.log_index import DecisionCycle, PipelineLogQuery
+
+DEFAULT_LOG_DIR = Path.home() / ".stock_manager" / "runtime"
+
+
+def _parse_day(value: str | None) -> date | None:
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise typer.BadParameter(f"Invalid date '{value}'. Use YYYY-MM-DD or YYYYMMDD.")
+
+
+def _resolve_range(
+    day: str | None, start: str | None, end: str | None
+) -> tuple[date | None, date | None]:
+    if day is not None:
+        parsed = _parse_day(day)
+        return parsed, parsed
+    return _parse_day(start), _parse_day(end)
+
+
+def _format_vote(vote: dict[str, Any]) -> str:
+    return (
+        f"    vote {vote.get('persona_id')}: {vote.get('action')} "
+        f"conviction={vote.get('conviction')}"
+    )
+
+
+def _format_cycle(cycle: DecisionCycle) -> list[str]:
+    verdict = {True: "PASSED", False: "REJECTED", None: "NO CONSENSUS"}[cycle.passed]
+    lines = [f"[{cycle.started_at}] session={cycle.session_id} {cycle.symbol} {verdict}"]
+    if cycle.screening is not None:
+        lines.append(f"    screening {json.dumps(cycle.screening.get('snapshot_summary', {}))}")
+    lines.extend(_format_vote(vote) for vote in cycle.votes)
+    if cycle.advisory is not None:
+        lines.append(
+            f"    advisory innovation_score={cycle.advisory.get('innovation_score')} "
+            f"{cycle.advisory.get('disruption_assessment')}"
+        )
+    if cycle.consensus is not None:
+        lines.append(
+            f"    consensus buy={cycle.consensus.get('buy_count')}/"
+            f"{cycle.consensus.get('total_count')} "
+            f"avg_conviction={cycle.consensus.get('avg_conviction')}"
+        )
+    for action in cycle.actions:
+        details = {
+            key: value
+            for key, value in action.items()
+            if key not in ("event", "symbol", "session_id", "timestamp")
+        }
+        lines.append(
+            f"    {action.get('event')} [{action.get('timestamp')}] "
+            f"{json.dumps(details, ensure_ascii=False)}"
+        )
+    return lines
+
+
+def create_logs_app() -> typer.Typer:
+    app = typer.Typer(help="Query, index and replay pipeline NDJSON logs.")
+
+    log_dir_option = typer.Option(DEFAULT_LOG_DIR, "--log-dir", help="Directory of NDJSON logs.")
+    prefix_option = typer.Option(
+        None, "--prefix", help="Only read files with this prefix (e.g. pipeline)."
+    )
+    day_option = typer.Option(None, "--date", help="Single day (YYYY-MM-DD).")
+    start_option = typer.Option(None, "--from", help="First day (YYYY-MM-DD).")
+    end_option = typer.Option(None, "--to", help="Last day (YYYY-MM-DD).")
+
+    @app.command("index")
+    def index(
+        log_dir: Path = log_dir_option,
+        prefix: str | None = prefix_option,
+        day: str | None = day_option,
+        start: str | None = start_option,
+        end: str | None = end_option,
+    ) -> None:
+        """Build or refresh sidecar indexes."""
+        first, last = _resolve_range(day, start, end)
+        query = PipelineLogQuery(log_dir, prefix=prefix)
+        count = query.build_indexes(first, last)
+        typer.echo(f"Indexed {count} events in {len(query.files(first, last))} files")
+
+    @app.command("query")
+    def query_events(
+        log_dir: Path = log_dir_option,
+        prefix: str | None = prefix_option,
+        day: str | None = day_option,
+        start: str | None = start_option,
+        end: str | None = end_option,
+        symbol: str | None = typer.Option(None, "--symbol", help="Filter by symbol."),
+        event: list[str] = typer.Option(
+            [], "--event", help="Filter by event type (repeatable)."
+        ),
+        session_id: str | None = typer.Option(None, "--session", help="Filter by session id."),
+        limit: int = typer.Option(0, "--limit", help="Stop after N events (0 = no limit)."),
+    ) -> None:
+        """Print matching events as NDJSON."""
+        first, last = _resolve_range(day, start, end)
+        query = PipelineLogQuery(log_dir, prefix=prefix)
+        printed = 0
+        for record in query.iter_events(
+            start=first,
+            end=last,
+            symbol=symbol,
+            events=event or None,
+            session_id=session_id,
+        ):
+            typer.echo(json.dumps(record, ensure_ascii=False))
+            printed += 1
+            if limit and printed >= limit:
+                break
+
+    @app.command("sessions")
+    def sessions(
+        log_dir: Path = log_dir_option,
+        prefix: str | None = prefix_option,
+        day: str | None = day_option,
+        start: str | None = start_option,
+        end: str | None = end_option,
+    ) -> None:
+        """List sessions with their time span, event count and symbols."""
+        first, last = _resolve_range(day, start, end)
+        summary = PipelineLogQuery(log_dir, prefix=prefix).sessions(first, last)
+        for session_id, item in sorted(summary.items(), key=lambda kv: str(kv[1]["first"])):
+            symbols = ",".join(sorted(item["symbols"])) or "-"
+            typer.echo(
+                f"{session_id} {item['first']} -> {item['last']} "
+                f"events={item['events']} symbols={symbols}"
+            )
+
+    @app.command("timeline")
+    def timeline(
+        symbol: str = typer.Argument(..., help="Symbol to reconstruct decisions for."),
+        log_dir: Path = log_dir_option,
+        prefix: str | None = prefix_option,
+        day: str | None = day_option,
+        start: str | None = start_option,
+        end: str | None = end_option,
+        session_id: str | None = typer.Option(None, "--session", help="Filter by session id."),
+    ) -> None:
+        """Reconstruct a symbol's decision cycles (votes, consensus, orders)."""
+        first, last = _resolve_range(day, start, end)
+        cycles = PipelineLogQuery(log_dir, prefix=prefix).decision_timeline(
+            symbol, start=first, end=last, session_id=session_id
+        )
+        if not cycles:
+            typer.echo(f"No decision events for {symbol}")
+            raise typer.Exit(code=1)
+        for cycle in cycles:
+            for line in _format_cycle(cycle):
+                typer.echo(line)
+
+    return app
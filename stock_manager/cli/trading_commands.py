@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 import signal
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from types import FrameType
 from typing import Any, Literal
@@ -199,6 +199,7 @@ def _resolve_strategy_config(
     strategy: str | None,
     strategy_symbols: str | None,
     client: KISRestClient,
+    config: TradingConfig | None = None,
 ) -> tuple[Any | None, tuple[str, ...]]:
     symbols = _parse_strategy_symbols(strategy_symbols)
 
@@ -207,7 +208,7 @@ def _resolve_strategy_config(
             raise ValueError("--strategy-symbols requires --strategy.")
         return None, ()
 
-    return resolve_strategy(strategy_name=strategy, client=client), symbols
+    return resolve_strategy(strategy_name=strategy, client=client, config=config), symbols
 
 
 def run_command(
@@ -220,11 +221,17 @@ def run_command(
     strategy_max_symbols_per_cycle: int,
     strategy_max_buys_per_cycle: int,
     strategy_run_interval_sec: float,
+    strategy_screen_concurrency: int = 1,
+    strategy_symbol_timeout_sec: float = 0.0,
     strategy_auto_discover: bool = False,
     strategy_discovery_limit: int = 20,
     strategy_discovery_fallback_symbols: str | None = None,
     websocket_monitoring_enabled: bool = False,
     websocket_execution_notice_enabled: bool = False,
+    consensus_fetch_concurrency: int = 1,
+    consensus_data_cache: bool = False,
+    consensus_data_cache_path: str | None = None,
+    consensus_short_circuit: bool = False,
 ) -> None:
     setup_logging()
     if duration_sec < 0:
@@ -234,12 +241,31 @@ def run_command(
     runtime: RuntimeContext | None = None
     try:
         runtime = _build_runtime_context()
+        config = TradingConfig(
+            strategy_order_quantity=strategy_order_quantity,
+            strategy_max_symbols_per_cycle=strategy_max_symbols_per_cycle,
+            strategy_max_buys_per_cycle=strategy_max_buys_per_cycle,
+            strategy_run_interval_sec=strategy_run_interval_sec,
+            strategy_screen_concurrency=strategy_screen_concurrency,
+            strategy_symbol_timeout_sec=strategy_symbol_timeout_sec or None,
+            strategy_auto_discover=strategy_auto_discover,
+            strategy_discovery_limit=strategy_discovery_limit,
+            strategy_discovery_fallback_symbols=_parse_strategy_symbols(
+                strategy_discovery_fallback_symbols
+            ),
+            websocket_monitoring_enabled=websocket_monitoring_enabled,
+            websocket_execution_notice_enabled=websocket_execution_notice_enabled,
+            consensus_fetch_concurrency=consensus_fetch_concurrency,
+            consensus_data_cache=consensus_data_cache,
+            consensus_data_cache_path=consensus_data_cache_path,
+            consensus_short_circuit=consensus_short_circuit,
+        )
         resolved_strategy, resolved_symbols = _resolve_strategy_config(
             strategy=strategy,
             strategy_symbols=strategy_symbols,
             client=runtime.client,
+            config=config,
         )
-        discovery_fallback_symbols = _parse_strategy_symbols(strategy_discovery_fallback_symbols)
         _enforce_live_promotion_gate(use_mock=runtime.config.use_mock)
         if not skip_auth:
             runtime.client.authenticate()
@@ -247,18 +273,10 @@ def run_command(
         notifier = SlackNotifier(SlackConfig())
         engine = TradingEngine(
             client=runtime.client,
-            config=TradingConfig(
+            config=replace(
+                config,
                 strategy=resolved_strategy,
                 strategy_symbols=resolved_symbols,
-                strategy_order_quantity=strategy_order_quantity,
-                strategy_max_symbols_per_cycle=strategy_max_symbols_per_cycle,
-                strategy_max_buys_per_cycle=strategy_max_buys_per_cycle,
-                strategy_run_interval_sec=strategy_run_interval_sec,
-                strategy_auto_discover=strategy_auto_discover,
-                strategy_discovery_limit=strategy_discovery_limit,
-                strategy_discovery_fallback_symbols=discovery_fallback_symbols,
-                websocket_monitoring_enabled=websocket_monitoring_enabled,
-                websocket_execution_notice_enabled=websocket_execution_notice_enabled,
             ),
             account_number=runtime.account_number,
             account_product_code=runtime.account_product_code,
@@ -52,8 +52,9 @@ from stock_manager.trading.guardrails import (
     resolve_auto_exit_order,
     resolve_operational_state,
 )
+from stock_manager.adapters.broker.kis.quote_board import SOURCE_REST, QuoteBoard, get_quote_board
 from stock_manager.monitoring import PriceMonitor, PositionReconciler
-from stock_manager.persistence import TradingState, save_state_atomic, load_state
+from stock_manager.persistence import StateJournal, TradingState, save_state_atomic, load_state
 from stock_manager.persistence.recovery import (
     startup_reconciliation,
     RecoveryReport,
@@ -66,6 +67,7 @@ from stock_manager.notifications import (
     NotificationLevel,
 )
 from stock_manager.trading.logging import PipelineJsonLogger
+from stock_manager.trading.strategies.batch import BatchScreener
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +118,7 @@ class EngineStatus:
     strategy_discovery_symbols: tuple[str, ...]
     strategy_discovery_reason: str | None
     strategy_discovery_updated_at: str | None
+    websocket_sessions: tuple[dict[str, Any], ...] = ()
 
 
 @dataclass
@@ -157,8 +160,10 @@ class TradingEngine:
     _risk_manager: RiskManager = field(init=False)
     _rate_limiter: RateLimiter = field(init=False)
     _price_monitor: PriceMonitor = field(init=False)
+    _quote_board: QuoteBoard = field(default_factory=get_quote_board, init=False, repr=False)
     _reconciler: PositionReconciler = field(init=False)
     _state: TradingState = field(init=False)
+    _state_journal: StateJournal | None = field(default=None, init=False, repr=False)
     _running: bool = field(default=False, init=False)
     _buying_enabled: bool = field(default=False, init=False)
     _buy_blocked_reason: str | None = field(default=None, init=False)
@@ -181,6 +186,7 @@ class TradingEngine:
         default_factory=threading.Event, init=False, repr=False
     )
     _strategy_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _batch_screener: BatchScreener | None = field(default=None, init=False, repr=False)
     _auto_exit_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
     _state_lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
     _auto_exit_last_trigger: dict[tuple[str, str], float] = field(
@@ -210,7 +216,10 @@ class TradingEngine:
         )
 
         # Initialize position manager
-        self._position_manager = PositionManager()
+        self._position_manager = PositionManager(
+            trailing_stop_pct=self.config.trailing_stop_pct,
+            exit_dispatch="async" if self.config.async_exit_dispatch else "sync",
+        )
 
         self._risk_manager = RiskManager(
             limits=RiskLimits(
@@ -240,6 +249,11 @@ class TradingEngine:
             client=self.client,
             interval=self.config.polling_interval_sec,
             rate_limiter=self._rate_limiter,
+            quote_board=self._quote_board,
+            batch_size=self.config.price_poll_batch_size,
+            max_interval=self.config.price_poll_max_interval_sec,
+            trigger_distance=self._exit_trigger_distance,
+            is_paper_trading=self.is_paper_trading,
         )
 
         # Initialize position reconciler
@@ -257,6 +271,7 @@ class TradingEngine:
         self._runtime_logger = PipelineJsonLogger(
             log_dir=self.state_path.parent / "runtime",
             prefix="engine-runtime",
+            buffered=self.config.runtime_log_buffered,
         )
 
         # Initialize empty state
@@ -375,6 +390,7 @@ class TradingEngine:
 
         # Update state after reconciliation
         self._update_state()
+        self._start_state_journal()
         self._persist_state()
 
         self._running = True
@@ -480,11 +496,13 @@ class TradingEngine:
         # Stop monitoring threads (they handle joining internally)
         self._price_monitor.stop(timeout=timeout / 2)
         self._stop_realtime_streams()
+        self._position_manager.shutdown(timeout=timeout / 2)
         self._reconciler.stop(timeout=timeout / 2)
 
         # Final state save
         self._update_state()
         self._persist_state()
+        self._stop_state_journal()
 
         self._running = False
         self._set_operational_state(
@@ -500,6 +518,8 @@ class TradingEngine:
             "Engine Stopped",
             position_count=len(self._position_manager.get_all_positions()),
         )
+        # Buffered runtime logging: everything logged above reaches disk
+        self._runtime_logger.flush()
 
     def __enter__(self):
         """Context manager entry."""
@@ -643,7 +663,7 @@ class TradingEngine:
             )
             self._state.pending_orders[order.order_id] = order
             self._update_state_unlocked()
-        self._persist_state()
+        self._persist_state(durable=True)
 
         result = self._submit_order_intent(order)
 
@@ -747,7 +767,7 @@ class TradingEngine:
             )
             self._state.pending_orders[order.order_id] = order
             self._update_state_unlocked()
-        self._persist_state()
+        self._persist_state(durable=True)
 
         result = self._submit_order_intent(order)
 
@@ -992,8 +1012,20 @@ class TradingEngine:
             strategy_discovery_symbols=self._strategy_discovery_symbols,
             strategy_discovery_reason=self._strategy_discovery_reason,
             strategy_discovery_updated_at=self._strategy_discovery_updated_at,
+            websocket_sessions=self._websocket_health(),
         )
 
+    def _websocket_health(self) -> tuple[dict[str, Any], ...]:
+        adapter = self._broker_adapter
+        health = getattr(adapter, "websocket_health", None) if adapter is not None else None
+        if not callable(health):
+            return ()
+        try:
+            return tuple(health())
+        except Exception:
+            logger.debug("Failed to read websocket session health", exc_info=True)
+            return ()
+
     def is_healthy(self) -> bool:
         """Quick health check.
 
@@ -1034,6 +1066,17 @@ class TradingEngine:
 
     # Internal helper methods
 
+    def _exit_trigger_distance(self, symbol: str) -> float | None:
+        """Fractional gap between the last price and the nearest exit level."""
+        position = self._position_manager.get_position(symbol)
+        if position is None or not position.current_price or position.current_price <= 0:
+            return None
+        levels = [lvl for lvl in (position.stop_loss, position.take_profit) if lvl is not None]
+        if not levels:
+            return None
+        price = position.current_price
+        return float(min(abs(price - level) for level in levels) / price)
+
     def _on_price_update(self, symbol: str, price: Decimal) -> None:
         """Callback for price updates from monitor.
 
@@ -1436,9 +1479,14 @@ class TradingEngine:
 
         if websocket_monitoring_enabled and symbols:
             try:
-                adapter.subscribe_quotes(symbols=symbols, callback=self._on_websocket_quote)
+                overflow = adapter.subscribe_quotes(
+                    symbols=symbols, callback=self._on_websocket_quote
+                )
                 quote_stream_active = True
                 self._note_market_data_success()
+                if overflow:
+                    # Beyond the sessions' subscription cap: poll just these.
+                    self._ensure_polling_fallback(list(overflow))
             except Exception:
                 logger.warning(
                     "WebSocket quote stream unavailable; falling back to polling",
@@ -1480,9 +1528,16 @@ class TradingEngine:
             getattr(self.config, "websocket_monitoring_enabled", False)
         ):
             try:
-                adapter.subscribe_quotes(symbols=[normalized], callback=self._on_websocket_quote)
-                self._note_market_data_success()
-                return
+                overflow = adapter.subscribe_quotes(
+                    symbols=[normalized], callback=self._on_websocket_quote
+                )
+                if normalized not in (overflow or ()):
+                    self._note_market_data_success()
+                    return
+                logger.info(
+                    "WebSocket sessions full; polling symbol",
+                    extra={"symbol": normalized},
+                )
             except Exception:
                 logger.warning(
                     "WebSocket quote subscription failed; using polling monitor",
@@ -1494,6 +1549,19 @@ class TradingEngine:
             self._price_monitor.start([], self._on_price_update)
         self._price_monitor.add_symbol(normalized)
 
+    def _release_symbol_monitoring(self, symbol: str) -> None:
+        self._price_monitor.remove_symbol(symbol)
+        adapter = self._broker_adapter
+        unsubscribe = getattr(adapter, "unsubscribe_quotes", None) if adapter is not None else None
+        if not callable(unsubscribe) or not bool(
+            getattr(self.config, "websocket_monitoring_enabled", False)
+        ):
+            return
+        try:
+            unsubscribe(symbols=[symbol.strip().upper()])
+        except Exception:
+            logger.debug("WebSocket quote unsubscribe failed", exc_info=True)
+
     def _on_websocket_quote(self, event: Any) -> None:
         symbol = str(getattr(event, "symbol", "")).strip().upper()
         if not symbol:
@@ -1555,6 +1623,20 @@ class TradingEngine:
         if status != "reconnect_exhausted":
             return
 
+        session = int(getattr(event, "session", 0) or 0)
+        if session:
+            # Secondary sessions carry quotes only; poll their symbols and
+            # leave the execution-stream guard to session 0.
+            websocket_client = getattr(self._broker_adapter, "websocket_client", None)
+            sessions = getattr(websocket_client, "sessions", ())
+            if session < len(sessions):
+                self._ensure_polling_fallback(list(sessions[session].quote_subscriptions))
+            logger.warning(
+                "WebSocket quote session exhausted; polling its symbols",
+                extra={"session": session},
+            )
+            return
+
         if decision.start_polling_fallback and "quote_stream_fallback_enabled" not in self._guardrail_notifications_sent:
             self._guardrail_notifications_sent.add("quote_stream_fallback_enabled")
             fallback_symbols = list(self._position_manager.get_all_positions().keys())
@@ -1768,21 +1850,63 @@ class TradingEngine:
         else:
             logger.debug("Strategy symbol resolution unchanged", extra=log_payload)
 
-    def _persist_state(self):
-        """Save current state to disk atomically."""
+    def _persist_state(self, *, durable: bool = False):
+        """Save current state to disk atomically.
+
+        With a state journal running the change is handed to its background
+        writer; ``durable=True`` blocks until it has been committed (used
+        before an order intent is sent to the broker).
+        """
         try:
+            journal = self._state_journal
+            if journal is not None:
+                with self._state_lock:
+                    data = self._state.to_dict()
+                ticket = journal.submit(data)
+                if durable and not journal.flush(ticket, timeout=5.0):
+                    raise RuntimeError("Timed out waiting for state journal commit")
+                return
             with self._state_lock:
                 snapshot = TradingState.from_dict(self._state.to_dict())
             save_state_atomic(snapshot, self.state_path)
             logger.debug(f"State persisted to {self.state_path}")
         except Exception as e:
-            logger.error(f"Failed to persist state: {e}", exc_info=True)
-            self._notify(
-                "error.state_persistence_failed",
-                NotificationLevel.WARNING,
-                "상태 저장 실패",
-                **self._build_error_context(e, operation="state_persistence"),
-            )
+            self._on_state_persistence_error(e)
+
+    def _on_state_persistence_error(self, error: Exception) -> None:
+        logger.error(f"Failed to persist state: {error}", exc_info=True)
+        self._notify(
+            "error.state_persistence_failed",
+            NotificationLevel.WARNING,
+            "상태 저장 실패",
+            **self._build_error_context(error, operation="state_persistence"),
+        )
+
+    def _start_state_journal(self) -> None:
+        window = self.config.state_journal_commit_window_sec
+        if window is None or self._state_journal is not None:
+            return
+        journal = StateJournal(
+            self.state_path,
+            commit_window_sec=window,
+            compact_every=self.config.state_journal_compact_every,
+            on_error=self._on_state_persistence_error,
+        )
+        try:
+            with self._state_lock:
+                baseline = TradingState.from_dict(self._state.to_dict())
+            journal.start(baseline)
+        except Exception as e:
+            logger.warning(f"State journal unavailable, using synchronous snapshots: {e}")
+            return
+        self._state_journal = journal
+
+    def _stop_state_journal(self) -> None:
+        journal = self._state_journal
+        if journal is None:
+            return
+        self._state_journal = None
+        journal.close()
 
     def _update_state(self):
         """Sync positions from position manager to state."""
@@ -2521,7 +2645,7 @@ class TradingEngine:
                 )
                 if effective_qty >= position.quantity:
                     self._position_manager.close_position(order.symbol)
-                    self._price_monitor.remove_symbol(order.symbol)
+                    self._release_symbol_monitoring(order.symbol)
                     closed_position = True
                 else:
                     position.quantity -= effective_qty
@@ -3505,6 +3629,12 @@ class TradingEngine:
             logger.debug("Strategy orchestration stop failed", exc_info=True)
         finally:
             self._strategy_thread = None
+            if self._batch_screener is not None:
+                self._batch_screener.close()
+                self._batch_screener = None
+            close_strategy = getattr(getattr(self.config, "strategy", None), "close", None)
+            if callable(close_strategy):
+                close_strategy()
 
     def _strategy_loop(self) -> None:
         interval = float(getattr(self.config, "strategy_run_interval_sec", 0.0) or 0.0)
@@ -3569,24 +3699,21 @@ class TradingEngine:
             return
 
         with self._strategy_lock:
+            max_buys = int(getattr(self.config, "strategy_max_buys_per_cycle", 0) or 0)
+            qty = int(getattr(self.config, "strategy_order_quantity", 0) or 0)
+            screener = self._get_batch_screener()
+            if screener is not None:
+                self._run_streaming_screen(strategy, screener, symbols, max_buys=max_buys, qty=qty)
+                return
+
             try:
                 scores = strategy.screen(symbols)
             except Exception as e:
-                logger.error("Strategy screen failed", exc_info=True)
-                self._notify(
-                    "strategy.error",
-                    NotificationLevel.ERROR,
-                    "전략 스크리닝 오류",
-                    strategy=type(strategy).__name__,
-                    symbols=symbols,
-                    **self._build_error_context(e, operation="strategy_screen"),
-                )
+                self._notify_strategy_screen_error(strategy, symbols, e)
                 return
 
-            max_buys = int(getattr(self.config, "strategy_max_buys_per_cycle", 0) or 0)
             if max_buys <= 0:
                 return
-            qty = int(getattr(self.config, "strategy_order_quantity", 0) or 0)
             if qty <= 0:
                 return
 
@@ -3594,31 +3721,90 @@ class TradingEngine:
             for score in scores:
                 if submitted >= max_buys:
                     break
-                symbol = getattr(score, "symbol", None)
-                if not isinstance(symbol, str) or not symbol.strip():
-                    continue
-                symbol = symbol.strip().upper()
-                if not bool(getattr(score, "passes_all", True)):
-                    continue
+                if self._submit_strategy_buy(score, qty):
+                    submitted += 1
 
-                if self._position_manager.get_position(symbol) is not None:
-                    continue
-                if self._has_pending_order(symbol, side="buy"):
+    def _get_batch_screener(self) -> BatchScreener | None:
+        """Return the engine's streaming screener, or None for serial ``screen()``."""
+        concurrency = int(getattr(self.config, "strategy_screen_concurrency", 1) or 1)
+        if concurrency <= 1:
+            return None
+        if self._batch_screener is None:
+            self._batch_screener = BatchScreener(
+                max_concurrency=concurrency,
+                symbol_timeout_sec=getattr(self.config, "strategy_symbol_timeout_sec", None),
+            )
+        return self._batch_screener
+
+    def _run_streaming_screen(
+        self,
+        strategy: Any,
+        screener: BatchScreener,
+        symbols: list[str],
+        *,
+        max_buys: int,
+        qty: int,
+    ) -> None:
+        """Screen symbols concurrently and submit buys as passing results arrive.
+
+        Screening stops early once ``max_buys`` buys have been submitted.
+        """
+        can_buy = max_buys > 0 and qty > 0
+        submitted = 0
+        outcomes = screener.iter_screen(strategy, symbols)
+        try:
+            for outcome in outcomes:
+                if not can_buy or not outcome.passes:
                     continue
+                if self._submit_strategy_buy(outcome.score, qty):
+                    submitted += 1
+                    if submitted >= max_buys:
+                        break
+        except Exception as e:
+            self._notify_strategy_screen_error(strategy, symbols, e)
+        finally:
+            outcomes.close()
 
-                try:
-                    price = self._get_current_price(symbol)
-                    result = self.buy(symbol, qty, price, origin="strategy")
-                    if result.success:
-                        submitted += 1
-                except Exception as e:
-                    logger.error("Buy submission failed", extra={"symbol": symbol}, exc_info=True)
-                    self._notify(
-                        "error.buy_submission_failed",
-                        NotificationLevel.ERROR,
-                        "매수 주문 제출 실패",
-                        **self._build_error_context(e, symbol=symbol, operation="buy_submission"),
-                    )
+    def _notify_strategy_screen_error(
+        self, strategy: Any, symbols: list[str], error: Exception
+    ) -> None:
+        logger.error("Strategy screen failed", exc_info=True)
+        self._notify(
+            "strategy.error",
+            NotificationLevel.ERROR,
+            "전략 스크리닝 오류",
+            strategy=type(strategy).__name__,
+            symbols=symbols,
+            **self._build_error_context(error, operation="strategy_screen"),
+        )
+
+    def _submit_strategy_buy(self, score: Any, qty: int) -> bool:
+        """Submit a strategy buy for a passing score. Returns True if the order succeeded."""
+        symbol = getattr(score, "symbol", None)
+        if not isinstance(symbol, str) or not symbol.strip():
+            return False
+        symbol = symbol.strip().upper()
+        if not bool(getattr(score, "passes_all", True)):
+            return False
+
+        if self._position_manager.get_position(symbol) is not None:
+            return False
+        if self._has_pending_order(symbol, side="buy"):
+            return False
+
+        try:
+            price = self._get_current_price(symbol)
+            result = self.buy(symbol, qty, price, origin="strategy")
+            return bool(result.success)
+        except Exception as e:
+            logger.error("Buy submission failed", extra={"symbol": symbol}, exc_info=True)
+            self._notify(
+                "error.buy_submission_failed",
+                NotificationLevel.ERROR,
+                "매수 주문 제출 실패",
+                **self._build_error_context(e, symbol=symbol, operation="buy_submission"),
+            )
+            return False
 
     def _should_process_auto_exit(self, symbol: str, *, trigger_type: str) -> bool:
         cooldown = float(getattr(self.config, "auto_exit_cooldown_sec", 1.0) or 0.0)
@@ -3795,7 +3981,7 @@ class TradingEngine:
             logger.debug(f"Notification error (suppressed): {e}")
 
     def _get_current_price(self, symbol: str) -> int:
-        """Fetch current price from broker.
+        """Fetch current price, from the quote board when fresh, else the broker.
 
         Args:
             symbol: Stock symbol code
@@ -3810,6 +3996,12 @@ class TradingEngine:
             inquire_current_price,
         )
 
+        max_age = getattr(self.config, "quote_board_max_age_sec", None)
+        if max_age is not None:
+            board_price = self._quote_board.price(symbol, max_age)
+            if board_price is not None:
+                return int(board_price)
+
         # Call API directly - inquire_current_price makes the request and returns response
         response = inquire_current_price(
             client=self.client, stock_code=symbol, is_paper_trading=self.is_paper_trading
@@ -3819,7 +4011,10 @@ class TradingEngine:
         # Response has structure: {"output": {"stck_prpr": "70000"}}
         if "output" in response and "stck_prpr" in response["output"]:
             self._note_market_data_success()
-            return int(response["output"]["stck_prpr"])
+            price = int(response["output"]["stck_prpr"])
+            if price > 0:
+                self._quote_board.update(symbol, last=Decimal(price), source=SOURCE_REST)
+            return price
 
         raise ValueError(f"Failed to extract price from response: {response}")
 
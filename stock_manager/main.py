@@ -20,6 +20,7 @@ def build_app():
     typer = _require_typer()
 
     from stock_manager.cli.doctor import run_doctor
+    from stock_manager.cli.log_commands import create_logs_app
     from stock_manager.cli.setup_wizard import run_setup
     from stock_manager.cli.trading_commands import (
         create_trade_app,
@@ -92,6 +93,16 @@ def build_app():
             "--strategy-run-interval-sec",
             help="Seconds between strategy cycles after startup.",
         ),
+        strategy_screen_concurrency: int = typer.Option(
+            1,
+            "--strategy-screen-concurrency",
+            help="Symbols screened concurrently per strategy cycle (1 = serial).",
+        ),
+        strategy_symbol_timeout_sec: float = typer.Option(
+            0.0,
+            "--strategy-symbol-timeout-sec",
+            help="Per-symbol screening deadline in concurrent mode (0 = no deadline).",
+        ),
         strategy_auto_discover: bool = typer.Option(
             False,
             "--strategy-auto-discover",
@@ -117,6 +128,26 @@ def build_app():
             "--websocket-execution-notice-enabled",
             help="Use websocket execution notice stream for reconciliation.",
         ),
+        consensus_fetch_concurrency: int = typer.Option(
+            1,
+            "--consensus-fetch-concurrency",
+            help="Parallel KIS calls per symbol in the consensus data fetcher (1 = serial).",
+        ),
+        consensus_data_cache: bool = typer.Option(
+            False,
+            "--consensus-data-cache",
+            help="Cache consensus market data in memory across strategy cycles.",
+        ),
+        consensus_data_cache_path: str | None = typer.Option(
+            None,
+            "--consensus-data-cache-path",
+            help="Persist the consensus data cache to this JSON file.",
+        ),
+        consensus_short_circuit: bool = typer.Option(
+            False,
+            "--consensus-short-circuit",
+            help="Skip remaining personas once a symbol can no longer pass consensus.",
+        ),
     ) -> None:
         """Start trading engine and keep it running until stop signal."""
         run_command(
@@ -128,15 +159,22 @@ def build_app():
             strategy_max_symbols_per_cycle=strategy_max_symbols_per_cycle,
             strategy_max_buys_per_cycle=strategy_max_buys_per_cycle,
             strategy_run_interval_sec=strategy_run_interval_sec,
+            strategy_screen_concurrency=strategy_screen_concurrency,
+            strategy_symbol_timeout_sec=strategy_symbol_timeout_sec,
             strategy_auto_discover=strategy_auto_discover,
             strategy_discovery_limit=strategy_discovery_limit,
             strategy_discovery_fallback_symbols=strategy_discovery_fallback_symbols,
             websocket_monitoring_enabled=websocket_monitoring_enabled,
             websocket_execution_notice_enabled=websocket_execution_notice_enabled,
+            consensus_fetch_concurrency=consensus_fetch_concurrency,
+            consensus_data_cache=consensus_data_cache,
+            consensus_data_cache_path=consensus_data_cache_path,
+            consensus_short_circuit=consensus_short_circuit,
         )
 
     app.add_typer(create_trade_app(), name="trade")
     app.add_typer(create_verify_app(), name="verify")
+    app.add_typer(create_logs_app(), name="logs")
 
     @app.command("smoke")
     def smoke() -> None:
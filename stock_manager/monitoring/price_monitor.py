@@ -2,31 +2,78 @@
 Sync-based price monitoring with polling.
 
 Uses threading for background price updates while main thread handles trading logic.
+
+Batched mode (``batch_size > 0``, real trading only):
+- One ``intstock-multprice`` request prices up to 30 symbols, instead of
+  one ``inquire-price`` request per symbol per tick.
+- The loop ticks every ``interval``. Each tick it polls the symbols that
+  are *due*: those near a stop-loss/take-profit (via ``trigger_distance``)
+  are always due, and the rest once per adaptive interval. The adaptive
+  interval stretches from ``interval`` toward ``max_interval`` as
+  rate-limit headroom shrinks.
 """
 
 import logging
 import threading
+import time
 from decimal import Decimal
 from typing import Any, Callable, Optional
 
+from stock_manager.adapters.broker.kis.quote_board import SOURCE_REST, QuoteBoard, get_quote_board
+from stock_manager.adapters.broker.kis.rate_limit import client_rate_limiter
+
 logger = logging.getLogger(__name__)
 
+# Symbols per intstock-multprice request (KIS limit).
+MULTIPRICE_BATCH_LIMIT = 30
+
+
+def _positive_decimal(value: Any) -> Optional[Decimal]:
+    """Parse a KIS numeric field; None when missing, malformed or not positive."""
+    try:
+        parsed = Decimal(str(value or "0"))
+    except ArithmeticError:
+        return None
+    return parsed if parsed > 0 else None
+
+
 class PriceMonitor:
     """
     Sync-based price monitoring with polling.
 
     Runs in background thread, calls callbacks when prices update.
+
+    ``rate_limiter`` is only used in front of clients that do not already
+    wait on the shared per-app-key KIS budget; a KIS client's own limiter
+    covers every request it sends, so a second one would not coordinate with
+    other callers on the same key.
     """
 
     def __init__(
         self,
         client: Any,  # KISRestClient
         interval: float = 2.0,  # 2 second polling interval
-        rate_limiter: Optional[Any] = None  # RateLimiter
+        rate_limiter: Optional[Any] = None,  # RateLimiter
+        quote_board: Optional[QuoteBoard] = None,
+        batch_size: int = 0,  # 0 = one inquire-price request per symbol
+        max_interval: Optional[float] = None,
+        trigger_distance: Optional[Callable[[str], Optional[float]]] = None,
+        urgent_distance: float = 0.02,
+        is_paper_trading: bool = False,
     ):
         self.client = client
         self.interval = interval
-        self.rate_limiter = rate_limiter
+        self.rate_limiter = rate_limiter if client_rate_limiter(client) is None else None
+        self.batch_size = min(max(0, batch_size), MULTIPRICE_BATCH_LIMIT)
+        self.max_interval = max(interval, max_interval if max_interval is not None else interval)
+        # Fractional distance from the current price to the nearest exit
+        # trigger; symbols within urgent_distance are polled every tick.
+        self.trigger_distance = trigger_distance
+        self.urgent_distance = urgent_distance
+        self.is_paper_trading = is_paper_trading
+        self._last_polled: dict[str, float] = {}
+        # Polled prices are published for REST-free reads elsewhere.
+        self.quote_board = quote_board if quote_board is not None else get_quote_board()
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._symbols: list[str] = []
@@ -90,8 +137,28 @@ class PriceMonitor:
         """Check if monitor is running."""
         return self._thread is not None and self._thread.is_alive()
 
+    def _publish_quote(self, symbol: str, price: Decimal, volume: Any) -> None:
+        """Record a polled price on the shared quote board."""
+        if price <= 0:
+            return
+        try:
+            parsed_volume = int(volume) if volume not in (None, "") else None
+        except (TypeError, ValueError):
+            parsed_volume = None
+        self.quote_board.update(symbol, last=price, volume=parsed_volume, source=SOURCE_REST)
+
+    @property
+    def batched(self) -> bool:
+        """True when polling through the multi-price API."""
+        # intstock-multprice has no paper-trading TR_ID.
+        return self.batch_size > 0 and not self.is_paper_trading
+
     def _poll_loop(self) -> None:
         """Polling loop - runs in background thread."""
+        if self.batched:
+            self._batched_poll_loop()
+            return
+
         # Import here to avoid circular imports
         from stock_manager.adapters.broker.kis.apis.domestic_stock.basic import inquire_current_price
 
@@ -112,6 +179,7 @@ class PriceMonitor:
                         output = response.get("output", {})
                         price_str = output.get("stck_prpr", "0")
                         price = Decimal(price_str)
+                        self._publish_quote(symbol, price, output.get("acml_vol"))
 
                         if self._callback:
                             self._callback(symbol, price)
@@ -125,3 +193,125 @@ class PriceMonitor:
 
             # Wait for next poll interval
             self._stop_event.wait(self.interval)
+
+    # ------------------------------------------------------------------
+    # Batched mode
+    # ------------------------------------------------------------------
+
+    def _batched_poll_loop(self) -> None:
+        while not self._stop_event.is_set():
+            due = self._due_symbols(time.monotonic())
+            for start in range(0, len(due), self.batch_size):
+                if self._stop_event.is_set():
+                    break
+                self._poll_batch(due[start : start + self.batch_size])
+            self._stop_event.wait(self.interval)
+
+    def _rate_headroom(self) -> float:
+        """Fraction (0-1) of the tighter rate budget currently available."""
+        ratios = []
+        limiter = self.rate_limiter
+        if limiter is not None:
+            capacity = getattr(limiter, "max_requests", 0)
+            if isinstance(capacity, int) and capacity > 0:
+                ratios.append(limiter.available / capacity)
+        available = getattr(self.client, "request_rate_limiter_available", None)
+        capacity = getattr(self.client, "request_rate_limiter_capacity", None)
+        if isinstance(available, int) and isinstance(capacity, int) and capacity > 0:
+            ratios.append(available / capacity)
+        return min(ratios, default=1.0)
+
+    def current_interval(self) -> float:
+        """Adaptive refresh interval for non-urgent symbols.
+
+        Full ``interval`` while at least half the budget is free, then
+        linear up to ``max_interval`` as headroom falls to zero.
+        """
+        headroom = self._rate_headroom()
+        if headroom >= 0.5:
+            return self.interval
+        return self.interval + (self.max_interval - self.interval) * (1 - headroom / 0.5)
+
+    def _is_urgent(self, symbol: str) -> bool:
+        if self.trigger_distance is None:
+            return False
+        try:
+            distance = self.trigger_distance(symbol)
+        except Exception:
+            logger.debug(f"Trigger distance failed for {symbol}", exc_info=True)
+            return False
+        return distance is not None and distance <= self.urgent_distance
+
+    def _due_symbols(self, now: float) -> list[str]:
+        """Symbols to poll this tick: urgent first, then least recently polled."""
+        with self._symbols_lock:
+            symbols = list(self._symbols)
+        for stale in set(self._last_polled) - set(symbols):
+            del self._last_polled[stale]
+
+        refresh = self.current_interval()
+        urgent: list[str] = []
+        routine: list[tuple[float, str]] = []
+        for symbol in symbols:
+            last = self._last_polled.get(symbol)
+            if self._is_urgent(symbol):
+                urgent.append(symbol)
+            elif last is None or now - last >= refresh - 1e-3:
+                routine.append((last or 0.0, symbol))
+        routine.sort()
+        return urgent + [symbol for _, symbol in routine]
+
+    def _poll_batch(self, symbols: list[str]) -> None:
+        from stock_manager.adapters.broker.kis.apis.domestic_stock.analysis import (
+            get_intstock_multprice,
+        )
+
+        params: dict[str, str] = {}
+        for position, symbol in enumerate(symbols, start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{position}"] = "J"
+            params[f"FID_INPUT_ISCD_{position}"] = symbol
+
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            response = get_intstock_multprice(self.client, is_paper_trading=False, **params)
+        except Exception as e:
+            logger.warning(f"Multi-price fetch error for {len(symbols)} symbols: {e}")
+            return
+
+        if response.get("rt_cd") != "0":
+            logger.warning(f"Multi-price fetch failed: {response.get('msg1')}")
+            return
+
+        polled_at = time.monotonic()
+        rows = response.get("output") or []
+        if isinstance(rows, dict):
+            rows = [rows]
+        # Symbols the API leaves out (halted, unknown code) still count as
+        # polled, so they wait for their next interval like everyone else.
+        for symbol in symbols:
+            self._last_polled[symbol] = polled_at
+        missing = set(symbols)
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            symbol = str(row.get("inter_shrn_iscd") or "").strip().upper()
+            if symbol not in missing:
+                continue
+            missing.discard(symbol)
+            try:
+                price = Decimal(str(row.get("inter2_prpr") or "0"))
+            except ArithmeticError:
+                continue
+            self._publish_batch_row(symbol, price, row)
+            if self._callback and price > 0:
+                self._callback(symbol, price)
+        if missing:
+            logger.warning(f"Multi-price response omitted: {', '.join(sorted(missing))}")
+
+    def _publish_batch_row(self, symbol: str, price: Decimal, row: dict[str, Any]) -> None:
+        self._publish_quote(symbol, price, row.get("acml_vol"))
+        ask = _positive_decimal(row.get("inter2_askp"))
+        bid = _positive_decimal(row.get("inter2_bidp"))
+        if ask is not None or bid is not None:
+            self.quote_board.update(symbol, bid=bid, ask=ask, source=SOURCE_REST)
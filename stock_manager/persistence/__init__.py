@@ -9,9 +9,11 @@ from stock_manager.persistence.state import (
     save_state_atomic,
     load_state,
 )
+from stock_manager.persistence.journal import StateJournal
 
 __all__ = [
     "TradingState",
     "save_state_atomic",
     "load_state",
+    "StateJournal",
 ]
@@ -0,0 +1,240 @@
+"""
+Write-coalescing state journal.
+
+Why:
+- ``save_state_atomic`` rewrites the whole indented snapshot with two fsyncs.
+  Calling it on every fill and reconciliation update blocked trading threads
+  on disk I/O.
+
+``StateJournal`` moves that I/O onto a background writer:
+
+1. ``submit`` stores the latest serialized state and returns immediately.
+2. The writer waits ``commit_window_sec`` so that a burst of submissions
+   collapses into one pending state.
+3. It diffs that state against the last committed one and appends a single
+   compact delta record to ``<state>.journal``, so the whole burst shares
+   one write and one fsync (group commit).
+4. Every ``compact_every`` records, the state is compacted into a fresh
+   snapshot via the regular atomic protocol and the journal is truncated.
+
+``flush`` blocks until everything submitted so far is durable. Callers that
+need write-ahead semantics (e.g. an order recorded before it is sent to the
+broker) use it, and keep the same guarantee as ``save_state_atomic``.
+``load_state`` replays the journal on recovery.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from stock_manager.persistence.state import (
+    _KEYED_SECTIONS,
+    _WHOLE_SECTIONS,
+    TradingState,
+    fsync_directory,
+    journal_path,
+    write_json_atomic,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def diff_state(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Delta record body that turns *previous* into *current* (empty if equal)."""
+    record: dict[str, Any] = {}
+    for section in _KEYED_SECTIONS:
+        before = previous.get(section, {})
+        after = current.get(section, {})
+        changes = {key: value for key, value in after.items() if before.get(key) != value}
+        changes.update({key: None for key in before.keys() - after.keys()})
+        if changes:
+            record[section] = changes
+    for section in _WHOLE_SECTIONS:
+        if previous.get(section) != current.get(section):
+            record[section] = current.get(section, {})
+    return record
+
+
+class StateJournal:
+    """Background, group-committed writer for ``TradingState`` snapshots.
+
+    Args:
+        path: Snapshot path; the journal lives next to it.
+        commit_window_sec: How long the writer waits after the first pending
+            submission so that later ones coalesce into the same commit.
+        compact_every: Journal records written before compacting into a new
+            snapshot.
+        on_error: Called with the exception when a commit fails. The pending
+            state is kept and retried on the next commit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        commit_window_sec: float = 0.02,
+        compact_every: int = 256,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        if compact_every < 1:
+            raise ValueError("compact_every must be at least 1")
+        self._path = Path(path)
+        self._journal_path = journal_path(self._path)
+        self._commit_window_sec = max(0.0, commit_window_sec)
+        self._compact_every = compact_every
+        self._on_error = on_error
+
+        self._cond = threading.Condition()
+        self._pending: dict[str, Any] | None = None
+        self._submitted = 0
+        self._durable = 0
+        self._closed = True
+        self._thread: threading.Thread | None = None
+
+        # Writer-thread state
+        self._committed: dict[str, Any] = {}
+        self._seq = 0
+        self._records_since_snapshot = 0
+        self._file: Any = None
+
+    @property
+    def path(self) -> Path:
+        return self._journal_path
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last committed journal record."""
+        return self._seq
+
+    def start(self, baseline: TradingState) -> None:
+        """Compact *baseline* into a snapshot and start the writer thread."""
+        with self._cond:
+            if not self._closed:
+                return
+            self._seq = baseline.journal_seq
+            self._compact(baseline.to_dict())
+            self._closed = False
+            self._thread = threading.Thread(
+                target=self._run, name="state-journal-writer", daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, state: dict[str, Any]) -> int:
+        """Queue a serialized state (``TradingState.to_dict()``); returns its ticket."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("StateJournal is not running")
+            self._pending = state
+            self._submitted += 1
+            self._cond.notify_all()
+            return self._submitted
+
+    def flush(self, ticket: int | None = None, timeout: float | None = None) -> bool:
+        """Block until *ticket* (default: every submission so far) is durable."""
+        with self._cond:
+            target = self._submitted if ticket is None else ticket
+            return self._cond.wait_for(
+                lambda: self._durable >= target or self._thread is None, timeout
+            ) and self._durable >= target
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Commit whatever is pending, compact, and stop the writer."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._pending is not None or self._closed)
+                    if self._pending is None and self._closed:
+                        break
+                if self._commit_window_sec and not self._closed:
+                    time.sleep(self._commit_window_sec)
+                self._commit_pending()
+            if self._records_since_snapshot:
+                self._compact(self._committed)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error(f"State journal writer stopped: {exc}", exc_info=True)
+        finally:
+            self._close_file()
+            with self._cond:
+                self._thread = None
+                self._cond.notify_all()
+
+    def _commit_pending(self) -> None:
+        with self._cond:
+            state, ticket = self._pending, self._submitted
+            self._pending = None
+        if state is None:
+            return
+
+        try:
+            record = diff_state(self._committed, state)
+            if record:
+                record["seq"] = self._seq + 1
+                record["last_updated"] = state.get("last_updated")
+                self._append(record)
+                self._seq += 1
+                self._records_since_snapshot += 1
+            self._committed = state
+            if self._records_since_snapshot >= self._compact_every:
+                self._compact(state)
+        except Exception as exc:
+            logger.error(f"Failed to commit state journal: {exc}", exc_info=True)
+            with self._cond:
+                if self._pending is None:
+                    self._pending = state
+            if self._on_error is not None:
+                self._on_error(exc)
+            if not self._closed:
+                time.sleep(max(self._commit_window_sec, 0.1))
+            return
+
+        with self._cond:
+            self._durable = max(self._durable, ticket)
+            self._cond.notify_all()
+
+    def _append(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            created = not self._journal_path.exists()
+            self._file = open(self._journal_path, "a")
+            if created:
+                fsync_directory(self._journal_path.parent)
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _compact(self, state: dict[str, Any]) -> None:
+        snapshot = dict(state)
+        snapshot["journal_seq"] = self._seq
+        write_json_atomic(snapshot, self._path)
+        # Records up to journal_seq are now in the snapshot, so they are
+        # skipped on replay even if truncation below never happens.
+        self._close_file()
+        with open(self._journal_path, "w") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._committed = state
+        self._records_since_snapshot = 0
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -6,6 +6,12 @@ Protocol:
 2. fsync temp file (force to disk)
 3. Atomic rename
 4. fsync directory (ensure rename is durable)
+
+When the engine runs with a state journal (see ``journal.py``), changes made
+after the last snapshot are appended to ``<state>.journal`` as delta
+records. Each record carries a sequence number. The snapshot stores the
+last sequence it already contains in ``journal_seq``, and ``load_state``
+replays only the newer records.
 """
 
 import os
@@ -33,6 +39,7 @@ class TradingState:
     runtime_metadata: dict[str, Any] = field(default_factory=dict)
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     version: int = 4
+    journal_seq: int = 0
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
@@ -48,6 +55,7 @@ class TradingState:
             "runtime_metadata": dict(self.runtime_metadata),
             "last_updated": self.last_updated.isoformat(),
             "version": 4,
+            "journal_seq": self.journal_seq,
         }
 
     @classmethod
@@ -79,6 +87,7 @@ class TradingState:
             ),
             last_updated=_parse_dt(data.get("last_updated")) or datetime.now(timezone.utc),
             version=int(data.get("version", 1)),
+            journal_seq=int(data.get("journal_seq", 0) or 0),
         )
 
 
@@ -88,6 +97,11 @@ def save_state_atomic(state: TradingState, path: Path) -> None:
 
     CRITICAL: This ensures state survives power failure/crash.
     """
+    write_json_atomic(state.to_dict(), path)
+
+
+def write_json_atomic(data: dict, path: Path, *, indent: int | None = 2) -> None:
+    """Durably replace *path* with *data* (temp file, fsync, rename, dir fsync)."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_name = tempfile.mkstemp(
@@ -101,7 +115,7 @@ def save_state_atomic(state: TradingState, path: Path) -> None:
     try:
         # Step 1: Write to temp file
         with os.fdopen(fd, "w") as f:
-            json.dump(state.to_dict(), f, indent=2)
+            json.dump(data, f, indent=indent)
             # Step 2: Force to disk (CRITICAL)
             f.flush()
             os.fsync(f.fileno())
@@ -110,26 +124,103 @@ def save_state_atomic(state: TradingState, path: Path) -> None:
         tmp_path.replace(path)
 
         # Step 4: Sync directory entry
-        dir_fd = os.open(path.parent, os.O_RDONLY)
-        try:
-            os.fsync(dir_fd)
-        finally:
-            os.close(dir_fd)
+        fsync_directory(path.parent)
     finally:
         if tmp_path.exists():
             tmp_path.unlink(missing_ok=True)
 
 
+def fsync_directory(directory: Path) -> None:
+    """Make a rename or file creation inside *directory* durable."""
+    dir_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
 def load_state(path: Path) -> TradingState | None:
-    """Load state from file, return None if not exists."""
+    """Load state from file, replaying any newer journal records.
+
+    Returns None when neither the snapshot nor a journal exists.
+    """
     path = Path(path)
-    if not path.exists():
+    journal = journal_path(path)
+    if not path.exists() and not journal.exists():
         return None
-    with open(path, "r") as f:
-        data = json.load(f)
+    data: dict[str, Any] = {}
+    if path.exists():
+        with open(path, "r") as f:
+            data = json.load(f)
+    if journal.exists():
+        data = replay_journal(data, journal)
     return TradingState.from_dict(data)
 
 
+# ---------------------------------------------------------------------------
+# Journal replay
+# ---------------------------------------------------------------------------
+
+JOURNAL_SUFFIX = ".journal"
+_KEYED_SECTIONS = ("positions", "pending_orders")
+_WHOLE_SECTIONS = ("risk_controls", "runtime_metadata")
+
+
+def journal_path(path: Path) -> Path:
+    """Journal file that accompanies the snapshot at *path*."""
+    path = Path(path)
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+def apply_journal_record(data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply one delta record to a serialized state dict in place.
+
+    Keyed sections map keys to their new value (``None`` removes the key).
+    Whole sections replace the previous value.
+    """
+    for section in _KEYED_SECTIONS:
+        changes = record.get(section)
+        if not changes:
+            continue
+        target = data.setdefault(section, {})
+        for key, value in changes.items():
+            if value is None:
+                target.pop(key, None)
+            else:
+                target[key] = value
+    for section in _WHOLE_SECTIONS:
+        if section in record:
+            data[section] = record[section]
+    if record.get("last_updated"):
+        data["last_updated"] = record["last_updated"]
+    data["journal_seq"] = int(record["seq"])
+
+
+def replay_journal(data: dict[str, Any], journal: Path) -> dict[str, Any]:
+    """Apply records newer than ``data["journal_seq"]`` from *journal*.
+
+    Replay stops at the first torn or malformed line: that is a record
+    whose group commit never finished, so nothing after it was acknowledged.
+    """
+    applied_seq = int(data.get("journal_seq", 0) or 0)
+    with open(journal, "r") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.endswith("\n"):
+                logger.warning("Ignoring torn journal tail at %s:%d", journal, line_no)
+                break
+            try:
+                record = json.loads(line)
+                seq = int(record["seq"])
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Ignoring malformed journal record at %s:%d", journal, line_no)
+                break
+            if seq <= applied_seq:
+                continue
+            apply_journal_record(data, record)
+            applied_seq = seq
+    return data
+
+
 def _parse_dt(value: Any) -> datetime | None:
     if value in (None, ""):
         return None
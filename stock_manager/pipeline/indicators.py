@@ -25,16 +25,30 @@ Benchmarks (pure Python, 250 bars, 10 symbols):
     All indicators combined: ~6ms total
     Per symbol:              ~0.6ms
     Memory for 10 symbols:  ~600 KB
+
+Backends:
+    An optional NumPy implementation (``indicators_np``) produces the same
+    output with vectorized window math. Select it per call with
+    ``backend="numpy"``, globally with ``set_indicator_backend("numpy")``,
+    or via ``STOCK_MANAGER_INDICATOR_BACKEND=numpy``. Pure Python stays the
+    default so numpy remains an optional dependency; an unknown or
+    unavailable backend in the environment variable falls back to it with a
+    warning. EMA, RSI and MACD are sequential recursions with no vectorized
+    form, so they have only the pure-Python implementation.
 """
 
 from __future__ import annotations
 
+import importlib
+import logging
 import math
+import os
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import NamedTuple
 
+logger = logging.getLogger(__name__)
 
 # ─── Type aliases ─────────────────────────────────────────────────────────────
 
@@ -45,6 +59,64 @@ IndicatorSeries = list[float | None]
 """Indicator values; None indicates insufficient data for that bar."""
 
 
+# ─── Backend selection ────────────────────────────────────────────────────────
+
+INDICATOR_BACKENDS: tuple[str, ...] = ("python", "numpy")
+
+
+def _load_backend(name: str):
+    """Return the implementation module for *name* (None for pure Python)."""
+    if name not in INDICATOR_BACKENDS:
+        raise ValueError(
+            f"Unknown indicator backend: {name!r} (expected one of {INDICATOR_BACKENDS})"
+        )
+    if name == "python":
+        return None
+    try:
+        return importlib.import_module("stock_manager.pipeline.indicators_np")
+    except ImportError:
+        raise ImportError("numpy required for the numpy indicator backend: pip install numpy")
+
+
+def set_indicator_backend(name: str) -> None:
+    """Select the default backend ("python" or "numpy") for all indicator calls.
+
+    Raises:
+        ValueError: If *name* is not a known backend.
+        ImportError: If "numpy" is requested but numpy is not installed.
+    """
+    global _backend
+    _load_backend(name)
+    _backend = name
+
+
+def _backend_from_env() -> str:
+    """Backend named by ``STOCK_MANAGER_INDICATOR_BACKEND``, or "python" if unusable."""
+    name = os.environ.get("STOCK_MANAGER_INDICATOR_BACKEND", "").strip().lower() or "python"
+    try:
+        _load_backend(name)
+    except (ValueError, ImportError) as e:
+        logger.warning("Ignoring STOCK_MANAGER_INDICATOR_BACKEND=%r: %s", name, e)
+        return "python"
+    return name
+
+
+_backend = _backend_from_env()
+
+
+def get_indicator_backend() -> str:
+    """Return the current default indicator backend name."""
+    return _backend
+
+
+def _accelerated(backend: str | None):
+    """Resolve the per-call override / global default to an implementation module."""
+    name = _backend if backend is None else backend
+    if name == "python":
+        return None
+    return _load_backend(name)
+
+
 @dataclass(frozen=True)
 class OHLCVBar:
     """Single OHLCV bar (Open, High, Low, Close, Volume).
@@ -237,7 +309,7 @@ class IndicatorSnapshot:
 # ─── Core calculation functions ───────────────────────────────────────────────
 
 
-def sma(prices: PriceSeries, period: int) -> IndicatorSeries:
+def sma(prices: PriceSeries, period: int, *, backend: str | None = None) -> IndicatorSeries:
     """Simple Moving Average.
 
     Computes the arithmetic mean of `period` consecutive closing prices.
@@ -245,6 +317,8 @@ def sma(prices: PriceSeries, period: int) -> IndicatorSeries:
     Args:
         prices: Closing prices ordered oldest → newest.
         period: Lookback window (e.g. 20 for SMA-20).
+        backend: Implementation override ("python"/"numpy"); None uses the
+                 global default (see ``set_indicator_backend``).
 
     Returns:
         List of length len(prices). Values before index (period-1)
@@ -257,6 +331,9 @@ def sma(prices: PriceSeries, period: int) -> IndicatorSeries:
         >>> sma([1.0, 2.0, 3.0, 4.0, 5.0], 3)
         [None, None, 2.0, 3.0, 4.0]
     """
+    impl = _accelerated(backend)
+    if impl is not None:
+        return impl.sma(prices, period)
     if period <= 0:
         raise ValueError(f"period must be positive, got {period}")
     n = len(prices)
@@ -458,6 +535,8 @@ def bollinger_bands(
     prices: PriceSeries,
     period: int = 20,
     num_std: float = 2.0,
+    *,
+    backend: str | None = None,
 ) -> BollingerBandsResult:
     """Bollinger Bands with %B and Bandwidth.
 
@@ -476,6 +555,8 @@ def bollinger_bands(
         prices:  Closing prices ordered oldest → newest.
         period:  Moving average period (default 20).
         num_std: Standard deviation multiplier (default 2.0).
+        backend: Implementation override ("python"/"numpy"); None uses the
+                 global default (see ``set_indicator_backend``).
 
     Returns:
         BollingerBandsResult with all band series.
@@ -499,6 +580,9 @@ def bollinger_bands(
         >>> if bb.bandwidth[-1] is not None and bb.bandwidth[-1] < 2.0:
         ...     print("Bollinger squeeze — watch for breakout")
     """
+    impl = _accelerated(backend)
+    if impl is not None:
+        return impl.bollinger_bands(prices, period, num_std)
     if period <= 0:
         raise ValueError(f"period must be positive, got {period}")
     n = len(prices)
@@ -622,13 +706,21 @@ def detect_crossovers(
 
 
 def atr(
-    highs: list[float], lows: list[float], closes: list[float], period: int = 14
+    highs: list[float],
+    lows: list[float],
+    closes: list[float],
+    period: int = 14,
+    *,
+    backend: str | None = None,
 ) -> IndicatorSeries:
     """Average True Range using Wilder's smoothing.
 
     TR = max(high-low, |high-prev_close|, |low-prev_close|)
     ATR = Wilder's smoothed average of TR over `period` bars.
     """
+    impl = _accelerated(backend)
+    if impl is not None:
+        return impl.atr(highs, lows, closes, period)
     if period <= 0:
         raise ValueError(f"period must be positive, got {period}")
     n = len(closes)
@@ -660,7 +752,12 @@ def atr(
 
 
 def adx(
-    highs: list[float], lows: list[float], closes: list[float], period: int = 14
+    highs: list[float],
+    lows: list[float],
+    closes: list[float],
+    period: int = 14,
+    *,
+    backend: str | None = None,
 ) -> IndicatorSeries:
     """Average Directional Index (ADX).
 
@@ -668,6 +765,9 @@ def adx(
     ADX > 25 = trending, ADX < 20 = ranging.
     Uses Wilder's smoothing for DI+, DI-, and ADX.
     """
+    impl = _accelerated(backend)
+    if impl is not None:
+        return impl.adx(highs, lows, closes, period)
     if period <= 0:
         raise ValueError(f"period must be positive, got {period}")
     n = len(closes)
@@ -735,11 +835,16 @@ def adx(
     return result
 
 
-def obv(closes: list[float], volumes: list[int]) -> IndicatorSeries:
+def obv(
+    closes: list[float], volumes: list[int], *, backend: str | None = None
+) -> IndicatorSeries:
     """On-Balance Volume.
 
     Cumulative volume indicator: add volume on up days, subtract on down days.
     """
+    impl = _accelerated(backend)
+    if impl is not None:
+        return impl.obv(closes, volumes)
     n = len(closes)
     if n < 2 or len(volumes) != n:
         return [None] * n
@@ -767,6 +872,8 @@ def stochastic(
     closes: list[float],
     k_period: int = 14,
     d_period: int = 3,
+    *,
+    backend: str | None = None,
 ) -> tuple[IndicatorSeries, IndicatorSeries]:
     """Stochastic Oscillator (%K and %D).
 
@@ -775,6 +882,9 @@ def stochastic(
 
     Returns (k_series, d_series).
     """
+    impl = _accelerated(backend)
+    if impl is not None:
+        return impl.stochastic(highs, lows, closes, k_period, d_period)
     if k_period <= 0 or d_period <= 0:
         raise ValueError(f"periods must be positive, got k={k_period}, d={d_period}")
     n = len(closes)
@@ -806,11 +916,16 @@ def stochastic(
     return k_series, d_series
 
 
-def volume_ratio(volumes: list[int], period: int = 20) -> IndicatorSeries:
+def volume_ratio(
+    volumes: list[int], period: int = 20, *, backend: str | None = None
+) -> IndicatorSeries:
     """Volume Ratio (current volume / average volume).
 
     Values > 1.5 indicate high volume. Values < 0.5 indicate low volume.
     """
+    impl = _accelerated(backend)
+    if impl is not None:
+        return impl.volume_ratio(volumes, period)
     if period <= 0:
         raise ValueError(f"period must be positive, got {period}")
     n = len(volumes)
@@ -0,0 +1,232 @@
+"""
+NumPy-backed implementations of the indicator functions in ``indicators.py``.
+
+Optional backend: requires ``numpy`` (``pip install numpy``). Select it per
+call with ``backend="numpy"`` or globally with
+``set_indicator_backend("numpy")`` / ``STOCK_MANAGER_INDICATOR_BACKEND=numpy``.
+
+Every function has the same signature, return type and None-padding as its
+pure-Python counterpart. Windowed work (SMA, Bollinger σ, stochastic
+high/low, volume averages, true range and directional movement) is
+vectorized. The Wilder smoothing inside ATR/ADX is inherently sequential, so
+it runs as a scalar loop over the precomputed arrays, which also keeps those
+bit-identical to the Python backend. Windowed means use NumPy summation and
+agree to floating-point rounding (~1e-12 relative). EMA, RSI and MACD have
+no vectorized form and are not implemented here.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from stock_manager.pipeline.indicators import (
+    BollingerBandsResult,
+    IndicatorSeries,
+    PriceSeries,
+)
+
+
+def _check_period(period: int) -> None:
+    if period <= 0:
+        raise ValueError(f"period must be positive, got {period}")
+
+
+def _padded(values: np.ndarray, start: int, n: int) -> IndicatorSeries:
+    """Place *values* at ``[start, start + len(values))`` in a None-padded list.
+
+    NaN marks "undefined" inside vectorized results and becomes None.
+    """
+    result: IndicatorSeries = [None] * n
+    result[start : start + len(values)] = [None if v != v else v for v in values.tolist()]
+    return result
+
+
+def _window_sums(arr: np.ndarray, period: int) -> np.ndarray:
+    return sliding_window_view(arr, period).sum(axis=1)
+
+
+def _wilder(seed: float, values: list[float], period: int) -> list[float]:
+    """Wilder recursion ``x = (x * (p - 1) + v) / p`` starting from *seed*."""
+    out = [seed]
+    x = seed
+    for v in values:
+        x = (x * (period - 1) + v) / period
+        out.append(x)
+    return out
+
+
+def _true_range(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    tr = highs - lows
+    prev_close = closes[:-1]
+    tr[1:] = np.maximum.reduce(
+        [tr[1:], np.abs(highs[1:] - prev_close), np.abs(lows[1:] - prev_close)]
+    )
+    return tr
+
+
+# ─── Close-based indicators ──────────────────────────────────────────────────
+
+
+def sma(prices: PriceSeries, period: int) -> IndicatorSeries:
+    _check_period(period)
+    n = len(prices)
+    if n < period:
+        return [None] * n
+    arr = np.asarray(prices, dtype=np.float64)
+    return _padded(_window_sums(arr, period) / period, period - 1, n)
+
+
+def bollinger_bands(
+    prices: PriceSeries,
+    period: int = 20,
+    num_std: float = 2.0,
+) -> BollingerBandsResult:
+    _check_period(period)
+    n = len(prices)
+    if n < period:
+        return BollingerBandsResult(
+            upper=[None] * n,
+            middle=[None] * n,
+            lower=[None] * n,
+            pct_b=[None] * n,
+            bandwidth=[None] * n,
+        )
+
+    arr = np.asarray(prices, dtype=np.float64)
+    windows = sliding_window_view(arr, period)
+    mid = windows.sum(axis=1) / period
+    variance = ((windows - mid[:, None]) ** 2).sum(axis=1) / period
+    std = np.sqrt(variance)
+    up = mid + num_std * std
+    low = mid - num_std * std
+    band_width = up - low
+    last = arr[period - 1 :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_b = np.where(band_width > 0.0, (last - low) / band_width, np.nan)
+        bwidth = np.where(mid > 0.0, band_width / mid * 100.0, np.nan)
+
+    start = period - 1
+    return BollingerBandsResult(
+        upper=_padded(up, start, n),
+        middle=_padded(mid, start, n),
+        lower=_padded(low, start, n),
+        pct_b=_padded(pct_b, start, n),
+        bandwidth=_padded(bwidth, start, n),
+    )
+
+
+# ─── OHLCV-based indicators ──────────────────────────────────────────────────
+
+
+def atr(
+    highs: list[float], lows: list[float], closes: list[float], period: int = 14
+) -> IndicatorSeries:
+    _check_period(period)
+    n = len(closes)
+    if n < 2 or len(highs) != n or len(lows) != n or n < period:
+        return [None] * n
+
+    tr = _true_range(
+        np.asarray(highs, dtype=np.float64),
+        np.asarray(lows, dtype=np.float64),
+        np.asarray(closes, dtype=np.float64),
+    ).tolist()
+    seed = sum(tr[:period]) / period
+    result: IndicatorSeries = [None] * (period - 1)
+    result.extend(_wilder(seed, tr[period:], period))
+    return result
+
+
+def adx(
+    highs: list[float], lows: list[float], closes: list[float], period: int = 14
+) -> IndicatorSeries:
+    _check_period(period)
+    n = len(closes)
+    if n < period * 2 or len(highs) != n or len(lows) != n:
+        return [None] * n
+
+    h = np.asarray(highs, dtype=np.float64)
+    lo = np.asarray(lows, dtype=np.float64)
+    c = np.asarray(closes, dtype=np.float64)
+
+    up_move = np.diff(h)
+    down_move = -np.diff(lo)
+    plus_dm = np.zeros(n)
+    minus_dm = np.zeros(n)
+    plus_dm[1:] = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm[1:] = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    tr = _true_range(h, lo, c).tolist()
+    plus_list = plus_dm.tolist()
+    minus_list = minus_dm.tolist()
+
+    s_tr = _wilder(sum(tr[:period]) / period, tr[period:], period)[1:]
+    s_plus = _wilder(sum(plus_list[:period]) / period, plus_list[period:], period)[1:]
+    s_minus = _wilder(sum(minus_list[:period]) / period, minus_list[period:], period)[1:]
+
+    dx_vals: list[float] = []
+    for st, sp, sm in zip(s_tr, s_plus, s_minus):
+        if st == 0:
+            dx_vals.append(0.0)
+            continue
+        plus_di = 100.0 * sp / st
+        minus_di = 100.0 * sm / st
+        di_sum = plus_di + minus_di
+        dx_vals.append(0.0 if di_sum == 0 else 100.0 * abs(plus_di - minus_di) / di_sum)
+
+    seed = sum(dx_vals[:period]) / period
+    result: IndicatorSeries = [None] * (2 * period - 1)
+    result.extend(_wilder(seed, dx_vals[period:], period))
+    return result
+
+
+def obv(closes: list[float], volumes: list[int]) -> IndicatorSeries:
+    n = len(closes)
+    if n < 2 or len(volumes) != n:
+        return [None] * n
+    direction = np.sign(np.diff(np.asarray(closes, dtype=np.float64)))
+    signed = np.empty(n, dtype=np.float64)
+    signed[0] = float(volumes[0])
+    signed[1:] = direction * np.asarray(volumes[1:], dtype=np.float64)
+    return _padded(np.cumsum(signed), 0, n)
+
+
+def stochastic(
+    highs: list[float],
+    lows: list[float],
+    closes: list[float],
+    k_period: int = 14,
+    d_period: int = 3,
+) -> tuple[IndicatorSeries, IndicatorSeries]:
+    if k_period <= 0 or d_period <= 0:
+        raise ValueError(f"periods must be positive, got k={k_period}, d={d_period}")
+    n = len(closes)
+    if n < k_period or len(highs) != n or len(lows) != n:
+        return [None] * n, [None] * n
+
+    highest = sliding_window_view(np.asarray(highs, dtype=np.float64), k_period).max(axis=1)
+    lowest = sliding_window_view(np.asarray(lows, dtype=np.float64), k_period).min(axis=1)
+    last = np.asarray(closes[k_period - 1 :], dtype=np.float64)
+    span = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_vals = np.where(span == 0.0, 50.0, (last - lowest) / span * 100.0)
+
+    k_series = _padded(k_vals, k_period - 1, n)
+    if len(k_vals) < d_period:
+        return k_series, [None] * n
+    d_vals = _window_sums(k_vals, d_period) / d_period
+    return k_series, _padded(d_vals, k_period + d_period - 2, n)
+
+
+def volume_ratio(volumes: list[int], period: int = 20) -> IndicatorSeries:
+    _check_period(period)
+    n = len(volumes)
+    if n < period:
+        return [None] * n
+    vol = np.asarray(volumes, dtype=np.int64)
+    avg = _window_sums(vol, period) / period
+    last = vol[period - 1 :].astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(avg > 0, last / avg, 0.0)
+    return _padded(ratio, period - 1, n)
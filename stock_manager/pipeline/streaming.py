@@ -0,0 +1,969 @@
+"""
+Incremental (streaming) technical indicators for stock-manager.
+
+The functions in ``pipeline/indicators.py`` recompute every indicator over
+the full price history on each call. The classes here keep the running state
+instead, so a new bar or an intraday tick costs O(1) per indicator:
+
+- ``update(...)`` commits a completed bar and returns the new value.
+- ``peek(...)``   returns the value the indicator *would* have if the bar
+                  were appended, without changing state. Used for the
+                  forming (intraday) bar, which changes on every tick.
+- ``to_dict()`` / ``from_dict()`` serialize the state so a warm indicator
+  set can be persisted and resumed without reseeding from history.
+
+Values match the batch functions (same seeding, smoothing and None-padding
+rules). Seed windows are buffered and averaged with ``sum()`` like the batch
+code, whose float summation is compensated on Python 3.12+; SMA and
+Bollinger use running sums. Results agree to floating-point rounding.
+
+``StreamingIndicators`` bundles the indicators used by
+``compute_snapshot_ohlcv`` and produces the same ``IndicatorSnapshot``:
+
+    stream = StreamingIndicators("005930")
+    stream.seed(parse_kis_ohlcv(output), last_bar_forming=True)
+    snap = stream.update_tick(71200.0, volume=8_512_300)   # intraday quote
+    stream.add_bar(closed_bar)                              # end of session
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any
+
+from stock_manager.pipeline.indicators import IndicatorSnapshot, OHLCVBar, OHLCVSeries
+
+# Running sums are recomputed from the window this often to bound drift.
+_RESYNC_INTERVAL = 1024
+
+
+def _check_period(period: int) -> int:
+    if period <= 0:
+        raise ValueError(f"period must be positive, got {period}")
+    return period
+
+
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0.0:
+        return 100.0
+    if avg_gain == 0.0:
+        return 0.0
+    return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+
+# ─── Close-based indicators ──────────────────────────────────────────────────
+
+
+class IncrementalSMA:
+    """Simple moving average over a fixed window (running sum)."""
+
+    def __init__(self, period: int) -> None:
+        self.period = _check_period(period)
+        self._window: deque[float] = deque()
+        self._sum = 0.0
+        self._since_resync = 0
+
+    @property
+    def value(self) -> float | None:
+        if len(self._window) < self.period:
+            return None
+        return self._sum / self.period
+
+    def peek(self, price: float) -> float | None:
+        n = len(self._window)
+        if n + 1 < self.period:
+            return None
+        dropped = self._window[0] if n == self.period else 0.0
+        return (self._sum + price - dropped) / self.period
+
+    def update(self, price: float) -> float | None:
+        self._window.append(price)
+        self._sum += price
+        if len(self._window) > self.period:
+            self._sum -= self._window.popleft()
+        self._since_resync += 1
+        if self._since_resync >= _RESYNC_INTERVAL:
+            self._sum = sum(self._window)
+            self._since_resync = 0
+        return self.value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"period": self.period, "window": list(self._window)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalSMA:
+        obj = cls(int(data["period"]))
+        obj._window = deque(float(v) for v in data.get("window", []))
+        obj._sum = sum(obj._window)
+        return obj
+
+
+class IncrementalEMA:
+    """Standard EMA (alpha = 2/(period+1)) seeded with the SMA of the first bars."""
+
+    def __init__(self, period: int) -> None:
+        self.period = _check_period(period)
+        self._k = 2.0 / (period + 1)
+        self._seed: list[float] = []
+        self._value: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        return self._value
+
+    def peek(self, price: float) -> float | None:
+        if self._value is None:
+            if len(self._seed) + 1 < self.period:
+                return None
+            return sum([*self._seed, price]) / self.period
+        return price * self._k + self._value * (1.0 - self._k)
+
+    def update(self, price: float) -> float | None:
+        if self._value is None:
+            self._seed.append(price)
+            if len(self._seed) == self.period:
+                self._value = sum(self._seed) / self.period
+                self._seed = []
+        else:
+            self._value = price * self._k + self._value * (1.0 - self._k)
+        return self._value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"period": self.period, "seed": list(self._seed), "value": self._value}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalEMA:
+        obj = cls(int(data["period"]))
+        obj._seed = [float(v) for v in data.get("seed", [])]
+        obj._value = data.get("value")
+        return obj
+
+
+class IncrementalRSI:
+    """RSI with Wilder smoothing; first value after ``period`` price changes."""
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = _check_period(period)
+        self._alpha = 1.0 / period
+        self._prev: float | None = None
+        self._gains: list[float] = []
+        self._losses: list[float] = []
+        self._avg_gain: float | None = None
+        self._avg_loss: float | None = None
+        self._value: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        return self._value
+
+    def _advance(self, price: float, commit: bool) -> float | None:
+        if self._prev is None:
+            if commit:
+                self._prev = price
+            return None
+
+        delta = price - self._prev
+        gain = max(delta, 0.0)
+        loss = abs(min(delta, 0.0))
+        avg_gain = self._avg_gain
+        avg_loss = self._avg_loss
+        value: float | None = None
+
+        if avg_gain is None or avg_loss is None:
+            gains = [*self._gains, gain]
+            losses = [*self._losses, loss]
+            if len(gains) == self.period:
+                avg_gain = sum(gains) / self.period
+                avg_loss = sum(losses) / self.period
+                value = _rsi_from_averages(avg_gain, avg_loss)
+                gains, losses = [], []
+            if commit:
+                self._gains = gains
+                self._losses = losses
+        else:
+            avg_gain = avg_gain * (1.0 - self._alpha) + gain * self._alpha
+            avg_loss = avg_loss * (1.0 - self._alpha) + loss * self._alpha
+            value = _rsi_from_averages(avg_gain, avg_loss)
+
+        if commit:
+            self._prev = price
+            self._avg_gain = avg_gain
+            self._avg_loss = avg_loss
+            self._value = value
+        return value
+
+    def peek(self, price: float) -> float | None:
+        return self._advance(price, commit=False)
+
+    def update(self, price: float) -> float | None:
+        return self._advance(price, commit=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "period": self.period,
+            "prev": self._prev,
+            "gains": list(self._gains),
+            "losses": list(self._losses),
+            "avg_gain": self._avg_gain,
+            "avg_loss": self._avg_loss,
+            "value": self._value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalRSI:
+        obj = cls(int(data["period"]))
+        obj._prev = data.get("prev")
+        obj._gains = [float(v) for v in data.get("gains", [])]
+        obj._losses = [float(v) for v in data.get("losses", [])]
+        obj._avg_gain = data.get("avg_gain")
+        obj._avg_loss = data.get("avg_loss")
+        obj._value = data.get("value")
+        return obj
+
+
+class IncrementalMACD:
+    """MACD line, signal line and histogram built from incremental EMAs."""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> None:
+        self.fast = IncrementalEMA(fast_period)
+        self.slow = IncrementalEMA(slow_period)
+        self.signal = IncrementalEMA(signal_period)
+        self._macd: float | None = None
+        self._hist: float | None = None
+
+    @property
+    def value(self) -> tuple[float | None, float | None, float | None]:
+        """(macd, signal, histogram) for the last committed bar."""
+        return self._macd, self.signal.value if self._macd is not None else None, self._hist
+
+    def _advance(
+        self, price: float, commit: bool
+    ) -> tuple[float | None, float | None, float | None]:
+        if commit:
+            fast, slow = self.fast.update(price), self.slow.update(price)
+        else:
+            fast, slow = self.fast.peek(price), self.slow.peek(price)
+        if fast is None or slow is None:
+            return None, None, None
+        macd_val = fast - slow
+        sig = self.signal.update(macd_val) if commit else self.signal.peek(macd_val)
+        hist = macd_val - sig if sig is not None else None
+        if commit:
+            self._macd = macd_val
+            self._hist = hist
+        return macd_val, sig, hist
+
+    def peek(self, price: float) -> tuple[float | None, float | None, float | None]:
+        return self._advance(price, commit=False)
+
+    def update(self, price: float) -> tuple[float | None, float | None, float | None]:
+        return self._advance(price, commit=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fast": self.fast.to_dict(),
+            "slow": self.slow.to_dict(),
+            "signal": self.signal.to_dict(),
+            "macd": self._macd,
+            "hist": self._hist,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalMACD:
+        obj = cls()
+        obj.fast = IncrementalEMA.from_dict(data["fast"])
+        obj.slow = IncrementalEMA.from_dict(data["slow"])
+        obj.signal = IncrementalEMA.from_dict(data["signal"])
+        obj._macd = data.get("macd")
+        obj._hist = data.get("hist")
+        return obj
+
+
+class IncrementalBollinger:
+    """Bollinger Bands (population σ) from running shifted sums.
+
+    Sums are taken over ``price - shift`` to limit cancellation error; the
+    shift is re-centred on every resync.
+
+    ``update``/``peek`` return ``(upper, middle, lower, pct_b, bandwidth)``.
+    """
+
+    def __init__(self, period: int = 20, num_std: float = 2.0) -> None:
+        self.period = _check_period(period)
+        self.num_std = num_std
+        self._window: deque[float] = deque()
+        self._shift: float | None = None
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._since_resync = 0
+        self._value: tuple[float | None, ...] = (None,) * 5
+
+    @property
+    def value(self) -> tuple[float | None, ...]:
+        return self._value
+
+    def _bands(self, price: float, total: float, total_sq: float) -> tuple[float | None, ...]:
+        shift = self._shift if self._shift is not None else price
+        n = self.period
+        mean_shifted = total / n
+        variance = total_sq / n - mean_shifted * mean_shifted
+        if variance <= 1e-12 * (total_sq / n):
+            variance = 0.0
+        std = math.sqrt(variance)
+        mid = shift + mean_shifted
+        up = mid + self.num_std * std
+        low = mid - self.num_std * std
+        band_width = up - low
+        pct_b = (price - low) / band_width if band_width > 0.0 else None
+        bandwidth = (band_width / mid * 100.0) if mid > 0.0 else None
+        return up, mid, low, pct_b, bandwidth
+
+    def _advance(self, price: float, commit: bool) -> tuple[float | None, ...]:
+        shift = self._shift if self._shift is not None else price
+        x = price - shift
+        total = self._sum + x
+        total_sq = self._sumsq + x * x
+        n = len(self._window) + 1
+        if n > self.period:
+            dropped = self._window[0] - shift
+            total -= dropped
+            total_sq -= dropped * dropped
+            n = self.period
+        value = self._bands(price, total, total_sq) if n == self.period else (None,) * 5
+
+        if commit:
+            self._shift = shift
+            self._window.append(price)
+            if len(self._window) > self.period:
+                self._window.popleft()
+            self._sum, self._sumsq = total, total_sq
+            self._since_resync += 1
+            if self._since_resync >= _RESYNC_INTERVAL:
+                self._resync()
+            self._value = value
+        return value
+
+    def _resync(self) -> None:
+        self._shift = sum(self._window) / len(self._window) if self._window else None
+        shift = self._shift or 0.0
+        self._sum = sum(p - shift for p in self._window)
+        self._sumsq = sum((p - shift) ** 2 for p in self._window)
+        self._since_resync = 0
+
+    def peek(self, price: float) -> tuple[float | None, ...]:
+        return self._advance(price, commit=False)
+
+    def update(self, price: float) -> tuple[float | None, ...]:
+        return self._advance(price, commit=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "period": self.period,
+            "num_std": self.num_std,
+            "window": list(self._window),
+            "value": list(self._value),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalBollinger:
+        obj = cls(int(data["period"]), float(data.get("num_std", 2.0)))
+        obj._window = deque(float(v) for v in data.get("window", []))
+        obj._resync()
+        obj._value = tuple(data.get("value", (None,) * 5))
+        return obj
+
+
+# ─── OHLCV-based indicators ──────────────────────────────────────────────────
+
+
+def _true_range(bar: OHLCVBar, prev_close: float | None) -> float:
+    if prev_close is None:
+        return bar.high - bar.low
+    return max(bar.high - bar.low, abs(bar.high - prev_close), abs(bar.low - prev_close))
+
+
+class IncrementalATR:
+    """Average True Range with Wilder smoothing (valid from bar ``period``)."""
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = _check_period(period)
+        self._count = 0
+        self._prev_close: float | None = None
+        self._seed: list[float] = []
+        self._atr: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        return self._atr if self._count >= 2 else None
+
+    def _advance(self, bar: OHLCVBar, commit: bool) -> float | None:
+        tr = _true_range(bar, self._prev_close)
+        count = self._count + 1
+        seed = self._seed
+        atr_val = self._atr
+        if atr_val is None:
+            seed = [*seed, tr]
+            if len(seed) == self.period:
+                atr_val = sum(seed) / self.period
+                seed = []
+        else:
+            atr_val = (atr_val * (self.period - 1) + tr) / self.period
+
+        if commit:
+            self._count = count
+            self._prev_close = bar.close
+            self._seed = seed
+            self._atr = atr_val
+        return atr_val if count >= 2 else None
+
+    def peek(self, bar: OHLCVBar) -> float | None:
+        return self._advance(bar, commit=False)
+
+    def update(self, bar: OHLCVBar) -> float | None:
+        return self._advance(bar, commit=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "period": self.period,
+            "count": self._count,
+            "prev_close": self._prev_close,
+            "seed": list(self._seed),
+            "atr": self._atr,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalATR:
+        obj = cls(int(data["period"]))
+        obj._count = int(data.get("count", 0))
+        obj._prev_close = data.get("prev_close")
+        obj._seed = [float(v) for v in data.get("seed", [])]
+        obj._atr = data.get("atr")
+        return obj
+
+
+class IncrementalADX:
+    """Average Directional Index (Wilder), valid from bar ``2 * period``."""
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = _check_period(period)
+        self._count = 0
+        self._prev: tuple[float, float, float] | None = None  # (high, low, close)
+        self._seed: list[tuple[float, float, float]] = []  # (tr, +dm, -dm)
+        self._smoothed: tuple[float, float, float] | None = None  # (tr, +dm, -dm)
+        self._dx_seed: list[float] = []
+        self._adx: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        return self._adx
+
+    def _advance(self, bar: OHLCVBar, commit: bool) -> float | None:
+        p = self.period
+        if self._prev is None:
+            tr, plus_dm, minus_dm = bar.high - bar.low, 0.0, 0.0
+        else:
+            prev_high, prev_low, prev_close = self._prev
+            up_move = bar.high - prev_high
+            down_move = prev_low - bar.low
+            plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+            minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+            tr = max(bar.high - bar.low, abs(bar.high - prev_close), abs(bar.low - prev_close))
+
+        count = self._count + 1
+        seed, smoothed = self._seed, self._smoothed
+        dx_seed, adx_val = self._dx_seed, self._adx
+
+        if smoothed is None:
+            seed = [*seed, (tr, plus_dm, minus_dm)]
+            if len(seed) == p:
+                trs, pluses, minuses = zip(*seed)
+                smoothed = (sum(trs) / p, sum(pluses) / p, sum(minuses) / p)
+                seed = []
+        else:
+            s_tr, s_plus, s_minus = smoothed
+            s_tr = (s_tr * (p - 1) + tr) / p
+            s_plus = (s_plus * (p - 1) + plus_dm) / p
+            s_minus = (s_minus * (p - 1) + minus_dm) / p
+            smoothed = (s_tr, s_plus, s_minus)
+
+            if s_tr == 0:
+                dx = 0.0
+            else:
+                plus_di = 100.0 * s_plus / s_tr
+                minus_di = 100.0 * s_minus / s_tr
+                di_sum = plus_di + minus_di
+                dx = 0.0 if di_sum == 0 else 100.0 * abs(plus_di - minus_di) / di_sum
+
+            if adx_val is None:
+                dx_seed = [*dx_seed, dx]
+                if len(dx_seed) == p:
+                    adx_val = sum(dx_seed) / p
+                    dx_seed = []
+            else:
+                adx_val = (adx_val * (p - 1) + dx) / p
+
+        if commit:
+            self._count = count
+            self._prev = (bar.high, bar.low, bar.close)
+            self._seed, self._smoothed = seed, smoothed
+            self._dx_seed, self._adx = dx_seed, adx_val
+        return adx_val
+
+    def peek(self, bar: OHLCVBar) -> float | None:
+        return self._advance(bar, commit=False)
+
+    def update(self, bar: OHLCVBar) -> float | None:
+        return self._advance(bar, commit=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "period": self.period,
+            "count": self._count,
+            "prev": list(self._prev) if self._prev is not None else None,
+            "seed": [list(e) for e in self._seed],
+            "smoothed": list(self._smoothed) if self._smoothed is not None else None,
+            "dx_seed": list(self._dx_seed),
+            "adx": self._adx,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalADX:
+        obj = cls(int(data["period"]))
+        obj._count = int(data.get("count", 0))
+        prev = data.get("prev")
+        obj._prev = tuple(prev) if prev is not None else None  # type: ignore[assignment]
+        obj._seed = [(float(t), float(pl), float(mi)) for t, pl, mi in data.get("seed", [])]
+        smoothed = data.get("smoothed")
+        obj._smoothed = tuple(smoothed) if smoothed is not None else None  # type: ignore[assignment]
+        obj._dx_seed = [float(v) for v in data.get("dx_seed", [])]
+        obj._adx = data.get("adx")
+        return obj
+
+
+class IncrementalOBV:
+    """On-Balance Volume (None until two bars are seen, like ``obv``)."""
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._prev_close: float | None = None
+        self._obv = 0.0
+
+    @property
+    def value(self) -> float | None:
+        return self._obv if self._count >= 2 else None
+
+    def _advance(self, bar: OHLCVBar, commit: bool) -> float | None:
+        if self._prev_close is None:
+            obv_val = float(bar.volume)
+        elif bar.close > self._prev_close:
+            obv_val = self._obv + float(bar.volume)
+        elif bar.close < self._prev_close:
+            obv_val = self._obv - float(bar.volume)
+        else:
+            obv_val = self._obv
+        count = self._count + 1
+        if commit:
+            self._count = count
+            self._prev_close = bar.close
+            self._obv = obv_val
+        return obv_val if count >= 2 else None
+
+    def peek(self, bar: OHLCVBar) -> float | None:
+        return self._advance(bar, commit=False)
+
+    def update(self, bar: OHLCVBar) -> float | None:
+        return self._advance(bar, commit=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"count": self._count, "prev_close": self._prev_close, "obv": self._obv}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalOBV:
+        obj = cls()
+        obj._count = int(data.get("count", 0))
+        obj._prev_close = data.get("prev_close")
+        obj._obv = float(data.get("obv", 0.0))
+        return obj
+
+
+class IncrementalStochastic:
+    """Stochastic %K/%D using monotonic deques for the rolling high/low."""
+
+    def __init__(self, k_period: int = 14, d_period: int = 3) -> None:
+        if k_period <= 0 or d_period <= 0:
+            raise ValueError(f"periods must be positive, got k={k_period}, d={d_period}")
+        self.k_period = k_period
+        self.d_period = d_period
+        self._index = 0
+        self._highs: deque[tuple[int, float]] = deque()  # decreasing highs
+        self._lows: deque[tuple[int, float]] = deque()  # increasing lows
+        self._k_values: deque[float] = deque()
+        self._value: tuple[float | None, float | None] = (None, None)
+
+    @property
+    def value(self) -> tuple[float | None, float | None]:
+        return self._value
+
+    @staticmethod
+    def _window_extreme(
+        entries: deque[tuple[int, float]], oldest_allowed: int, candidate: float, use_max: bool
+    ) -> float:
+        best = candidate
+        for idx, val in entries:
+            if idx >= oldest_allowed:
+                best = max(best, val) if use_max else min(best, val)
+                break
+        return best
+
+    def _advance(self, bar: OHLCVBar, commit: bool) -> tuple[float | None, float | None]:
+        idx = self._index
+        oldest = idx - self.k_period + 1
+        k_val: float | None = None
+        d_val: float | None = None
+
+        if idx >= self.k_period - 1:
+            highest = self._window_extreme(self._highs, oldest, bar.high, use_max=True)
+            lowest = self._window_extreme(self._lows, oldest, bar.low, use_max=False)
+            if highest == lowest:
+                k_val = 50.0
+            else:
+                k_val = (bar.close - lowest) / (highest - lowest) * 100.0
+            recent = list(self._k_values)[-(self.d_period - 1):] if self.d_period > 1 else []
+            if len(recent) == self.d_period - 1:
+                d_val = sum(recent + [k_val]) / self.d_period
+
+        if commit:
+            while self._highs and self._highs[-1][1] <= bar.high:
+                self._highs.pop()
+            self._highs.append((idx, bar.high))
+            while self._lows and self._lows[-1][1] >= bar.low:
+                self._lows.pop()
+            self._lows.append((idx, bar.low))
+            while self._highs[0][0] <= idx - self.k_period:
+                self._highs.popleft()
+            while self._lows[0][0] <= idx - self.k_period:
+                self._lows.popleft()
+            if k_val is not None:
+                self._k_values.append(k_val)
+                if len(self._k_values) > self.d_period:
+                    self._k_values.popleft()
+            self._index = idx + 1
+            self._value = (k_val, d_val)
+        return k_val, d_val
+
+    def peek(self, bar: OHLCVBar) -> tuple[float | None, float | None]:
+        return self._advance(bar, commit=False)
+
+    def update(self, bar: OHLCVBar) -> tuple[float | None, float | None]:
+        return self._advance(bar, commit=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "k_period": self.k_period,
+            "d_period": self.d_period,
+            "index": self._index,
+            "highs": [list(e) for e in self._highs],
+            "lows": [list(e) for e in self._lows],
+            "k_values": list(self._k_values),
+            "value": list(self._value),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalStochastic:
+        obj = cls(int(data["k_period"]), int(data["d_period"]))
+        obj._index = int(data.get("index", 0))
+        obj._highs = deque((int(i), float(v)) for i, v in data.get("highs", []))
+        obj._lows = deque((int(i), float(v)) for i, v in data.get("lows", []))
+        obj._k_values = deque(float(v) for v in data.get("k_values", []))
+        k_val, d_val = data.get("value", (None, None))
+        obj._value = (k_val, d_val)
+        return obj
+
+
+class IncrementalVolumeRatio:
+    """Current volume divided by the rolling average volume (integer sums)."""
+
+    def __init__(self, period: int = 20) -> None:
+        self.period = _check_period(period)
+        self._window: deque[int] = deque()
+        self._sum = 0
+        self._value: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        return self._value
+
+    def _ratio(self, volume: int, total: int) -> float:
+        avg = total / self.period
+        return float(volume) / avg if avg > 0 else 0.0
+
+    def peek(self, volume: int) -> float | None:
+        n = len(self._window)
+        if n + 1 < self.period:
+            return None
+        dropped = self._window[0] if n == self.period else 0
+        return self._ratio(volume, self._sum + volume - dropped)
+
+    def update(self, volume: int) -> float | None:
+        self._window.append(volume)
+        self._sum += volume
+        if len(self._window) > self.period:
+            self._sum -= self._window.popleft()
+        self._value = self._ratio(volume, self._sum) if len(self._window) == self.period else None
+        return self._value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"period": self.period, "window": list(self._window), "value": self._value}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> IncrementalVolumeRatio:
+        obj = cls(int(data["period"]))
+        obj._window = deque(int(v) for v in data.get("window", []))
+        obj._sum = sum(obj._window)
+        obj._value = data.get("value")
+        return obj
+
+
+# ─── Indicator bundle ────────────────────────────────────────────────────────
+
+
+_SMA_PERIODS = (5, 10, 20, 60, 120, 200)
+STREAMING_STATE_VERSION = 2
+
+
+class StreamingIndicators:
+    """Incremental equivalent of ``compute_snapshot_ohlcv`` for one symbol.
+
+    Completed bars are committed with ``add_bar``. The current session's bar
+    is kept as a *forming* bar that ``update_tick`` revises in place (close,
+    high/low, cumulative volume); snapshots evaluate it with ``peek`` so
+    every tick costs O(1) per indicator and never disturbs committed state.
+
+    Not thread-safe; callers serialize access per symbol.
+    """
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.sma = {period: IncrementalSMA(period) for period in _SMA_PERIODS}
+        self.rsi = IncrementalRSI(14)
+        self.macd = IncrementalMACD(12, 26, 9)
+        self.bollinger = IncrementalBollinger(20, 2.0)
+        self.atr = IncrementalATR(14)
+        self.adx = IncrementalADX(14)
+        self.obv = IncrementalOBV()
+        self.stochastic = IncrementalStochastic(14, 3)
+        self.volume_ratio = IncrementalVolumeRatio(20)
+        self.bar_count = 0
+        self.last_date: str | None = None
+        self.forming: OHLCVBar | None = None
+
+    # ------------------------------------------------------------------
+    # Feeding
+    # ------------------------------------------------------------------
+
+    def seed(self, bars: OHLCVSeries, *, last_bar_forming: bool = False) -> IndicatorSnapshot:
+        """Feed history (oldest → newest) once.
+
+        Args:
+            bars: Historical bars, e.g. from ``parse_kis_ohlcv``.
+            last_bar_forming: Treat the newest bar as today's unfinished bar
+                so later ticks revise it instead of appending.
+        """
+        history = list(bars)
+        if last_bar_forming and history:
+            self.forming = history.pop()
+        for bar in history:
+            self._commit(bar)
+        return self.snapshot()
+
+    def add_bar(self, bar: OHLCVBar) -> IndicatorSnapshot:
+        """Commit a completed bar.
+
+        A forming bar with the same date is replaced by *bar*; a forming bar
+        from an earlier date is committed first.
+        """
+        if self.forming is not None:
+            if self.forming.date != bar.date:
+                self._commit(self.forming)
+            self.forming = None
+        self._commit(bar)
+        return self.snapshot()
+
+    def update_tick(
+        self,
+        price: float,
+        *,
+        volume: int | None = None,
+        date: str | None = None,
+    ) -> IndicatorSnapshot:
+        """Revise the forming bar with a live trade price.
+
+        Args:
+            price: Latest trade price.
+            volume: Cumulative session volume, if known.
+            date: Session date; a new date commits the previous forming bar.
+        """
+        forming = self.forming
+        if forming is not None and date is not None and forming.date and forming.date != date:
+            self._commit(forming)
+            forming = None
+        if forming is None:
+            self.forming = OHLCVBar(
+                date=date or "",
+                open=price,
+                high=price,
+                low=price,
+                close=price,
+                volume=int(volume or 0),
+            )
+        else:
+            self.forming = OHLCVBar(
+                date=forming.date or (date or ""),
+                open=forming.open,
+                high=max(forming.high, price),
+                low=min(forming.low, price),
+                close=price,
+                volume=int(volume) if volume is not None else forming.volume,
+            )
+        return self.snapshot()
+
+    def close_session(self) -> IndicatorSnapshot:
+        """Commit the forming bar (if any) as a completed bar."""
+        if self.forming is not None:
+            bar, self.forming = self.forming, None
+            self._commit(bar)
+        return self.snapshot()
+
+    def _commit(self, bar: OHLCVBar) -> None:
+        close = bar.close
+        for indicator in self.sma.values():
+            indicator.update(close)
+        self.rsi.update(close)
+        self.macd.update(close)
+        self.bollinger.update(close)
+        self.atr.update(bar)
+        self.adx.update(bar)
+        self.obv.update(bar)
+        self.stochastic.update(bar)
+        self.volume_ratio.update(bar.volume)
+        self.bar_count += 1
+        self.last_date = bar.date
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> IndicatorSnapshot:
+        """Latest-bar values, matching ``compute_snapshot_ohlcv`` on the same bars."""
+        snap = IndicatorSnapshot(symbol=self.symbol)
+        bar = self.forming
+        if bar is None and self.bar_count == 0:
+            return snap
+
+        if bar is None:
+            smas = {p: ind.value for p, ind in self.sma.items()}
+            ema12, ema26 = self.macd.fast.value, self.macd.slow.value
+            rsi_val = self.rsi.value
+            macd_line, macd_signal, macd_hist = self.macd.value
+            bands = self.bollinger.value
+            atr_val = self.atr.value
+            adx_val = self.adx.value
+            obv_val = self.obv.value
+            stoch_k, stoch_d = self.stochastic.value
+            vr_val = self.volume_ratio.value
+        else:
+            close = bar.close
+            smas = {p: ind.peek(close) for p, ind in self.sma.items()}
+            ema12, ema26 = self.macd.fast.peek(close), self.macd.slow.peek(close)
+            rsi_val = self.rsi.peek(close)
+            macd_line, macd_signal, macd_hist = self.macd.peek(close)
+            bands = self.bollinger.peek(close)
+            atr_val = self.atr.peek(bar)
+            adx_val = self.adx.peek(bar)
+            obv_val = self.obv.peek(bar)
+            stoch_k, stoch_d = self.stochastic.peek(bar)
+            vr_val = self.volume_ratio.peek(bar.volume)
+
+        snap.sma5, snap.sma10, snap.sma20 = smas[5], smas[10], smas[20]
+        snap.sma60, snap.sma120, snap.sma200 = smas[60], smas[120], smas[200]
+        snap.ema12, snap.ema26 = ema12, ema26
+
+        snap.rsi14 = rsi_val
+        if rsi_val is not None:
+            snap.is_overbought = rsi_val > 70.0
+            snap.is_oversold = rsi_val < 30.0
+
+        snap.macd_line, snap.macd_signal, snap.macd_hist = macd_line, macd_signal, macd_hist
+        if macd_hist is not None:
+            snap.macd_bullish = macd_hist > 0.0
+
+        snap.bb_upper, snap.bb_middle, snap.bb_lower, snap.bb_pct_b, snap.bb_bandwidth = bands
+        if snap.bb_bandwidth is not None:
+            snap.bb_squeeze = snap.bb_bandwidth < 2.0
+
+        snap.atr14 = atr_val
+        snap.adx14 = adx_val
+        if adx_val is not None:
+            snap.is_trending = adx_val > 25.0
+        snap.obv_val = obv_val
+        snap.stoch_k, snap.stoch_d = stoch_k, stoch_d
+        snap.volume_ratio_val = vr_val
+        if vr_val is not None:
+            snap.is_high_volume = vr_val > 1.5
+        return snap
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable state, resumable with ``from_dict``."""
+        forming = self.forming
+        return {
+            "version": STREAMING_STATE_VERSION,
+            "symbol": self.symbol,
+            "bar_count": self.bar_count,
+            "last_date": self.last_date,
+            "forming": (
+                {
+                    "date": forming.date,
+                    "open": forming.open,
+                    "high": forming.high,
+                    "low": forming.low,
+                    "close": forming.close,
+                    "volume": forming.volume,
+                }
+                if forming is not None
+                else None
+            ),
+            "sma": {str(p): ind.to_dict() for p, ind in self.sma.items()},
+            "rsi": self.rsi.to_dict(),
+            "macd": self.macd.to_dict(),
+            "bollinger": self.bollinger.to_dict(),
+            "atr": self.atr.to_dict(),
+            "adx": self.adx.to_dict(),
+            "obv": self.obv.to_dict(),
+            "stochastic": self.stochastic.to_dict(),
+            "volume_ratio": self.volume_ratio.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StreamingIndicators:
+        if data.get("version") != STREAMING_STATE_VERSION:
+            raise ValueError(f"Unsupported streaming state version: {data.get('version')}")
+        obj = cls(str(data["symbol"]))
+        obj.bar_count = int(data.get("bar_count", 0))
+        obj.last_date = data.get("last_date")
+        forming = data.get("forming")
+        obj.forming = OHLCVBar(**forming) if forming else None
+        obj.sma = {int(p): IncrementalSMA.from_dict(v) for p, v in data["sma"].items()}
+        obj.rsi = IncrementalRSI.from_dict(data["rsi"])
+        obj.macd = IncrementalMACD.from_dict(data["macd"])
+        obj.bollinger = IncrementalBollinger.from_dict(data["bollinger"])
+        obj.atr = IncrementalATR.from_dict(data["atr"])
+        obj.adx = IncrementalADX.from_dict(data["adx"])
+        obj.obv = IncrementalOBV.from_dict(data["obv"])
+        obj.stochastic = IncrementalStochastic.from_dict(data["stochastic"])
+        obj.volume_ratio = IncrementalVolumeRatio.from_dict(data["volume_ratio"])
+        return obj
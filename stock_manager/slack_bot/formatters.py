@@ -169,6 +169,19 @@ def format_status(status: "EngineStatus | None", session_info: dict) -> dict:
             {"type": "mrkdwn", "text": f"*탐색 종목:*\n{discovery_symbols_text}"},
             {"type": "mrkdwn", "text": f"*최근 탐색:*\n{discovery_updated_at}"},
         ]
+        websocket_sessions = getattr(status, "websocket_sessions", ())
+        if isinstance(websocket_sessions, tuple) and websocket_sessions:
+            connected = sum(1 for item in websocket_sessions if item.get("connected"))
+            subscriptions = sum(int(item.get("subscriptions") or 0) for item in websocket_sessions)
+            runtime_fields.append(
+                {
+                    "type": "mrkdwn",
+                    "text": (
+                        f"*웹소켓 세션:*\n{connected}/{len(websocket_sessions)} 연결"
+                        f" · {subscriptions} 구독"
+                    ),
+                }
+            )
         blocks.append({"type": "divider"})
         blocks.append({"type": "section", "fields": runtime_fields})
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable
@@ -173,6 +173,7 @@ class SessionManager:
         """Build Dalio hybrid persona with env-driven LLM runtime settings."""
         from stock_manager.trading.llm.circuit_breaker import CircuitBreaker
         from stock_manager.trading.llm.config import InvocationCounter, LLMConfig
+        from stock_manager.trading.llm.verdict_cache import LLMVerdictCache
         from stock_manager.trading.personas.dalio_hybrid_persona import DalioHybridPersona
 
         llm_config = LLMConfig.from_env()
@@ -186,6 +187,7 @@ class SessionManager:
             circuit_breaker=circuit_breaker,
             llm_config=llm_config,
             invocation_counter=InvocationCounter(),
+            verdict_cache=LLMVerdictCache.from_config(llm_config),
         )
 
     @staticmethod
@@ -206,6 +208,7 @@ class SessionManager:
     def _apply_selective_llm_overlay(strategy: Any) -> Any:
         """Enable hybrid LLM for all personas in consensus strategy."""
         from stock_manager.trading.strategies.consensus import ConsensusStrategy
+        from stock_manager.trading.llm.verdict_cache import LLMVerdictCache
         from stock_manager.trading.personas.hybrid import HybridPersonaWrapper
 
         if not isinstance(strategy, ConsensusStrategy):
@@ -214,6 +217,7 @@ class SessionManager:
         llm_config, circuit_breaker, invocation_counter = (
             SessionManager._build_hybrid_shared_resources()
         )
+        verdict_cache = LLMVerdictCache.from_config(llm_config)
 
         personas = strategy.evaluator.personas
         for idx, persona in enumerate(personas):
@@ -222,11 +226,16 @@ class SessionManager:
                 circuit_breaker=circuit_breaker,
                 llm_config=llm_config,
                 invocation_counter=invocation_counter,
+                verdict_cache=verdict_cache,
             )
+        strategy.evaluator.llm_batching = llm_config.batch_prompts
 
         logger.info(
-            "Applied strategy overlay: llm_mode=selective, hybrid_enabled_count=%d",
+            "Applied strategy overlay: llm_mode=selective, hybrid_enabled_count=%d, "
+            "verdict_cache=%s, batch_prompts=%s",
             len(personas),
+            "on" if verdict_cache is not None else "off",
+            "on" if llm_config.batch_prompts else "off",
         )
         return strategy
 
@@ -408,11 +417,19 @@ class SessionManager:
 
             runtime.client.authenticate()
 
+            config = TradingConfig(
+                strategy_order_quantity=params.order_quantity,
+                strategy_run_interval_sec=params.run_interval_sec,
+                strategy_auto_discover=params.strategy_auto_discover,
+                strategy_discovery_limit=params.strategy_discovery_limit,
+                strategy_discovery_fallback_symbols=params.strategy_discovery_fallback_symbols,
+            )
             symbols_str = ",".join(params.symbols) if params.symbols else None
             resolved_strategy, resolved_symbols = _resolve_strategy_config(
                 strategy=params.strategy,
                 strategy_symbols=symbols_str,
                 client=runtime.client,
+                config=config,
             )
             if params.llm_mode == "selective":
                 resolved_strategy = self._apply_selective_llm_overlay(resolved_strategy)
@@ -420,16 +437,10 @@ class SessionManager:
             notifier = SlackNotifier(SlackConfig())
             engine = TradingEngine(
                 client=runtime.client,
-                config=TradingConfig(
+                config=replace(
+                    config,
                     strategy=resolved_strategy,
                     strategy_symbols=resolved_symbols,
-                    strategy_order_quantity=params.order_quantity,
-                    strategy_run_interval_sec=params.run_interval_sec,
-                    strategy_auto_discover=params.strategy_auto_discover,
-                    strategy_discovery_limit=params.strategy_discovery_limit,
-                    strategy_discovery_fallback_symbols=(
-                        params.strategy_discovery_fallback_symbols
-                    ),
                 ),
                 account_number=runtime.account_number,
                 account_product_code=runtime.account_product_code,
@@ -1,37 +1,237 @@
 """SQLite-backed state storage replacing JSON files.
 
-Migration strategy: new writes go to SQLite, reads fall back to JSON.
+Migration strategy: ``migrate_from_json`` imports an existing ``TradingState`` file (including
+its journal) once, after which the database is the source of truth.
+
+Storage layout:
+- ``state``: free-form key/value entries (JSON values)
+- ``positions`` / ``orders``: typed rows keyed by symbol / order id
+- ``fills``: append-only executions, deduplicated by execution key
+- ``realized_pnl``: append-only realized PnL entries
+- ``runtime_metadata``: engine metadata as key/value rows
+
+Each thread gets its own connection. The database runs in WAL mode, so
+readers (reconciler, Slack status queries) never block the writer.
+Writes commit immediately unless they run inside ``batch()``, which groups
+them into a single transaction.
 """
 from __future__ import annotations
 
 import json
 import logging
 import sqlite3
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+from stock_manager.persistence.state import (
+    TradingState,
+    _deserialize_order,
+    _deserialize_position,
+    _parse_dt,
+    _serialize_order,
+    _serialize_position,
+    load_state,
+)
+from stock_manager.trading.models import Order, Position
+
 logger = logging.getLogger(__name__)
 
+SCHEMA_VERSION = 2
+
+_MIGRATIONS: dict[int, tuple[str, ...]] = {
+    1: (
+        """
+        CREATE TABLE IF NOT EXISTS state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+    ),
+    2: (
+        """
+        CREATE TABLE IF NOT EXISTS positions (
+            symbol TEXT PRIMARY KEY,
+            quantity INTEGER NOT NULL,
+            entry_price TEXT NOT NULL,
+            current_price TEXT,
+            stop_loss TEXT,
+            take_profit TEXT,
+            unrealized_pnl TEXT NOT NULL DEFAULT '0',
+            status TEXT NOT NULL,
+            opened_at TEXT NOT NULL,
+            closed_at TEXT,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_positions_status ON positions (status)",
+        """
+        CREATE TABLE IF NOT EXISTS orders (
+            order_id TEXT PRIMARY KEY,
+            idempotency_key TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            price INTEGER,
+            status TEXT NOT NULL,
+            broker_order_id TEXT,
+            created_at TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_orders_symbol ON orders (symbol)",
+        "CREATE INDEX IF NOT EXISTS idx_orders_status ON orders (status)",
+        "CREATE INDEX IF NOT EXISTS idx_orders_broker_order_id ON orders (broker_order_id)",
+        """
+        CREATE TABLE IF NOT EXISTS fills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            execution_key TEXT UNIQUE,
+            order_id TEXT,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            price TEXT NOT NULL,
+            filled_at TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_fills_symbol ON fills (symbol, filled_at)",
+        "CREATE INDEX IF NOT EXISTS idx_fills_order_id ON fills (order_id)",
+        """
+        CREATE TABLE IF NOT EXISTS realized_pnl (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            pnl TEXT NOT NULL,
+            order_id TEXT,
+            realized_at TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_realized_pnl_symbol ON realized_pnl (symbol, realized_at)",
+        """
+        CREATE TABLE IF NOT EXISTS runtime_metadata (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+        """,
+    ),
+}
+
+_RISK_CONTROLS_KEY = "trading_state.risk_controls"
+_LAST_UPDATED_KEY = "trading_state.last_updated"
+_MIGRATED_FROM_KEY = "trading_state.migrated_from"
+
 
 class SQLiteStateBackend:
-    """Key-value state storage backed by SQLite."""
+    """SQLite state store with typed trading tables and key-value entries.
 
-    def __init__(self, db_path: str | Path = "data/state.db") -> None:
+    Args:
+        db_path: Database file path.
+        synchronous: ``PRAGMA synchronous`` level. ``FULL`` fsyncs the WAL on
+            every commit; ``NORMAL`` trades the last commits on power loss
+            for lower latency.
+        busy_timeout_ms: How long a connection waits on a locked database.
+        cache_size_kb: Page cache size per connection.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "data/state.db",
+        *,
+        synchronous: str = "FULL",
+        busy_timeout_ms: int = 5000,
+        cache_size_kb: int = 8192,
+    ) -> None:
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Unsupported synchronous level: {synchronous}")
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self._db_path))
+        self._synchronous = synchronous.upper()
+        self._busy_timeout_ms = busy_timeout_ms
+        self._cache_size_kb = cache_size_kb
+
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
         self._init_schema()
 
-    def _init_schema(self) -> None:
-        """Create the state table if it does not exist."""
-        self._conn.execute("""
-            CREATE TABLE IF NOT EXISTS state (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
-                updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+    # ------------------------------------------------------------------
+    # Connections and transactions
+    # ------------------------------------------------------------------
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Connection owned by the calling thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            # check_same_thread=False only so close() can release connections
+            # of other threads; each thread still uses its own connection.
+            conn = sqlite3.connect(
+                str(self._db_path), isolation_level=None, check_same_thread=False
             )
-        """)
-        self._conn.commit()
+            conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(f"PRAGMA synchronous = {self._synchronous}")
+            conn.execute(f"PRAGMA cache_size = -{int(self._cache_size_kb)}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group every write in the block into one transaction.
+
+        Nested ``batch()`` blocks join the outermost transaction. Any
+        exception rolls the whole batch back.
+        """
+        conn = self._conn
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def _init_schema(self) -> None:
+        """Create or upgrade tables up to ``SCHEMA_VERSION``."""
+        conn = self._conn
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        if current >= SCHEMA_VERSION:
+            return
+        with self.batch():
+            for version in range(current + 1, SCHEMA_VERSION + 1):
+                for statement in _MIGRATIONS[version]:
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # ------------------------------------------------------------------
+    # Key-value entries
+    # ------------------------------------------------------------------
 
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a value by key, returning default if not found."""
@@ -44,16 +244,17 @@ class SQLiteStateBackend:
 
     def set(self, key: str, value: Any) -> None:
         """Store a value by key, replacing any existing entry."""
-        self._conn.execute(
-            "INSERT OR REPLACE INTO state (key, value, updated_at) VALUES (?, ?, datetime('now'))",
-            (key, json.dumps(value)),
-        )
-        self._conn.commit()
+        with self.batch():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (key, value, updated_at) "
+                "VALUES (?, ?, datetime('now'))",
+                (key, json.dumps(value)),
+            )
 
     def delete(self, key: str) -> bool:
         """Delete a key. Returns True if the key existed."""
-        cursor = self._conn.execute("DELETE FROM state WHERE key = ?", (key,))
-        self._conn.commit()
+        with self.batch():
+            cursor = self._conn.execute("DELETE FROM state WHERE key = ?", (key,))
         return cursor.rowcount > 0
 
     def keys(self) -> list[str]:
@@ -61,6 +262,303 @@ class SQLiteStateBackend:
         rows = self._conn.execute("SELECT key FROM state").fetchall()
         return [r[0] for r in rows]
 
+    # ------------------------------------------------------------------
+    # Positions
+    # ------------------------------------------------------------------
+
+    def upsert_positions(self, positions: Mapping[str, Position | dict[str, Any]]) -> None:
+        """Insert or replace positions keyed by symbol."""
+        rows = []
+        for symbol, position in positions.items():
+            data = _serialize_position(symbol, position)
+            rows.append(
+                (
+                    symbol,
+                    data["quantity"],
+                    data["entry_price"],
+                    data["current_price"],
+                    data["stop_loss"],
+                    data["take_profit"],
+                    data["unrealized_pnl"],
+                    data["status"],
+                    data["opened_at"],
+                    data["closed_at"],
+                )
+            )
+        with self.batch():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO positions (symbol, quantity, entry_price, "
+                "current_price, stop_loss, take_profit, unrealized_pnl, status, opened_at, "
+                "closed_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))",
+                rows,
+            )
+
+    def delete_position(self, symbol: str) -> bool:
+        """Delete a position. Returns True if it existed."""
+        with self.batch():
+            cursor = self._conn.execute("DELETE FROM positions WHERE symbol = ?", (symbol,))
+        return cursor.rowcount > 0
+
+    def get_positions(self, status: str | None = None) -> dict[str, Position]:
+        """Return stored positions, optionally filtered by status value."""
+        query = (
+            "SELECT symbol, quantity, entry_price, current_price, stop_loss, take_profit, "
+            "unrealized_pnl, status, opened_at, closed_at FROM positions"
+        )
+        params: tuple[Any, ...] = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        columns = (
+            "symbol",
+            "quantity",
+            "entry_price",
+            "current_price",
+            "stop_loss",
+            "take_profit",
+            "unrealized_pnl",
+            "status",
+            "opened_at",
+            "closed_at",
+        )
+        positions: dict[str, Position] = {}
+        for row in self._conn.execute(query, params):
+            raw = dict(zip(columns, row))
+            position = _deserialize_position(raw["symbol"], raw)
+            if position is not None:
+                positions[raw["symbol"]] = position
+        return positions
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    def upsert_orders(self, orders: Mapping[str, Order | dict[str, Any]]) -> None:
+        """Insert or replace orders keyed by order id."""
+        rows = []
+        for order_id, order in orders.items():
+            data = _serialize_order(order_id, order)
+            rows.append(
+                (
+                    order_id,
+                    data["idempotency_key"],
+                    data["symbol"],
+                    data["side"],
+                    data["quantity"],
+                    data["price"],
+                    data["status"],
+                    data["broker_order_id"],
+                    data["created_at"],
+                    json.dumps(data),
+                )
+            )
+        with self.batch():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO orders (order_id, idempotency_key, symbol, side, "
+                "quantity, price, status, broker_order_id, created_at, payload, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))",
+                rows,
+            )
+
+    def delete_order(self, order_id: str) -> bool:
+        """Delete an order. Returns True if it existed."""
+        with self.batch():
+            cursor = self._conn.execute("DELETE FROM orders WHERE order_id = ?", (order_id,))
+        return cursor.rowcount > 0
+
+    def get_orders(
+        self, *, status: str | None = None, symbol: str | None = None
+    ) -> dict[str, Order]:
+        """Return stored orders, optionally filtered by status and/or symbol."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        query = "SELECT order_id, payload FROM orders"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        orders: dict[str, Order] = {}
+        for order_id, payload in self._conn.execute(query, params):
+            order = _deserialize_order(order_id, json.loads(payload))
+            if order is not None:
+                orders[order_id] = order
+        return orders
+
+    # ------------------------------------------------------------------
+    # Fills and realized PnL
+    # ------------------------------------------------------------------
+
+    def record_fill(
+        self,
+        *,
+        symbol: str,
+        side: str,
+        quantity: int,
+        price: Decimal | int | str,
+        order_id: str | None = None,
+        execution_key: str | None = None,
+        filled_at: datetime | None = None,
+    ) -> bool:
+        """Append a fill. Returns False if *execution_key* was already recorded."""
+        filled_at = filled_at or datetime.now(timezone.utc)
+        with self.batch():
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO fills (execution_key, order_id, symbol, side, quantity, "
+                "price, filled_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    execution_key,
+                    order_id,
+                    symbol,
+                    side,
+                    int(quantity),
+                    str(price),
+                    filled_at.isoformat(),
+                ),
+            )
+        return cursor.rowcount > 0
+
+    def get_fills(self, symbol: str | None = None) -> list[dict[str, Any]]:
+        """Return fills in insertion order, optionally for one symbol."""
+        query = (
+            "SELECT execution_key, order_id, symbol, side, quantity, price, filled_at FROM fills"
+        )
+        params: tuple[Any, ...] = ()
+        if symbol is not None:
+            query += " WHERE symbol = ?"
+            params = (symbol,)
+        query += " ORDER BY id"
+        return [
+            {
+                "execution_key": execution_key,
+                "order_id": order_id,
+                "symbol": row_symbol,
+                "side": side,
+                "quantity": quantity,
+                "price": Decimal(price),
+                "filled_at": _parse_dt(filled_at),
+            }
+            for execution_key, order_id, row_symbol, side, quantity, price, filled_at in (
+                self._conn.execute(query, params)
+            )
+        ]
+
+    def record_realized_pnl(
+        self,
+        *,
+        symbol: str,
+        quantity: int,
+        pnl: Decimal | int | str,
+        order_id: str | None = None,
+        realized_at: datetime | None = None,
+    ) -> None:
+        """Append a realized PnL entry."""
+        realized_at = realized_at or datetime.now(timezone.utc)
+        with self.batch():
+            self._conn.execute(
+                "INSERT INTO realized_pnl (symbol, quantity, pnl, order_id, realized_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (symbol, int(quantity), str(pnl), order_id, realized_at.isoformat()),
+            )
+
+    def realized_pnl_total(
+        self, *, symbol: str | None = None, since: datetime | None = None
+    ) -> Decimal:
+        """Sum realized PnL, optionally for one symbol and/or since a timestamp."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if since is not None:
+            clauses.append("realized_at >= ?")
+            params.append(since.astimezone(timezone.utc).isoformat())
+        query = "SELECT pnl FROM realized_pnl"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        # Summed in Python: SQLite would round TEXT decimals through REAL.
+        return sum((Decimal(row[0]) for row in self._conn.execute(query, params)), Decimal("0"))
+
+    # ------------------------------------------------------------------
+    # Runtime metadata
+    # ------------------------------------------------------------------
+
+    def set_runtime_metadata(self, values: Mapping[str, Any]) -> None:
+        """Insert or replace runtime metadata entries."""
+        with self.batch():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO runtime_metadata (key, value, updated_at) "
+                "VALUES (?, ?, datetime('now'))",
+                [(key, json.dumps(value)) for key, value in values.items()],
+            )
+
+    def get_runtime_metadata(self) -> dict[str, Any]:
+        """Return all runtime metadata entries."""
+        return {
+            key: json.loads(value)
+            for key, value in self._conn.execute("SELECT key, value FROM runtime_metadata")
+        }
+
+    # ------------------------------------------------------------------
+    # TradingState bridge
+    # ------------------------------------------------------------------
+
+    def save_trading_state(self, state: TradingState) -> None:
+        """Replace positions, orders, risk controls and metadata in one transaction."""
+        with self.batch():
+            conn = self._conn
+            conn.execute("DELETE FROM positions")
+            conn.execute("DELETE FROM orders")
+            conn.execute("DELETE FROM runtime_metadata")
+            self.upsert_positions(state.positions)
+            self.upsert_orders(state.pending_orders)
+            self.set_runtime_metadata(state.runtime_metadata)
+            self.set(_RISK_CONTROLS_KEY, dict(state.risk_controls))
+            self.set(_LAST_UPDATED_KEY, state.last_updated.isoformat())
+
+    def load_trading_state(self) -> TradingState | None:
+        """Rebuild a ``TradingState`` from the typed tables (None if never saved)."""
+        last_updated = self.get(_LAST_UPDATED_KEY)
+        if last_updated is None:
+            return None
+        return TradingState(
+            positions=self.get_positions(),
+            pending_orders=self.get_orders(),
+            risk_controls=self.get(_RISK_CONTROLS_KEY, {}),
+            runtime_metadata=self.get_runtime_metadata(),
+            last_updated=_parse_dt(last_updated) or datetime.now(timezone.utc),
+        )
+
+    def migrate_from_json(self, path: str | Path, *, force: bool = False) -> bool:
+        """Import a ``TradingState`` JSON file (and its journal) into the store.
+
+        Skipped when the store already holds a trading state unless *force*
+        is set. Returns True when a state was imported.
+        """
+        if not force and self.get(_LAST_UPDATED_KEY) is not None:
+            return False
+        state = load_state(Path(path))
+        if state is None:
+            return False
+        with self.batch():
+            self.save_trading_state(state)
+            self.set(_MIGRATED_FROM_KEY, str(path))
+        logger.info(
+            "Migrated trading state from %s (%d positions, %d orders)",
+            path,
+            len(state.positions),
+            len(state.pending_orders),
+        )
+        return True
+
     def close(self) -> None:
-        """Close the database connection."""
-        self._conn.close()
+        """Close every connection opened by this backend."""
+        self._closed = True
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
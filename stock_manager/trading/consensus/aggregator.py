@@ -53,6 +53,16 @@ class VoteAggregator:
         self.min_conviction = min_conviction
         self.min_category_diversity = min_category_diversity
 
+    def can_still_pass(self, votes: list[PersonaVote], pending: int) -> bool:
+        """Whether *votes* plus *pending* further votes could still pass.
+
+        Only the BUY threshold is checked: once even *pending* extra BUYs
+        cannot reach it, the decision is fixed at ``passes_threshold=False``
+        whatever the remaining votes are (or whether they are cast at all).
+        """
+        buy_count = sum(1 for v in votes if v.action == VoteAction.BUY)
+        return buy_count + pending >= self.threshold
+
     def aggregate(
         self,
         votes: list[PersonaVote],
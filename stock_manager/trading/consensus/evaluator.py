@@ -1,24 +1,48 @@
 """Consensus evaluator: orchestrates parallel persona evaluation.
 
 Fetches a MarketSnapshot for a symbol, fans out evaluation to all
-investor personas (and the optional Wood advisory) via a thread pool,
-collects votes, and delegates to VoteAggregator for the final decision.
+investor personas (and the optional Wood advisory) via a long-lived thread
+pool, collects votes, and delegates to VoteAggregator for the final decision.
+
+Personas are submitted cheapest first (rule-only before LLM-capable). With
+``short_circuit`` enabled, collection stops as soon as the aggregator can no
+longer pass the symbol; queued evaluations are cancelled and the skipped
+personas are reported in ``ConsensusResult.not_evaluated``. Evaluations that
+are already running are abandoned, not stopped: Python threads cannot be
+interrupted, so each one keeps its pool worker until it returns and its vote
+is discarded.
+
+Each evaluation's timeout starts when it begins running, so time spent
+queued behind other personas in the shared pool does not count against it.
+An evaluation that never gets a worker is given up once the pool could have
+run every submission back to back (``ceil(n / max_workers)`` timeouts).
+
+With ``llm_batching`` enabled, hybrid personas only run their rule stage in
+the pool; every persona that wants LLM verification is then verified by a
+single batched request (see ``personas.hybrid_batch``).
 """
 
 from __future__ import annotations
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
 from stock_manager.trading.consensus.aggregator import VoteAggregator
 from stock_manager.trading.personas.base import InvestorPersona
 
 if TYPE_CHECKING:
     from stock_manager.trading.indicators.fetcher import TechnicalDataFetcher
+    from stock_manager.trading.personas.hybrid import HybridPersona
 from stock_manager.trading.personas.models import (
     AdvisoryVote,
     ConsensusResult,
+    MarketSnapshot,
     PersonaVote,
     VoteAction,
 )
@@ -27,6 +51,8 @@ from stock_manager.trading.personas.wood_advisory import WoodAdvisory
 logger = logging.getLogger(__name__)
 
 _PERSONA_TIMEOUT_SECONDS = 60
+# Wait granularity while an evaluation is still queued (has no start time).
+_START_POLL_SEC = 0.05
 
 
 class ConsensusEvaluator:
@@ -34,11 +60,16 @@ class ConsensusEvaluator:
 
     Workflow:
         1. Fetch a ``MarketSnapshot`` via ``TechnicalDataFetcher``.
-        2. Submit each persona's ``evaluate(snapshot)`` to a thread pool.
+        2. Submit each persona's ``evaluate(snapshot)`` to the shared thread
+           pool, cheapest (rule-only) personas first.
         3. Optionally submit the Wood advisory evaluation.
-        4. Collect results (timeout per persona, ABSTAIN on failure).
+        4. Collect results (timeout per persona, ABSTAIN on failure),
+           stopping early once the decision is fixed (``short_circuit``).
         5. Delegate to ``VoteAggregator`` for the consensus decision.
 
+    The pool is created on first use and reused for every symbol until
+    :meth:`close`.
+
     Thread safety: ``MarketSnapshot`` is frozen (immutable) and each persona's
     ``screen_rule`` is stateless, so concurrent reads are safe.
 
@@ -48,6 +79,11 @@ class ConsensusEvaluator:
         fetcher: Data fetcher that produces MarketSnapshot instances.
         aggregator: Vote aggregator for the final decision.
         max_workers: Maximum thread pool size for parallel evaluation.
+        llm_batching: Verify all triggered hybrid personas of a symbol with
+            one batched LLM request instead of one request each.
+        short_circuit: Stop evaluating a symbol once ``VoteAggregator`` can
+            no longer pass it; skipped personas cast no vote. Running
+            evaluations are abandoned and still occupy their workers.
     """
 
     def __init__(
@@ -57,12 +93,38 @@ class ConsensusEvaluator:
         fetcher: TechnicalDataFetcher,
         aggregator: VoteAggregator,
         max_workers: int = 5,
+        llm_batching: bool = False,
+        short_circuit: bool = False,
     ) -> None:
         self.personas = personas
         self.advisory = advisory
         self.fetcher = fetcher
         self.aggregator = aggregator
         self.max_workers = max_workers
+        self.llm_batching = llm_batching
+        self.short_circuit = short_circuit
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the persona pool and the fetcher's pool (recreated on next use)."""
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        close_fetcher = getattr(self.fetcher, "close", None)
+        if callable(close_fetcher):
+            close_fetcher()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="PersonaEval",
+                )
+            return self._executor
 
     def evaluate(self, symbol: str) -> ConsensusResult:
         """Run the full consensus pipeline for a single symbol.
@@ -78,72 +140,223 @@ class ConsensusEvaluator:
 
         votes: list[PersonaVote] = []
         advisory_vote: AdvisoryVote | None = None
+        deferred: list[tuple[HybridPersona, PersonaVote]] = []
+        evaluate = self._rule_stage if self.llm_batching else _full_evaluation
+        executor = self._get_executor()
+        personas = sorted(self.personas, key=_evaluation_cost)
+        waves = math.ceil((len(personas) + (self.advisory is not None)) / self.max_workers)
+        queue_deadline = time.monotonic() + waves * _PERSONA_TIMEOUT_SECONDS
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 2. Submit persona evaluations
-            persona_futures = {
-                executor.submit(persona.evaluate, snapshot): persona
-                for persona in self.personas
-            }
-
-            # 3. Submit advisory evaluation (if configured)
-            advisory_future = None
-            if self.advisory is not None:
-                advisory_future = executor.submit(self.advisory.evaluate, snapshot)
-
-            # 4. Collect persona votes
-            for future in as_completed(
-                persona_futures, timeout=_PERSONA_TIMEOUT_SECONDS
-            ):
-                persona = persona_futures[future]
-                try:
-                    vote = future.result(timeout=_PERSONA_TIMEOUT_SECONDS)
-                    votes.append(vote)
-                except Exception:
-                    logger.warning(
-                        "Persona %s failed for %s; recording ABSTAIN",
-                        persona.name,
-                        symbol,
-                        exc_info=True,
-                    )
-                    votes.append(
-                        PersonaVote(
-                            persona_name=persona.name,
-                            action=VoteAction.ABSTAIN,
-                            conviction=0.0,
-                            reasoning=f"Evaluation failed for {symbol}",
-                            criteria_met={},
-                            category=persona.category,
-                        )
-                    )
+        # 2. Submit persona evaluations, cheapest first
+        calls: dict[Future, _TimedCall] = {}
+        persona_futures: dict[Future, InvestorPersona] = {}
+        for persona in personas:
+            call = _TimedCall(evaluate, persona, snapshot)
+            future = executor.submit(call)
+            calls[future] = call
+            persona_futures[future] = persona
 
-            # 5. Collect advisory vote
-            if advisory_future is not None:
-                try:
-                    advisory_vote = advisory_future.result(
-                        timeout=_PERSONA_TIMEOUT_SECONDS
-                    )
-                except Exception:
+        # 3. Submit advisory evaluation (if configured)
+        advisory_future = None
+        if self.advisory is not None:
+            advisory_call = _TimedCall(self.advisory.evaluate, snapshot)
+            advisory_future = executor.submit(advisory_call)
+            calls[advisory_future] = advisory_call
+
+        # 4. Collect persona votes until every persona is in or the
+        #    decision can no longer change
+        outstanding = set(persona_futures)
+        try:
+            while outstanding:
+                done, _ = wait(
+                    outstanding,
+                    timeout=_next_wait_timeout((calls[f] for f in outstanding), queue_deadline),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    outstanding.discard(future)
+                    self._collect(symbol, persona_futures[future], future, votes, deferred)
+                now = time.monotonic()
+                for future in [f for f in outstanding if calls[f].is_overdue(now, queue_deadline)]:
+                    outstanding.discard(future)
+                    future.cancel()
+                    persona = persona_futures[future]
                     logger.warning(
-                        "Wood advisory failed for %s; skipping advisory",
-                        symbol,
-                        exc_info=True,
+                        "Persona %s timed out for %s; recording ABSTAIN", persona.name, symbol
                     )
+                    votes.append(_abstain_vote(persona, f"Evaluation timed out for {symbol}"))
+                pending = len(outstanding) + len(deferred)
+                if self.short_circuit and not self.aggregator.can_still_pass(votes, pending):
+                    break
+        finally:
+            for future in outstanding:
+                future.cancel()
+
+        not_evaluated: list[str] = []
+        for future in outstanding:
+            persona = persona_futures[future]
+            if future.done() and not future.cancelled():
+                self._collect(symbol, persona, future, votes, deferred)
+            else:
+                not_evaluated.append(persona.name)
+        if not_evaluated:
+            logger.debug(
+                "Decision fixed for %s; not evaluated: %s", symbol, ", ".join(not_evaluated)
+            )
+
+        # 5. Collect advisory vote
+        if advisory_future is not None:
+            advisory_call = calls[advisory_future]
+            while not advisory_future.done() and not advisory_call.is_overdue(
+                time.monotonic(), queue_deadline
+            ):
+                wait([advisory_future], timeout=_next_wait_timeout([advisory_call], queue_deadline))
+            try:
+                if not advisory_future.done():
+                    advisory_future.cancel()
+                    raise TimeoutError(f"Wood advisory timed out for {symbol}")
+                advisory_vote = advisory_future.result()
+            except Exception:
+                logger.warning(
+                    "Wood advisory failed for %s; skipping advisory",
+                    symbol,
+                    exc_info=True,
+                )
+
+        # 6. Batched LLM verification of deferred hybrid personas (their
+        #    rule votes stand when the decision is already fixed)
+        if deferred:
+            if self.short_circuit and not self.aggregator.can_still_pass(votes, len(deferred)):
+                votes.extend(rule_vote for _, rule_vote in deferred)
+            else:
+                votes.extend(self._verify_batch(symbol, snapshot, deferred))
 
-        # 6. Aggregate and return
+        # 7. Aggregate and return
         result = self.aggregator.aggregate(votes, advisory_vote)
         # Ensure the symbol is set on the result
-        if not result.symbol:
-            result = ConsensusResult(
-                symbol=symbol,
-                votes=result.votes,
-                advisory_vote=result.advisory_vote,
-                buy_count=result.buy_count,
-                sell_count=result.sell_count,
-                hold_count=result.hold_count,
-                abstain_count=result.abstain_count,
-                passes_threshold=result.passes_threshold,
-                avg_conviction=result.avg_conviction,
-                category_diversity=result.category_diversity,
+        return replace(
+            result, symbol=result.symbol or symbol, not_evaluated=not_evaluated
+        )
+
+    @staticmethod
+    def _collect(
+        symbol: str,
+        persona: InvestorPersona,
+        future: Future,
+        votes: list[PersonaVote],
+        deferred: list[tuple[HybridPersona, PersonaVote]],
+    ) -> None:
+        """Record a finished persona evaluation (ABSTAIN on failure)."""
+        try:
+            vote = future.result()
+            if isinstance(vote, _DeferredVerification):
+                deferred.append((vote.persona, vote.rule_vote))
+            else:
+                votes.append(vote)
+        except Exception:
+            logger.warning(
+                "Persona %s failed for %s; recording ABSTAIN",
+                persona.name,
+                symbol,
+                exc_info=True,
+            )
+            votes.append(_abstain_vote(persona, f"Evaluation failed for {symbol}"))
+
+    @staticmethod
+    def _rule_stage(
+        persona: InvestorPersona, snapshot: MarketSnapshot
+    ) -> PersonaVote | _DeferredVerification:
+        """Full evaluation, except hybrid personas needing the LLM are deferred."""
+        from stock_manager.trading.personas.hybrid import HybridPersona
+
+        if not isinstance(persona, HybridPersona):
+            return persona.evaluate(snapshot)
+        rule_vote = persona.screen_rule(snapshot)
+        if not persona.should_trigger_llm(rule_vote):
+            return rule_vote
+        return _DeferredVerification(persona, rule_vote)
+
+    @staticmethod
+    def _verify_batch(
+        symbol: str,
+        snapshot: MarketSnapshot,
+        deferred: list[tuple[HybridPersona, PersonaVote]],
+    ) -> list[PersonaVote]:
+        from stock_manager.trading.personas.hybrid_batch import BatchedLLMVerifier
+
+        try:
+            return BatchedLLMVerifier().verify(snapshot, deferred)
+        except Exception:
+            logger.warning(
+                "Batched LLM verification failed for %s; using rule-based votes",
+                symbol,
+                exc_info=True,
             )
-        return result
+            return [rule_vote for _, rule_vote in deferred]
+
+
+@dataclass(frozen=True)
+class _DeferredVerification:
+    """Rule-stage result of a hybrid persona awaiting batched LLM verification."""
+
+    persona: HybridPersona
+    rule_vote: PersonaVote
+
+
+class _TimedCall:
+    """Pool task that records when it starts running, for per-task timeouts."""
+
+    __slots__ = ("fn", "args", "started")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any) -> None:
+        self.fn = fn
+        self.args = args
+        self.started: float | None = None
+
+    def __call__(self) -> Any:
+        self.started = time.monotonic()
+        return self.fn(*self.args)
+
+    def is_overdue(self, now: float, queue_deadline: float) -> bool:
+        if self.started is None:
+            return now >= queue_deadline
+        return now - self.started >= _PERSONA_TIMEOUT_SECONDS
+
+
+def _next_wait_timeout(calls: Iterable[_TimedCall], queue_deadline: float) -> float:
+    """Seconds until the earliest running call is due (short poll while any is queued)."""
+    now = time.monotonic()
+    timeout = queue_deadline - now
+    for call in calls:
+        if call.started is None:
+            timeout = min(timeout, _START_POLL_SEC)
+        else:
+            timeout = min(timeout, call.started + _PERSONA_TIMEOUT_SECONDS - now)
+    return max(0.0, timeout)
+
+
+def _abstain_vote(persona: InvestorPersona, reasoning: str) -> PersonaVote:
+    return PersonaVote(
+        persona_name=persona.name,
+        action=VoteAction.ABSTAIN,
+        conviction=0.0,
+        reasoning=reasoning,
+        criteria_met={},
+        category=persona.category,
+    )
+
+
+def _full_evaluation(persona: InvestorPersona, snapshot: MarketSnapshot) -> PersonaVote:
+    return persona.evaluate(snapshot)
+
+
+def _evaluation_cost(persona: InvestorPersona) -> float:
+    """Relative cost: 0 for rule-only personas, >1 for LLM-capable ones.
+
+    LLM-capable personas are ordered by how often they call the LLM.
+    """
+    from stock_manager.trading.personas.hybrid import HybridPersona
+
+    if isinstance(persona, HybridPersona):
+        return 1.0 + persona.llm_trigger_rate
+    return 0.0
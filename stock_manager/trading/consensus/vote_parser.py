@@ -2,6 +2,10 @@
 
 Supports both English and Korean (한국어) action keywords and field labels.
 Falls back to ABSTAIN with 0.0 conviction on any parse failure.
+
+Batched responses (one request answered for several personas) carry one
+``### PERSONA: <name>`` section per persona; :meth:`VoteParser.split_batch`
+splits them for :meth:`VoteParser.parse`.
 """
 
 from __future__ import annotations
@@ -31,6 +35,28 @@ class VoteParser:
 
     CONVICTION_PATTERN = r"(?:CONVICTION|확신도)[:\s]*([0-9]*\.?[0-9]+)"
     REASONING_PATTERN = r"(?:REASONING|분석|근거)[:\s]*(.*?)(?:\n|$)"
+    PERSONA_HEADER_PATTERN = r"^[ \t]*#*[ \t]*(?:PERSONA|페르소나)[ \t]*:[ \t]*(.+?)[ \t]*$"
+
+    @staticmethod
+    def split_batch(response: str) -> dict[str, str]:
+        """Split a batched response into per-persona sections.
+
+        Returns:
+            Section text keyed by case-folded persona name.  Text before the
+            first header is ignored; a repeated header keeps the first
+            section.
+        """
+        sections: dict[str, str] = {}
+        headers = list(
+            re.finditer(
+                VoteParser.PERSONA_HEADER_PATTERN, response or "", re.IGNORECASE | re.MULTILINE
+            )
+        )
+        for index, header in enumerate(headers):
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(response)
+            name = header.group(1).strip("*`# ").casefold()
+            sections.setdefault(name, response[header.end():end].strip())
+        return sections
 
     @staticmethod
     def parse(
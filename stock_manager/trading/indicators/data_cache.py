@@ -0,0 +1,304 @@
+"""Tiered per-data-class cache for TechnicalDataFetcher API results.
+
+``OHLCVCache`` stores whole ``MarketSnapshot`` objects under a single TTL,
+but the inputs to a snapshot age at very different speeds:
+
+    - quote        current price, VKOSPI            -- seconds
+    - daily        daily OHLCV history/technicals   -- until the next KRX session
+    - fundamental  balance sheet, income statement,
+                   financial/growth/profit/stability ratios -- days
+
+``TieredDataCache`` keys entries by ``(symbol, data_class)`` and applies the
+TTL of the entry's tier. Daily and fundamental entries can be persisted to a
+JSON file so a restart during the trading day does not refetch them, and
+hit/miss counters are kept per tier.
+
+Thread-safe via RLock, following ``OHLCVCache``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+QUOTE = "quote"
+DAILY = "daily"
+FUNDAMENTAL = "fundamental"
+
+TIERS: tuple[str, ...] = (QUOTE, DAILY, FUNDAMENTAL)
+_PERSISTED_TIERS = frozenset({DAILY, FUNDAMENTAL})
+
+DATA_CACHE_VERSION = 1
+_KST = ZoneInfo("Asia/Seoul")
+_SESSION_OPEN_HOUR = 9
+
+
+def next_session_open(now: float | None = None) -> float:
+    """Return the epoch time of the next KRX session open (09:00 KST, Mon-Fri).
+
+    Holidays are not modelled; a stale entry on a holiday is simply refetched
+    on the following session open.
+    """
+    current = datetime.fromtimestamp(time.time() if now is None else now, tz=_KST)
+    candidate = current.replace(hour=_SESSION_OPEN_HOUR, minute=0, second=0, microsecond=0)
+    if candidate <= current:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    return candidate.timestamp()
+
+
+@dataclass
+class _DataEntry:
+    """Cached value with an absolute wall-clock expiry (survives restarts)."""
+
+    value: Any
+    tier: str
+    expires_at: float  # time.time() epoch seconds
+
+
+@dataclass
+class TierStats:
+    """Hit/miss counters for one cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TieredDataCache:
+    """Thread-safe cache of fetcher results keyed by (symbol, data class).
+
+    Args:
+        quote_ttl_sec: TTL for intraday quote data.
+        fundamental_ttl_sec: TTL for quarterly fundamentals (default 3 days).
+        daily_ttl_sec: Fixed TTL for daily OHLCV data. ``None`` (default)
+            keeps daily data until the next KRX session open.
+        persist_path: Optional JSON file for daily/fundamental entries.
+            Loaded on construction and written by ``save()``.
+        save_interval_sec: Minimum spacing between writes made through
+            ``maybe_save()``. ``close()`` always writes pending changes.
+
+    Usage:
+        cache = TieredDataCache(persist_path=Path("~/.stock_manager/data_cache.json"))
+        fetcher = TechnicalDataFetcher(client, data_cache=cache)
+        fetcher.fetch_snapshot("005930")   # 9 KIS calls
+        fetcher.fetch_snapshot("005930")   # quote calls only
+    """
+
+    def __init__(
+        self,
+        *,
+        quote_ttl_sec: float = 5.0,
+        fundamental_ttl_sec: float = 3 * 24 * 3600.0,
+        daily_ttl_sec: float | None = None,
+        persist_path: Path | None = None,
+        save_interval_sec: float = 60.0,
+    ) -> None:
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._data: dict[tuple[str, str], _DataEntry] = {}
+        self._stats: dict[str, TierStats] = {tier: TierStats() for tier in TIERS}
+        self.quote_ttl_sec = max(0.0, quote_ttl_sec)
+        self.fundamental_ttl_sec = max(0.0, fundamental_ttl_sec)
+        self.daily_ttl_sec = daily_ttl_sec
+        self.persist_path = Path(persist_path).expanduser() if persist_path else None
+        self.save_interval_sec = max(0.0, save_interval_sec)
+        self._dirty = False
+        self._last_save = time.monotonic()
+        if self.persist_path is not None:
+            self.load()
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(self, symbol: str, data_class: str, tier: str) -> Any | None:
+        """Return the cached value if present and fresh, else None.
+
+        Counts a hit or miss against *tier*; expired entries are dropped.
+        """
+        self._check_tier(tier)
+        key = (symbol, data_class)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self._stats[tier].misses += 1
+                return None
+            self._stats[tier].hits += 1
+            return entry.value
+
+    def put(self, symbol: str, data_class: str, tier: str, value: Any) -> None:
+        """Store *value* with the TTL of *tier*."""
+        self._check_tier(tier)
+        with self._lock:
+            self._data[(symbol, data_class)] = _DataEntry(
+                value=value,
+                tier=tier,
+                expires_at=self._expiry_for(tier),
+            )
+            if tier in _PERSISTED_TIERS:
+                self._dirty = True
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """Drop all entries for *symbol*, or everything when None."""
+        with self._lock:
+            if symbol is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if k[0] == symbol]:
+                    del self._data[key]
+            self._dirty = True
+
+    def stats(self) -> dict[str, TierStats]:
+        """Return a copy of the hit/miss counters per tier."""
+        with self._lock:
+            return {
+                tier: TierStats(hits=s.hits, misses=s.misses) for tier, s in self._stats.items()
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def load(self) -> int:
+        """Load persisted entries that are still fresh. Returns the count loaded."""
+        if self.persist_path is None or not self.persist_path.exists():
+            return 0
+        try:
+            raw = json.loads(self.persist_path.read_text(encoding="utf-8"))
+        except Exception:
+            logger.warning("Ignoring unreadable data cache %s", self.persist_path)
+            return 0
+        if not isinstance(raw, dict) or raw.get("version") != DATA_CACHE_VERSION:
+            return 0
+
+        now = time.time()
+        loaded = 0
+        with self._lock:
+            for item in raw.get("entries", []):
+                try:
+                    symbol, data_class = str(item["symbol"]), str(item["data_class"])
+                    tier = str(item["tier"])
+                    expires_at = float(item["expires_at"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if tier not in _PERSISTED_TIERS or expires_at <= now:
+                    continue
+                self._data[(symbol, data_class)] = _DataEntry(
+                    value=item.get("value"),
+                    tier=tier,
+                    expires_at=expires_at,
+                )
+                loaded += 1
+        return loaded
+
+    def save(self) -> bool:
+        """Prune expired entries and write persistable ones if anything changed.
+
+        Concurrent calls are serialized so an older snapshot never replaces a
+        newer one. Returns True if a file was written. Failures are logged,
+        never raised.
+        """
+        if self.persist_path is None:
+            return False
+        with self._save_lock:
+            with self._lock:
+                self._last_save = time.monotonic()
+                if not self._dirty:
+                    return False
+                now = time.time()
+                for key in [k for k, e in self._data.items() if e.expires_at <= now]:
+                    del self._data[key]
+                entries = [
+                    {
+                        "symbol": symbol,
+                        "data_class": data_class,
+                        "tier": entry.tier,
+                        "expires_at": entry.expires_at,
+                        "value": entry.value,
+                    }
+                    for (symbol, data_class), entry in self._data.items()
+                    if entry.tier in _PERSISTED_TIERS
+                ]
+                self._dirty = False
+
+            try:
+                _atomic_write_json(
+                    self.persist_path,
+                    {"version": DATA_CACHE_VERSION, "entries": entries},
+                )
+            except Exception:
+                logger.warning(
+                    "Failed to persist data cache to %s", self.persist_path, exc_info=True
+                )
+                with self._lock:
+                    self._dirty = True
+                return False
+            return True
+
+    def maybe_save(self) -> bool:
+        """``save()`` if at least ``save_interval_sec`` passed since the last one."""
+        with self._lock:
+            if time.monotonic() - self._last_save < self.save_interval_sec:
+                return False
+        return self.save()
+
+    def close(self) -> None:
+        """Write any pending changes; call on shutdown."""
+        self.save()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _check_tier(tier: str) -> None:
+        if tier not in TIERS:
+            raise ValueError(f"Unknown cache tier: {tier}")
+
+    def _expiry_for(self, tier: str) -> float:
+        now = time.time()
+        if tier == QUOTE:
+            return now + self.quote_ttl_sec
+        if tier == FUNDAMENTAL:
+            return now + self.fundamental_ttl_sec
+        if self.daily_ttl_sec is not None:
+            return now + max(0.0, self.daily_ttl_sec)
+        return next_session_open(now)
+
+
+def _atomic_write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -12,16 +12,31 @@ API endpoints used:
     - get_growth_ratio        (info.py)   -- YoY growth rates
     - get_profit_ratio        (info.py)   -- profitability ratios
     - get_stability_ratio     (info.py)   -- debt/equity, current ratio
+
+The calls are independent of each other, so ``fetch_snapshot`` can fan them
+out over a bounded worker pool (``max_concurrent_calls > 1``). Every call
+still waits on the rate budget; concurrency only removes the idle round-trip
+time between calls. KIS clients enforce the per-app-key budget they share
+with every other caller (PriceMonitor, order paths), so the fetcher adds a
+limiter of its own only in front of clients that do not.
+
+The daily bars behind the technicals are kept per symbol and exposed through
+``recent_daily_prices`` so the Soros cycle detector can reuse them instead of
+issuing its own ``inquire_daily_price`` request for the same symbol.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from typing import Any, Callable
 
 from stock_manager.adapters.broker.kis.exceptions import KISAPIError
+from stock_manager.adapters.broker.kis.rate_limit import client_rate_limiter
 from stock_manager.trading.personas.models import MarketSnapshot
 from stock_manager.pipeline.indicators import (
     compute_snapshot_ohlcv,
@@ -39,10 +54,34 @@ from stock_manager.adapters.broker.kis.apis.domestic_stock.info import (
     get_profit_ratio,
     get_stability_ratio,
 )
+from stock_manager.trading.indicators.data_cache import (
+    DAILY,
+    FUNDAMENTAL,
+    QUOTE,
+    TieredDataCache,
+)
 from stock_manager.trading.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 _DEFAULT_FETCHER_RATE_LIMIT_PER_SEC = 8
+_DEFAULT_FETCHER_MAX_CONCURRENT_CALLS = 1
+_VKOSPI_CODE = "580003"
+# inquire_daily_price answers with the latest 30 trading days; shared bars
+# keep that window so cycle detection sees the same data either way.
+_RECENT_DAILY_BARS = 30
+
+# Cache tier per snapshot call (see TieredDataCache).
+_CALL_TIERS: dict[str, str] = {
+    "current_price": QUOTE,
+    "vkospi": QUOTE,
+    "technicals": DAILY,
+    "financial_ratio": FUNDAMENTAL,
+    "balance_sheet": FUNDAMENTAL,
+    "income_statement": FUNDAMENTAL,
+    "growth_ratio": FUNDAMENTAL,
+    "profit_ratio": FUNDAMENTAL,
+    "stability_ratio": FUNDAMENTAL,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -119,6 +158,14 @@ class TechnicalDataFetcher:
 
     Args:
         client: KISRestClient instance for making API requests.
+        real_client: Optional real-server client used for real-only APIs in mock mode.
+        rate_limiter: Extra limiter acquired before every KIS call. When
+            omitted, one is created only if *client* does not already wait on
+            the shared per-app-key budget.
+        rate_limit_per_sec: Limit for that default limiter.
+        max_concurrent_calls: Worker pool size for the per-symbol KIS calls.
+            ``1`` keeps the calls sequential on the caller's thread.
+        data_cache: Optional tiered cache; fresh entries skip their KIS call.
     """
 
     def __init__(
@@ -128,11 +175,118 @@ class TechnicalDataFetcher:
         real_client: Any | None = None,
         rate_limiter: RateLimiter | None = None,
         rate_limit_per_sec: int = _DEFAULT_FETCHER_RATE_LIMIT_PER_SEC,
+        max_concurrent_calls: int = _DEFAULT_FETCHER_MAX_CONCURRENT_CALLS,
+        data_cache: TieredDataCache | None = None,
     ) -> None:
         self.client = client
         self._real_client = real_client
-        self._rate_limiter = rate_limiter or RateLimiter(max_requests=max(1, rate_limit_per_sec))
+        if rate_limiter is None and client_rate_limiter(client) is None:
+            rate_limiter = RateLimiter(max_requests=max(1, rate_limit_per_sec))
+        self._rate_limiter = rate_limiter
         self._mock_skip_log_once: set[str] = set()
+        self.max_concurrent_calls = max(1, int(max_concurrent_calls))
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._call_timings: dict[str, dict[str, float]] = {}
+        self._timings_lock = threading.Lock()
+        self._data_cache = data_cache
+        self._recent_daily: dict[str, list[dict[str, str]]] = {}
+        self._recent_daily_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the fetch worker pool (if any) and persist the data cache."""
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self._data_cache is not None:
+            self._data_cache.close()
+
+    def get_call_timings(self, symbol: str) -> dict[str, float]:
+        """Return per-call wall-clock durations (seconds) of the last fetch for *symbol*."""
+        with self._timings_lock:
+            return dict(self._call_timings.get(symbol, {}))
+
+    def recent_daily_prices(self, symbol: str) -> list[dict[str, str]] | None:
+        """Daily bars from the last ``fetch_snapshot`` of *symbol*, newest first.
+
+        Rows use the ``inquire_daily_price`` field names (``stck_bsop_date``,
+        ``stck_clpr``, ``acml_vol``). Returns None when *symbol* has not been
+        fetched or its price history was unavailable.
+        """
+        with self._recent_daily_lock:
+            rows = self._recent_daily.get(symbol)
+        return list(rows) if rows else None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_calls,
+                    thread_name_prefix="SnapshotFetch",
+                )
+            return self._executor
+
+    def _cached_call(self, key_symbol: str, name: str, fn: Callable[[], Any]) -> Callable[[], Any]:
+        """Wrap *fn* so a fresh ``data_cache`` entry short-circuits the KIS call.
+
+        Empty results (degraded data) are never cached.
+        """
+        cache = self._data_cache
+        if cache is None:
+            return fn
+        tier = _CALL_TIERS[name]
+
+        def _call() -> Any:
+            cached = cache.get(key_symbol, name, tier)
+            if cached is not None:
+                return cached
+            value = fn()
+            if value:
+                cache.put(key_symbol, name, tier, value)
+            return value
+
+        return _call
+
+    def _run_fetch_calls(
+        self,
+        symbol: str,
+        calls: dict[str, Callable[[], Any]],
+    ) -> dict[str, Any]:
+        """Run the named fetch calls and record how long each one took.
+
+        Calls run sequentially when ``max_concurrent_calls`` is 1, otherwise
+        they are submitted to the shared worker pool and collected once the
+        last one returns.
+        """
+        timings: dict[str, float] = {}
+
+        def timed(name: str, fn: Callable[[], Any]) -> Any:
+            started = time.perf_counter()
+            try:
+                return fn()
+            finally:
+                timings[name] = time.perf_counter() - started
+
+        results: dict[str, Any] = {}
+        if self.max_concurrent_calls <= 1:
+            for name, fn in calls.items():
+                results[name] = timed(name, fn)
+        else:
+            executor = self._get_executor()
+            futures = {name: executor.submit(timed, name, fn) for name, fn in calls.items()}
+            for name, future in futures.items():
+                results[name] = future.result()
+
+        with self._timings_lock:
+            self._call_timings[symbol] = timings
+        logger.debug(
+            "Snapshot calls for %s: %s",
+            symbol,
+            ", ".join(f"{name}={elapsed * 1000:.1f}ms" for name, elapsed in timings.items()),
+        )
+        return results
 
     def _is_mock_mode(self) -> bool:
         config = getattr(self.client, "config", None)
@@ -146,6 +300,10 @@ class TechnicalDataFetcher:
         msg1 = str(payload.get("msg1", ""))
         return msg_cd == "EGW00201" or "초당 거래건수" in msg1
 
+    def _acquire_rate_limit(self) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
     def _call_kis_api(
         self,
         api_name: str,
@@ -156,7 +314,7 @@ class TechnicalDataFetcher:
     ) -> dict[str, Any]:
         if skip_in_mock and self._is_mock_mode():
             if self._real_client is not None:
-                self._rate_limiter.acquire()
+                self._acquire_rate_limit()
                 try:
                     return fn(self._real_client, *args, **kwargs)
                 except Exception:
@@ -169,7 +327,7 @@ class TechnicalDataFetcher:
                 self._mock_skip_log_once.add(api_name)
             return {}
 
-        self._rate_limiter.acquire()
+        self._acquire_rate_limit()
         try:
             return fn(self.client, *args, **kwargs)
         except KISAPIError as error:
@@ -185,7 +343,8 @@ class TechnicalDataFetcher:
     def fetch_snapshot(self, symbol: str) -> MarketSnapshot:
         """Fetch all data and assemble a MarketSnapshot for the given symbol.
 
-        Makes multiple KIS API calls sequentially:
+        Makes the following independent KIS API calls, sequentially or over
+        the worker pool depending on ``max_concurrent_calls``:
             1. Current price data
             2. Financial ratios (P/E, P/B, ROE, EPS)
             3. Balance sheet
@@ -194,6 +353,11 @@ class TechnicalDataFetcher:
             6. Growth ratios
             7. Profitability ratios
             8. Stability ratios
+            9. VKOSPI market context
+
+        Per-call timings are available afterwards via ``get_call_timings``.
+        With a ``data_cache``, calls whose tier entry is still fresh are
+        served from the cache instead of KIS.
 
         Args:
             symbol: 6-digit stock code (e.g., '005930').
@@ -201,32 +365,37 @@ class TechnicalDataFetcher:
         Returns:
             Fully populated MarketSnapshot (frozen dataclass).
         """
-        # --- 1. Current price ---
-        price_data = self._fetch_current_price(symbol)
-
-        # --- 2. Financial ratios ---
-        fin_ratio = self._fetch_financial_ratio(symbol)
-
-        # --- 3. Balance sheet ---
-        balance = self._fetch_balance_sheet(symbol)
-
-        # --- 4. OHLCV history + technical indicators ---
-        technicals = self._fetch_technicals(symbol)
-
-        # --- 5. Income statement ---
-        income = self._fetch_income_statement(symbol)
-
-        # --- 6. Growth ratios ---
-        growth = self._fetch_growth_ratio(symbol)
-
-        # --- 7. Profit ratios ---
-        profit = self._fetch_profit_ratio(symbol)
-
-        # --- 8. Stability ratios ---
-        stability = self._fetch_stability_ratio(symbol)
-
-        # --- 9. Market context ---
-        vkospi = self._fetch_vkospi()
+        calls: dict[str, Callable[[], Any]] = {
+            "current_price": lambda: self._fetch_current_price(symbol),
+            "financial_ratio": lambda: self._fetch_financial_ratio(symbol),
+            "balance_sheet": lambda: self._fetch_balance_sheet(symbol),
+            "technicals": lambda: self._fetch_technicals(symbol),
+            "income_statement": lambda: self._fetch_income_statement(symbol),
+            "growth_ratio": lambda: self._fetch_growth_ratio(symbol),
+            "profit_ratio": lambda: self._fetch_profit_ratio(symbol),
+            "stability_ratio": lambda: self._fetch_stability_ratio(symbol),
+            "vkospi": self._fetch_vkospi,
+        }
+        results = self._run_fetch_calls(
+            symbol,
+            {
+                name: self._cached_call(_VKOSPI_CODE if name == "vkospi" else symbol, name, fn)
+                for name, fn in calls.items()
+            },
+        )
+        if self._data_cache is not None:
+            self._data_cache.maybe_save()
+        price_data = results["current_price"]
+        fin_ratio = results["financial_ratio"]
+        balance = results["balance_sheet"]
+        technicals = results["technicals"]
+        income = results["income_statement"]
+        growth = results["growth_ratio"]
+        profit = results["profit_ratio"]
+        stability = results["stability_ratio"]
+        vkospi = results["vkospi"]
+        with self._recent_daily_lock:
+            self._recent_daily[symbol] = technicals.get("recent_daily") or []
 
         # --- Assemble MarketSnapshot ---
         return MarketSnapshot(
@@ -406,6 +575,14 @@ class TechnicalDataFetcher:
                 "adx_14": snap.adx14 or 0.0,
                 "atr_14": snap.atr14 or 0.0,
                 "avg_volume_20d": avg_vol,
+                "recent_daily": [
+                    {
+                        "stck_bsop_date": bar.date,
+                        "stck_clpr": str(bar.close),
+                        "acml_vol": str(bar.volume),
+                    }
+                    for bar in reversed(ohlcv[-_RECENT_DAILY_BARS:])
+                ],
             }
         except Exception:
             logger.exception("Failed to fetch technicals for %s", symbol)
@@ -413,7 +590,9 @@ class TechnicalDataFetcher:
 
     def _fetch_vkospi(self) -> float | None:
         """Fetch VKOSPI (Korean VIX) as market stress indicator."""
-        response = self._call_kis_api("inquire_current_price_vkospi", inquire_current_price, "580003")
+        response = self._call_kis_api(
+            "inquire_current_price_vkospi", inquire_current_price, _VKOSPI_CODE
+        )
         output = _get_output(response)
         value = _safe_float(output.get("stck_prpr"), default=0.0)
         return value if value > 0 else None
@@ -1,7 +1,8 @@
 """LLM infrastructure for persona-augmented consensus trading.
 
 Provides Claude Agent SDK integration, circuit breaker for fault tolerance,
-configuration management, invocation counting, and vote parsing.
+configuration management, invocation counting, verdict caching, and vote
+parsing.
 """
 
 from stock_manager.trading.llm.client import (
@@ -10,6 +11,12 @@ from stock_manager.trading.llm.client import (
 )
 from stock_manager.trading.llm.circuit_breaker import CircuitBreaker, CircuitState
 from stock_manager.trading.llm.config import InvocationCounter, LLMConfig
+from stock_manager.trading.llm.verdict_cache import LLMVerdictCache
+from stock_manager.trading.llm.worker_pool import (
+    LLMUnavailableError,
+    LLMWorkerPool,
+    get_worker_pool,
+)
 from stock_manager.trading.consensus.vote_parser import VoteParser
 
 __all__ = [
@@ -19,5 +26,9 @@ __all__ = [
     "CircuitState",
     "InvocationCounter",
     "LLMConfig",
+    "LLMVerdictCache",
+    "LLMUnavailableError",
+    "LLMWorkerPool",
+    "get_worker_pool",
     "VoteParser",
 ]
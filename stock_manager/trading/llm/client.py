@@ -2,7 +2,7 @@
 
 Provides async and sync interfaces for querying Claude via the local CLI.
 Includes retry with exponential backoff and a synchronous wrapper for
-thread-pool contexts.
+thread-pool contexts backed by the shared :class:`LLMWorkerPool`.
 """
 
 from __future__ import annotations
@@ -119,18 +119,30 @@ async def async_persona_query_with_retry(
     return best_response
 
 
-def sync_persona_query(prompt: str, system_prompt: str, **kwargs) -> str | None:
+def sync_persona_query(
+    prompt: str,
+    system_prompt: str,
+    deadline_sec: float | None = None,
+    **kwargs,
+) -> str | None:
     """Synchronous wrapper for thread pool contexts.
 
-    Creates a new event loop via :func:`asyncio.run`.  Safe only when no
-    event loop is already running.
+    Dispatches to the shared :class:`LLMWorkerPool` (persistent event loop,
+    bounded concurrency) and blocks until the response arrives.  Safe to
+    call from any thread, including one with a running event loop.
 
     Args:
         prompt: The user prompt to send.
         system_prompt: System prompt defining persona behaviour.
+        deadline_sec: Overall budget (queueing, retries and backoff);
+            None waits for the query to finish.
         **kwargs: Forwarded to :func:`async_persona_query_with_retry`.
 
     Returns:
-        Response text or None.
+        Response text or None (failure, empty response, missed deadline).
     """
-    return asyncio.run(async_persona_query_with_retry(prompt, system_prompt, **kwargs))
+    from stock_manager.trading.llm.worker_pool import get_worker_pool
+
+    return get_worker_pool().query(
+        prompt, system_prompt, deadline_sec=deadline_sec, **kwargs
+    )
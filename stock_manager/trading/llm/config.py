@@ -1,8 +1,8 @@
 """LLM configuration and invocation counting.
 
 Provides :class:`LLMConfig` for centralised settings (with env-var overrides)
-and :class:`InvocationCounter` for thread-safe daily rate limiting that
-resets at midnight KST.
+and :class:`InvocationCounter` for thread-safe daily rate limiting and
+verdict-cache hit-rate metrics that reset at midnight KST.
 """
 
 from __future__ import annotations
@@ -13,6 +13,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+DEFAULT_VERDICT_CACHE_PATH = "~/.stock_manager/llm_verdict_cache.db"
+
 
 @dataclass(frozen=True)
 class LLMConfig:
@@ -20,6 +22,16 @@ class LLMConfig:
 
     All defaults can be overridden by calling :meth:`from_env` which reads
     the corresponding environment variables.
+
+    ``deadline_sec`` bounds one verification end to end (queueing, retries
+    and backoff) so it finishes inside the evaluator's per-persona timeout.
+
+    ``verdict_cache_*`` configure :class:`LLMVerdictCache`: entry lifetime
+    (0 disables caching), LRU capacity, significant digits kept when
+    bucketing prompt numbers, and the SQLite file (None = memory only).
+
+    ``batch_prompts`` verifies all triggered personas of a symbol with one
+    batched request (see ``personas.hybrid_batch``).
     """
 
     model: str = "claude-sonnet-4-6"
@@ -27,11 +39,17 @@ class LLMConfig:
     max_turns: int = 1
     timeout_sec: float = 30.0
     max_retries: int = 3
+    deadline_sec: float | None = 50.0
     cb_failure_threshold: int = 5
     cb_cooldown_sec: float = 60.0
     cb_sliding_window_sec: float = 300.0
     daily_invocation_limit: int | None = None
     log_all_invocations: bool = True
+    verdict_cache_ttl_sec: float = 900.0
+    verdict_cache_max_entries: int = 2048
+    verdict_cache_precision: int = 3
+    verdict_cache_path: str | None = None
+    batch_prompts: bool = False
 
     @classmethod
     def from_env(cls) -> LLMConfig:
@@ -39,14 +57,20 @@ class LLMConfig:
 
         Env vars read:
             ``CLAUDE_MODEL``, ``CLAUDE_CLI_PATH``, ``LLM_TIMEOUT_SEC``,
-            ``LLM_MAX_RETRIES``, ``LLM_CB_FAILURE_THRESHOLD``,
-            ``LLM_CB_COOLDOWN_SEC``, ``LLM_DAILY_LIMIT``.
+            ``LLM_MAX_RETRIES``, ``LLM_DEADLINE_SEC``, ``LLM_CB_FAILURE_THRESHOLD``,
+            ``LLM_CB_COOLDOWN_SEC``, ``LLM_DAILY_LIMIT``,
+            ``LLM_VERDICT_CACHE_TTL_SEC``, ``LLM_VERDICT_CACHE_PRECISION``,
+            ``LLM_VERDICT_CACHE_PATH`` (empty = memory only; defaults to
+            ``~/.stock_manager/llm_verdict_cache.db``), ``LLM_BATCH_PROMPTS``.
         """
         return cls(
             model=os.environ.get("CLAUDE_MODEL", cls.model),
             cli_path=os.environ.get("CLAUDE_CLI_PATH", cls.cli_path),
             timeout_sec=float(os.environ.get("LLM_TIMEOUT_SEC", cls.timeout_sec)),
             max_retries=int(os.environ.get("LLM_MAX_RETRIES", cls.max_retries)),
+            deadline_sec=(
+                float(v) if (v := os.environ.get("LLM_DEADLINE_SEC")) else cls.deadline_sec
+            ),
             cb_failure_threshold=int(
                 os.environ.get("LLM_CB_FAILURE_THRESHOLD", cls.cb_failure_threshold)
             ),
@@ -56,6 +80,17 @@ class LLMConfig:
             daily_invocation_limit=(
                 int(v) if (v := os.environ.get("LLM_DAILY_LIMIT")) else None
             ),
+            verdict_cache_ttl_sec=float(
+                os.environ.get("LLM_VERDICT_CACHE_TTL_SEC", cls.verdict_cache_ttl_sec)
+            ),
+            verdict_cache_precision=int(
+                os.environ.get("LLM_VERDICT_CACHE_PRECISION", cls.verdict_cache_precision)
+            ),
+            verdict_cache_path=(
+                os.environ.get("LLM_VERDICT_CACHE_PATH", DEFAULT_VERDICT_CACHE_PATH) or None
+            ),
+            batch_prompts=os.environ.get("LLM_BATCH_PROMPTS", "").strip().lower()
+            in ("1", "true", "yes", "on"),
         )
 
 
@@ -63,27 +98,63 @@ class InvocationCounter:
     """Thread-safe daily invocation counter. Resets at midnight KST.
 
     Used to enforce optional daily rate limits on LLM calls to control
-    API spend.
+    API spend. Also tracks daily verdict-cache hits and misses.
     """
 
     def __init__(self) -> None:
         self._count: int = 0
+        self._cache_hits: int = 0
+        self._cache_misses: int = 0
         self._date: str = ""
         self._lock = threading.RLock()
 
+    def _roll_date(self) -> None:
+        today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
+        if today != self._date:
+            self._date = today
+            self._count = 0
+            self._cache_hits = 0
+            self._cache_misses = 0
+
     def increment(self) -> int:
         """Increment the counter and return the new value.
 
         Automatically resets if the KST date has changed since the last call.
         """
         with self._lock:
-            today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
-            if today != self._date:
-                self._date = today
-                self._count = 0
+            self._roll_date()
             self._count += 1
             return self._count
 
+    def record_cache_hit(self) -> None:
+        """Count a verdict served from the cache (no LLM call)."""
+        with self._lock:
+            self._roll_date()
+            self._cache_hits += 1
+
+    def record_cache_miss(self) -> None:
+        """Count a verdict lookup that had to go to the LLM."""
+        with self._lock:
+            self._roll_date()
+            self._cache_misses += 1
+
+    @property
+    def cache_hits(self) -> int:
+        with self._lock:
+            return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        with self._lock:
+            return self._cache_misses
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Today's cache hits / lookups (0.0 before any lookup)."""
+        with self._lock:
+            lookups = self._cache_hits + self._cache_misses
+            return self._cache_hits / lookups if lookups else 0.0
+
     @property
     def count(self) -> int:
         """Current invocation count for today (KST)."""
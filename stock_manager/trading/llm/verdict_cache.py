@@ -0,0 +1,237 @@
+"""Content-addressed cache of LLM persona verdicts.
+
+Why:
+- ``HybridPersona.screen_llm`` asked the LLM on every triggered vote. Each
+  call spawns a Claude CLI subprocess (30s timeout, up to three retries).
+- Re-screening the same watchlist every cycle therefore re-asked identical
+  questions whenever the inputs had barely moved.
+
+How:
+- The key is a SHA-256 over persona, model, system-prompt hash, symbol and
+  the *canonical* prompt. Canonicalisation rounds every number in the
+  prompt to ``precision`` significant digits, so tick-level noise maps to
+  the same key while a real move does not.
+- Entries expire after ``ttl_sec`` and the least recently used entries are
+  evicted beyond ``max_entries``.
+- With a ``path`` the cache is stored in SQLite and survives restarts.
+  Without one it is memory-only.
+
+Only the raw LLM response text is stored. Callers re-parse it, so a cache
+hit produces exactly the vote a live call with that response would.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+from stock_manager.trading.llm.config import LLMConfig
+
+logger = logging.getLogger(__name__)
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def canonicalize_prompt(prompt: str, precision: int = 3) -> str:
+    """Return *prompt* with every number rounded to *precision* significant digits."""
+
+    def _bucket(match: re.Match[str]) -> str:
+        value = float(match.group())
+        if value == 0:
+            return "0"
+        return f"{value:.{precision}g}"
+
+    return _NUMBER.sub(_bucket, prompt)
+
+
+def verdict_key(
+    *,
+    persona: str,
+    model: str,
+    system_prompt: str,
+    symbol: str,
+    prompt: str,
+    precision: int = 3,
+) -> str:
+    """Content address for one persona verdict."""
+    system_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+    material = "\x1f".join(
+        (persona, model, system_hash, symbol, canonicalize_prompt(prompt, precision))
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMVerdictCache:
+    """Thread-safe TTL/LRU cache of LLM responses, optionally persisted to SQLite.
+
+    Args:
+        path: SQLite file for persistence (None = memory only).
+        ttl_sec: Seconds an entry stays valid.
+        max_entries: LRU capacity.
+        precision: Significant digits kept when canonicalising prompts.
+        clock: Wall-clock source (seconds); injectable for tests.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        *,
+        ttl_sec: float = 900.0,
+        max_entries: int = 2048,
+        precision: int = 3,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._ttl_sec = ttl_sec
+        self._max_entries = max_entries
+        self._precision = precision
+        self._clock = clock
+        self._lock = threading.RLock()
+        # key -> (stored_at, response); order = least recently used first
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            self._open(Path(path).expanduser())
+
+    @classmethod
+    def from_config(cls, config: LLMConfig) -> LLMVerdictCache | None:
+        """Build the cache described by *config*; None when caching is disabled."""
+        if config.verdict_cache_ttl_sec <= 0 or config.verdict_cache_max_entries <= 0:
+            return None
+        return cls(
+            config.verdict_cache_path,
+            ttl_sec=config.verdict_cache_ttl_sec,
+            max_entries=config.verdict_cache_max_entries,
+            precision=config.verdict_cache_precision,
+        )
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def key(
+        self, *, persona: str, model: str, system_prompt: str, symbol: str, prompt: str
+    ) -> str:
+        """Content address for a query, using this cache's precision."""
+        return verdict_key(
+            persona=persona,
+            model=model,
+            system_prompt=system_prompt,
+            symbol=symbol,
+            prompt=prompt,
+            precision=self._precision,
+        )
+
+    def get(self, key: str) -> str | None:
+        """Cached response for *key*, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if self._clock() - stored_at >= self._ttl_sec:
+                self._delete(key)
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: str) -> None:
+        """Store *response* under *key*, evicting the least recently used overflow."""
+        with self._lock:
+            stored_at = self._clock()
+            self._entries[key] = (stored_at, response)
+            self._entries.move_to_end(key)
+            evicted: list[str] = []
+            while len(self._entries) > self._max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                evicted.append(old_key)
+            self._persist(key, stored_at, response, evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._execute(lambda conn: conn.execute("DELETE FROM llm_verdicts"))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # SQLite persistence
+    # ------------------------------------------------------------------
+
+    def _open(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_verdicts ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, response TEXT NOT NULL)"
+            )
+            conn.commit()
+            rows = conn.execute(
+                "SELECT key, stored_at, response FROM llm_verdicts "
+                "WHERE stored_at > ? ORDER BY stored_at DESC LIMIT ?",
+                (self._clock() - self._ttl_sec, self._max_entries),
+            ).fetchall()
+        except (OSError, sqlite3.Error):
+            logger.warning(
+                "LLM verdict cache at %s unavailable; using memory only", path, exc_info=True
+            )
+            return
+        self._conn = conn
+        for key, stored_at, response in reversed(rows):
+            self._entries[key] = (stored_at, response)
+
+    def _persist(self, key: str, stored_at: float, response: str, evicted: list[str]) -> None:
+        if self._conn is None:
+            return
+
+        def _write(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_verdicts (key, stored_at, response) "
+                "VALUES (?, ?, ?)",
+                (key, stored_at, response),
+            )
+            conn.executemany(
+                "DELETE FROM llm_verdicts WHERE key = ?", [(k,) for k in evicted]
+            )
+            conn.execute(
+                "DELETE FROM llm_verdicts WHERE stored_at <= ?",
+                (stored_at - self._ttl_sec,),
+            )
+
+        self._execute(_write)
+
+    def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._conn is not None:
+            self._execute(
+                lambda conn: conn.execute("DELETE FROM llm_verdicts WHERE key = ?", (key,))
+            )
+
+    def _execute(self, operation: Callable[[sqlite3.Connection], object]) -> None:
+        assert self._conn is not None
+        try:
+            with self._conn:
+                operation(self._conn)
+        except sqlite3.Error:
+            logger.warning("LLM verdict cache write failed", exc_info=True)
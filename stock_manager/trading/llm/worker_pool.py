@@ -0,0 +1,255 @@
+"""Long-lived execution service for persona LLM queries.
+
+Why:
+- ``sync_persona_query`` used to call :func:`asyncio.run` per query. Every
+  HybridPersona check built and tore down an event loop inside a
+  ``ConsensusEvaluator`` pool thread. Concurrent persona checks could not
+  share anything.
+
+How:
+- One persistent event loop runs in a daemon thread. Callers from any
+  thread submit queries and get a :class:`concurrent.futures.Future` back.
+- An :class:`asyncio.Semaphore` bounds how many queries (CLI sessions) run
+  at once. Every other submission waits on the loop without blocking a
+  thread of its own.
+- A deadline covers queue wait plus the query itself (including retries).
+  On expiry the query task is cancelled and the future resolves to None.
+- The optional :class:`CircuitBreaker` and :class:`InvocationCounter` gate
+  submissions and record outcomes. A rejected submission raises
+  :class:`LLMUnavailableError` immediately.
+
+:func:`get_worker_pool` returns the process-wide pool used by
+``sync_persona_query``. Its size comes from ``LLM_MAX_CONCURRENCY``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+from stock_manager.trading.llm import client
+from stock_manager.trading.llm.circuit_breaker import CircuitBreaker
+from stock_manager.trading.llm.config import InvocationCounter
+
+logger = logging.getLogger(__name__)
+
+QueryFn = Callable[..., Awaitable["str | None"]]
+
+
+class LLMUnavailableError(RuntimeError):
+    """Submission rejected by the circuit breaker or the daily invocation limit."""
+
+
+class LLMWorkerPool:
+    """Persistent event-loop thread that runs LLM queries with bounded concurrency.
+
+    Args:
+        max_concurrency: Maximum queries in flight at once.
+        circuit_breaker: Optional breaker consulted before each submission
+            and updated with each outcome.
+        invocation_counter: Optional daily counter, incremented per
+            accepted submission.
+        daily_invocation_limit: Limit enforced with *invocation_counter*.
+        query: Coroutine function performing one query (defaults to
+            :func:`client.async_persona_query_with_retry`).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        *,
+        circuit_breaker: CircuitBreaker | None = None,
+        invocation_counter: InvocationCounter | None = None,
+        daily_invocation_limit: int | None = None,
+        query: QueryFn | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._max_concurrency = max_concurrency
+        self._circuit_breaker = circuit_breaker
+        self._invocation_counter = invocation_counter
+        self._daily_invocation_limit = daily_invocation_limit
+        self._query = query
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_flight = 0
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def in_flight(self) -> int:
+        """Queries currently holding a concurrency slot."""
+        return self._in_flight
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the loop thread (idempotent)."""
+        with self._lock:
+            if self.running:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop, args=(loop, ready), name="llm-worker-pool", daemon=True
+            )
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the loop; queries still pending are cancelled."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        prompt: str,
+        system_prompt: str,
+        *,
+        deadline_sec: float | None = None,
+        **kwargs: Any,
+    ) -> concurrent.futures.Future:
+        """Schedule a query and return a future resolving to the response text.
+
+        The future resolves to None when the query fails, returns nothing,
+        or misses *deadline_sec* (measured from submission).
+
+        Raises:
+            LLMUnavailableError: Circuit breaker open or daily limit reached.
+        """
+        self._admit()
+        self.start()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("LLMWorkerPool.submit called from its own loop thread")
+        deadline = None if deadline_sec is None else time.monotonic() + deadline_sec
+        assert self._loop is not None
+        return asyncio.run_coroutine_threadsafe(
+            self._execute(prompt, system_prompt, deadline, kwargs), self._loop
+        )
+
+    def query(
+        self,
+        prompt: str,
+        system_prompt: str,
+        *,
+        deadline_sec: float | None = None,
+        **kwargs: Any,
+    ) -> str | None:
+        """Blocking :meth:`submit`: wait for the response (None on failure)."""
+        future = self.submit(prompt, system_prompt, deadline_sec=deadline_sec, **kwargs)
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            return None
+
+    def _admit(self) -> None:
+        if self._circuit_breaker is not None and not self._circuit_breaker.allow_request():
+            raise LLMUnavailableError("circuit breaker open")
+        counter = self._invocation_counter
+        if counter is not None:
+            if not counter.allow_invocation(self._daily_invocation_limit):
+                raise LLMUnavailableError(
+                    f"daily invocation limit reached ({self._daily_invocation_limit})"
+                )
+            counter.increment()
+
+    async def _execute(
+        self,
+        prompt: str,
+        system_prompt: str,
+        deadline: float | None,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        try:
+            if deadline is None:
+                response = await self._run_query(prompt, system_prompt, kwargs)
+            else:
+                response = await asyncio.wait_for(
+                    self._run_query(prompt, system_prompt, kwargs),
+                    timeout=max(0.0, deadline - time.monotonic()),
+                )
+        except asyncio.TimeoutError:
+            logger.warning("LLM query missed its deadline; cancelled")
+            response = None
+        except Exception:
+            logger.warning("LLM query failed", exc_info=True)
+            response = None
+        self._record_outcome(response is not None)
+        return response
+
+    async def _run_query(
+        self, prompt: str, system_prompt: str, kwargs: dict[str, Any]
+    ) -> str | None:
+        assert self._semaphore is not None
+        query = self._query or client.async_persona_query_with_retry
+        async with self._semaphore:
+            self._in_flight += 1
+            try:
+                return await query(prompt, system_prompt, **kwargs)
+            finally:
+                self._in_flight -= 1
+
+    def _record_outcome(self, succeeded: bool) -> None:
+        if self._circuit_breaker is None:
+            return
+        if succeeded:
+            self._circuit_breaker.record_success()
+        else:
+            self._circuit_breaker.record_failure()
+
+
+_default_pool: LLMWorkerPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> LLMWorkerPool:
+    """Process-wide pool (ungated) sized by ``LLM_MAX_CONCURRENCY`` (default 8)."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = LLMWorkerPool(int(os.environ.get("LLM_MAX_CONCURRENCY", "8")))
+            atexit.register(_default_pool.shutdown)
+        return _default_pool
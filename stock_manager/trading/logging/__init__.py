@@ -1,7 +1,15 @@
 """Trading pipeline logging with NDJSON output."""
 
+from stock_manager.trading.logging.log_index import (
+    DecisionCycle,
+    PipelineLogQuery,
+    build_index,
+)
 from stock_manager.trading.logging.pipeline_logger import PipelineJsonLogger
 
 __all__ = [
+    "DecisionCycle",
     "PipelineJsonLogger",
+    "PipelineLogQuery",
+    "build_index",
 ]
@@ -0,0 +1,356 @@
+"""Indexed queries over daily pipeline NDJSON logs.
+
+Why:
+- Answering "why did we buy 005930 on Tuesday" meant grepping whole days of
+  NDJSON. Every file had to be read and parsed line by line.
+
+How:
+- Each ``{prefix}-{YYYYMMDD}.ndjson`` file gets a sidecar ``.idx`` file. It
+  holds one row per event: byte offset, event type, symbol and session id.
+- The sidecar records the byte size it covers. The logger only appends, so
+  a grown log file is indexed incrementally from that offset. A shrunken or
+  replaced file is re-indexed from scratch.
+- Queries pick files by date, filter on the index rows, then seek to the
+  matching offsets. Only matching lines are read and parsed.
+- Gzipped rolled files (``.ndjson.gz``) cannot be seeked cheaply. They are
+  stream-filtered instead.
+
+``decision_timeline`` groups a symbol's screening, agent votes, consensus
+result and orders into decision cycles for post-mortems.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+_FILE_PATTERN = re.compile(r"^(?P<prefix>.+)-(?P<day>\d{8})\.ndjson(?P<gz>\.gz)?$")
+
+TIMELINE_EVENTS = frozenset(
+    {
+        "screening_complete",
+        "agent_vote",
+        "advisory_vote",
+        "consensus_result",
+        "buy_decision",
+        "order_executed",
+        "sell_trigger",
+        "trade_complete",
+        "error",
+    }
+)
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Location and routing keys of one NDJSON line."""
+
+    offset: int
+    event: str | None
+    symbol: str | None
+    session_id: str | None
+
+
+@dataclass(frozen=True)
+class LogFile:
+    """One daily log file."""
+
+    path: Path
+    prefix: str
+    day: date
+
+    @property
+    def compressed(self) -> bool:
+        return self.path.suffix == ".gz"
+
+
+def index_path(path: Path) -> Path:
+    """Sidecar index path for the log file at *path*."""
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _entry_from_line(offset: int, line: bytes) -> IndexEntry | None:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    symbol = record.get("symbol")
+    return IndexEntry(
+        offset=offset,
+        event=record.get("event"),
+        symbol=str(symbol) if symbol not in (None, "") else None,
+        session_id=record.get("session_id"),
+    )
+
+
+def _load_index(path: Path) -> tuple[int, list[IndexEntry]] | None:
+    sidecar = index_path(path)
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != INDEX_VERSION:
+                return None
+            entries = [IndexEntry(*json.loads(line)) for line in f if line.strip()]
+        return int(header["size"]), entries
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_index(path: Path, size: int, entries: list[IndexEntry]) -> None:
+    sidecar = index_path(path)
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"version": INDEX_VERSION, "size": size}) + "\n")
+        for entry in entries:
+            f.write(
+                json.dumps([entry.offset, entry.event, entry.symbol, entry.session_id]) + "\n"
+            )
+    os.replace(tmp, sidecar)
+
+
+def build_index(path: Path) -> list[IndexEntry]:
+    """Return the index for *path*, extending or rebuilding its sidecar as needed.
+
+    Only complete lines are indexed, so a line the logger is still writing
+    is picked up on the next call.
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    loaded = _load_index(path)
+    if loaded is not None and loaded[0] == size:
+        return loaded[1]
+    if loaded is not None and loaded[0] < size:
+        start, entries = loaded
+    else:
+        start, entries = 0, []
+
+    offset = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            entry = _entry_from_line(offset, line)
+            if entry is not None:
+                entries.append(entry)
+            offset += len(line)
+
+    try:
+        _save_index(path, offset, entries)
+    except OSError:
+        logger.warning("Could not write log index for %s", path, exc_info=True)
+    return entries
+
+
+class PipelineLogQuery:
+    """Filter and replay events across daily NDJSON log files.
+
+    Args:
+        log_dir: Directory holding the daily files.
+        prefix: Only read files with this prefix (None = every prefix).
+    """
+
+    def __init__(self, log_dir: Path, prefix: str | None = None) -> None:
+        self._log_dir = Path(log_dir)
+        self._prefix = prefix
+
+    def files(self, start: date | None = None, end: date | None = None) -> list[LogFile]:
+        """Daily log files within ``[start, end]``, oldest first."""
+        found: list[LogFile] = []
+        if not self._log_dir.is_dir():
+            return found
+        for path in self._log_dir.iterdir():
+            match = _FILE_PATTERN.match(path.name)
+            if match is None:
+                continue
+            if self._prefix is not None and match["prefix"] != self._prefix:
+                continue
+            try:
+                day = datetime.strptime(match["day"], "%Y%m%d").date()
+            except ValueError:
+                continue
+            if (start is not None and day < start) or (end is not None and day > end):
+                continue
+            found.append(LogFile(path=path, prefix=match["prefix"], day=day))
+        return sorted(found, key=lambda item: (item.day, item.prefix, item.compressed))
+
+    def build_indexes(self, start: date | None = None, end: date | None = None) -> int:
+        """Refresh sidecar indexes for every uncompressed file; returns events indexed."""
+        return sum(
+            len(build_index(log_file.path))
+            for log_file in self.files(start, end)
+            if not log_file.compressed
+        )
+
+    def iter_events(
+        self,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+        symbol: str | None = None,
+        events: Iterable[str] | None = None,
+        session_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield matching events file by file, in file order."""
+        wanted_events = frozenset(events) if events is not None else None
+
+        def _matches(event: Any, event_symbol: Any, event_session: Any) -> bool:
+            if wanted_events is not None and event not in wanted_events:
+                return False
+            if symbol is not None and event_symbol != symbol:
+                return False
+            if session_id is not None and event_session != session_id:
+                return False
+            return True
+
+        for log_file in self.files(start, end):
+            if log_file.compressed:
+                yield from self._scan_compressed(log_file.path, _matches)
+                continue
+            entries = [
+                entry
+                for entry in build_index(log_file.path)
+                if _matches(entry.event, entry.symbol, entry.session_id)
+            ]
+            if not entries:
+                continue
+            with open(log_file.path, "rb") as f:
+                for entry in entries:
+                    f.seek(entry.offset)
+                    try:
+                        yield json.loads(f.readline())
+                    except ValueError:
+                        continue
+
+    @staticmethod
+    def _scan_compressed(path: Path, matches: Any) -> Iterator[dict[str, Any]]:
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                record_symbol = record.get("symbol")
+                if matches(
+                    record.get("event"),
+                    str(record_symbol) if record_symbol not in (None, "") else None,
+                    record.get("session_id"),
+                ):
+                    yield record
+
+    def sessions(
+        self, start: date | None = None, end: date | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Summarize sessions: first/last timestamp, event count and symbols."""
+        summary: dict[str, dict[str, Any]] = {}
+        for record in self.iter_events(start=start, end=end):
+            session = str(record.get("session_id"))
+            item = summary.setdefault(
+                session,
+                {"first": record.get("timestamp"), "last": None, "events": 0, "symbols": set()},
+            )
+            item["last"] = record.get("timestamp")
+            item["events"] += 1
+            if record.get("symbol") not in (None, ""):
+                item["symbols"].add(str(record["symbol"]))
+        return summary
+
+    def decision_timeline(
+        self,
+        symbol: str,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+        session_id: str | None = None,
+    ) -> list[DecisionCycle]:
+        """Rebuild *symbol*'s decision cycles from its pipeline events."""
+        return build_decision_timeline(
+            self.iter_events(
+                start=start,
+                end=end,
+                symbol=symbol,
+                events=TIMELINE_EVENTS,
+                session_id=session_id,
+            )
+        )
+
+
+@dataclass
+class DecisionCycle:
+    """Votes, consensus and follow-up actions for one screening of a symbol."""
+
+    symbol: str
+    session_id: str | None
+    started_at: str | None = None
+    screening: dict[str, Any] | None = None
+    votes: list[dict[str, Any]] = field(default_factory=list)
+    advisory: dict[str, Any] | None = None
+    consensus: dict[str, Any] | None = None
+    actions: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool | None:
+        return None if self.consensus is None else bool(self.consensus.get("passed"))
+
+
+_CYCLE_START_EVENTS = frozenset({"screening_complete", "agent_vote", "advisory_vote"})
+
+
+def _opens_new_cycle(current: DecisionCycle, event: Any, session: Any) -> bool:
+    if current.session_id != session:
+        return True
+    if event not in _CYCLE_START_EVENTS:
+        return False
+    return current.consensus is not None or (
+        event == "screening_complete" and (current.screening is not None or bool(current.votes))
+    )
+
+
+def build_decision_timeline(records: Iterable[dict[str, Any]]) -> list[DecisionCycle]:
+    """Group one symbol's events into decision cycles.
+
+    A cycle starts at screening or the first vote after a consensus result,
+    collects votes until the consensus result, and keeps the buy decisions,
+    orders and exits that follow until the next cycle starts.
+    """
+    cycles: list[DecisionCycle] = []
+    for record in records:
+        event = record.get("event")
+        session = record.get("session_id")
+        current = cycles[-1] if cycles else None
+        if current is None or _opens_new_cycle(current, event, session):
+            current = DecisionCycle(
+                symbol=str(record.get("symbol", "")),
+                session_id=session,
+                started_at=record.get("timestamp"),
+            )
+            cycles.append(current)
+
+        if event == "screening_complete":
+            current.screening = record
+        elif event == "agent_vote":
+            current.votes.append(record)
+        elif event == "advisory_vote":
+            current.advisory = record
+        elif event == "consensus_result":
+            current.consensus = record
+        else:
+            current.actions.append(record)
+    return cycles
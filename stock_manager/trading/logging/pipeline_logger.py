@@ -5,15 +5,72 @@ RLock. Each log entry includes timestamp, session_id, event type, and
 event-specific payload.
 
 File naming: {prefix}-{YYYYMMDD}.ndjson
+
+Modes:
+- Synchronous (default): every event opens the daily file, appends one
+  line and closes it on the caller's thread.
+- Buffered (``buffered=True``): events go onto a bounded queue. A
+  background writer serializes them in batches to a long-lived file handle,
+  switches files at date rollover, and can gzip the rolled file. Callers
+  must not mutate payload objects after logging them. ``flush()`` and
+  ``close()`` block until everything queued so far is on disk.
+
+``serializer="orjson"`` uses orjson when it is installed (falls back to the
+standard library otherwise). orjson writes datetimes in ISO format and
+enums by value instead of via ``str()``.
 """
 
+import atexit
+import gzip
+import importlib
 import json
+import logging
+import queue
+import shutil
 import threading
 import uuid
+import weakref
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Literal
+
+_orjson: Any
+try:
+    _orjson = importlib.import_module("orjson")
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+logger = logging.getLogger(__name__)
+
+Serializer = Literal["json", "orjson"]
+
+
+def _json_dumps(event: dict[str, Any]) -> bytes:
+    return json.dumps(event, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _orjson_dumps(event: dict[str, Any]) -> bytes:
+    if _orjson is None:  # only selected when installed
+        return _json_dumps(event)
+    return _orjson.dumps(event, default=str, option=_orjson.OPT_NON_STR_KEYS)
+
+
+def _resolve_serializer(name: Serializer) -> Callable[[dict[str, Any]], bytes]:
+    if name == "orjson":
+        if _orjson is not None:
+            return _orjson_dumps
+        logger.info("orjson not installed; pipeline logger falls back to json")
+        return _json_dumps
+    if name == "json":
+        return _json_dumps
+    raise ValueError(f"Unknown serializer: {name!r}")
+
+
+def _close_at_exit(ref: "weakref.ref[PipelineJsonLogger]") -> None:
+    pipeline_logger = ref()
+    if pipeline_logger is not None:
+        pipeline_logger.close()
 
 
 class PipelineJsonLogger:
@@ -25,14 +82,63 @@ class PipelineJsonLogger:
     Args:
         log_dir: Directory for log files (created if missing).
         prefix: Filename prefix (default: "pipeline").
+        buffered: Hand events to a background writer instead of writing
+            them on the caller's thread.
+        queue_size: Maximum queued events in buffered mode. Events beyond it
+            are dropped and counted in ``dropped_events``.
+        batch_size: Maximum events written per batch in buffered mode.
+        flush_interval_sec: Longest time a queued event waits before the
+            file handle is flushed in buffered mode.
+        compress_rolled: Gzip a day's file once the writer rolls over to
+            the next date (buffered mode only).
+        serializer: "json" (default) or "orjson".
     """
 
-    def __init__(self, log_dir: Path, prefix: str = "pipeline") -> None:
+    def __init__(
+        self,
+        log_dir: Path,
+        prefix: str = "pipeline",
+        *,
+        buffered: bool = False,
+        queue_size: int = 10_000,
+        batch_size: int = 256,
+        flush_interval_sec: float = 0.5,
+        compress_rolled: bool = False,
+        serializer: Serializer = "json",
+    ) -> None:
         self._log_dir = Path(log_dir)
         self._log_dir.mkdir(parents=True, exist_ok=True)
         self._prefix = prefix
         self._session_id = str(uuid.uuid4())[:8]
         self._lock = threading.RLock()
+        self._dumps = _resolve_serializer(serializer)
+
+        self._buffered = buffered
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_sec = max(0.01, flush_interval_sec)
+        self._compress_rolled = compress_rolled
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, queue_size))
+        self._dropped_events = 0
+        self._closed = False
+        self._writer: threading.Thread | None = None
+        # Writer-thread state
+        self._file: Any = None
+        self._file_day: str | None = None
+
+        if buffered:
+            self._writer = threading.Thread(
+                target=self._run_writer, name=f"{prefix}-log-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(_close_at_exit, weakref.ref(self))
+
+    @property
+    def dropped_events(self) -> int:
+        """Events discarded because the buffered queue was full."""
+        return self._dropped_events
+
+    def _path_for(self, day: str) -> Path:
+        return self._log_dir / f"{self._prefix}-{day}.ndjson"
 
     def _write(self, event: dict[str, Any]) -> None:
         """Write single NDJSON line to daily file.
@@ -40,13 +146,153 @@ class PipelineJsonLogger:
         Adds timestamp and session_id automatically. Uses default=str
         for serializing Decimal, datetime, and enum values.
         """
-        event["timestamp"] = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc)
+        event["timestamp"] = now.isoformat()
         event["session_id"] = self._session_id
-        today = datetime.now(timezone.utc).strftime("%Y%m%d")
-        filepath = self._log_dir / f"{self._prefix}-{today}.ndjson"
+        today = now.strftime("%Y%m%d")
+        if self._buffered:
+            self._enqueue(today, event)
+            return
+        filepath = self._path_for(today)
+        line = self._dumps(event).decode("utf-8")
         with self._lock:
             with open(filepath, "a", encoding="utf-8") as f:
-                f.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+                f.write(line + "\n")
+
+    # --- Buffered mode ---
+
+    def _enqueue(self, day: str, event: dict[str, Any]) -> None:
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait((day, event))
+        except queue.Full:
+            with self._lock:
+                self._dropped_events += 1
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until every event queued so far is written and flushed.
+
+        Returns True immediately in synchronous mode.
+        """
+        if not self._buffered or self._writer is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Flush pending events and stop the background writer."""
+        if self._closed:
+            return
+        self._closed = True
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Pipeline log queue full at close; pending events may be lost")
+            return
+        writer.join(timeout)
+
+    def _run_writer(self) -> None:
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self._flush_interval_sec)
+                except queue.Empty:
+                    continue
+                batch = [item]
+                while len(batch) < self._batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not self._write_batch(batch):
+                    break
+        finally:
+            self._close_file()
+
+    def _write_batch(self, batch: list[Any]) -> bool:
+        """Write one drained batch. Returns False once the stop marker is seen."""
+        lines: list[bytes] = []
+        day: str | None = None
+        keep_running = True
+        waiters: list[threading.Event] = []
+        for item in batch:
+            if item is None:
+                keep_running = False
+                continue
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                continue
+            item_day, event = item
+            if day is not None and item_day != day:
+                self._write_lines(day, lines)
+                lines = []
+            day = item_day
+            try:
+                lines.append(self._dumps(event) + b"\n")
+            except Exception:
+                logger.warning("Dropping unserializable pipeline log event", exc_info=True)
+        if day is not None:
+            self._write_lines(day, lines)
+        if self._dropped_events:
+            with self._lock:
+                dropped, self._dropped_events = self._dropped_events, 0
+            logger.warning("Pipeline logger dropped %d events (queue full)", dropped)
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError:
+                logger.warning("Failed to flush pipeline log", exc_info=True)
+        for waiter in waiters:
+            waiter.set()
+        return keep_running
+
+    def _write_lines(self, day: str, lines: list[bytes]) -> None:
+        if not lines:
+            return
+        try:
+            if self._file_day != day:
+                self._roll_to(day)
+            self._file.write(b"".join(lines))
+        except OSError:
+            logger.warning("Failed to write pipeline log batch", exc_info=True)
+            self._close_file()
+
+    def _roll_to(self, day: str) -> None:
+        previous_day = self._file_day
+        self._close_file()
+        self._file = open(self._path_for(day), "ab")
+        self._file_day = day
+        if self._compress_rolled and previous_day is not None and previous_day < day:
+            self._compress(self._path_for(previous_day))
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+                self._file_day = None
+
+    @staticmethod
+    def _compress(path: Path) -> None:
+        target = path.with_name(path.name + ".gz")
+        if not path.exists() or target.exists():
+            return
+        try:
+            with open(path, "rb") as src, gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            path.unlink()
+        except OSError:
+            logger.warning("Failed to compress rolled pipeline log %s", path, exc_info=True)
+            target.unlink(missing_ok=True)
 
     def log_runtime_event(self, event: str, **payload: Any) -> None:
         """Log a generic runtime event for engine/probe observability."""
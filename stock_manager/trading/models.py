@@ -140,6 +140,32 @@ class TradingConfig:
         max_position_size_pct: Maximum position size as portfolio percentage
         default_stop_loss_pct: Default stop loss percentage
         default_take_profit_pct: Default take profit percentage
+        quote_board_max_age_sec: Serve order pricing from the shared quote
+            board when its entry is at most this old (None = always REST)
+        price_poll_batch_size: Symbols per multi-price request when the
+            price monitor polls (0 = one request per symbol; real mode only)
+        price_poll_max_interval_sec: Longest refresh interval for symbols
+            away from their exit triggers when rate headroom runs low
+        trailing_stop_pct: Trail a stop this fraction below each position's
+            high-water price (None = fixed stop-loss only)
+        async_exit_dispatch: Run stop-loss/take-profit handlers on a
+            dedicated worker instead of the quote thread
+        state_journal_commit_window_sec: Persist state through a background
+            journal that coalesces changes within this window (None = write
+            a full snapshot synchronously on every change)
+        state_journal_compact_every: Journal records written before they are
+            compacted into a new snapshot
+        runtime_log_buffered: Write engine runtime NDJSON events from a
+            background thread instead of the caller's thread
+        consensus_fetch_concurrency: Per-symbol KIS calls the consensus
+            strategy's data fetcher runs in parallel (1 = serial)
+        consensus_data_cache: Reuse fetched quote/fundamental/daily data
+            across consensus cycles through an in-memory tiered cache
+        consensus_data_cache_path: Also persist that cache to this JSON file
+            so it survives restarts (None = memory only)
+        consensus_short_circuit: Stop evaluating a symbol once the consensus
+            can no longer pass; skipped personas are reported as not
+            evaluated and running evaluations are abandoned, not stopped
     """
 
     max_positions: int = 1
@@ -161,6 +187,8 @@ class TradingConfig:
     strategy_max_symbols_per_cycle: int = 50
     strategy_max_buys_per_cycle: int = 1
     strategy_run_interval_sec: float = 60.0
+    strategy_screen_concurrency: int = 1
+    strategy_symbol_timeout_sec: float | None = None
     strategy_auto_discover: bool = False
     strategy_discovery_limit: int = 20
     strategy_discovery_fallback_symbols: tuple[str, ...] = ()
@@ -168,4 +196,16 @@ class TradingConfig:
     websocket_execution_notice_enabled: bool = False
     auto_exit_cooldown_sec: float = 1.0
     quote_staleness_sec: float | None = None
+    quote_board_max_age_sec: float | None = None
+    price_poll_batch_size: int = 0
+    price_poll_max_interval_sec: float | None = None
+    trailing_stop_pct: Decimal | None = None
+    async_exit_dispatch: bool = False
+    state_journal_commit_window_sec: float | None = None
+    state_journal_compact_every: int = 256
+    runtime_log_buffered: bool = False
+    consensus_fetch_concurrency: int = 1
+    consensus_data_cache: bool = False
+    consensus_data_cache_path: str | None = None
+    consensus_short_circuit: bool = False
     reconciliation_staleness_sec: float = 180.0
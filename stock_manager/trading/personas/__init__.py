@@ -9,6 +9,9 @@ Data models:
 Base class:
     InvestorPersona
 
+Batch screening:
+    SnapshotTable
+
 Persona implementations:
     GrahamPersona, BuffettPersona, LynchPersona, SorosPersona, DalioPersona,
     MungerPersona, TempletonPersona, LivermorePersona, FisherPersona, SimonsPersona
@@ -24,6 +27,7 @@ from .models import (
     VoteAction,
 )
 from .base import InvestorPersona
+from .snapshot_table import SnapshotTable
 from .graham_persona import GrahamPersona
 from .buffett_persona import BuffettPersona
 from .lynch_persona import LynchPersona
@@ -50,6 +54,8 @@ __all__ = [
     "ConsensusResult",
     # Base
     "InvestorPersona",
+    # Batch screening
+    "SnapshotTable",
     # Personas
     "GrahamPersona",
     "BuffettPersona",
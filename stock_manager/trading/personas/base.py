@@ -8,9 +8,13 @@ pure rule-based evaluation.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from .models import MarketSnapshot, PersonaCategory, PersonaVote
 
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
+
 
 class InvestorPersona(ABC):
     """Abstract base for all investor personas.
@@ -34,6 +38,15 @@ class InvestorPersona(ABC):
         """
         ...
 
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        """Rule-based votes for every row of *table*, in row order.
+
+        Default: ``screen_rule`` per snapshot. Personas whose criteria are
+        pure functions of snapshot fields override this with array
+        expressions; results must match ``screen_rule`` row for row.
+        """
+        return [self.screen_rule(snapshot) for snapshot in table.snapshots]
+
     @property
     def llm_trigger_rate(self) -> float:
         """Approximate percentage of evaluations that would trigger LLM.
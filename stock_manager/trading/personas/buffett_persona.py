@@ -7,8 +7,14 @@ history, and sustained profitability.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 # Thresholds
 _MIN_ROE = 15.0            # %
@@ -77,6 +83,21 @@ class BuffettPersona(InvestorPersona):
             "dividend_growth": self._check_dividend_growth(snapshot),
             "sustained_margins": self._check_sustained_margins(snapshot),
         }
+        return self._vote(criteria)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        criteria: dict[str, Any] = {
+            "roe_above_15": table["roe"] > _MIN_ROE,
+            "low_leverage": table["debt_to_equity"] < _MAX_DEBT_TO_EQUITY,
+            "net_margin_above_20": table["net_margin"] > _MIN_NET_MARGIN,
+            "earnings_stability_10yr": table["years_positive_earnings"] >= _MIN_YEARS_EARNINGS,
+            "fcf_positive": table["free_cash_flow"] > 0,
+            "dividend_growth": table["years_dividends_paid"] >= _MIN_YEARS_DIVIDENDS,
+            "sustained_margins": table["operating_margin"] > _MIN_OPERATING_MARGIN,
+        }
+        return [self._vote(row) for row in iter_criteria_rows(criteria, len(table))]
+
+    def _vote(self, criteria: dict[str, bool]) -> PersonaVote:
         met = sum(criteria.values())
 
         if met >= 6:
@@ -6,12 +6,14 @@ from typing import TYPE_CHECKING
 
 from stock_manager.trading.llm.circuit_breaker import CircuitBreaker
 from stock_manager.trading.llm.config import InvocationCounter, LLMConfig
+from stock_manager.trading.llm.verdict_cache import LLMVerdictCache
 from stock_manager.trading.personas.dalio_persona import DalioPersona
 from stock_manager.trading.personas.hybrid import HybridPersona
 from stock_manager.trading.personas.models import MarketSnapshot, PersonaVote
 
 if TYPE_CHECKING:
     from stock_manager.trading.logging.pipeline_logger import PipelineJsonLogger
+    from stock_manager.trading.personas.snapshot_table import SnapshotTable
 
 
 class DalioHybridPersona(HybridPersona):
@@ -25,12 +27,14 @@ class DalioHybridPersona(HybridPersona):
         llm_config: LLMConfig | None = None,
         invocation_counter: InvocationCounter | None = None,
         pipeline_logger: PipelineJsonLogger | None = None,
+        verdict_cache: LLMVerdictCache | None = None,
     ) -> None:
         super().__init__(
             circuit_breaker=circuit_breaker,
             llm_config=llm_config,
             invocation_counter=invocation_counter,
             pipeline_logger=pipeline_logger,
+            verdict_cache=verdict_cache,
         )
         self._base = base_persona or DalioPersona()
         self.name = self._base.name
@@ -45,3 +49,6 @@ class DalioHybridPersona(HybridPersona):
 
     def screen_rule(self, snapshot: MarketSnapshot) -> PersonaVote:
         return self._base.screen_rule(snapshot)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        return self._base.screen_batch(table)
@@ -7,8 +7,14 @@ and ATR-based risk/reward.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 # Thresholds
 _MAX_SECTOR_CORRELATION = 0.8
@@ -99,6 +105,28 @@ class DalioPersona(InvestorPersona):
             "trend_alignment": self._check_trend_alignment(snapshot),
             "risk_reward_favorable": self._check_risk_reward(snapshot),
         }
+        return self._vote(criteria)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        price = table["current_price"]
+        atr = table["atr_14"]
+        sma_50 = table["sma_50"]
+        has_range = (atr > 0) & (price > 0)
+        atr_pct = table.divide(atr, price, has_range) * 100
+        upside = table["price_52w_high"] - price
+        criteria: dict[str, Any] = {
+            "sector_correlation_low": table["vkospi"] < (_MAX_SECTOR_CORRELATION * 100),
+            "volatility_in_band": has_range & (atr_pct >= 0.5) & (atr_pct <= 5.0),
+            "not_overbought": table["rsi_14"] < _RSI_OVERBOUGHT,
+            "trend_alignment": (table["adx_14"] >= _ADX_TRENDING)
+            & (sma_50 > 0)
+            & (price > sma_50),
+            "risk_reward_favorable": has_range
+            & (table.divide(upside, atr, has_range) >= _RISK_REWARD_MIN),
+        }
+        return [self._vote(row) for row in iter_criteria_rows(criteria, len(table))]
+
+    def _vote(self, criteria: dict[str, bool]) -> PersonaVote:
         met = sum(criteria.values())
 
         if met == 5:
@@ -16,8 +16,14 @@ LLM trigger ~35%: management quality assessment requires qualitative judgment.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 
 # ---------------------------------------------------------------------------
@@ -76,6 +82,24 @@ class FisherPersona(InvestorPersona):
             snapshot.earnings_growth_yoy > _EARNINGS_GROWTH_MIN
         )
 
+        return self._vote(criteria)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        operating_margin = table["operating_margin"]
+        net_margin = table["net_margin"]
+        debt_to_equity = table["debt_to_equity"]
+        margin_ok = operating_margin > _MARGIN_MIN
+        criteria: dict[str, Any] = {
+            "revenue_growth": table["revenue_growth_yoy"] > _REVENUE_GROWTH_MIN,
+            "rd_investment": margin_ok & (operating_margin > net_margin),
+            "margins_healthy": margin_ok & (net_margin > 0),
+            "low_debt": (debt_to_equity >= 0) & (debt_to_equity < _DEBT_EQUITY_MAX),
+            "high_roe": table["roe"] > _ROE_MIN,
+            "earnings_growth": table["earnings_growth_yoy"] > _EARNINGS_GROWTH_MIN,
+        }
+        return [self._vote(row) for row in iter_criteria_rows(criteria, len(table))]
+
+    def _vote(self, criteria: dict[str, bool]) -> PersonaVote:
         # --- Conviction ---
         met_count = sum(criteria.values())
         conviction = round(met_count * _CONVICTION_PER_CRITERIA, 4)
@@ -8,9 +8,14 @@ graduated by how many of the 7 criteria pass.
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import TYPE_CHECKING, Any
 
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 
 # Minimum market-cap thresholds (same as GrahamScreener)
@@ -81,6 +86,26 @@ class GrahamPersona(InvestorPersona):
             "pe": self._check_pe(snapshot),
             "pb": self._check_pb(snapshot),
         }
+        return self._vote(criteria)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        per = table["per"]
+        is_kospi = table.text_flags("market", lambda market: market.upper() == "KOSPI")
+        size_threshold = table.np.where(
+            is_kospi, float(_MIN_MARKET_CAP_KOSPI), float(_MIN_MARKET_CAP_KOSDAQ)
+        )
+        criteria: dict[str, Any] = {
+            "size": table["market_cap"] >= size_threshold,
+            "financial": (table["current_ratio"] >= 1.5) & (table["debt_to_equity"] < 1.0),
+            "stability": table["years_positive_earnings"] >= 1,
+            "dividends": table["years_dividends_paid"] >= 1,
+            "growth": table["earnings_growth_yoy"] > 0,
+            "pe": (per > 0) & (per <= 12.0),
+            "pb": table["pbr"] <= 1.0,
+        }
+        return [self._vote(row) for row in iter_criteria_rows(criteria, len(table))]
+
+    def _vote(self, criteria: dict[str, bool]) -> PersonaVote:
         met = sum(criteria.values())
 
         if met == 7:
@@ -11,25 +11,71 @@ implemented by each persona.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from stock_manager.trading.personas.base import InvestorPersona
 from stock_manager.trading.personas.models import (
     MarketSnapshot,
     PersonaVote,
+    VoteAction,
 )
 from stock_manager.trading.llm.client import sync_persona_query
 from stock_manager.trading.llm.circuit_breaker import CircuitBreaker
 from stock_manager.trading.llm.config import InvocationCounter, LLMConfig
+from stock_manager.trading.llm.verdict_cache import LLMVerdictCache
 from stock_manager.trading.consensus.vote_parser import VoteParser
 from stock_manager.trading.personas.prompts.prompt_loader import load_persona_prompt
 
 if TYPE_CHECKING:
     from stock_manager.trading.logging.pipeline_logger import PipelineJsonLogger
+    from stock_manager.trading.personas.snapshot_table import SnapshotTable
 
 logger = logging.getLogger(__name__)
 
 
+def market_data_block(snapshot: MarketSnapshot) -> str:
+    """Symbol, price, fundamentals and technicals section of an LLM prompt."""
+    return (
+        f"## Symbol: {snapshot.symbol} ({snapshot.name})\n"
+        f"Market: {snapshot.market} | Sector: {snapshot.sector}\n\n"
+        f"## Price\n"
+        f"Current: {snapshot.current_price} | "
+        f"52w High: {snapshot.price_52w_high} | "
+        f"52w Low: {snapshot.price_52w_low}\n\n"
+        f"## Valuation\n"
+        f"PER: {snapshot.per:.2f} | PBR: {snapshot.pbr:.2f} | "
+        f"ROE: {snapshot.roe:.2f}% | EPS: {snapshot.eps} | "
+        f"Dividend Yield: {snapshot.dividend_yield:.2f}%\n\n"
+        f"## Financial Health\n"
+        f"Debt/Equity: {snapshot.debt_to_equity:.2f} | "
+        f"Current Ratio: {snapshot.current_ratio:.2f} | "
+        f"Operating Margin: {snapshot.operating_margin:.2f}% | "
+        f"Net Margin: {snapshot.net_margin:.2f}%\n\n"
+        f"## Growth\n"
+        f"Revenue YoY: {snapshot.revenue_growth_yoy:.2f}% | "
+        f"Earnings YoY: {snapshot.earnings_growth_yoy:.2f}%\n\n"
+        f"## Technical Indicators\n"
+        f"SMA20: {snapshot.sma_20:.2f} | SMA200: {snapshot.sma_200:.2f} | "
+        f"RSI14: {snapshot.rsi_14:.2f} | MACD Signal: {snapshot.macd_signal:.4f} | "
+        f"ADX14: {snapshot.adx_14:.2f} | ATR14: {snapshot.atr_14:.2f}\n\n"
+    )
+
+
+def rule_vote_block(rule_vote: PersonaVote, heading: str = "## Rule-Based Vote (1st Stage)") -> str:
+    """Rule-based vote section of an LLM prompt."""
+    criteria_lines = "\n".join(
+        f"  - {k}: {'PASS' if v else 'FAIL'}"
+        for k, v in rule_vote.criteria_met.items()
+    )
+    return (
+        f"{heading}\n"
+        f"Action: {rule_vote.action.value} | "
+        f"Conviction: {rule_vote.conviction:.2f}\n"
+        f"Reasoning: {rule_vote.reasoning}\n"
+        f"Criteria:\n{criteria_lines}\n"
+    )
+
+
 class HybridPersona(InvestorPersona):
     """Persona with optional LLM 2nd-stage verification.
 
@@ -48,8 +94,12 @@ class HybridPersona(InvestorPersona):
         circuit_breaker: Shared circuit breaker protecting LLM calls.
         llm_config: LLM settings (model, timeout, limits).  Defaults to
             :class:`LLMConfig` with stock values.
-        invocation_counter: Optional daily rate limiter.
+        invocation_counter: Optional daily rate limiter; also receives
+            verdict-cache hit/miss counts.
         pipeline_logger: Optional structured logger for agent vote events.
+        verdict_cache: Optional shared :class:`LLMVerdictCache`.  A cached
+            response for the same (bucketed) prompt is reused instead of
+            querying the LLM again.
     """
 
     def __init__(
@@ -58,11 +108,13 @@ class HybridPersona(InvestorPersona):
         llm_config: LLMConfig | None = None,
         invocation_counter: InvocationCounter | None = None,
         pipeline_logger: PipelineJsonLogger | None = None,
+        verdict_cache: LLMVerdictCache | None = None,
     ) -> None:
         self._circuit_breaker = circuit_breaker
         self._llm_config = llm_config or LLMConfig()
         self._invocation_counter = invocation_counter
         self._pipeline_logger = pipeline_logger
+        self._verdict_cache = verdict_cache
         self._system_prompt: str | None = None
 
     # ------------------------------------------------------------------
@@ -76,7 +128,12 @@ class HybridPersona(InvestorPersona):
             self._system_prompt = load_persona_prompt(self.name.lower())
         return self._system_prompt
 
-    def _build_llm_prompt(
+    @property
+    def llm_config(self) -> LLMConfig:
+        """LLM settings (model, timeout, limits) used for verification."""
+        return self._llm_config
+
+    def build_llm_prompt(
         self,
         snapshot: MarketSnapshot,
         rule_vote: PersonaVote,
@@ -93,39 +150,9 @@ class HybridPersona(InvestorPersona):
         Returns:
             Formatted prompt string ready for ``sync_persona_query``.
         """
-        criteria_lines = "\n".join(
-            f"  - {k}: {'PASS' if v else 'FAIL'}"
-            for k, v in rule_vote.criteria_met.items()
-        )
-
         return (
-            f"## Symbol: {snapshot.symbol} ({snapshot.name})\n"
-            f"Market: {snapshot.market} | Sector: {snapshot.sector}\n\n"
-            f"## Price\n"
-            f"Current: {snapshot.current_price} | "
-            f"52w High: {snapshot.price_52w_high} | "
-            f"52w Low: {snapshot.price_52w_low}\n\n"
-            f"## Valuation\n"
-            f"PER: {snapshot.per:.2f} | PBR: {snapshot.pbr:.2f} | "
-            f"ROE: {snapshot.roe:.2f}% | EPS: {snapshot.eps} | "
-            f"Dividend Yield: {snapshot.dividend_yield:.2f}%\n\n"
-            f"## Financial Health\n"
-            f"Debt/Equity: {snapshot.debt_to_equity:.2f} | "
-            f"Current Ratio: {snapshot.current_ratio:.2f} | "
-            f"Operating Margin: {snapshot.operating_margin:.2f}% | "
-            f"Net Margin: {snapshot.net_margin:.2f}%\n\n"
-            f"## Growth\n"
-            f"Revenue YoY: {snapshot.revenue_growth_yoy:.2f}% | "
-            f"Earnings YoY: {snapshot.earnings_growth_yoy:.2f}%\n\n"
-            f"## Technical Indicators\n"
-            f"SMA20: {snapshot.sma_20:.2f} | SMA200: {snapshot.sma_200:.2f} | "
-            f"RSI14: {snapshot.rsi_14:.2f} | MACD Signal: {snapshot.macd_signal:.4f} | "
-            f"ADX14: {snapshot.adx_14:.2f} | ATR14: {snapshot.atr_14:.2f}\n\n"
-            f"## Rule-Based Vote (1st Stage)\n"
-            f"Action: {rule_vote.action.value} | "
-            f"Conviction: {rule_vote.conviction:.2f}\n"
-            f"Reasoning: {rule_vote.reasoning}\n"
-            f"Criteria:\n{criteria_lines}\n\n"
+            f"{market_data_block(snapshot)}"
+            f"{rule_vote_block(rule_vote)}\n"
             f"## Instructions\n"
             f"Review the data above and the rule-based vote. "
             f"Provide your independent assessment.\n\n"
@@ -146,14 +173,17 @@ class HybridPersona(InvestorPersona):
     ) -> PersonaVote:
         """LLM 2nd-stage verification.
 
-        1. Check circuit breaker -- if OPEN, return *rule_vote* unchanged.
-        2. Check invocation counter limit (if configured).
-        3. Build prompt with persona context, market data, and rule vote.
-        4. Call :func:`sync_persona_query` (blocking, safe in thread pool).
-        5. Record success/failure on the circuit breaker.
-        6. Parse response via :class:`VoteParser`.
-        7. Log as ``agent_vote`` event with ``_llm`` suffix on persona_id.
-        8. Return the LLM-verified vote.
+        1. Build prompt with persona context, market data, and rule vote.
+        2. Serve the verdict from the cache when an entry for the same
+           bucketed prompt is still fresh (skips steps 3-6).
+        3. Check circuit breaker -- if OPEN, return *rule_vote* unchanged.
+        4. Check invocation counter limit (if configured).
+        5. Call :func:`sync_persona_query` (blocking, safe in thread pool).
+        6. Record success/failure on the circuit breaker.
+        7. Parse response via :class:`VoteParser`; cache it unless the
+           parse fell back to ABSTAIN.
+        8. Log as ``agent_vote`` event with ``_llm`` suffix on persona_id.
+        9. Return the LLM-verified vote.
 
         On any failure the rule-based vote is returned unchanged (graceful
         degradation).
@@ -165,14 +195,59 @@ class HybridPersona(InvestorPersona):
         Returns:
             LLM-verified :class:`PersonaVote`, or *rule_vote* on fallback.
         """
-        # 1. Circuit breaker gate
+        # 1. Build prompt
+        prompt = self.build_llm_prompt(snapshot, rule_vote)
+
+        # 2. Verdict cache
+        cache_key, cached_vote = self.cached_llm_vote(snapshot, prompt)
+        if cached_vote is not None:
+            return cached_vote
+        return self._query_llm(snapshot, rule_vote, prompt, cache_key)
+
+    def _query_llm(
+        self,
+        snapshot: MarketSnapshot,
+        rule_vote: PersonaVote,
+        prompt: str,
+        cache_key: str | None,
+    ) -> PersonaVote:
+        """Steps 3-9 of :meth:`screen_llm` for an already built, uncached prompt."""
+        # 3-4. Circuit breaker and daily invocation limit gates
+        if not self.admit_llm_query():
+            return rule_vote
+
+        # 5-6. Query LLM
+        try:
+            response = sync_persona_query(
+                prompt=prompt,
+                system_prompt=self.system_prompt,
+                deadline_sec=self._llm_config.deadline_sec,
+                **self.llm_query_kwargs(),
+            )
+        except Exception:
+            logger.warning(
+                "%s: LLM query failed, using rule-based vote",
+                self.name,
+                exc_info=True,
+            )
+            self._circuit_breaker.record_failure()
+            return rule_vote
+
+        # 6-8. Circuit breaker bookkeeping, parse, cache and log
+        return self.finish_llm_query(snapshot, rule_vote, response, cache_key)
+
+    # ------------------------------------------------------------------
+    # Verification hooks (also driven by personas.hybrid_batch)
+    # ------------------------------------------------------------------
+
+    def admit_llm_query(self) -> bool:
+        """Apply the circuit breaker and daily limit gates; counts the invocation."""
         if not self._circuit_breaker.allow_request():
             logger.info(
                 "%s: Circuit breaker OPEN, using rule-based vote", self.name
             )
-            return rule_vote
+            return False
 
-        # 2. Daily invocation limit gate
         if self._invocation_counter is not None:
             if not self._invocation_counter.allow_invocation(
                 self._llm_config.daily_invocation_limit
@@ -182,46 +257,94 @@ class HybridPersona(InvestorPersona):
                     self.name,
                     self._invocation_counter.count,
                 )
-                return rule_vote
+                return False
             self._invocation_counter.increment()
-
-        # 3. Build prompt
-        prompt = self._build_llm_prompt(snapshot, rule_vote)
-
-        # 4-5. Query LLM with circuit breaker bookkeeping
-        try:
-            response = sync_persona_query(
-                prompt=prompt,
-                system_prompt=self.system_prompt,
-                model=self._llm_config.model,
-                max_turns=self._llm_config.max_turns,
-                timeout_sec=self._llm_config.timeout_sec,
-                max_retries=self._llm_config.max_retries,
-            )
-
-            if response is None:
-                logger.warning(
-                    "%s: LLM returned empty response, using rule-based vote",
-                    self.name,
-                )
-                self._circuit_breaker.record_failure()
-                return rule_vote
-
-            self._circuit_breaker.record_success()
-
-        except Exception:
+        return True
+
+    def llm_query_kwargs(self) -> dict[str, Any]:
+        """Model and retry settings forwarded with every query."""
+        return {
+            "model": self._llm_config.model,
+            "max_turns": self._llm_config.max_turns,
+            "timeout_sec": self._llm_config.timeout_sec,
+            "max_retries": self._llm_config.max_retries,
+        }
+
+    def finish_llm_query(
+        self,
+        snapshot: MarketSnapshot,
+        rule_vote: PersonaVote,
+        response: str | None,
+        cache_key: str | None,
+    ) -> PersonaVote:
+        """Record the outcome of an admitted query and turn it into a vote."""
+        if response is None:
             logger.warning(
-                "%s: LLM query failed, using rule-based vote",
+                "%s: LLM returned empty response, using rule-based vote",
                 self.name,
-                exc_info=True,
             )
             self._circuit_breaker.record_failure()
             return rule_vote
 
-        # 6. Parse LLM response
+        self._circuit_breaker.record_success()
+        llm_vote = self._llm_vote_from_response(snapshot, response)
+        self._store_verdict(cache_key, response, llm_vote)
+        return llm_vote
+
+    def record_llm_success(self) -> None:
+        """Report a successful LLM query to the circuit breaker."""
+        self._circuit_breaker.record_success()
+
+    def record_llm_failure(self) -> None:
+        """Report a failed LLM query to the circuit breaker."""
+        self._circuit_breaker.record_failure()
+
+    def accept_llm_vote(
+        self,
+        snapshot: MarketSnapshot,
+        llm_vote: PersonaVote,
+        response: str,
+        cache_key: str | None,
+    ) -> None:
+        """Log a vote parsed outside :meth:`screen_llm` and cache its *response*."""
+        self._log_llm_vote(snapshot, llm_vote)
+        self._store_verdict(cache_key, response, llm_vote)
+
+    def cached_llm_vote(
+        self, snapshot: MarketSnapshot, prompt: str
+    ) -> tuple[str | None, PersonaVote | None]:
+        """Look *prompt* up in the verdict cache: ``(cache_key, vote or None)``."""
+        if self._verdict_cache is None:
+            return None, None
+        cache_key = self._verdict_cache.key(
+            persona=self.name,
+            model=self._llm_config.model,
+            system_prompt=self.system_prompt,
+            symbol=snapshot.symbol,
+            prompt=prompt,
+        )
+        cached = self._verdict_cache.get(cache_key)
+        if self._invocation_counter is not None:
+            if cached is None:
+                self._invocation_counter.record_cache_miss()
+            else:
+                self._invocation_counter.record_cache_hit()
+        if cached is None:
+            return cache_key, None
+        logger.debug("%s: LLM verdict served from cache", self.name)
+        return cache_key, self._llm_vote_from_response(snapshot, cached)
+
+    def _store_verdict(self, cache_key: str | None, response: str, llm_vote: PersonaVote) -> None:
+        if cache_key is not None and llm_vote.action != VoteAction.ABSTAIN:
+            assert self._verdict_cache is not None
+            self._verdict_cache.put(cache_key, response)
+
+    def _llm_vote_from_response(self, snapshot: MarketSnapshot, response: str) -> PersonaVote:
         llm_vote = VoteParser.parse(response, self.name, self.category)
+        self._log_llm_vote(snapshot, llm_vote)
+        return llm_vote
 
-        # 7. Log LLM evaluation
+    def _log_llm_vote(self, snapshot: MarketSnapshot, llm_vote: PersonaVote) -> None:
         if self._pipeline_logger is not None:
             self._pipeline_logger.log_agent_vote(
                 symbol=snapshot.symbol,
@@ -231,8 +354,6 @@ class HybridPersona(InvestorPersona):
                 reasoning=llm_vote.reasoning,
             )
 
-        return llm_vote
-
     # ------------------------------------------------------------------
     # 2-stage evaluate override
     # ------------------------------------------------------------------
@@ -262,8 +383,13 @@ class HybridPersona(InvestorPersona):
             return rule_vote
 
         llm_vote = self.screen_llm(snapshot, rule_vote)
+        return self.merge_votes(rule_vote, llm_vote)
 
-        # screen_llm returns rule_vote itself on fallback (identity check)
+    def merge_votes(self, rule_vote: PersonaVote, llm_vote: PersonaVote) -> PersonaVote:
+        """Combine the rule-based and LLM votes (see :meth:`evaluate`).
+
+        *llm_vote* being *rule_vote* itself marks an LLM fallback.
+        """
         if llm_vote is rule_vote:
             return rule_vote
 
@@ -308,8 +434,11 @@ class HybridPersonaWrapper(HybridPersona):
         llm_config: LLMConfig | None = None,
         invocation_counter: InvocationCounter | None = None,
         pipeline_logger: "PipelineJsonLogger | None" = None,
+        verdict_cache: LLMVerdictCache | None = None,
     ) -> None:
-        super().__init__(circuit_breaker, llm_config, invocation_counter, pipeline_logger)
+        super().__init__(
+            circuit_breaker, llm_config, invocation_counter, pipeline_logger, verdict_cache
+        )
         self._base = base_persona
         self.name = base_persona.name
         self.category = base_persona.category
@@ -323,3 +452,6 @@ class HybridPersonaWrapper(HybridPersona):
 
     def screen_rule(self, snapshot: MarketSnapshot) -> PersonaVote:
         return self._base.screen_rule(snapshot)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        return self._base.screen_batch(table)
@@ -0,0 +1,228 @@
+"""Cross-persona batched LLM verification for one symbol.
+
+Why:
+- Every triggered :class:`HybridPersona` built its own prompt, repeating
+  the whole financial and technical block, and sent it on its own. Up to
+  nine personas triggering on one snapshot meant nine CLI round-trips
+  before the consensus could be computed.
+
+How:
+- Triggered personas for a snapshot go into a single request. The market
+  data block appears once, followed by each persona's system context and
+  rule-based vote.
+- The answer holds one ``### PERSONA: <name>`` section per persona.
+  :meth:`VoteParser.split_batch` splits it into per-persona votes.
+- The verdict cache is consulted per persona with the same key as an
+  individual query. Every parsed section is stored under that key, so
+  batched and individual mode share cached verdicts.
+- A persona whose section is missing or unparseable falls back to its own
+  individual query. The fallbacks run concurrently on the shared
+  :class:`LLMWorkerPool`, and the whole stage is bounded by the personas'
+  LLM deadline. A failed batch request degrades to the rule-based votes,
+  just like a failed individual query.
+
+The batch request is gated and recorded once, through the first pending
+persona's verification hooks (circuit breaker and invocation counter). In a
+session those are shared by every hybrid persona.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+
+from stock_manager.trading.consensus.vote_parser import VoteParser
+from stock_manager.trading.llm.client import sync_persona_query
+from stock_manager.trading.llm.config import LLMConfig
+from stock_manager.trading.llm.worker_pool import get_worker_pool
+from stock_manager.trading.personas.hybrid import (
+    HybridPersona,
+    market_data_block,
+    rule_vote_block,
+)
+from stock_manager.trading.personas.models import MarketSnapshot, PersonaVote, VoteAction
+
+logger = logging.getLogger(__name__)
+
+BATCH_SYSTEM_PROMPT = (
+    "You moderate a panel of independent investor personas. For each persona "
+    "listed, adopt that persona's context and investment philosophy, review the "
+    "shared market data and the persona's rule-based vote, and give that "
+    "persona's own assessment. Never let one persona's answer influence another's."
+)
+
+
+@dataclass
+class _Pending:
+    index: int
+    persona: HybridPersona
+    rule_vote: PersonaVote
+    prompt: str
+    cache_key: str | None
+
+
+def build_batch_prompt(snapshot: MarketSnapshot, pending: Sequence[_Pending]) -> str:
+    """Single prompt asking every pending persona for its verdict."""
+    sections = "".join(
+        f"### PERSONA: {item.persona.name}\n"
+        f"#### Persona Context\n{item.persona.system_prompt.strip()}\n\n"
+        f"{rule_vote_block(item.rule_vote, heading='#### Rule-Based Vote (1st Stage)')}\n"
+        for item in pending
+    )
+    names = ", ".join(item.persona.name for item in pending)
+    return (
+        f"{market_data_block(snapshot)}"
+        f"## Personas\n\n"
+        f"{sections}"
+        f"## Instructions\n"
+        f"Review the data above once per persona ({names}) and give each "
+        f"persona's independent assessment of its rule-based vote.\n\n"
+        f"Respond with one section per persona, in EXACTLY this format:\n"
+        f"### PERSONA: <name>\n"
+        f"ACTION: BUY | SELL | HOLD\n"
+        f"CONVICTION: 0.0-1.0\n"
+        f"REASONING: <that persona's analysis>\n"
+    )
+
+
+class BatchedLLMVerifier:
+    """Verify every triggered hybrid persona of one snapshot with one LLM request."""
+
+    def verify(
+        self,
+        snapshot: MarketSnapshot,
+        triggered: Sequence[tuple[HybridPersona, PersonaVote]],
+    ) -> list[PersonaVote]:
+        """Final (merged) votes for *triggered* ``(persona, rule_vote)`` pairs, in order."""
+        llm_votes: list[PersonaVote] = [rule_vote for _, rule_vote in triggered]
+        pending: list[_Pending] = []
+        for index, (persona, rule_vote) in enumerate(triggered):
+            prompt = persona.build_llm_prompt(snapshot, rule_vote)
+            cache_key, cached_vote = persona.cached_llm_vote(snapshot, prompt)
+            if cached_vote is not None:
+                llm_votes[index] = cached_vote
+            else:
+                pending.append(_Pending(index, persona, rule_vote, prompt, cache_key))
+
+        if len(pending) == 1:
+            self._query_individually(snapshot, pending, llm_votes)
+        elif pending:
+            unresolved = self._query_batch(snapshot, pending, llm_votes)
+            if unresolved:
+                logger.info(
+                    "%s: batched LLM response missing %d persona(s); querying individually",
+                    snapshot.symbol,
+                    len(unresolved),
+                )
+                self._query_individually(snapshot, unresolved, llm_votes)
+
+        return [
+            persona.merge_votes(rule_vote, llm_vote)
+            for (persona, rule_vote), llm_vote in zip(triggered, llm_votes)
+        ]
+
+    @staticmethod
+    def _query_individually(
+        snapshot: MarketSnapshot, pending: Sequence[_Pending], llm_votes: list[PersonaVote]
+    ) -> None:
+        """Query each persona on its own, concurrently, within one stage deadline."""
+        pool = get_worker_pool()
+        submitted: list[tuple[_Pending, Future]] = []
+        for item in pending:
+            if not item.persona.admit_llm_query():
+                continue
+            try:
+                future = pool.submit(
+                    item.prompt,
+                    item.persona.system_prompt,
+                    deadline_sec=item.persona.llm_config.deadline_sec,
+                    **item.persona.llm_query_kwargs(),
+                )
+            except Exception:
+                logger.warning(
+                    "%s: LLM query failed, using rule-based vote",
+                    item.persona.name,
+                    exc_info=True,
+                )
+                item.persona.record_llm_failure()
+                continue
+            submitted.append((item, future))
+        if not submitted:
+            return
+
+        timeout = max(_stage_timeout(item.persona.llm_config) for item, _ in submitted)
+        wait([future for _, future in submitted], timeout=timeout)
+        for item, future in submitted:
+            response: str | None = None
+            if future.done():
+                try:
+                    response = future.result()
+                except Exception:
+                    logger.warning(
+                        "%s: LLM query failed", item.persona.name, exc_info=True
+                    )
+            else:
+                future.cancel()
+                logger.warning(
+                    "%s: LLM query missed the %.1fs stage deadline", item.persona.name, timeout
+                )
+            llm_votes[item.index] = item.persona.finish_llm_query(
+                snapshot, item.rule_vote, response, item.cache_key
+            )
+
+    @staticmethod
+    def _query_batch(
+        snapshot: MarketSnapshot, pending: Sequence[_Pending], llm_votes: list[PersonaVote]
+    ) -> list[_Pending]:
+        """Run the batched request; returns personas that still need a verdict."""
+        lead = pending[0].persona
+        if not lead.admit_llm_query():
+            return []
+
+        try:
+            response = sync_persona_query(
+                prompt=build_batch_prompt(snapshot, pending),
+                system_prompt=BATCH_SYSTEM_PROMPT,
+                deadline_sec=lead.llm_config.deadline_sec,
+                **lead.llm_query_kwargs(),
+            )
+        except Exception:
+            logger.warning(
+                "%s: batched LLM query failed, using rule-based votes",
+                snapshot.symbol,
+                exc_info=True,
+            )
+            lead.record_llm_failure()
+            return []
+        if response is None:
+            logger.warning(
+                "%s: batched LLM query returned nothing, using rule-based votes",
+                snapshot.symbol,
+            )
+            lead.record_llm_failure()
+            return []
+        lead.record_llm_success()
+
+        sections = VoteParser.split_batch(response)
+        unresolved: list[_Pending] = []
+        for item in pending:
+            section = sections.get(item.persona.name.casefold())
+            if not section:
+                unresolved.append(item)
+                continue
+            llm_vote = VoteParser.parse(section, item.persona.name, item.persona.category)
+            if llm_vote.action == VoteAction.ABSTAIN:
+                unresolved.append(item)
+                continue
+            item.persona.accept_llm_vote(snapshot, llm_vote, section, item.cache_key)
+            llm_votes[item.index] = llm_vote
+        return unresolved
+
+
+def _stage_timeout(config: LLMConfig) -> float:
+    """Wall-clock bound for one persona's verification."""
+    if config.deadline_sec is not None:
+        return config.deadline_sec
+    return config.timeout_sec * (config.max_retries + 1)
@@ -16,8 +16,14 @@ LLM trigger ~10%: ambiguous tape patterns.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 
 # ---------------------------------------------------------------------------
@@ -82,6 +88,29 @@ class LivermorePersona(InvestorPersona):
             snapshot.adx_14 is not None and snapshot.adx_14 > _ADX_TRENDING
         )
 
+        return self._vote(criteria, snapshot.rsi_14)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        price = table["current_price"]
+        sma_20 = table["sma_20"]
+        sma_50 = table["sma_50"]
+        sma_200 = table["sma_200"]
+        rsi = table["rsi_14"]
+        avg_volume = table["avg_volume_20d"]
+        criteria: dict[str, Any] = {
+            "above_sma200": (sma_200 > 0) & (price > sma_200),
+            "macd_positive": table["macd_signal"] > 0,
+            "rsi_momentum_zone": (rsi >= _RSI_LOW) & (rsi <= _RSI_HIGH),
+            "high_volume": (avg_volume > 0) & (table["volume"] > avg_volume * _VOLUME_MULTIPLIER),
+            "golden_cross": (sma_20 > 0) & (sma_50 > 0) & (sma_20 > sma_50),
+            "adx_trending": table["adx_14"] > _ADX_TRENDING,
+        }
+        return [
+            self._vote(row, row_rsi)
+            for row, row_rsi in zip(iter_criteria_rows(criteria, len(table)), rsi.tolist())
+        ]
+
+    def _vote(self, criteria: dict[str, bool], rsi_14: float | None) -> PersonaVote:
         # --- Conviction ---
         met_count = sum(criteria.values())
         conviction = round(met_count / len(criteria), 4)
@@ -100,8 +129,8 @@ class LivermorePersona(InvestorPersona):
         bearish_reversal = (
             not criteria["above_sma200"]
             and not criteria["macd_positive"]
-            and snapshot.rsi_14 is not None
-            and snapshot.rsi_14 > _RSI_HIGH
+            and rsi_14 is not None
+            and rsi_14 > _RSI_HIGH
         )
         if bearish_reversal:
             action = VoteAction.SELL
@@ -7,8 +7,14 @@ earnings growth rate, revenue momentum, and stock classification
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 
 # ---------------------------------------------------------------------------
@@ -97,6 +103,36 @@ class LynchPersona(InvestorPersona):
             "revenue_growth_above_10": self._check_revenue_growth(snapshot),
             "favorable_classification": self._check_classification_favorable(snapshot),
         }
+        return self._vote(criteria, classification)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        np = table.np
+        per = table["per"]
+        eg = table["earnings_growth_yoy"]
+        rg = table["revenue_growth_yoy"]
+        kospi_per = table["kospi_per"]
+
+        classification = np.select(
+            [eg > 20.0, eg >= 10.0, (eg < 0) & (rg > 0)],
+            ["fast_grower", "stalwart", "turnaround"],
+            default="cyclical",
+        )
+        peg_valid = (eg > 0) & (per > 0)
+        peg = np.divide(per, eg, out=np.full(len(table), np.inf), where=peg_valid)
+        market_pe = np.where(np.isnan(kospi_per) | (kospi_per == 0), 12.0, kospi_per)
+        criteria: dict[str, Any] = {
+            "peg_below_1": peg_valid & (peg < 1.0),
+            "earnings_growth_20_50": (eg >= 15.0) & (eg <= 40.0),
+            "pe_below_market_avg": (per > 0) & (per < market_pe),
+            "revenue_growth_above_10": rg > 10.0,
+            "favorable_classification": np.isin(classification, ["fast_grower", "stalwart"]),
+        }
+        return [
+            self._vote(row, str(label))
+            for row, label in zip(iter_criteria_rows(criteria, len(table)), classification)
+        ]
+
+    def _vote(self, criteria: dict[str, bool], classification: str) -> PersonaVote:
         met = sum(criteria.values())
 
         if met >= 4:
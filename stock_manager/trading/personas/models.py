@@ -176,3 +176,5 @@ class ConsensusResult:
     passes_threshold: bool
     avg_conviction: float
     category_diversity: int
+    # Personas skipped once the decision was already fixed (no vote cast).
+    not_evaluated: list[str] = field(default_factory=list)
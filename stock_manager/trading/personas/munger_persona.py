@@ -16,8 +16,14 @@ LLM trigger ~35%: qualitative moat assessment in borderline cases.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 
 # ---------------------------------------------------------------------------
@@ -75,6 +81,29 @@ class MungerPersona(InvestorPersona):
         # 6. Low debt
         criteria["low_debt"] = 0 <= snapshot.debt_to_equity < _DEBT_EQUITY_MAX
 
+        return self._vote(criteria)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        total_assets = table["total_assets"]
+        per = table["per"]
+        pbr = table["pbr"]
+        debt_to_equity = table["debt_to_equity"]
+        has_assets = total_assets > 0
+        receivable_ratio = table.divide(table["accounts_receivable"], total_assets, has_assets)
+        criteria: dict[str, Any] = {
+            "no_accounting_red_flags": has_assets & (receivable_ratio < 0.30),
+            "competitive_moat": table["roe"] > _ROE_MOAT_MIN,
+            "understandable_business": table.text_flags(
+                "sector",
+                lambda sector: sector and sector.strip().lower() not in ("", "unknown"),
+            ),
+            "reasonable_price": (per > 0) & (per < _PE_MAX) & (pbr > 0) & (pbr < _PB_MAX),
+            "management_alignment": (table["operating_margin"] > 0) & (table["net_margin"] > 0),
+            "low_debt": (debt_to_equity >= 0) & (debt_to_equity < _DEBT_EQUITY_MAX),
+        }
+        return [self._vote(row) for row in iter_criteria_rows(criteria, len(table))]
+
+    def _vote(self, criteria: dict[str, bool]) -> PersonaVote:
         # --- Conviction ---
         met_count = sum(criteria.values())
         conviction = round(met_count * _CONVICTION_PER_CRITERIA, 4)
@@ -19,9 +19,14 @@ LLM trigger: 0% -- NEVER.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
 
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 
 # ---------------------------------------------------------------------------
@@ -144,6 +149,66 @@ class SimonsPersona(InvestorPersona):
         growth_score = 1.0 if positive_growth else 0.0
         signal_scores["stat_arb"] = (low_score + growth_score) / 2
 
+        return self._vote(criteria, signal_scores)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        np = table.np
+        price = table["current_price"]
+        sma_20 = table["sma_20"]
+        rsi = table["rsi_14"]
+        bollinger = table["bollinger_position"]
+        avg_volume = table["avg_volume_20d"]
+        low_52w = table["price_52w_low"]
+        range_52w = table["price_52w_high"] - low_52w
+        criteria: dict[str, Any] = {}
+        scores: dict[str, Any] = {}
+
+        # Same signals as screen_rule; rows failing a guard score 0.0.
+        has_sma = (sma_20 > 0) & (price > 0)
+        deviation = table.divide(sma_20 - price, sma_20, has_sma)
+        criteria["mean_reversion"] = has_sma & (deviation >= 0.04)
+        scores["mean_reversion"] = np.where(has_sma, np.clip(deviation / 0.08, 0.0, 1.0), 0.0)
+
+        rsi_oversold = rsi < _RSI_OVERSOLD
+        macd_turning = table["macd_signal"] > 0
+        criteria["rsi_macd_reversal"] = rsi_oversold & macd_turning
+        rsi_score = np.where(rsi_oversold, (_RSI_OVERSOLD - rsi) / _RSI_OVERSOLD, 0.0)
+        scores["rsi_macd_reversal"] = (rsi_score + np.where(macd_turning, 1.0, 0.0)) / 2
+
+        bollinger_extreme = bollinger < _BOLLINGER_EXTREME
+        criteria["bollinger_extreme"] = bollinger_extreme
+        scores["bollinger_extreme"] = np.where(
+            bollinger_extreme,
+            np.minimum((_BOLLINGER_EXTREME - bollinger) / _BOLLINGER_EXTREME, 1.0),
+            0.0,
+        )
+
+        has_volume = avg_volume > 0
+        vol_ratio = table.divide(table["volume"], avg_volume, has_volume)
+        criteria["volume_anomaly"] = has_volume & (vol_ratio >= _VOLUME_ANOMALY_FACTOR)
+        scores["volume_anomaly"] = np.where(
+            has_volume, np.minimum(vol_ratio / (_VOLUME_ANOMALY_FACTOR * 2), 1.0), 0.0
+        )
+
+        criteria["stochastic_proxy"] = rsi_oversold & bollinger_extreme
+        scores["stochastic_proxy"] = (
+            scores["rsi_macd_reversal"] + scores["bollinger_extreme"]
+        ) / 2
+
+        has_range = (low_52w > 0) & (table["price_52w_high"] > 0) & (range_52w > 0)
+        position_in_range = table.divide(price - low_52w, range_52w, has_range)
+        positive_growth = table["earnings_growth_yoy"] > 0
+        criteria["stat_arb"] = has_range & (position_in_range < 0.15) & positive_growth
+        low_score = np.where(has_range, np.maximum(0.0, 1.0 - position_in_range / 0.15), 0.0)
+        scores["stat_arb"] = (low_score + np.where(positive_growth, 1.0, 0.0)) / 2
+
+        score_rows = iter_criteria_rows(scores, len(table), cast=float)
+        return [
+            self._vote(row, row_scores)
+            for row, row_scores in zip(iter_criteria_rows(criteria, len(table)), score_rows)
+        ]
+
+    def _vote(self, criteria: dict[str, bool], signal_scores: dict[str, float]) -> PersonaVote:
         # --- Weighted conviction (continuous, 0.0-1.0) ---
         conviction = 0.0
         for signal_name, weight in _WEIGHTS.items():
@@ -0,0 +1,114 @@
+"""Columnar view over many MarketSnapshots for batch persona screening.
+
+Why:
+- ``screen_rule`` evaluates one frozen snapshot at a time. Screening a whole
+  universe, or replaying personas over years of dates, paid that per-row
+  attribute and Decimal overhead once per persona.
+
+``SnapshotTable`` converts each snapshot field to a NumPy column on first
+access and caches it. Every persona screening the same table shares those
+columns:
+- Decimal and int fields become ``float64``; ``None`` becomes ``NaN``.
+- str fields become object arrays.
+
+Rule-based personas override ``InvestorPersona.screen_batch`` to compute
+their criteria as array expressions over these columns. ``screen_rule``
+stays the reference implementation (see the parity tests).
+
+NumPy is optional (``pip install stock-manager[fast]``). It is only
+required when a table is built.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Sequence
+from dataclasses import fields
+from typing import Any
+
+from .models import MarketSnapshot
+
+_TEXT_FIELDS = frozenset(
+    f.name for f in fields(MarketSnapshot) if f.type in ("str", str)
+)
+_SKIPPED_FIELDS = frozenset({"timestamp"})
+
+
+def _require_numpy() -> Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        raise ImportError("numpy required for batch persona screening: pip install numpy")
+
+
+def _to_float(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
+
+class SnapshotTable:
+    """Immutable columnar table of MarketSnapshots (one row per snapshot).
+
+    Args:
+        snapshots: Rows in evaluation order. Votes returned by
+            ``screen_batch`` follow the same order.
+    """
+
+    def __init__(self, snapshots: Sequence[MarketSnapshot]) -> None:
+        self.np = _require_numpy()
+        self._snapshots = tuple(snapshots)
+        self._columns: dict[str, Any] = {}
+
+    @property
+    def snapshots(self) -> tuple[MarketSnapshot, ...]:
+        return self._snapshots
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __getitem__(self, name: str) -> Any:
+        """Column *name* as a NumPy array (cached)."""
+        column = self._columns.get(name)
+        if column is None:
+            column = self._build_column(name)
+            self._columns[name] = column
+        return column
+
+    def _build_column(self, name: str) -> Any:
+        if name in _SKIPPED_FIELDS or name not in MarketSnapshot.__dataclass_fields__:
+            raise KeyError(f"Unknown snapshot column: {name}")
+        values = [getattr(snapshot, name) for snapshot in self._snapshots]
+        if name in _TEXT_FIELDS:
+            column = self.np.empty(len(values), dtype=object)
+            column[:] = values
+            return column
+        return self.np.fromiter(
+            (_to_float(value) for value in values), dtype=self.np.float64, count=len(values)
+        )
+
+    def divide(self, numerator: Any, denominator: Any, where: Any) -> Any:
+        """Element-wise ``numerator / denominator`` on rows where *where* holds, else 0."""
+        return self.np.divide(
+            numerator, denominator, out=self.np.zeros(len(self)), where=where
+        )
+
+    def text_flags(self, name: str, predicate: Any) -> Any:
+        """Boolean column from applying *predicate* to a str field."""
+        return self.np.fromiter(
+            (bool(predicate(value)) for value in self[name]), dtype=bool, count=len(self)
+        )
+
+
+def iter_criteria_rows(
+    criteria: dict[str, Any], size: int, cast: Any = bool
+) -> Iterator[dict[str, Any]]:
+    """Per-row ``criteria_met`` dicts, preserving criteria order.
+
+    *cast* converts each cell (``float`` for per-row score dicts).
+    """
+    names = list(criteria)
+    rows = zip(*(criteria[name].tolist() for name in names)) if names else iter(())
+    for row in rows:
+        yield dict(zip(names, (cast(value) for value in row)))
+    if not names:
+        for _ in range(size):
+            yield {}
@@ -17,8 +17,14 @@ from __future__ import annotations
 
 from decimal import Decimal
 
+from typing import TYPE_CHECKING, Any
+
 from .base import InvestorPersona
 from .models import MarketSnapshot, PersonaCategory, PersonaVote, VoteAction
+from .snapshot_table import iter_criteria_rows
+
+if TYPE_CHECKING:
+    from .snapshot_table import SnapshotTable
 
 
 # ---------------------------------------------------------------------------
@@ -74,6 +80,27 @@ class TempletonPersona(InvestorPersona):
         # 6. Dividend yield > market average
         criteria["dividend_above_avg"] = snapshot.dividend_yield > _DIVIDEND_YIELD_MIN
 
+        return self._vote(criteria)
+
+    def screen_batch(self, table: SnapshotTable) -> list[PersonaVote]:
+        high = table["price_52w_high"]
+        per = table["per"]
+        pbr = table["pbr"]
+        has_high = high > 0
+        drawdown = table.divide(high - table["current_price"], high, has_high)
+        down_from_high = has_high & (drawdown >= _DRAWDOWN_MIN)
+        positive_earnings = table["eps"] > 0
+        criteria: dict[str, Any] = {
+            "down_from_52w_high": down_from_high,
+            "low_pe": (per > 0) & (per < _PE_MAX),
+            "low_pb": (pbr > 0) & (pbr < _PB_MAX),
+            "positive_earnings": positive_earnings,
+            "sector_pessimism": down_from_high & positive_earnings,
+            "dividend_above_avg": table["dividend_yield"] > _DIVIDEND_YIELD_MIN,
+        }
+        return [self._vote(row) for row in iter_criteria_rows(criteria, len(table))]
+
+    def _vote(self, criteria: dict[str, bool]) -> PersonaVote:
         # --- Conviction ---
         met_count = sum(criteria.values())
         conviction = round(met_count * _CONVICTION_PER_CRITERIA, 4)
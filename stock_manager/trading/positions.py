@@ -3,14 +3,34 @@ Thread-safe position management.
 
 Uses RLock to protect shared state accessed from multiple threads
 (main thread and price monitor thread).
+
+Why the trigger index:
+- With tick-level WebSocket quotes ``update_price`` is the hottest path in
+  the process. Re-running the stop-loss/take-profit checks for every tick
+  costs two dictionary lookups and two Decimal comparisons, done under
+  the lock.
+
+Each open position has an immutable ``_TriggerLevels`` snapshot. It holds
+the nearest exit threshold below the price (stop-loss or trailing stop)
+and the nearest one above it (take-profit or trailing high-water mark). A
+tick that lands strictly between them costs one chained comparison
+against the snapshot, read without the lock. Only crossings take the slow
+path. Snapshots are rebuilt when the position's ``stop_loss`` /
+``take_profit`` objects change, so callers that assign new levels
+directly need no extra bookkeeping.
+
+Exit callbacks run inline by default. With ``exit_dispatch="async"`` they
+are queued to an ``ExitDispatcher`` worker, so order submission never
+blocks the quote thread.
 """
 
-from threading import RLock
+from threading import Condition, RLock, Thread
 from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import datetime, timezone
-from typing import Callable, Optional
+from typing import Callable, Literal, Optional
 import logging
+import queue
 
 from .models import Position, PositionStatus
 
@@ -77,37 +97,213 @@ def calculate_unrealized_pnl(
     return (current_price - entry_price) * quantity
 
 
+_NEG_INF = Decimal("-Infinity")
+_POS_INF = Decimal("Infinity")
+
+
+@dataclass(frozen=True, slots=True)
+class _TriggerLevels:
+    """Immutable exit thresholds for one position.
+
+    ``stop_loss``/``take_profit`` keep the exact objects the snapshot was
+    built from. ``update_price`` compares them by identity to detect
+    levels reassigned on the position.
+    """
+
+    position: Position
+    stop_loss: Decimal | None
+    take_profit: Decimal | None
+    high_water: Decimal | None
+    lower: Decimal
+    upper: Decimal
+
+    def is_stale(self) -> bool:
+        position = self.position
+        return (
+            position.stop_loss is not self.stop_loss
+            or position.take_profit is not self.take_profit
+        )
+
+
+class ExitDispatcher:
+    """Runs exit callbacks on a single worker thread.
+
+    A trigger that is still queued or running for a symbol is not queued
+    again. Ticks that stay inside the exit zone therefore produce one
+    callback per burst instead of one per tick.
+    """
+
+    def __init__(self, name: str = "position-exit-dispatcher") -> None:
+        self._name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending: set[tuple[str, str]] = set()
+        self._cond = Condition()
+        self._thread: Thread | None = None
+
+    def submit(self, symbol: str, trigger: str, callback: Callable[[str], None]) -> bool:
+        """Queue *callback* for *symbol*; False if the same trigger is pending."""
+        key = (symbol, trigger)
+        with self._cond:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+        self._queue.put((key, callback))
+        return True
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until every queued callback has run."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending, timeout)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            key, callback = item
+            try:
+                callback(key[0])
+            except Exception:
+                logger.exception(f"Exit callback failed: {key[1]} {key[0]}")
+            finally:
+                with self._cond:
+                    self._pending.discard(key)
+                    self._cond.notify_all()
+
+
 @dataclass
 class PositionManager:
-    """Thread-safe position management."""
+    """Thread-safe position management.
+
+    Attributes:
+        trailing_stop_pct: Arm a trailing stop this fraction below the
+            highest price seen since the position was opened (None = off).
+            It fires ``on_stop_loss``.
+        exit_dispatch: ``"sync"`` runs exit callbacks on the calling
+            thread. ``"async"`` hands them to an ``ExitDispatcher``.
+    """
 
     _positions: dict[str, Position] = field(default_factory=dict)
     _lock: RLock = field(default_factory=RLock, init=False, repr=False)
     _on_stop_loss: Optional[Callable[[str], None]] = None
     _on_take_profit: Optional[Callable[[str], None]] = None
+    trailing_stop_pct: Optional[Decimal] = None
+    exit_dispatch: Literal["sync", "async"] = "sync"
+    _triggers: dict[str, _TriggerLevels] = field(default_factory=dict, init=False, repr=False)
+    _dispatcher: Optional[ExitDispatcher] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.exit_dispatch not in ("sync", "async"):
+            raise ValueError(f"Unknown exit_dispatch: {self.exit_dispatch!r}")
+        if self.trailing_stop_pct is not None:
+            self.trailing_stop_pct = Decimal(str(self.trailing_stop_pct))
+            if not Decimal("0") < self.trailing_stop_pct < Decimal("1"):
+                raise ValueError("trailing_stop_pct must be between 0 and 1")
+        if self.exit_dispatch == "async":
+            self._dispatcher = ExitDispatcher()
+        for symbol, position in self._positions.items():
+            self._triggers[symbol] = self._build_triggers(position)
 
     def update_price(self, symbol: str, price: Decimal) -> None:
         """Thread-safe price update (called from monitor thread)."""
+        levels = self._triggers.get(symbol)
+        if levels is None:
+            return
+
+        pos = levels.position
+        with self._lock:
+            if self._positions.get(symbol) is not pos:
+                return
+            pos.current_price = price
+            pos.unrealized_pnl = calculate_unrealized_pnl(price, pos.entry_price, pos.quantity)
+
+        # Lock-free fast path: one comparison against the nearest thresholds
+        if levels.lower < price < levels.upper and not levels.is_stale():
+            return
+        self._on_threshold_crossed(symbol, price)
+
+    def _on_threshold_crossed(self, symbol: str, price: Decimal) -> None:
         callback_to_call = None
-        callback_symbol = None
+        trigger = ""
 
         with self._lock:
-            if symbol in self._positions:
-                pos = self._positions[symbol]
-                pos.current_price = price
-                pos.unrealized_pnl = calculate_unrealized_pnl(price, pos.entry_price, pos.quantity)
-
-                # Determine callback (inside lock)
-                if self.check_stop_loss(symbol) and self._on_stop_loss:
-                    callback_to_call = self._on_stop_loss
-                    callback_symbol = symbol
-                elif self.check_take_profit(symbol) and self._on_take_profit:
-                    callback_to_call = self._on_take_profit
-                    callback_symbol = symbol
+            levels = self._triggers.get(symbol)
+            if levels is None:
+                return
+            high_water = levels.high_water
+            if high_water is not None and price > high_water:
+                high_water = price
+            if levels.is_stale() or high_water is not levels.high_water:
+                levels = self._build_triggers(levels.position, high_water)
+                self._triggers[symbol] = levels
+
+            # Stop-loss (including the trailing stop) takes precedence
+            if price <= levels.lower and self._on_stop_loss:
+                callback_to_call, trigger = self._on_stop_loss, "stop_loss"
+            elif is_take_profit_triggered(price, levels.take_profit) and self._on_take_profit:
+                callback_to_call, trigger = self._on_take_profit, "take_profit"
+            dispatcher = self._dispatcher
 
         # Execute callback (outside lock)
-        if callback_to_call and callback_symbol:
-            callback_to_call(callback_symbol)
+        if callback_to_call is None:
+            return
+        if dispatcher is not None:
+            dispatcher.submit(symbol, trigger, callback_to_call)
+        else:
+            callback_to_call(symbol)
+
+    def _build_triggers(
+        self, position: Position, high_water: Decimal | None = None
+    ) -> _TriggerLevels:
+        stop_loss = position.stop_loss
+        take_profit = position.take_profit
+        lower = stop_loss if stop_loss is not None else _NEG_INF
+        upper = take_profit if take_profit is not None else _POS_INF
+
+        if self.trailing_stop_pct is not None:
+            if high_water is None:
+                high_water = max(position.entry_price, position.current_price or Decimal("0"))
+            lower = max(lower, high_water * (Decimal("1") - self.trailing_stop_pct))
+            # A new high leaves the fast path so the trailing stop can ratchet up
+            upper = min(upper, high_water)
+        else:
+            high_water = None
+
+        return _TriggerLevels(
+            position=position,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            high_water=high_water,
+            lower=lower,
+            upper=upper,
+        )
+
+    def refresh_triggers(self, symbol: str) -> None:
+        """Rebuild *symbol*'s trigger snapshot, keeping its high-water mark."""
+        with self._lock:
+            levels = self._triggers.get(symbol)
+            if levels is not None:
+                self._triggers[symbol] = self._build_triggers(levels.position, levels.high_water)
+
+    def wait_for_exits(self, timeout: float | None = None) -> bool:
+        """Block until queued exit callbacks have run (no-op in sync mode)."""
+        dispatcher = self._dispatcher
+        return True if dispatcher is None else dispatcher.wait_idle(timeout)
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the async exit dispatcher worker, if any."""
+        if self._dispatcher is not None:
+            self._dispatcher.stop(timeout=timeout)
 
     def get_position(self, symbol: str) -> Optional[Position]:
         """Thread-safe position retrieval."""
@@ -125,12 +321,14 @@ class PositionManager:
             if position.symbol in self._positions:
                 raise ValueError(f"Position already exists for {position.symbol}")
             self._positions[position.symbol] = position
+            self._triggers[position.symbol] = self._build_triggers(position)
             logger.info(f"Opened position: {position.symbol} qty={position.quantity}")
 
     def close_position(self, symbol: str) -> Optional[Position]:
         """Thread-safe position removal."""
         with self._lock:
             pos = self._positions.pop(symbol, None)
+            self._triggers.pop(symbol, None)
             if pos:
                 pos.status = PositionStatus.CLOSED
                 pos.closed_at = datetime.now(timezone.utc)
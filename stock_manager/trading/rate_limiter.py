@@ -1,17 +1,25 @@
 """
 KIS API rate limiter - 20 requests per second recommended.
 
-Thread-safe sliding window implementation.
+Thread-safe sliding window implementation. Request timestamps live in a
+deque (O(1) amortized expiry). Waiting is inherited from
+``rate_limit.TokenBucket``: blocked callers are woken in FIFO order, each
+sleeping exactly until its slot frees instead of polling.
+
+KIS clients already wait on the shared per-app-key budget
+(``rate_limit.shared_rate_limiter``) for every request, so callers only need
+a ``RateLimiter`` in front of clients that do not (see
+``rate_limit.client_rate_limiter``).
 """
 
-from threading import Lock
-from time import time, sleep
-from typing import Optional
+from collections import deque
 import logging
 
+from stock_manager.adapters.broker.kis.rate_limit import RateBudget, TokenBucket
+
 logger = logging.getLogger(__name__)
 
-class RateLimiter:
+class RateLimiter(TokenBucket):
     """
     Thread-safe rate limiter using sliding window algorithm.
 
@@ -26,72 +34,43 @@ class RateLimiter:
             max_requests: Maximum requests allowed in window
             window_seconds: Time window in seconds
         """
+        super().__init__(
+            RateBudget(max(1, max_requests) / window_seconds, capacity=max(1, max_requests))
+        )
         self.max_requests = max_requests
         self.window = window_seconds
-        self.requests: list[float] = []
-        self._lock = Lock()
-
-    def acquire(self, timeout: Optional[float] = None) -> bool:
-        """
-        Block until request is allowed.
-
-        Args:
-            timeout: Maximum time to wait (None = wait forever)
-
-        Returns:
-            True if acquired, False if timeout
-        """
-        start_time = time()
-
-        while True:
-            with self._lock:
-                now = time()
-
-                # Remove old requests outside window
-                self.requests = [t for t in self.requests if now - t < self.window]
-
-                if len(self.requests) < self.max_requests:
-                    self.requests.append(now)
-                    return True
-
-                # Calculate wait time
-                if self.requests:
-                    sleep_time = self.requests[0] + self.window - now
-                else:
-                    sleep_time = 0
-
-            # Check timeout
-            if timeout is not None and (time() - start_time + sleep_time) > timeout:
-                return False
-
-            if sleep_time > 0:
-                sleep(min(sleep_time, 0.1))  # Sleep in small increments
-
-    def try_acquire(self) -> bool:
-        """
-        Non-blocking attempt to acquire.
-
-        Returns:
-            True if acquired, False if rate limited
-        """
-        with self._lock:
-            now = time()
-            self.requests = [t for t in self.requests if now - t < self.window]
-
-            if len(self.requests) < self.max_requests:
-                self.requests.append(now)
-                return True
-            return False
-
-    @property
-    def available(self) -> int:
-        """Number of requests available in current window."""
-        with self._lock:
-            now = time()
-            self.requests = [t for t in self.requests if now - t < self.window]
-            return self.max_requests - len(self.requests)
+        self.requests: deque[float] = deque()
 
     def reset(self) -> None:
         """Reset the rate limiter."""
         with self._lock:
             self.requests.clear()
+            if self._waiters:
+                self._waiters[0].notify()
+
+    # ------------------------------------------------------------------
+    # Window state (called with ``_lock`` held)
+    # ------------------------------------------------------------------
+
+    def _expire(self, now: float) -> None:
+        """Remove old requests outside window."""
+        while self.requests and now - self.requests[0] >= self.window:
+            self.requests.popleft()
+
+    def _take(self, tokens: float, now: float) -> float:
+        """Record a request and return 0, or return seconds until a slot frees."""
+        self._expire(now)
+        if len(self.requests) < self.max_requests:
+            self.requests.append(now)
+            return 0.0
+        if not self.requests:
+            return float("inf")
+        return max(self.requests[0] + self.window - now, 1e-6)
+
+    def _give(self, tokens: float, now: float) -> None:
+        if self.requests:
+            self.requests.pop()
+
+    def _peek(self, now: float) -> float:
+        self._expire(now)
+        return float(self.max_requests - len(self.requests))
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Optional
 import logging
 
 from .thesis import CycleStage
@@ -21,10 +21,38 @@ class CycleAnalysis:
 
 
 class BoomBustCycleDetector:
-    """Identifies current stage of boom-bust cycle."""
+    """Identifies current stage of boom-bust cycle.
 
-    def __init__(self, client: Any):  # KISRestClient
+    ``daily_prices`` optionally supplies daily rows (``inquire_daily_price``
+    field names, newest first) already fetched this cycle, e.g.
+    ``TechnicalDataFetcher.recent_daily_prices``. The detector only calls
+    ``inquire_daily_price`` itself when the provider has nothing for the symbol.
+    """
+
+    def __init__(
+        self,
+        client: Any,  # KISRestClient
+        daily_prices: Optional[Callable[[str], Optional[list[dict]]]] = None,
+    ):
         self.client = client
+        self.daily_prices = daily_prices
+
+    def _load_daily_prices(self, symbol: str, lookback_days: int) -> Optional[list[dict]]:
+        """Daily rows for *symbol*, newest first; None when the request failed."""
+        if self.daily_prices is not None:
+            rows = self.daily_prices(symbol)
+            if rows:
+                return rows
+
+        from stock_manager.adapters.broker.kis.apis.domestic_stock.basic import (
+            inquire_daily_price
+        )
+
+        response = inquire_daily_price(self.client, symbol, period=str(lookback_days))
+        if response.get("rt_cd") != "0":
+            logger.warning(f"Failed to get data for {symbol}")
+            return None
+        return response.get("output2", [])
 
     def detect_stage(
         self,
@@ -39,18 +67,9 @@ class BoomBustCycleDetector:
         4. Momentum acceleration
         """
         try:
-            from stock_manager.adapters.broker.kis.apis.domestic_stock.basic import (
-                inquire_daily_price
-            )
-
             # Get historical data
-            response = inquire_daily_price(self.client, symbol, period=str(lookback_days))
-            if response.get("rt_cd") != "0":
-                logger.warning(f"Failed to get data for {symbol}")
-                return CycleStage.INCEPTION
-
-            daily_prices = response.get("output2", [])
-            if len(daily_prices) < 20:
+            daily_prices = self._load_daily_prices(symbol, lookback_days)
+            if daily_prices is None or len(daily_prices) < 20:
                 return CycleStage.INCEPTION
 
             # Calculate indicators
@@ -88,23 +107,8 @@ class BoomBustCycleDetector:
         plus trend_strength, volume_pattern, volatility, momentum.
         """
         try:
-            from stock_manager.adapters.broker.kis.apis.domestic_stock.basic import (
-                inquire_daily_price
-            )
-
-            response = inquire_daily_price(self.client, symbol, period=str(lookback_days))
-            if response.get("rt_cd") != "0":
-                logger.warning(f"Failed to get data for {symbol}")
-                return CycleAnalysis(
-                    stage=CycleStage.INCEPTION,
-                    trend_strength=Decimal("0"),
-                    volume_pattern="normal",
-                    volatility=Decimal("0"),
-                    momentum=0,
-                )
-
-            daily_prices = response.get("output2", [])
-            if len(daily_prices) < 20:
+            daily_prices = self._load_daily_prices(symbol, lookback_days)
+            if daily_prices is None or len(daily_prices) < 20:
                 return CycleAnalysis(
                     stage=CycleStage.INCEPTION,
                     trend_strength=Decimal("0"),
@@ -10,10 +10,13 @@ Implements various investment strategies including:
 from __future__ import annotations
 
 from collections.abc import Callable
+from pathlib import Path
 
 from typing import Any
 
+from stock_manager.trading.models import TradingConfig
 from stock_manager.trading.strategies.base import Strategy, StrategyScore
+from stock_manager.trading.strategies.batch import BatchScreener, ScreenOutcome
 from stock_manager.trading.strategies.consensus import ConsensusScore, ConsensusStrategy
 from stock_manager.trading.strategies.graham import (
     GrahamScreener,
@@ -23,13 +26,18 @@ from stock_manager.trading.strategies.graham import (
 )
 
 
+# One persona worker per binding persona; the pool is shared by every symbol.
+_CONSENSUS_EVAL_WORKERS = 10
+
+
 def _normalize_strategy_name(value: str) -> str:
     return "".join(char for char in value.lower().strip() if char.isalnum())
 
 
-def _build_consensus_strategy(client: Any) -> ConsensusStrategy:
+def _build_consensus_strategy(client: Any, config: TradingConfig) -> ConsensusStrategy:
     from stock_manager.trading.consensus.aggregator import VoteAggregator
     from stock_manager.trading.consensus.evaluator import ConsensusEvaluator
+    from stock_manager.trading.indicators.data_cache import TieredDataCache
     from stock_manager.trading.indicators.fetcher import TechnicalDataFetcher
     from stock_manager.trading.personas.buffett_persona import BuffettPersona
     from stock_manager.trading.personas.dalio_persona import DalioPersona
@@ -44,38 +52,55 @@ def _build_consensus_strategy(client: Any) -> ConsensusStrategy:
     from stock_manager.trading.personas.wood_advisory import WoodAdvisory
     from stock_manager.trading.reflexivity.cycle_detector import BoomBustCycleDetector
 
+    from stock_manager.adapters.broker.kis.client import build_real_data_client
+    from stock_manager.adapters.broker.kis.config import KISConfig
+
+    _kis_config = getattr(client, "config", None)
+    _real_client = None
+    if isinstance(_kis_config, KISConfig) and _kis_config.use_mock:
+        _real_client = build_real_data_client(_kis_config)
+
+    data_cache = None
+    if config.consensus_data_cache:
+        cache_path = config.consensus_data_cache_path
+        data_cache = TieredDataCache(persist_path=Path(cache_path) if cache_path else None)
+
+    fetcher = TechnicalDataFetcher(
+        client,
+        real_client=_real_client,
+        max_concurrent_calls=config.consensus_fetch_concurrency,
+        data_cache=data_cache,
+    )
     personas = [
         BuffettPersona(),
         GrahamPersona(),
         LynchPersona(),
         MungerPersona(),
         DalioPersona(),
-        SorosPersona(detector=BoomBustCycleDetector(client)),
+        # Reuses the daily bars the fetcher pulled for the same symbol.
+        SorosPersona(
+            detector=BoomBustCycleDetector(client, daily_prices=fetcher.recent_daily_prices)
+        ),
         FisherPersona(),
         TempletonPersona(),
         LivermorePersona(),
         SimonsPersona(),
     ]
-    from stock_manager.adapters.broker.kis.client import build_real_data_client
-    from stock_manager.adapters.broker.kis.config import KISConfig
-
-    _kis_config = getattr(client, "config", None)
-    _real_client = None
-    if isinstance(_kis_config, KISConfig) and _kis_config.use_mock:
-        _real_client = build_real_data_client(_kis_config)
 
     evaluator = ConsensusEvaluator(
         personas=personas,
         advisory=WoodAdvisory(),
-        fetcher=TechnicalDataFetcher(client, real_client=_real_client),
+        fetcher=fetcher,
         aggregator=VoteAggregator(),
+        max_workers=_CONSENSUS_EVAL_WORKERS,
+        short_circuit=config.consensus_short_circuit,
     )
     return ConsensusStrategy(evaluator=evaluator)
 
 
-_STRATEGY_FACTORIES: dict[str, Callable[[Any], Strategy]] = {
-    "graham": lambda client: GrahamScreener(client=client, market="KOSPI"),
-    "grahamscreener": lambda client: GrahamScreener(client=client, market="KOSPI"),
+_STRATEGY_FACTORIES: dict[str, Callable[[Any, TradingConfig], Strategy]] = {
+    "graham": lambda client, _config: GrahamScreener(client=client, market="KOSPI"),
+    "grahamscreener": lambda client, _config: GrahamScreener(client=client, market="KOSPI"),
     "consensus": _build_consensus_strategy,
     "consensusstrategy": _build_consensus_strategy,
 }
@@ -85,7 +110,9 @@ def get_available_strategy_names() -> tuple[str, ...]:
     return tuple(sorted(_STRATEGY_FACTORIES))
 
 
-def resolve_strategy(strategy_name: str, *, client: Any) -> Strategy:
+def resolve_strategy(
+    strategy_name: str, *, client: Any, config: TradingConfig | None = None
+) -> Strategy:
     normalized_name = _normalize_strategy_name(strategy_name)
     try:
         factory = _STRATEGY_FACTORIES[normalized_name]
@@ -95,12 +122,14 @@ def resolve_strategy(strategy_name: str, *, client: Any) -> Strategy:
             f"Unknown strategy '{strategy_name}'. Available strategies: {available}"
         ) from exc
 
-    return factory(client)
+    return factory(client, config or TradingConfig())
 
 
 __all__ = [
     "Strategy",
     "StrategyScore",
+    "BatchScreener",
+    "ScreenOutcome",
     "ConsensusStrategy",
     "ConsensusScore",
     "GrahamScreener",
@@ -0,0 +1,234 @@
+"""Batch screening engine: pipelined multi-symbol ``Strategy.evaluate``.
+
+``Strategy.screen`` evaluates symbols one after another, so a 50-symbol
+consensus cycle pays every symbol's KIS fetch and persona evaluation in
+series. ``BatchScreener`` keeps a bounded window of symbols in flight on a
+worker pool: while one symbol's personas are voting, the next symbols are
+already fetching their snapshots.
+
+Results are streamed in completion order by ``iter_screen`` so callers can
+act on a passing symbol (e.g. submit a buy) before the rest of the universe
+has finished. Each symbol gets an optional deadline, measured from when its
+evaluation starts running; a symbol that overruns it is reported as timed
+out and its late result is discarded. The worker of a timed-out symbol stays
+busy until ``evaluate`` returns, so its slot is only refilled after that.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Generator, Iterable, Optional
+
+from stock_manager.trading.strategies.base import Strategy, StrategyScore
+
+logger = logging.getLogger(__name__)
+
+_START_POLL_SEC = 0.05
+
+
+@dataclass(frozen=True)
+class ScreenOutcome:
+    """Result of screening a single symbol.
+
+    Attributes:
+        symbol: Symbol that was evaluated.
+        score: Strategy score, or None if evaluation failed or timed out.
+        elapsed_sec: Wall-clock seconds from start of evaluation to completion.
+        timed_out: True if the symbol exceeded its deadline.
+        error: Exception text when ``evaluate`` raised.
+    """
+
+    symbol: str
+    score: Optional[StrategyScore]
+    elapsed_sec: float
+    timed_out: bool = False
+    error: str | None = None
+
+    @property
+    def passes(self) -> bool:
+        """Whether the symbol produced a passing score."""
+        return self.score is not None and bool(self.score.passes_all)
+
+
+class BatchScreener:
+    """Screens many symbols concurrently with a bounded in-flight window.
+
+    Args:
+        max_concurrency: Maximum symbols evaluated at the same time.
+        symbol_timeout_sec: Per-symbol deadline measured from the moment its
+            evaluation starts running. ``None`` or ``<= 0`` disables deadlines.
+
+    Usage:
+        screener = BatchScreener(max_concurrency=4, symbol_timeout_sec=20)
+        for outcome in screener.iter_screen(strategy, symbols):
+            if outcome.passes:
+                submit_buy(outcome.symbol)
+        screener.close()
+
+    Thread safety:
+        ``iter_screen`` may be called from one thread at a time per
+        screener; the underlying ``Strategy.evaluate`` must tolerate
+        concurrent calls for different symbols.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        symbol_timeout_sec: float | None = None,
+    ) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.symbol_timeout_sec = (
+            float(symbol_timeout_sec) if symbol_timeout_sec and symbol_timeout_sec > 0 else None
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the worker pool. Running evaluations are not interrupted."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def screen(self, strategy: Strategy, symbols: list[str]) -> list[StrategyScore]:
+        """Screen all symbols and return passing scores in input order.
+
+        Drop-in equivalent of ``Strategy.screen`` that runs concurrently.
+        """
+        passing: dict[str, StrategyScore] = {}
+        for outcome in self.iter_screen(strategy, symbols):
+            if outcome.passes and outcome.score is not None:
+                passing[outcome.symbol] = outcome.score
+        return [passing[symbol] for symbol in symbols if symbol in passing]
+
+    def iter_screen(
+        self, strategy: Strategy, symbols: list[str]
+    ) -> Generator[ScreenOutcome, None, None]:
+        """Yield a ScreenOutcome per symbol as soon as each one finishes.
+
+        At most ``max_concurrency`` symbols occupy a worker; the next symbol
+        is submitted whenever a worker frees up. A timed-out symbol is
+        reported immediately but keeps its worker until ``evaluate`` returns.
+        Closing the generator early (e.g. once enough buys were submitted)
+        cancels symbols that have not started yet.
+        """
+        queue = list(dict.fromkeys(symbols))
+        if not queue:
+            return
+
+        executor = self._get_executor()
+        in_flight: dict[Future[Optional[StrategyScore]], _Task] = {}
+        # Timed-out evaluations still running on a worker.
+        abandoned: set[Future[Optional[StrategyScore]]] = set()
+        next_index = 0
+
+        def submit_next() -> None:
+            nonlocal next_index
+            abandoned.difference_update([f for f in abandoned if f.done()])
+            while (
+                next_index < len(queue)
+                and len(in_flight) + len(abandoned) < self.max_concurrency
+            ):
+                task = _Task(queue[next_index])
+                next_index += 1
+                in_flight[executor.submit(task.run, strategy)] = task
+
+        try:
+            submit_next()
+            while in_flight or next_index < len(queue):
+                done, _ = wait(
+                    [*in_flight, *abandoned],
+                    timeout=self._next_wait_timeout(in_flight.values()),
+                    return_when=FIRST_COMPLETED,
+                )
+                now = time.monotonic()
+                for future in done:
+                    task = in_flight.pop(future, None)
+                    if task is not None:
+                        yield self._collect(future, task.symbol, task.elapsed(now))
+                for future, task in list(in_flight.items()):
+                    if self._is_past_deadline(task.started, now):
+                        in_flight.pop(future)
+                        if not future.cancel():
+                            abandoned.add(future)
+                        logger.warning(
+                            "Screening %s exceeded %.1fs deadline; skipping",
+                            task.symbol,
+                            self.symbol_timeout_sec,
+                        )
+                        yield ScreenOutcome(
+                            symbol=task.symbol,
+                            score=None,
+                            elapsed_sec=task.elapsed(now),
+                            timed_out=True,
+                        )
+                submit_next()
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="BatchScreener",
+                )
+            return self._executor
+
+    def _is_past_deadline(self, started: float | None, now: float) -> bool:
+        return (
+            self.symbol_timeout_sec is not None
+            and started is not None
+            and (now - started) >= self.symbol_timeout_sec
+        )
+
+    def _next_wait_timeout(self, tasks: Iterable[_Task]) -> float | None:
+        if self.symbol_timeout_sec is None:
+            return None
+        tasks = list(tasks)
+        if not tasks:
+            return None
+        starts = [task.started for task in tasks if task.started is not None]
+        if len(starts) < len(tasks):
+            # A task starting is not observable through wait(); poll for it.
+            return _START_POLL_SEC
+        return max(0.0, min(starts) + self.symbol_timeout_sec - time.monotonic())
+
+    @staticmethod
+    def _collect(
+        future: Future[Optional[StrategyScore]], symbol: str, elapsed: float
+    ) -> ScreenOutcome:
+        try:
+            score = future.result()
+        except Exception as exc:
+            logger.warning("Screening %s failed", symbol, exc_info=True)
+            return ScreenOutcome(symbol=symbol, score=None, elapsed_sec=elapsed, error=str(exc))
+        return ScreenOutcome(symbol=symbol, score=score, elapsed_sec=elapsed)
+
+
+class _Task:
+    """One symbol's evaluation; records when it actually starts running."""
+
+    __slots__ = ("symbol", "submitted", "started")
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.submitted = time.monotonic()
+        self.started: float | None = None
+
+    def run(self, strategy: Strategy) -> Optional[StrategyScore]:
+        self.started = time.monotonic()
+        return strategy.evaluate(self.symbol)
+
+    def elapsed(self, now: float) -> float:
+        return now - (self.started if self.started is not None else self.submitted)
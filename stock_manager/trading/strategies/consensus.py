@@ -58,6 +58,10 @@ class ConsensusStrategy(Strategy):
     def __init__(self, evaluator: ConsensusEvaluator) -> None:
         self.evaluator = evaluator
 
+    def close(self) -> None:
+        """Release the evaluator's worker pools (recreated on next evaluate)."""
+        self.evaluator.close()
+
     def evaluate(self, symbol: str) -> Optional[ConsensusScore]:
         """Evaluate a single symbol through the consensus pipeline.
 
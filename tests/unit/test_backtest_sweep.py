@@ -0,0 +1,231 @@
+"""Tests for the backtest parameter sweep and walk-forward runner."""
+
+from __future__ import annotations
+
+import csv
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from stock_manager.backtesting.config import BacktestConfig
+from stock_manager.backtesting.data_loader import HistoricalDataLoader
+from stock_manager.backtesting.engine import BacktestEngine
+from stock_manager.backtesting.sweep import (
+    SweepParams,
+    SweepRunner,
+    format_sweep_table,
+    parameter_grid,
+    random_parameter_sample,
+    rank_results,
+    walk_forward_windows,
+    write_sweep_csv,
+)
+from stock_manager.trading.personas.models import PersonaCategory, PersonaVote, VoteAction
+
+
+# ---------------------------------------------------------------------------
+# Helpers (module level so the process pool can pickle them)
+# ---------------------------------------------------------------------------
+
+
+class _TrendPersona:
+    """Votes BUY when the close is above its 20-day average."""
+
+    def __init__(self, name: str, category: PersonaCategory, conviction: float) -> None:
+        self.name = name
+        self.category = category
+        self.conviction = conviction
+
+    def screen_rule(self, snapshot) -> PersonaVote:
+        bullish = float(snapshot.current_price) > snapshot.sma_20
+        return PersonaVote(
+            persona_name=self.name,
+            action=VoteAction.BUY if bullish else VoteAction.HOLD,
+            conviction=self.conviction,
+            reasoning="trend",
+            criteria_met={"above_sma20": bullish},
+            category=self.category,
+        )
+
+
+def _personas() -> list[_TrendPersona]:
+    return [
+        _TrendPersona("Alpha", PersonaCategory.VALUE, 0.9),
+        _TrendPersona("Beta", PersonaCategory.MOMENTUM, 0.7),
+        _TrendPersona("Gamma", PersonaCategory.MACRO, 0.5),
+    ]
+
+
+def _loader(num_days: int = 120) -> HistoricalDataLoader:
+    loader = HistoricalDataLoader()
+    base = date(2024, 1, 1).toordinal()
+    for symbol, drift in (("UP", 60), ("WAVE", 0)):
+        records = []
+        for i in range(num_days):
+            close = 10_000 + i * drift + (400 if (i // 7) % 2 else -400)
+            records.append(
+                {
+                    "date": date.fromordinal(base + i),
+                    "open": close,
+                    "high": close + 100,
+                    "low": close - 100,
+                    "close": close,
+                    "volume": 100_000,
+                }
+            )
+        loader.load_from_records(symbol, records)
+    return loader
+
+
+def _config(num_days: int = 120) -> BacktestConfig:
+    return BacktestConfig(
+        symbols=["UP", "WAVE"],
+        start_date=date(2024, 1, 1),
+        end_date=date.fromordinal(date(2024, 1, 1).toordinal() + num_days - 1),
+        initial_capital=Decimal("10000000"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parameter generation
+# ---------------------------------------------------------------------------
+
+
+class TestParameterGrid:
+    def test_grid_is_cartesian_product(self):
+        grid = parameter_grid(threshold=[1, 2, 3], position_size_pct=[5.0, 10.0])
+        assert len(grid) == 6
+        assert {(p.threshold, p.position_size_pct) for p in grid} == {
+            (t, s) for t in (1, 2, 3) for s in (5.0, 10.0)
+        }
+        assert all(p.quorum_pct == 0.70 for p in grid)
+
+    def test_personas_axis_normalized_to_tuples(self):
+        grid = parameter_grid(personas=[["Alpha", "Beta"], None])
+        assert grid[0].personas == ("Alpha", "Beta")
+        assert grid[1].personas is None
+        assert [p.name for p in grid[0].select_personas(_personas())] == ["Alpha", "Beta"]
+
+    def test_unknown_or_empty_axis_rejected(self):
+        with pytest.raises(ValueError, match="Unknown sweep parameter"):
+            parameter_grid(thresold=[6])
+        with pytest.raises(ValueError, match="no values"):
+            parameter_grid(threshold=[])
+
+    def test_random_sample_is_seeded_and_distinct(self):
+        axes = dict(threshold=[1, 2, 3, 4], min_conviction=[0.5, 0.6, 0.7])
+        first = random_parameter_sample(5, seed=42, **axes)
+        assert first == random_parameter_sample(5, seed=42, **axes)
+        assert len(set(first)) == 5
+        assert len(random_parameter_sample(100, **axes)) == 12
+
+    def test_apply_overrides_portfolio_settings(self):
+        params = SweepParams(position_size_pct=25.0, rebalance_interval_days=3)
+        config = params.apply(_config())
+        assert config.position_size_pct == 25.0
+        assert config.rebalance_interval_days == 3
+        assert config.symbols == ["UP", "WAVE"]
+
+
+class TestWalkForwardWindows:
+    def test_windows_tile_test_periods(self):
+        calendar = [date.fromordinal(date(2024, 1, 1).toordinal() + i) for i in range(10)]
+        windows = walk_forward_windows(calendar, train_days=4, test_days=2)
+        assert [(w.train_start.day, w.train_end.day, w.test_start.day, w.test_end.day)
+                for w in windows] == [(1, 4, 5, 6), (3, 6, 7, 8), (5, 8, 9, 10)]
+
+    def test_custom_step_and_short_calendar(self):
+        calendar = [date.fromordinal(date(2024, 1, 1).toordinal() + i) for i in range(10)]
+        assert len(walk_forward_windows(calendar, 4, 2, step_days=1)) == 5
+        assert walk_forward_windows(calendar[:5], 4, 2) == []
+        with pytest.raises(ValueError):
+            walk_forward_windows(calendar, 0, 2)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+class TestEngineAggregator:
+    def test_aggregator_threshold_gates_entries(self):
+        loader, config = _loader(), _config()
+        lenient = SweepParams(threshold=1, min_conviction=0.0, min_category_diversity=1)
+        strict = SweepParams(threshold=4, min_conviction=0.0, min_category_diversity=1)
+
+        lenient_run = BacktestEngine(loader, _personas(), aggregator=lenient.aggregator())
+        strict_run = BacktestEngine(loader, _personas(), aggregator=strict.aggregator())
+
+        lenient_result = lenient_run.run(config)
+        assert lenient_result.portfolio.trades or lenient_result.portfolio.positions
+        strict_result = strict_run.run(config)
+        assert strict_result.portfolio.trades == []
+        assert strict_result.portfolio.positions == {}
+
+
+class TestSweepRunner:
+    def test_run_ranks_results_by_metric(self):
+        params = parameter_grid(
+            threshold=[1, 4], min_conviction=[0.0], min_category_diversity=[1]
+        )
+        runner = SweepRunner(_loader(), _personas, rank_by="total_trades")
+        results = runner.run(_config(), params)
+
+        assert [r.params.threshold for r in results] == [1, 4]
+        assert results[0].metrics.total_trades >= results[1].metrics.total_trades
+        assert results[0].start_date == date(2024, 1, 1)
+
+    def test_process_pool_matches_in_process(self):
+        params = parameter_grid(
+            threshold=[1, 2, 3], min_conviction=[0.0], min_category_diversity=[1]
+        )
+        serial = SweepRunner(_loader(), _personas).run(_config(), params)
+        parallel = SweepRunner(_loader(), _personas, max_workers=2).run(_config(), params)
+        assert [(r.params, r.metrics) for r in parallel] == [
+            (r.params, r.metrics) for r in serial
+        ]
+
+    def test_walk_forward_scores_winner_out_of_sample(self):
+        params = parameter_grid(
+            threshold=[1, 4], min_conviction=[0.0], min_category_diversity=[1]
+        )
+        runner = SweepRunner(_loader(), _personas, rank_by="total_trades")
+        results = runner.walk_forward(_config(), params, train_days=60, test_days=30)
+
+        assert len(results) == 2
+        for wf in results:
+            assert wf.best.start_date == wf.window.train_start
+            assert wf.test.start_date == wf.window.test_start
+            assert wf.test.params == wf.best.params
+            assert wf.window.train_end < wf.window.test_start
+
+    def test_unknown_rank_metric_rejected(self):
+        with pytest.raises(ValueError):
+            SweepRunner(_loader(), _personas, rank_by="alpha")
+
+    def test_lower_is_better_metrics_sort_ascending(self):
+        params = parameter_grid(
+            threshold=[1, 4], min_conviction=[0.0], min_category_diversity=[1]
+        )
+        results = SweepRunner(_loader(), _personas).run(_config(), params)
+        ranked = rank_results(results, "max_drawdown_pct")
+        assert ranked[0].metrics.max_drawdown_pct <= ranked[-1].metrics.max_drawdown_pct
+
+
+class TestSweepOutput:
+    def test_csv_and_table(self, tmp_path):
+        params = parameter_grid(threshold=[1, 4], personas=[["Alpha"], None])
+        results = SweepRunner(_loader(), _personas).run(_config(), params)
+
+        path = tmp_path / "out" / "sweep.csv"
+        write_sweep_csv(results, path)
+        with open(path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert [int(r["rank"]) for r in rows] == [1, 2, 3, 4]
+        assert {r["personas"] for r in rows} == {"Alpha", "all"}
+        assert "sharpe_ratio" in rows[0]
+
+        table = format_sweep_table(results, top=2)
+        assert len(table.splitlines()) == 3
+        assert "t=" in table.splitlines()[1]
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from stock_manager.backtesting.columnar import ColumnarMarketData, SymbolColumns
 from stock_manager.backtesting.config import BacktestConfig
 from stock_manager.backtesting.data_loader import HistoricalBar, HistoricalDataLoader
 from stock_manager.backtesting.engine import BacktestEngine, BacktestResult
@@ -649,6 +650,111 @@ class TestBacktestEngine:
         assert len(result.portfolio.equity_curve) > 0
 
 
+# ---------------------------------------------------------------------------
+# TestColumnarMarketData
+# ---------------------------------------------------------------------------
+
+
+def _random_walk_bars(num_days: int = 320, seed: int = 3) -> list[HistoricalBar]:
+    """Bars with ups, downs and flat days so RSI/extremes are non-trivial."""
+    import random
+
+    rng = random.Random(seed)
+    base = date(2023, 1, 2)
+    close = 50000
+    bars = []
+    for i in range(num_days):
+        close = max(1000, close + rng.choice([-700, -300, 0, 0, 250, 600]))
+        bars.append(
+            HistoricalBar(
+                date=date.fromordinal(base.toordinal() + i),
+                open=Decimal(close - 100),
+                high=Decimal(close + rng.randint(0, 900)),
+                low=Decimal(close - rng.randint(0, 900)),
+                close=Decimal(close),
+                volume=rng.randint(10_000, 5_000_000),
+            )
+        )
+    return bars
+
+
+class TestColumnarMarketData:
+    """Tests for the columnar backtest core."""
+
+    def test_snapshot_matches_build_snapshot_from_bars(self):
+        bars = _random_walk_bars()
+        columns = SymbolColumns("005930", bars)
+        for row in range(len(bars)):
+            expected = build_snapshot_from_bars("005930", bars, row)
+            got = columns.snapshot(row)
+            assert got.current_price == expected.current_price
+            assert got.prev_close == expected.prev_close
+            assert got.avg_volume_20d == expected.avg_volume_20d
+            assert got.price_52w_high == expected.price_52w_high
+            assert got.price_52w_low == expected.price_52w_low
+            assert got.sma_20 == pytest.approx(expected.sma_20, rel=1e-12)
+            assert got.sma_50 == pytest.approx(expected.sma_50, rel=1e-12)
+            assert got.sma_200 == pytest.approx(expected.sma_200, rel=1e-12)
+            assert got.rsi_14 == pytest.approx(expected.rsi_14, abs=0.011)
+
+    def test_snapshot_out_of_range_is_empty(self):
+        columns = SymbolColumns("X", _make_bars(num_days=5))
+        assert columns.snapshot(5).symbol == ""
+        assert columns.snapshot(-1).symbol == ""
+
+    def test_calendar_alignment_with_missing_days(self):
+        loader = HistoricalDataLoader()
+        records = _make_records(num_days=10)
+        loader.load_from_records("A", records)
+        loader.load_from_records("B", records[::2])
+
+        market = ColumnarMarketData.from_loader(
+            loader, ["A", "B", "MISSING"], date(2024, 1, 3), date(2024, 1, 8)
+        )
+
+        assert list(market.columns) == ["A", "B"]
+        assert market.calendar == [date(2024, 1, d) for d in range(3, 9)]
+        assert market.rows["A"] == [0, 1, 2, 3, 4, 5]
+        assert market.rows["B"] == [-1, 0, -1, 1, -1, 2]
+        assert set(market.closes_on(0)) == {"A"}
+        assert market.closes_on(1)["B"] == market.columns["B"].close[0]
+        assert market.columns["B"].bar(1) == loader.get_bar_on_date("B", date(2024, 1, 6))
+
+    def test_loader_range_boundaries(self):
+        loader = HistoricalDataLoader()
+        loader.load_from_records("A", _make_records(num_days=10))
+        bars = loader.get_bars("A", date(2023, 12, 1), date(2024, 1, 4))
+        assert [b.date for b in bars] == [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+        assert loader.get_bars("A", date(2024, 2, 1), date(2024, 3, 1)) == []
+        assert loader.get_bar_on_date("A", date(2024, 1, 1)) is None
+        assert loader.get_bar_on_date("A", date(2024, 1, 11)).close == Decimal("10900")
+
+    def test_engine_evaluates_snapshots_only_on_rebalance_days(self):
+        loader = HistoricalDataLoader()
+        loader.load_from_records("A", _make_records(num_days=60))
+        seen: list[tuple[str, Decimal]] = []
+
+        persona = MagicMock()
+
+        def screen(snapshot):
+            seen.append((snapshot.symbol, snapshot.current_price))
+            vote = MagicMock()
+            vote.action.value = "hold"
+            return vote
+
+        persona.screen_rule.side_effect = screen
+        config = BacktestConfig(
+            symbols=["A"],
+            start_date=date(2024, 1, 2),
+            end_date=date(2024, 3, 1),
+            rebalance_interval_days=10,
+        )
+        BacktestEngine(loader, personas=[persona]).run(config)
+
+        # Rebalance days 10..60 step 10 -> rows 9, 19, ...; rows < 20 are skipped.
+        assert seen == [("A", Decimal(str(10000 + row * 100))) for row in (29, 39, 49, 59)]
+
+
 # ---------------------------------------------------------------------------
 # TestReport
 # ---------------------------------------------------------------------------
@@ -0,0 +1,157 @@
+"""Tests for the memory-mapped OHLCV bar store."""
+
+from __future__ import annotations
+
+import pickle
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from stock_manager.backtesting.bar_store import OHLCVStore, date_to_int, int_to_date
+from stock_manager.backtesting.data_loader import HistoricalBar, HistoricalDataLoader
+
+
+def _bars(num_days: int, start: date = date(2024, 1, 2)) -> list[HistoricalBar]:
+    base = start.toordinal()
+    return [
+        HistoricalBar(
+            date=date.fromordinal(base + i),
+            open=Decimal(10000 + i * 10),
+            high=Decimal(10100 + i * 10),
+            low=Decimal(9900 + i * 10),
+            close=Decimal(10050 + i * 10),
+            volume=1_000_000 + i,
+        )
+        for i in range(num_days)
+    ]
+
+
+def _kis_output(days: list[tuple[str, int]]) -> list[dict]:
+    """KIS daily price rows (newest first, like the API)."""
+    return [
+        {
+            "stck_bsop_date": day,
+            "stck_oprc": str(close - 50),
+            "stck_hgpr": str(close + 100),
+            "stck_lwpr": str(close - 100),
+            "stck_clpr": str(close),
+            "acml_vol": "12345",
+        }
+        for day, close in reversed(days)
+    ]
+
+
+class TestDateCodec:
+    def test_round_trip(self):
+        assert date_to_int(date(2024, 3, 9)) == 20240309
+        assert int_to_date(20240309) == date(2024, 3, 9)
+
+
+class TestOHLCVStore:
+    def test_append_and_read_round_trip(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        bars = _bars(30)
+        assert store.append("005930", bars) == 30
+
+        assert store.symbols() == ["005930"]
+        assert store.get_bars("005930", date(2000, 1, 1), date(2100, 1, 1)) == bars
+        assert store.last_date("005930") == bars[-1].date
+
+    def test_range_query_is_zero_copy_slice(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("005930", _bars(30))
+
+        cols = store.columns("005930").between(date(2024, 1, 5), date(2024, 1, 9))
+        assert list(cols.dates) == [20240105, 20240106, 20240107, 20240108, 20240109]
+        assert cols.close.obj is store.columns("005930").close.obj
+        assert cols.close[0] == 10080.0
+
+    def test_append_skips_bars_not_newer_than_last(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        bars = _bars(20)
+        store.append("A", bars[:10])
+        assert store.append("A", bars[5:15]) == 5
+        assert store.append("A", bars[:15]) == 0
+        assert [b.date for b in store.get_bars("A", bars[0].date, bars[-1].date)] == [
+            b.date for b in bars[:15]
+        ]
+
+    def test_append_kis_output(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        written = store.append_kis_output(
+            "005930", _kis_output([("20240102", 70000), ("20240103", 71000)])
+        )
+        assert written == 2
+        bars = store.get_bars("005930", date(2024, 1, 1), date(2024, 1, 31))
+        assert [b.close for b in bars] == [Decimal("70000"), Decimal("71000")]
+        assert bars[0].volume == 12345
+
+        # Overlapping response only adds the new session.
+        assert store.append_kis_output(
+            "005930", _kis_output([("20240103", 71000), ("20240104", 72000)])
+        ) == 1
+
+    def test_new_rows_visible_after_append(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        bars = _bars(10)
+        store.append("A", bars[:5])
+        held = store.columns("A")
+        store.append("A", bars[5:])
+
+        assert len(held) == 5  # existing views keep their snapshot
+        assert len(store.columns("A")) == 10
+
+    def test_uneven_columns_are_trimmed(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("A", _bars(5))
+        with open(tmp_path / "A" / "close.bin", "ab") as f:
+            f.write(b"\x00" * 12)  # torn write
+        store.close()
+
+        assert len(store.columns("A")) == 5
+        assert (tmp_path / "A" / "close.bin").stat().st_size == 5 * 8  # repaired before mapping
+        store.append("A", _bars(3, start=date(2024, 2, 1)))
+        assert len(store.columns("A")) == 8
+        assert (tmp_path / "A" / "close.bin").stat().st_size == 8 * 8
+
+    def test_unknown_symbol_is_empty(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        assert len(store.columns("NOPE")) == 0
+        assert store.last_date("NOPE") is None
+        assert not store.has_symbol("NOPE")
+
+    def test_invalid_symbol_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            OHLCVStore(tmp_path).columns("../etc")
+
+    def test_pickle_drops_maps(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("A", _bars(3))
+        store.columns("A")
+        clone = pickle.loads(pickle.dumps(store))
+        assert clone.root == store.root
+        assert len(clone.columns("A")) == 3
+
+
+class TestLoaderWithStore:
+    def test_loader_reads_store_on_demand(self, tmp_path):
+        store = OHLCVStore(tmp_path)
+        store.append("A", _bars(30))
+        loader = HistoricalDataLoader(store=store)
+        loader.load_from_records("B", [
+            {"date": "2024-01-02", "open": 1, "high": 1, "low": 1, "close": 1, "volume": 1}
+        ])
+
+        assert loader.available_symbols() == ["B", "A"]
+        assert len(loader.get_bars("A", date(2024, 1, 5), date(2024, 1, 14))) == 10
+        assert loader.get_bar_on_date("A", date(2024, 1, 3)).close == Decimal("10060")
+        assert loader.get_bar_on_date("A", date(2023, 1, 3)) is None
+        assert loader.get_bars("B", date(2024, 1, 1), date(2024, 1, 31))[0].close == 1
+
+    def test_loader_treats_unknown_and_invalid_symbols_as_empty(self, tmp_path):
+        loader = HistoricalDataLoader(store=OHLCVStore(tmp_path))
+
+        assert loader.get_bars("NOPE", date(2024, 1, 1), date(2024, 1, 31)) == []
+        assert loader.get_bars("../etc", date(2024, 1, 1), date(2024, 1, 31)) == []
+        assert loader.get_bar_on_date("../etc", date(2024, 1, 3)) is None
@@ -0,0 +1,157 @@
+"""Tests for the pipelined multi-symbol BatchScreener."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from stock_manager.trading.strategies import BatchScreener, ScreenOutcome
+from stock_manager.trading.strategies.base import Strategy, StrategyScore
+
+
+@dataclass
+class _Score(StrategyScore):
+    passes: bool
+
+    @property
+    def passes_all(self) -> bool:
+        return self.passes
+
+    @property
+    def criteria_passed(self) -> int:
+        return 1 if self.passes else 0
+
+
+class _SlowStrategy(Strategy):
+    def __init__(self, delays: dict[str, float], passing: set[str] | None = None) -> None:
+        self.delays = delays
+        self.passing = passing if passing is not None else set(delays)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.evaluated: list[str] = []
+
+    def evaluate(self, symbol: str) -> _Score | None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.evaluated.append(symbol)
+        try:
+            time.sleep(self.delays.get(symbol, 0.0))
+            if symbol == "BOOM":
+                raise RuntimeError("boom")
+            return _Score(symbol=symbol, passes=symbol in self.passing)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_screen_matches_serial_screen_order() -> None:
+    strategy = _SlowStrategy(
+        {"A": 0.03, "B": 0.0, "C": 0.01, "D": 0.0},
+        passing={"A", "C", "D"},
+    )
+    screener = BatchScreener(max_concurrency=3)
+    try:
+        concurrent = screener.screen(strategy, ["A", "B", "C", "D"])
+    finally:
+        screener.close()
+
+    assert [s.symbol for s in concurrent] == [s.symbol for s in strategy.screen(["A", "B", "C", "D"])]
+
+
+def test_iter_screen_streams_in_completion_order() -> None:
+    strategy = _SlowStrategy({"SLOW": 0.1, "FAST": 0.0})
+    screener = BatchScreener(max_concurrency=2)
+    try:
+        outcomes = list(screener.iter_screen(strategy, ["SLOW", "FAST"]))
+    finally:
+        screener.close()
+
+    assert [o.symbol for o in outcomes] == ["FAST", "SLOW"]
+    assert all(isinstance(o, ScreenOutcome) and o.passes for o in outcomes)
+
+
+def test_concurrency_is_bounded() -> None:
+    symbols = [f"S{i}" for i in range(8)]
+    strategy = _SlowStrategy({s: 0.02 for s in symbols})
+    screener = BatchScreener(max_concurrency=3)
+    try:
+        outcomes = list(screener.iter_screen(strategy, symbols))
+    finally:
+        screener.close()
+
+    assert len(outcomes) == 8
+    assert 1 < strategy.peak <= 3
+
+
+def test_symbol_deadline_reports_timeout() -> None:
+    strategy = _SlowStrategy({"HANG": 0.5, "OK": 0.0})
+    screener = BatchScreener(max_concurrency=2, symbol_timeout_sec=0.05)
+    started = time.monotonic()
+    try:
+        outcomes = {o.symbol: o for o in screener.iter_screen(strategy, ["HANG", "OK"])}
+    finally:
+        screener.close()
+
+    assert time.monotonic() - started < 0.4
+    assert outcomes["HANG"].timed_out is True
+    assert outcomes["HANG"].score is None
+    assert outcomes["OK"].passes is True
+
+
+def test_evaluate_errors_are_isolated() -> None:
+    strategy = _SlowStrategy({"BOOM": 0.0, "OK": 0.0})
+    screener = BatchScreener(max_concurrency=2)
+    try:
+        outcomes = {o.symbol: o for o in screener.iter_screen(strategy, ["BOOM", "OK"])}
+    finally:
+        screener.close()
+
+    assert outcomes["BOOM"].error == "boom"
+    assert outcomes["BOOM"].passes is False
+    assert outcomes["OK"].passes is True
+
+
+def test_closing_stream_early_skips_unstarted_symbols() -> None:
+    symbols = [f"S{i}" for i in range(10)]
+    strategy = _SlowStrategy({s: 0.01 for s in symbols})
+    screener = BatchScreener(max_concurrency=1)
+    try:
+        stream = screener.iter_screen(strategy, symbols)
+        first = next(stream)
+        stream.close()
+        time.sleep(0.05)
+    finally:
+        screener.close()
+
+    assert first.symbol == "S0"
+    assert len(strategy.evaluated) < len(symbols)
+
+
+def test_duplicate_and_empty_symbol_lists() -> None:
+    strategy = _SlowStrategy({"A": 0.0})
+    screener = BatchScreener(max_concurrency=2)
+    try:
+        assert list(screener.iter_screen(strategy, [])) == []
+        outcomes = list(screener.iter_screen(strategy, ["A", "A"]))
+    finally:
+        screener.close()
+
+    assert [o.symbol for o in outcomes] == ["A"]
+
+
+def test_timed_out_symbol_holds_its_worker_and_replacement_gets_full_deadline() -> None:
+    strategy = _SlowStrategy({"HANG": 0.3, "NEXT": 0.1})
+    screener = BatchScreener(max_concurrency=1, symbol_timeout_sec=0.15)
+    try:
+        outcomes = {o.symbol: o for o in screener.iter_screen(strategy, ["HANG", "NEXT"])}
+    finally:
+        screener.close()
+
+    assert outcomes["HANG"].timed_out is True
+    # NEXT queued behind HANG's worker; its deadline starts only when it runs.
+    assert outcomes["NEXT"].timed_out is False
+    assert outcomes["NEXT"].passes is True
+    assert strategy.peak == 1
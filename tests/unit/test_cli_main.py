@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 from typing import Any
@@ -365,8 +366,9 @@ def test_run_wires_strategy_options_into_trading_config(monkeypatch) -> None:
     strategy_name = "graham"
     strategy_symbols = " 005930, 000660 "
 
-    def fake_resolve_strategy(*, client, strategy_name: str):
+    def fake_resolve_strategy(*, client, strategy_name: str, config=None):
         captured["strategy_name"] = strategy_name
+        captured["strategy_config"] = config
         return "fake-strategy"
 
     captured["config"] = None
@@ -385,8 +387,8 @@ def test_run_wires_strategy_options_into_trading_config(monkeypatch) -> None:
         pass
 
     # Intentionally keep this import-compatible with positional client argument in _resolve_strategy_config.
-    def fake_resolve_strategy_function(strategy_name: str, *, client):
-        return fake_resolve_strategy(client=client, strategy_name=strategy_name)
+    def fake_resolve_strategy_function(strategy_name: str, *, client, config=None):
+        return fake_resolve_strategy(client=client, strategy_name=strategy_name, config=config)
 
     monkeypatch.setattr(trading_commands, "resolve_strategy", fake_resolve_strategy_function)
     monkeypatch.setattr(trading_commands, "TradingEngine", FakeEngine)
@@ -421,11 +423,18 @@ def test_run_wires_strategy_options_into_trading_config(monkeypatch) -> None:
             "005930,000660",
             "--websocket-monitoring-enabled",
             "--websocket-execution-notice-enabled",
+            "--consensus-fetch-concurrency",
+            "4",
+            "--consensus-data-cache",
+            "--consensus-data-cache-path",
+            "/tmp/consensus-cache.json",
+            "--consensus-short-circuit",
         ],
     )
 
     assert result.exit_code == 0
     assert captured["strategy_name"] == strategy_name
+    assert captured["strategy_config"].consensus_fetch_concurrency == 4
     config = captured["config"]
     assert config is not None
     assert config.strategy == "fake-strategy"
@@ -439,6 +448,10 @@ def test_run_wires_strategy_options_into_trading_config(monkeypatch) -> None:
     assert config.strategy_discovery_fallback_symbols == ("005930", "000660")
     assert config.websocket_monitoring_enabled is True
     assert config.websocket_execution_notice_enabled is True
+    assert config.consensus_fetch_concurrency == 4
+    assert config.consensus_data_cache is True
+    assert config.consensus_data_cache_path == "/tmp/consensus-cache.json"
+    assert config.consensus_short_circuit is True
 
 
 def test_parse_strategy_symbols_ignores_blank_entries_and_trims_case() -> None:
@@ -468,7 +481,7 @@ def test_run_wires_empty_strategy_symbols_after_parse(monkeypatch) -> None:
 
     captured: dict[str, Any] = {}
 
-    def fake_resolve_strategy(*, strategy_name: str, client):
+    def fake_resolve_strategy(*, strategy_name: str, client, config=None):
         captured["strategy_name"] = strategy_name
         return "fake-strategy"
 
@@ -526,7 +539,7 @@ def test_run_wires_non_positive_strategy_order_quantity(monkeypatch, quantity) -
 
     captured: dict[str, Any] = {}
 
-    def fake_resolve_strategy(*, strategy_name: str, client):
+    def fake_resolve_strategy(*, strategy_name: str, client, config=None):
         return "fake-strategy"
 
     captured["config"] = None
@@ -1062,3 +1075,37 @@ def test_smoke_fails_after_opsq2000_retry_exhaustion(monkeypatch) -> None:
     assert "OPSQ2000" in result.stdout
     assert "KIS_MOCK_ACCOUNT_NUMBER" in result.stdout
     assert client.make_request.call_count == trading_commands._MOCK_OPSQ2000_RETRY_ATTEMPTS
+
+
+def test_logs_timeline_reports_decision_cycles(tmp_path) -> None:
+    vote = {
+        "event": "agent_vote",
+        "symbol": "005930",
+        "persona_id": "graham",
+        "action": "BUY",
+        "conviction": 0.9,
+        "session_id": "s1",
+        "timestamp": "t1",
+    }
+    consensus = {
+        "event": "consensus_result",
+        "symbol": "005930",
+        "passed": True,
+        "buy_count": 1,
+        "total_count": 1,
+        "session_id": "s1",
+        "timestamp": "t2",
+    }
+    (tmp_path / "pipeline-20260221.ndjson").write_text(
+        json.dumps(vote) + "\n" + json.dumps(consensus) + "\n", encoding="utf-8"
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(
+        build_app(),
+        ["logs", "timeline", "005930", "--log-dir", str(tmp_path), "--date", "2026-02-21"],
+    )
+
+    assert result.exit_code == 0
+    assert "PASSED" in result.stdout
+    assert "vote graham: BUY" in result.stdout
@@ -0,0 +1,191 @@
+"""Tests for ConsensusEvaluator executor reuse, cost ordering and short-circuiting."""
+
+from __future__ import annotations
+
+import threading
+import time
+from decimal import Decimal
+from unittest.mock import Mock
+
+import stock_manager.trading.consensus.evaluator as evaluator_module
+from stock_manager.trading.consensus.aggregator import VoteAggregator
+from stock_manager.trading.consensus.evaluator import ConsensusEvaluator
+from stock_manager.trading.llm.circuit_breaker import CircuitBreaker
+from stock_manager.trading.models import TradingConfig
+from stock_manager.trading.personas.base import InvestorPersona
+from stock_manager.trading.personas.hybrid import HybridPersona
+from stock_manager.trading.personas.models import (
+    MarketSnapshot,
+    PersonaCategory,
+    PersonaVote,
+    VoteAction,
+)
+from stock_manager.trading.strategies import resolve_strategy
+
+CATEGORIES = list(PersonaCategory)
+
+
+def _vote(name: str, action: VoteAction, category: PersonaCategory) -> PersonaVote:
+    return PersonaVote(
+        persona_name=name,
+        action=action,
+        conviction=0.8,
+        reasoning="test",
+        criteria_met={},
+        category=category,
+    )
+
+
+class _RulePersona(InvestorPersona):
+    def __init__(
+        self,
+        name: str,
+        action: VoteAction,
+        calls: list[str],
+        index: int = 0,
+        delay: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.category = CATEGORIES[index % len(CATEGORIES)]
+        self._action = action
+        self._calls = calls
+        self._delay = delay
+
+    def screen_rule(self, snapshot: MarketSnapshot) -> PersonaVote:
+        self._calls.append(self.name)
+        time.sleep(self._delay)
+        return _vote(self.name, self._action, self.category)
+
+
+class _LLMPersona(HybridPersona):
+    def __init__(
+        self,
+        name: str,
+        action: VoteAction,
+        calls: list[str],
+        index: int = 0,
+        gate: threading.Event | None = None,
+    ) -> None:
+        super().__init__(circuit_breaker=CircuitBreaker(failure_threshold=5, cooldown_sec=10.0))
+        self.name = name
+        self.category = CATEGORIES[index % len(CATEGORIES)]
+        self._action = action
+        self._calls = calls
+        self._gate = gate
+
+    def screen_rule(self, snapshot: MarketSnapshot) -> PersonaVote:
+        self._calls.append(self.name)
+        if self._gate is not None:
+            self._gate.wait(5)
+        return _vote(self.name, self._action, self.category)
+
+
+def _evaluator(personas: list[InvestorPersona], **kwargs) -> ConsensusEvaluator:
+    fetcher = Mock()
+    fetcher.fetch_snapshot.return_value = MarketSnapshot(
+        symbol="005930", current_price=Decimal("70000")
+    )
+    return ConsensusEvaluator(
+        personas=personas,
+        advisory=None,
+        fetcher=fetcher,
+        aggregator=VoteAggregator(),
+        **kwargs,
+    )
+
+
+def test_rule_only_personas_run_before_llm_capable_ones() -> None:
+    calls: list[str] = []
+    personas = [
+        _LLMPersona("llm", VoteAction.HOLD, calls),
+        _RulePersona("rule", VoteAction.HOLD, calls),
+    ]
+
+    _evaluator(personas, max_workers=1).evaluate("005930")
+
+    assert calls == ["rule", "llm"]
+
+
+def test_short_circuit_skips_personas_once_threshold_is_unreachable() -> None:
+    calls: list[str] = []
+    gate = threading.Event()  # keeps the slow personas busy until the test ends
+    personas: list[InvestorPersona] = [
+        _LLMPersona(f"llm{i}", VoteAction.BUY, calls, i, gate) for i in range(5)
+    ] + [_RulePersona(f"rule{i}", VoteAction.SELL, calls, i) for i in range(5)]
+    evaluator = _evaluator(personas, max_workers=1, short_circuit=True)
+
+    try:
+        result = evaluator.evaluate("005930")
+    finally:
+        gate.set()
+        evaluator.close()
+
+    # The single worker may already have started the first slow persona.
+    assert calls[:5] == [f"rule{i}" for i in range(5)]
+    assert len(calls) <= 6
+    assert sorted(result.not_evaluated) == [f"llm{i}" for i in range(5)]
+    assert result.sell_count == 5
+    assert result.buy_count == 0
+    assert not result.passes_threshold
+    assert result.symbol == "005930"
+
+
+def test_passing_symbol_evaluates_every_persona_and_reuses_pool() -> None:
+    calls: list[str] = []
+    personas = [_RulePersona(f"rule{i}", VoteAction.BUY, calls, i) for i in range(10)]
+    evaluator = _evaluator(personas, max_workers=3, short_circuit=True)
+
+    first = evaluator.evaluate("005930")
+    pool = evaluator._executor
+    second = evaluator.evaluate("005930")
+
+    assert first.passes_threshold and second.passes_threshold
+    assert first.not_evaluated == []
+    assert len(calls) == 20
+    assert evaluator._executor is pool
+
+    evaluator.close()
+    assert evaluator._executor is None
+    evaluator.fetcher.close.assert_called_once()
+
+
+def test_persona_timeout_starts_when_evaluation_runs(monkeypatch) -> None:
+    monkeypatch.setattr(evaluator_module, "_PERSONA_TIMEOUT_SECONDS", 0.15)
+    calls: list[str] = []
+    personas: list[InvestorPersona] = [
+        _RulePersona("hang", VoteAction.BUY, calls, 0, delay=0.25),
+        _RulePersona("next", VoteAction.BUY, calls, 1, delay=0.1),
+    ]
+    evaluator = _evaluator(personas, max_workers=1)
+
+    try:
+        result = evaluator.evaluate("005930")
+    finally:
+        evaluator.close()
+
+    votes = {vote.persona_name: vote for vote in result.votes}
+    assert votes["hang"].action == VoteAction.ABSTAIN
+    assert votes["hang"].reasoning == "Evaluation timed out for 005930"
+    # "next" waited behind "hang" in the queue; only its run time counts.
+    assert votes["next"].action == VoteAction.BUY
+    assert result.not_evaluated == []
+
+
+def test_aggregator_can_still_pass() -> None:
+    aggregator = VoteAggregator(threshold=6)
+    votes = [_vote("a", VoteAction.BUY, PersonaCategory.VALUE)] + [
+        _vote(f"s{i}", VoteAction.SELL, PersonaCategory.VALUE) for i in range(4)
+    ]
+
+    assert aggregator.can_still_pass(votes, pending=5)
+    assert not aggregator.can_still_pass(votes, pending=4)
+
+
+def test_consensus_strategy_short_circuit_follows_config() -> None:
+    default = resolve_strategy("consensus", client=Mock())
+    enabled = resolve_strategy(
+        "consensus", client=Mock(), config=TradingConfig(consensus_short_circuit=True)
+    )
+
+    assert default.evaluator.short_circuit is False
+    assert enabled.evaluator.short_circuit is True
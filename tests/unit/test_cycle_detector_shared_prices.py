@@ -0,0 +1,82 @@
+"""Tests for sharing the fetcher's daily bars with BoomBustCycleDetector."""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from stock_manager.trading.indicators.fetcher import TechnicalDataFetcher
+from stock_manager.trading.reflexivity.cycle_detector import BoomBustCycleDetector
+
+_DAILY_PRICE = "stock_manager.adapters.broker.kis.apis.domestic_stock.basic.inquire_daily_price"
+
+
+def _rows(count: int) -> list[dict[str, str]]:
+    """Newest-first KIS daily rows with a steady uptrend and a volume spike."""
+    return [
+        {
+            "stck_bsop_date": f"2026{(count - i):04d}",
+            "stck_oprc": str(60000 + (count - i) * 300),
+            "stck_hgpr": str(60500 + (count - i) * 300),
+            "stck_lwpr": str(59500 + (count - i) * 300),
+            "stck_clpr": str(60000 + (count - i) * 300),
+            "acml_vol": str(500000 if i < 5 else 100000),
+        }
+        for i in range(count)
+    ]
+
+
+def _fetched(rows: list[dict[str, str]]) -> TechnicalDataFetcher:
+    client = MagicMock()
+    client.config = SimpleNamespace(use_mock=False)
+    fetcher = TechnicalDataFetcher(client=client)
+    with ExitStack() as stack:
+        for name in (
+            "_fetch_current_price",
+            "_fetch_financial_ratio",
+            "_fetch_balance_sheet",
+            "_fetch_income_statement",
+            "_fetch_growth_ratio",
+            "_fetch_profit_ratio",
+            "_fetch_stability_ratio",
+        ):
+            stack.enter_context(patch.object(fetcher, name, return_value={}))
+        stack.enter_context(patch.object(fetcher, "_fetch_vkospi", return_value=None))
+        stack.enter_context(
+            patch(
+                "stock_manager.trading.indicators.fetcher.inquire_period_price",
+                return_value={"rt_cd": "0", "output": rows},
+            )
+        )
+        fetcher.fetch_snapshot("005930")
+    return fetcher
+
+
+def test_detector_reuses_fetched_bars_without_request() -> None:
+    rows = _rows(120)
+    fetcher = _fetched(rows)
+    shared = BoomBustCycleDetector(MagicMock(), daily_prices=fetcher.recent_daily_prices)
+    standalone = BoomBustCycleDetector(MagicMock())
+
+    with patch(_DAILY_PRICE) as daily_price:
+        analysis = shared.detect_stage_full("005930")
+        daily_price.assert_not_called()
+
+        daily_price.return_value = {"rt_cd": "0", "output2": rows[:30]}
+        expected = standalone.detect_stage_full("005930")
+
+    assert len(fetcher.recent_daily_prices("005930")) == 30
+    assert analysis == expected
+    assert analysis.volume_pattern == "climactic"
+
+
+def test_detector_requests_when_symbol_not_fetched() -> None:
+    fetcher = _fetched(_rows(120))
+    detector = BoomBustCycleDetector(MagicMock(), daily_prices=fetcher.recent_daily_prices)
+
+    with patch(_DAILY_PRICE, return_value={"rt_cd": "0", "output2": _rows(30)}) as daily_price:
+        detector.detect_stage_full("000660")
+
+    daily_price.assert_called_once()
+    assert fetcher.recent_daily_prices("000660") is None
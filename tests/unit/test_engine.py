@@ -28,7 +28,7 @@ from stock_manager.trading import (
     OrderResult,
     RiskCheckResult,
 )
-from stock_manager.persistence import TradingState
+from stock_manager.persistence import TradingState, load_state
 from stock_manager.persistence.recovery import RecoveryReport, RecoveryResult
 from stock_manager.adapters.broker.kis.client import KISRestClient
 from stock_manager.trading.strategies.base import Strategy, StrategyScore
@@ -634,6 +634,59 @@ class TestStrategyOrchestration:
         ]
         engine.stop()
 
+    @patch("stock_manager.engine.load_state")
+    @patch("stock_manager.engine.startup_reconciliation")
+    def test_concurrent_screening_streams_buys_and_stops_at_max_buys(
+        self,
+        mock_reconcile,
+        mock_load,
+        mock_client,
+        tmp_path,
+    ):
+        mock_load.return_value = None
+        mock_reconcile.return_value = RecoveryReport(
+            result=RecoveryResult.CLEAN,
+            orphan_positions=[],
+            missing_positions=[],
+            quantity_mismatches={},
+            pending_orders=[],
+            errors=[],
+        )
+
+        symbols = ("005930", "000660", "035720", "051910")
+        strategy = _ScreeningStrategy(
+            {"005930": True, "000660": False, "035720": True, "051910": True}
+        )
+        strategy.screen = MagicMock(side_effect=AssertionError("serial screen must not run"))
+        config = TradingConfig(
+            strategy=strategy,
+            strategy_symbols=symbols,
+            strategy_order_quantity=1,
+            strategy_max_buys_per_cycle=2,
+            strategy_run_interval_sec=0.0,
+            strategy_screen_concurrency=2,
+            strategy_symbol_timeout_sec=5.0,
+        )
+        engine = TradingEngine(
+            client=mock_client,
+            config=config,
+            account_number="12345678",
+            account_product_code="01",
+            state_path=tmp_path / "test_state.json",
+            is_paper_trading=True,
+        )
+        engine._get_current_price = MagicMock(return_value=70000)
+        engine.buy = MagicMock(return_value=OrderResult(success=True, order_id="OID"))
+
+        engine.start()
+
+        assert engine.buy.call_count == 2
+        bought = {call.args[0] for call in engine.buy.call_args_list}
+        assert "000660" not in bought
+        assert bought <= {"005930", "035720", "051910"}
+        engine.stop()
+        assert engine._batch_screener is None
+
     @patch("stock_manager.engine.load_state")
     @patch("stock_manager.engine.startup_reconciliation")
     def test_strategy_max_buys_per_cycle_limits_submissions(
@@ -2260,6 +2313,48 @@ class TestInternalHelpers:
 
         mock_save.assert_called_once_with(engine._state, engine.state_path)
 
+    @patch("stock_manager.engine.load_state")
+    @patch("stock_manager.engine.startup_reconciliation")
+    def test_persist_state_uses_journal_when_configured(
+        self, mock_reconcile, mock_load, mock_client, tmp_path, mock_position
+    ):
+        mock_load.return_value = None
+        mock_reconcile.return_value = RecoveryReport(
+            result=RecoveryResult.CLEAN,
+            orphan_positions=[],
+            missing_positions=[],
+            quantity_mismatches={},
+            pending_orders=[],
+            errors=[],
+        )
+        state_path = tmp_path / "state.json"
+        engine = TradingEngine(
+            client=mock_client,
+            config=TradingConfig(
+                market_hours_enabled=False,
+                state_journal_commit_window_sec=0.0,
+            ),
+            account_number="12345678",
+            state_path=state_path,
+            is_paper_trading=True,
+        )
+        engine.start()
+        assert engine._state_journal is not None
+
+        engine._position_manager.open_position(mock_position)
+        engine._update_state()
+        with patch("stock_manager.engine.save_state_atomic") as mock_save:
+            engine._persist_state(durable=True)
+        mock_save.assert_not_called()
+
+        recovered = load_state(state_path)
+        assert recovered is not None
+        assert "005930" in recovered.positions
+
+        engine.stop()
+        assert engine._state_journal is None
+        assert load_state(state_path).positions["005930"].quantity == 10
+
     def test_update_state_syncs_positions(self, engine, mock_position):
         """Test that _update_state() syncs positions to state."""
         engine._position_manager.open_position(mock_position)
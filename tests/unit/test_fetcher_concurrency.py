@@ -0,0 +1,165 @@
+"""Tests for TechnicalDataFetcher concurrent snapshot assembly."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from stock_manager.trading.indicators.fetcher import TechnicalDataFetcher
+
+_CALL_NAMES = {
+    "current_price",
+    "financial_ratio",
+    "balance_sheet",
+    "technicals",
+    "income_statement",
+    "growth_ratio",
+    "profit_ratio",
+    "stability_ratio",
+    "vkospi",
+}
+
+
+def _build_fetcher(**kwargs) -> TechnicalDataFetcher:
+    client = MagicMock()
+    client.config = SimpleNamespace(use_mock=False)
+    return TechnicalDataFetcher(client=client, **kwargs)
+
+
+def _patch_fetch_methods(fetcher: TechnicalDataFetcher, *, delay: float = 0.0, tracker=None):
+    def make(value):
+        def _impl(*_args):
+            if tracker is not None:
+                tracker.enter()
+            try:
+                if delay:
+                    time.sleep(delay)
+                return value
+            finally:
+                if tracker is not None:
+                    tracker.exit()
+
+        return _impl
+
+    return [
+        patch.object(fetcher, "_fetch_current_price", side_effect=make({"current_price": "50000", "name": "Test"})),
+        patch.object(fetcher, "_fetch_financial_ratio", side_effect=make({"per": "10", "pbr": "1.2"})),
+        patch.object(fetcher, "_fetch_balance_sheet", side_effect=make({"total_assets": "1000"})),
+        patch.object(fetcher, "_fetch_technicals", side_effect=make({"sma_20": 49000.0, "avg_volume_20d": 10})),
+        patch.object(fetcher, "_fetch_income_statement", side_effect=make({"operating_income": "150"})),
+        patch.object(fetcher, "_fetch_growth_ratio", side_effect=make({"revenue_growth_yoy": "15.0"})),
+        patch.object(fetcher, "_fetch_profit_ratio", side_effect=make({"roe": "15.0"})),
+        patch.object(fetcher, "_fetch_stability_ratio", side_effect=make({"current_ratio": "1.8"})),
+        patch.object(fetcher, "_fetch_vkospi", side_effect=make(18.5)),
+    ]
+
+
+class _ConcurrencyTracker:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def enter(self) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def exit(self) -> None:
+        with self._lock:
+            self.active -= 1
+
+
+def _fetch(fetcher: TechnicalDataFetcher, symbol: str = "005930", **kwargs):
+    patches = _patch_fetch_methods(fetcher, **kwargs)
+    for p in patches:
+        p.start()
+    try:
+        return fetcher.fetch_snapshot(symbol)
+    finally:
+        for p in patches:
+            p.stop()
+
+
+class TestConcurrentSnapshotFetch:
+    def test_default_fetcher_is_sequential(self) -> None:
+        fetcher = _build_fetcher()
+        tracker = _ConcurrencyTracker()
+
+        _fetch(fetcher, tracker=tracker)
+
+        assert fetcher.max_concurrent_calls == 1
+        assert tracker.peak == 1
+
+    def test_concurrent_mode_overlaps_calls(self) -> None:
+        fetcher = _build_fetcher(max_concurrent_calls=4)
+        tracker = _ConcurrencyTracker()
+        try:
+            _fetch(fetcher, delay=0.02, tracker=tracker)
+        finally:
+            fetcher.close()
+
+        assert 1 < tracker.peak <= 4
+
+    def test_concurrent_snapshot_matches_sequential(self) -> None:
+        sequential = _fetch(_build_fetcher())
+        fetcher = _build_fetcher(max_concurrent_calls=9)
+        try:
+            concurrent = _fetch(fetcher)
+        finally:
+            fetcher.close()
+
+        assert concurrent.current_price == sequential.current_price
+        assert concurrent.per == sequential.per
+        assert concurrent.total_assets == sequential.total_assets
+        assert concurrent.sma_20 == sequential.sma_20
+        assert concurrent.free_cash_flow == sequential.free_cash_flow
+        assert concurrent.vkospi == sequential.vkospi == 18.5
+
+    def test_call_timings_recorded_per_symbol(self) -> None:
+        fetcher = _build_fetcher(max_concurrent_calls=3)
+        try:
+            _fetch(fetcher, "000660", delay=0.005)
+        finally:
+            fetcher.close()
+
+        timings = fetcher.get_call_timings("000660")
+        assert set(timings) == _CALL_NAMES
+        assert all(elapsed >= 0.004 for elapsed in timings.values())
+        assert fetcher.get_call_timings("005930") == {}
+
+    def test_concurrent_calls_still_acquire_shared_rate_limiter(self) -> None:
+        rate_limiter = MagicMock()
+        rate_limiter.acquire.return_value = True
+        fetcher = _build_fetcher(rate_limiter=rate_limiter, max_concurrent_calls=4)
+
+        with patch("stock_manager.trading.indicators.fetcher.inquire_current_price") as mock_price, patch(
+            "stock_manager.trading.indicators.fetcher.inquire_period_price"
+        ) as mock_period, patch("stock_manager.trading.indicators.fetcher.get_financial_ratio"), patch(
+            "stock_manager.trading.indicators.fetcher.get_balance_sheet"
+        ), patch("stock_manager.trading.indicators.fetcher.get_income_statement"), patch(
+            "stock_manager.trading.indicators.fetcher.get_growth_ratio"
+        ), patch("stock_manager.trading.indicators.fetcher.get_profit_ratio"), patch(
+            "stock_manager.trading.indicators.fetcher.get_stability_ratio"
+        ):
+            mock_price.return_value = {"rt_cd": "0", "output": {"stck_prpr": "1000"}}
+            mock_period.return_value = {}
+            try:
+                fetcher.fetch_snapshot("005930")
+            finally:
+                fetcher.close()
+
+        assert rate_limiter.acquire.call_count == 9
+
+    def test_close_is_idempotent_and_pool_is_recreated(self) -> None:
+        fetcher = _build_fetcher(max_concurrent_calls=2)
+        fetcher.close()
+        _fetch(fetcher)
+        fetcher.close()
+        fetcher.close()
+        snapshot = _fetch(fetcher)
+        fetcher.close()
+
+        assert snapshot.symbol == "005930"
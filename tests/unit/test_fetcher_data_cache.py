@@ -0,0 +1,212 @@
+"""Tests for TieredDataCache and its use by TechnicalDataFetcher."""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from stock_manager.trading.indicators.data_cache import (
+    DAILY,
+    FUNDAMENTAL,
+    QUOTE,
+    TieredDataCache,
+    next_session_open,
+)
+from stock_manager.trading.indicators.fetcher import TechnicalDataFetcher
+from stock_manager.trading.models import TradingConfig
+from stock_manager.trading.strategies import resolve_strategy
+
+_KST = ZoneInfo("Asia/Seoul")
+
+
+class TestTieredDataCache:
+    def test_get_put_and_stats(self) -> None:
+        cache = TieredDataCache()
+
+        assert cache.get("005930", "balance_sheet", FUNDAMENTAL) is None
+        cache.put("005930", "balance_sheet", FUNDAMENTAL, {"total_assets": "1"})
+        assert cache.get("005930", "balance_sheet", FUNDAMENTAL) == {"total_assets": "1"}
+
+        stats = cache.stats()
+        assert stats[FUNDAMENTAL].hits == 1
+        assert stats[FUNDAMENTAL].misses == 1
+        assert stats[FUNDAMENTAL].hit_rate == 0.5
+        assert stats[QUOTE].hits == 0
+
+    def test_quote_tier_expires_independently(self) -> None:
+        cache = TieredDataCache(quote_ttl_sec=0.01)
+        cache.put("005930", "current_price", QUOTE, {"current_price": "1"})
+        cache.put("005930", "growth_ratio", FUNDAMENTAL, {"sale_gror": "1"})
+
+        time.sleep(0.03)
+
+        assert cache.get("005930", "current_price", QUOTE) is None
+        assert cache.get("005930", "growth_ratio", FUNDAMENTAL) is not None
+
+    def test_unknown_tier_rejected(self) -> None:
+        cache = TieredDataCache()
+        with pytest.raises(ValueError, match="Unknown cache tier"):
+            cache.put("005930", "x", "weekly", {})
+
+    def test_daily_tier_expires_at_next_session_open(self) -> None:
+        cache = TieredDataCache()
+        cache.put("005930", "technicals", DAILY, {"sma_20": 1.0})
+
+        entry = cache._data[("005930", "technicals")]
+        assert entry.expires_at == pytest.approx(next_session_open(), abs=1.0)
+
+    @pytest.mark.parametrize(
+        ("now", "expected"),
+        [
+            (datetime(2026, 3, 3, 10, 0, tzinfo=_KST), datetime(2026, 3, 4, 9, 0, tzinfo=_KST)),
+            (datetime(2026, 3, 3, 8, 0, tzinfo=_KST), datetime(2026, 3, 3, 9, 0, tzinfo=_KST)),
+            (datetime(2026, 3, 6, 16, 0, tzinfo=_KST), datetime(2026, 3, 9, 9, 0, tzinfo=_KST)),
+            (datetime(2026, 3, 7, 12, 0, tzinfo=_KST), datetime(2026, 3, 9, 9, 0, tzinfo=_KST)),
+        ],
+    )
+    def test_next_session_open(self, now: datetime, expected: datetime) -> None:
+        assert next_session_open(now.timestamp()) == expected.timestamp()
+
+    def test_persistence_roundtrip_skips_quotes(self, tmp_path) -> None:
+        path = tmp_path / "cache.json"
+        cache = TieredDataCache(persist_path=path)
+        cache.put("005930", "current_price", QUOTE, {"current_price": "1"})
+        cache.put("005930", "balance_sheet", FUNDAMENTAL, {"total_assets": "1"})
+        cache.put("005930", "technicals", DAILY, {"sma_20": 2.0})
+
+        assert cache.save() is True
+        assert cache.save() is False  # nothing changed since
+
+        restored = TieredDataCache(persist_path=path)
+        assert len(restored) == 2
+        assert restored.get("005930", "technicals", DAILY) == {"sma_20": 2.0}
+        assert restored.get("005930", "current_price", QUOTE) is None
+
+    def test_save_prunes_expired_entries_and_leaves_no_temp_files(self, tmp_path) -> None:
+        path = tmp_path / "cache.json"
+        cache = TieredDataCache(persist_path=path, fundamental_ttl_sec=0.01)
+        cache.put("005930", "balance_sheet", FUNDAMENTAL, {"total_assets": "1"})
+        cache.put("005930", "technicals", DAILY, {"sma_20": 2.0})
+        time.sleep(0.03)
+
+        assert cache.save() is True
+
+        assert len(cache) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]
+        assert len(json.loads(path.read_text())["entries"]) == 1
+
+    def test_maybe_save_respects_interval(self, tmp_path) -> None:
+        path = tmp_path / "cache.json"
+        cache = TieredDataCache(persist_path=path, save_interval_sec=3600.0)
+        cache.put("005930", "technicals", DAILY, {"sma_20": 2.0})
+
+        assert cache.maybe_save() is False
+        assert not path.exists()
+        cache.close()
+        assert path.exists()
+
+    def test_load_ignores_expired_and_corrupt_files(self, tmp_path) -> None:
+        path = tmp_path / "cache.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "entries": [
+                        {
+                            "symbol": "005930",
+                            "data_class": "balance_sheet",
+                            "tier": FUNDAMENTAL,
+                            "expires_at": time.time() - 1,
+                            "value": {},
+                        },
+                        {"symbol": "005930"},
+                    ],
+                }
+            )
+        )
+        assert len(TieredDataCache(persist_path=path)) == 0
+
+        path.write_text("{not json")
+        assert len(TieredDataCache(persist_path=path)) == 0
+
+
+def _build_fetcher(cache: TieredDataCache) -> TechnicalDataFetcher:
+    client = MagicMock()
+    client.config = SimpleNamespace(use_mock=False)
+    return TechnicalDataFetcher(client=client, data_cache=cache)
+
+
+class TestFetcherWithDataCache:
+    def _patches(self, fetcher: TechnicalDataFetcher) -> dict[str, MagicMock]:
+        values = {
+            "_fetch_current_price": {"current_price": "50000"},
+            "_fetch_financial_ratio": {"per": "10"},
+            "_fetch_balance_sheet": {"total_assets": "1000"},
+            "_fetch_technicals": {"sma_20": 49000.0},
+            "_fetch_income_statement": {},
+            "_fetch_growth_ratio": {"revenue_growth_yoy": "15.0"},
+            "_fetch_profit_ratio": {"roe": "15.0"},
+            "_fetch_stability_ratio": {"current_ratio": "1.8"},
+            "_fetch_vkospi": 18.5,
+        }
+        return {name: MagicMock(return_value=value) for name, value in values.items()}
+
+    def test_second_fetch_only_hits_quote_calls(self) -> None:
+        cache = TieredDataCache()
+        fetcher = _build_fetcher(cache)
+        mocks = self._patches(fetcher)
+
+        with patch.multiple(fetcher, **mocks):
+            first = fetcher.fetch_snapshot("005930")
+            cache.invalidate("580003")
+            cache._data.pop(("005930", "current_price"))
+            second = fetcher.fetch_snapshot("005930")
+
+        assert second.total_assets == first.total_assets
+        assert second.sma_20 == first.sma_20
+        assert mocks["_fetch_current_price"].call_count == 2
+        assert mocks["_fetch_vkospi"].call_count == 2
+        assert mocks["_fetch_balance_sheet"].call_count == 1
+        assert mocks["_fetch_technicals"].call_count == 1
+        # Empty (degraded) results are not cached.
+        assert mocks["_fetch_income_statement"].call_count == 2
+
+    def test_fetch_persists_cache(self, tmp_path) -> None:
+        path = tmp_path / "cache.json"
+        fetcher = _build_fetcher(TieredDataCache(persist_path=path))
+
+        with patch.multiple(fetcher, **self._patches(fetcher)):
+            fetcher.fetch_snapshot("005930")
+        assert not path.exists()  # writes are batched, not per snapshot
+        fetcher.close()
+
+        restored = TieredDataCache(persist_path=path)
+        assert restored.get("005930", "profit_ratio", FUNDAMENTAL) == {"roe": "15.0"}
+
+
+class TestConsensusStrategyDataCache:
+    def _fetcher(self, config: TradingConfig) -> TechnicalDataFetcher:
+        strategy = resolve_strategy("consensus", client=MagicMock(), config=config)
+        return strategy.evaluator.fetcher
+
+    def test_data_cache_is_off_by_default(self) -> None:
+        assert self._fetcher(TradingConfig())._data_cache is None
+
+    def test_data_cache_stays_in_memory_without_path(self) -> None:
+        fetcher = self._fetcher(TradingConfig(consensus_data_cache=True))
+        assert fetcher._data_cache is not None
+        assert fetcher._data_cache.persist_path is None
+
+    def test_data_cache_persists_to_configured_path(self, tmp_path) -> None:
+        path = tmp_path / "cache.json"
+        fetcher = self._fetcher(
+            TradingConfig(consensus_data_cache=True, consensus_data_cache_path=str(path))
+        )
+        assert fetcher._data_cache is not None
+        assert fetcher._data_cache.persist_path == path
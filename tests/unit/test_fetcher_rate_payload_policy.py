@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from stock_manager.adapters.broker.kis.exceptions import KISAPIError
+from stock_manager.adapters.broker.kis.rate_limit import KISRateLimiter, RateBudget
 from stock_manager.trading.indicators.fetcher import TechnicalDataFetcher
 
 
@@ -22,6 +23,18 @@ class TestTechnicalDataFetcherGuardrails:
         fetcher = TechnicalDataFetcher(client=_build_client(use_mock=False))
         assert fetcher._rate_limiter.max_requests == 8
 
+    def test_client_with_shared_kis_budget_needs_no_fetcher_limiter(self) -> None:
+        client = _build_client(use_mock=False)
+        client.request_rate_limiter = KISRateLimiter(RateBudget(8))
+        fetcher = TechnicalDataFetcher(client=client)
+
+        with patch("stock_manager.trading.indicators.fetcher.inquire_current_price") as mock_price:
+            mock_price.return_value = {"rt_cd": "0", "output": {"stck_prpr": "1000"}}
+            fetcher._fetch_current_price("005930")
+
+        assert fetcher._rate_limiter is None
+        mock_price.assert_called_once()
+
     def test_mock_mode_skips_real_only_growth_api(self) -> None:
         fetcher = TechnicalDataFetcher(client=_build_client(use_mock=True))
 
@@ -0,0 +1,180 @@
+"""Parity tests: NumPy indicator backend vs. the pure-Python functions.
+
+The NumPy backend is optional; parity tests are skipped when numpy is not
+installed. Backend selection tests run either way.
+"""
+from __future__ import annotations
+
+import importlib.util
+import random
+
+import pytest
+
+from stock_manager.pipeline import indicators as ind
+from stock_manager.pipeline.indicators import (
+    adx,
+    atr,
+    bollinger_bands,
+    get_indicator_backend,
+    obv,
+    set_indicator_backend,
+    sma,
+    stochastic,
+    volume_ratio,
+)
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+needs_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _series(n: int, seed: int = 11) -> tuple[list[float], list[float], list[float], list[int]]:
+    rng = random.Random(seed)
+    highs, lows, closes, volumes = [], [], [], []
+    price = 50_000.0
+    for i in range(n):
+        prev = price
+        price = max(100.0, price * (1.0 + rng.gauss(0.0, 0.015)))
+        high = max(prev, price) * (1.0 + rng.random() * 0.01)
+        low = min(prev, price) * (1.0 - rng.random() * 0.01)
+        if i % 29 == 0:  # flat bar: zero range, unchanged close
+            high = low = price = prev
+        highs.append(high)
+        lows.append(low)
+        closes.append(price)
+        volumes.append(0 if i % 41 == 0 else rng.randint(1, 3_000_000))
+    return highs, lows, closes, volumes
+
+
+def _assert_same(actual, expected, rel: float = 1e-12) -> None:
+    assert len(actual) == len(expected)
+    for i, (a, e) in enumerate(zip(actual, expected)):
+        if e is None:
+            assert a is None, f"index {i}: expected None, got {a}"
+        else:
+            assert a is not None, f"index {i}: expected {e}, got None"
+            assert a == pytest.approx(e, rel=rel, abs=1e-9), f"index {i}"
+
+
+LENGTHS = [0, 1, 2, 5, 13, 14, 27, 28, 40, 250]
+
+
+# ---------------------------------------------------------------------------
+# Parity
+# ---------------------------------------------------------------------------
+
+
+@needs_numpy
+class TestNumpyParity:
+    @pytest.mark.parametrize("n", LENGTHS)
+    @pytest.mark.parametrize("period", [1, 3, 20])
+    def test_sma(self, n: int, period: int) -> None:
+        _, _, closes, _ = _series(n)
+        _assert_same(sma(closes, period, backend="numpy"), sma(closes, period))
+
+    @pytest.mark.parametrize("n", LENGTHS)
+    def test_bollinger(self, n: int) -> None:
+        _, _, closes, _ = _series(n)
+        got = bollinger_bands(closes, backend="numpy")
+        expected = bollinger_bands(closes)
+        for name in ("upper", "middle", "lower"):
+            _assert_same(getattr(got, name), getattr(expected, name))
+        _assert_same(got.pct_b, expected.pct_b, rel=1e-9)
+        _assert_same(got.bandwidth, expected.bandwidth, rel=1e-9)
+
+    def test_bollinger_flat_prices_keep_none_pct_b(self) -> None:
+        closes = [100.0] * 25
+        assert bollinger_bands(closes, backend="numpy") == bollinger_bands(closes)
+
+    @pytest.mark.parametrize("n", LENGTHS)
+    def test_ohlcv_indicators_exact(self, n: int) -> None:
+        highs, lows, closes, volumes = _series(n)
+        assert atr(highs, lows, closes, backend="numpy") == atr(highs, lows, closes)
+        assert adx(highs, lows, closes, backend="numpy") == adx(highs, lows, closes)
+        assert obv(closes, volumes, backend="numpy") == obv(closes, volumes)
+        assert volume_ratio(volumes, backend="numpy") == volume_ratio(volumes)
+
+    @pytest.mark.parametrize("n", LENGTHS)
+    def test_stochastic(self, n: int) -> None:
+        highs, lows, closes, _ = _series(n)
+        got_k, got_d = stochastic(highs, lows, closes, backend="numpy")
+        exp_k, exp_d = stochastic(highs, lows, closes)
+        assert got_k == exp_k
+        _assert_same(got_d, exp_d)
+
+    def test_mismatched_lengths_return_none_padding(self) -> None:
+        highs, lows, closes, volumes = _series(30)
+        assert atr(highs[:-1], lows, closes, backend="numpy") == [None] * 30
+        assert adx(highs, lows[:-1], closes, backend="numpy") == [None] * 30
+        assert obv(closes, volumes[:-1], backend="numpy") == [None] * 30
+
+    def test_invalid_period_raises(self) -> None:
+        with pytest.raises(ValueError):
+            sma([1.0, 2.0], 0, backend="numpy")
+        with pytest.raises(ValueError):
+            stochastic([1.0], [1.0], [1.0], 0, 3, backend="numpy")
+
+    def test_returns_python_floats(self) -> None:
+        _, _, closes, _ = _series(30)
+        values = [v for v in sma(closes, 5, backend="numpy") if v is not None]
+        assert all(type(v) is float for v in values)
+
+
+# ---------------------------------------------------------------------------
+# Backend selection
+# ---------------------------------------------------------------------------
+
+
+class TestBackendSelection:
+    @pytest.fixture(autouse=True)
+    def _restore_backend(self):
+        previous = get_indicator_backend()
+        yield
+        ind._backend = previous
+
+    def test_default_is_python(self) -> None:
+        assert get_indicator_backend() == "python"
+
+    def test_unknown_backend_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            set_indicator_backend("fortran")
+        with pytest.raises(ValueError):
+            sma([1.0, 2.0], 1, backend="fortran")
+
+    def test_unknown_env_backend_falls_back_to_python(self, monkeypatch, caplog) -> None:
+        monkeypatch.setenv("STOCK_MANAGER_INDICATOR_BACKEND", "bogus")
+        with caplog.at_level("WARNING", logger=ind.__name__):
+            assert ind._backend_from_env() == "python"
+        assert "bogus" in caplog.text
+
+    @pytest.mark.skipif(HAS_NUMPY, reason="numpy is installed")
+    def test_env_numpy_without_numpy_falls_back(self, monkeypatch) -> None:
+        monkeypatch.setenv("STOCK_MANAGER_INDICATOR_BACKEND", "numpy")
+        assert ind._backend_from_env() == "python"
+
+    @pytest.mark.skipif(HAS_NUMPY, reason="numpy is installed")
+    def test_numpy_backend_requires_numpy(self) -> None:
+        with pytest.raises(ImportError):
+            set_indicator_backend("numpy")
+        assert get_indicator_backend() == "python"
+
+    @needs_numpy
+    def test_global_backend_routes_calls(self, monkeypatch) -> None:
+        from stock_manager.pipeline import indicators_np
+
+        calls: list[int] = []
+        original = indicators_np.sma
+
+        def spy(prices, period):
+            calls.append(period)
+            return original(prices, period)
+
+        monkeypatch.setattr(indicators_np, "sma", spy)
+        set_indicator_backend("numpy")
+        sma([1.0, 2.0, 3.0], 2)
+        sma([1.0, 2.0, 3.0], 2, backend="python")
+        assert calls == [2]
@@ -0,0 +1,303 @@
+"""Unit tests for incremental (streaming) indicators.
+
+Every incremental indicator is checked against its batch counterpart in
+``pipeline/indicators.py`` bar by bar, including the forming-bar preview
+(``peek``) and state round-trips through ``to_dict``/``from_dict``.
+"""
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from stock_manager.pipeline.indicators import (
+    OHLCVBar,
+    adx,
+    atr,
+    bollinger_bands,
+    compute_snapshot_ohlcv,
+    ema,
+    macd,
+    obv,
+    rsi,
+    sma,
+    stochastic,
+    volume_ratio,
+)
+from stock_manager.pipeline.streaming import (
+    IncrementalADX,
+    IncrementalATR,
+    IncrementalBollinger,
+    IncrementalEMA,
+    IncrementalMACD,
+    IncrementalOBV,
+    IncrementalRSI,
+    IncrementalSMA,
+    IncrementalStochastic,
+    IncrementalVolumeRatio,
+    StreamingIndicators,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _random_bars(n: int = 300, seed: int = 7, start: float = 70_000.0) -> list[OHLCVBar]:
+    rng = random.Random(seed)
+    bars: list[OHLCVBar] = []
+    close = start
+    for i in range(n):
+        open_ = close
+        close = max(100.0, close * (1.0 + rng.gauss(0.0, 0.02)))
+        high = max(open_, close) * (1.0 + rng.random() * 0.01)
+        low = min(open_, close) * (1.0 - rng.random() * 0.01)
+        # Occasional flat bars exercise the zero-range / unchanged-close paths.
+        if i % 37 == 0:
+            high = low = close = open_
+        bars.append(
+            OHLCVBar(
+                date=f"D{i:04d}",
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=rng.randint(0, 2_000_000),
+            )
+        )
+    return bars
+
+
+def _assert_series_close(actual: list, expected: list, rel: float = 1e-9) -> None:
+    assert len(actual) == len(expected)
+    for i, (a, e) in enumerate(zip(actual, expected)):
+        if e is None:
+            assert a is None, f"index {i}: expected None, got {a}"
+        else:
+            assert a == pytest.approx(e, rel=rel, abs=1e-9), f"index {i}"
+
+
+BARS = _random_bars()
+CLOSES = [b.close for b in BARS]
+HIGHS = [b.high for b in BARS]
+LOWS = [b.low for b in BARS]
+VOLUMES = [b.volume for b in BARS]
+
+
+# ---------------------------------------------------------------------------
+# Per-indicator parity
+# ---------------------------------------------------------------------------
+
+
+class TestCloseIndicatorParity:
+    @pytest.mark.parametrize("period", [1, 5, 20, 200])
+    def test_sma(self, period: int) -> None:
+        ind = IncrementalSMA(period)
+        _assert_series_close([ind.update(p) for p in CLOSES], sma(CLOSES, period))
+
+    @pytest.mark.parametrize("period", [1, 12, 26])
+    def test_ema_exact(self, period: int) -> None:
+        ind = IncrementalEMA(period)
+        assert [ind.update(p) for p in CLOSES] == ema(CLOSES, period)
+
+    def test_rsi_exact(self) -> None:
+        ind = IncrementalRSI(14)
+        assert [ind.update(p) for p in CLOSES] == rsi(CLOSES, 14)
+
+    def test_macd_exact(self) -> None:
+        ind = IncrementalMACD()
+        got = [ind.update(p) for p in CLOSES]
+        expected = macd(CLOSES)
+        assert [g[0] for g in got] == expected.macd
+        assert [g[1] for g in got] == expected.signal
+        assert [g[2] for g in got] == expected.histogram
+
+    def test_bollinger(self) -> None:
+        ind = IncrementalBollinger(20, 2.0)
+        got = [ind.update(p) for p in CLOSES]
+        expected = bollinger_bands(CLOSES, 20, 2.0)
+        _assert_series_close([g[0] for g in got], expected.upper)
+        _assert_series_close([g[1] for g in got], expected.middle)
+        _assert_series_close([g[2] for g in got], expected.lower)
+        _assert_series_close([g[3] for g in got], expected.pct_b, rel=1e-6)
+        _assert_series_close([g[4] for g in got], expected.bandwidth, rel=1e-6)
+
+    def test_bollinger_flat_window_has_no_pct_b(self) -> None:
+        ind = IncrementalBollinger(5, 2.0)
+        for _ in range(4):
+            ind.update(101.0)
+        upper, middle, lower, pct_b, _ = ind.update(101.0)
+        assert upper == middle == lower == 101.0
+        assert pct_b is None
+
+    def test_invalid_period_raises(self) -> None:
+        with pytest.raises(ValueError):
+            IncrementalSMA(0)
+
+
+class TestOHLCVIndicatorParity:
+    def test_atr_exact(self) -> None:
+        ind = IncrementalATR(14)
+        assert [ind.update(b) for b in BARS] == atr(HIGHS, LOWS, CLOSES, 14)
+
+    def test_adx_exact(self) -> None:
+        ind = IncrementalADX(14)
+        assert [ind.update(b) for b in BARS] == adx(HIGHS, LOWS, CLOSES, 14)
+
+    def test_obv_exact(self) -> None:
+        ind = IncrementalOBV()
+        expected = obv(CLOSES, VOLUMES)
+        # Streaming values are "batch over the bars seen so far": a single bar
+        # has no OBV yet, exactly like obv() on a one-element series.
+        expected[0] = None
+        assert [ind.update(b) for b in BARS] == expected
+
+    def test_stochastic_exact(self) -> None:
+        ind = IncrementalStochastic(14, 3)
+        got = [ind.update(b) for b in BARS]
+        k_series, d_series = stochastic(HIGHS, LOWS, CLOSES, 14, 3)
+        assert [g[0] for g in got] == k_series
+        assert [g[1] for g in got] == d_series
+
+    def test_volume_ratio_exact(self) -> None:
+        ind = IncrementalVolumeRatio(20)
+        assert [ind.update(v) for v in VOLUMES] == volume_ratio(VOLUMES, 20)
+
+
+# ---------------------------------------------------------------------------
+# peek() must not disturb state
+# ---------------------------------------------------------------------------
+
+
+class TestPeek:
+    def test_peek_matches_update_and_is_side_effect_free(self) -> None:
+        indicators = [
+            (IncrementalSMA(20), lambda b: b.close),
+            (IncrementalEMA(12), lambda b: b.close),
+            (IncrementalRSI(14), lambda b: b.close),
+            (IncrementalMACD(), lambda b: b.close),
+            (IncrementalBollinger(), lambda b: b.close),
+            (IncrementalATR(14), lambda b: b),
+            (IncrementalADX(14), lambda b: b),
+            (IncrementalOBV(), lambda b: b),
+            (IncrementalStochastic(), lambda b: b),
+            (IncrementalVolumeRatio(), lambda b: b.volume),
+        ]
+        for ind, arg in indicators:
+            for bar in BARS[:80]:
+                before = json.dumps(ind.to_dict(), sort_keys=True)
+                previewed = ind.peek(arg(bar))
+                assert json.dumps(ind.to_dict(), sort_keys=True) == before
+                assert ind.update(arg(bar)) == previewed, type(ind).__name__
+
+
+# ---------------------------------------------------------------------------
+# StreamingIndicators
+# ---------------------------------------------------------------------------
+
+
+def _snapshot_fields(snap) -> dict:
+    data = dict(vars(snap))
+    data.pop("symbol")
+    data.pop("as_of", None)
+    return data
+
+
+def _assert_snapshots_close(actual, expected) -> None:
+    got, want = _snapshot_fields(actual), _snapshot_fields(expected)
+    assert got.keys() == want.keys()
+    for name, value in want.items():
+        if isinstance(value, float):
+            assert got[name] == pytest.approx(value, rel=1e-6, abs=1e-9), name
+        else:
+            assert got[name] == value, name
+
+
+class TestStreamingIndicators:
+    def test_empty_snapshot(self) -> None:
+        snap = StreamingIndicators("005930").snapshot()
+        assert snap.symbol == "005930"
+        assert snap.sma5 is None and snap.rsi14 is None
+
+    def test_add_bar_matches_compute_snapshot_ohlcv(self) -> None:
+        stream = StreamingIndicators("005930")
+        for i, bar in enumerate(BARS):
+            snap = stream.add_bar(bar)
+            if i in (0, 1, 13, 27, 60, 199, len(BARS) - 1):
+                _assert_snapshots_close(snap, compute_snapshot_ohlcv("005930", BARS[: i + 1]))
+
+    def test_tick_preview_matches_batch_with_revised_bar(self) -> None:
+        history, today = BARS[:-1], BARS[-1]
+        stream = StreamingIndicators("005930")
+        stream.seed(history + [today], last_bar_forming=True)
+
+        snap = stream.update_tick(today.close * 1.03, volume=today.volume + 5_000)
+        revised = OHLCVBar(
+            date=today.date,
+            open=today.open,
+            high=max(today.high, today.close * 1.03),
+            low=today.low,
+            close=today.close * 1.03,
+            volume=today.volume + 5_000,
+        )
+        _assert_snapshots_close(snap, compute_snapshot_ohlcv("005930", history + [revised]))
+        assert stream.bar_count == len(history)
+
+    def test_ticks_then_new_session_commits_forming_bar(self) -> None:
+        stream = StreamingIndicators("005930")
+        stream.seed(BARS[:100])
+        stream.update_tick(70_000.0, volume=10, date="N1")
+        stream.update_tick(70_500.0, volume=20, date="N1")
+        stream.update_tick(69_800.0, volume=30, date="N1")
+        stream.update_tick(71_000.0, volume=5, date="N2")
+
+        assert stream.bar_count == 101
+        assert stream.forming is not None and stream.forming.date == "N2"
+        first_day = OHLCVBar("N1", 70_000.0, 70_500.0, 69_800.0, 69_800.0, 30)
+        second_day = OHLCVBar("N2", 71_000.0, 71_000.0, 71_000.0, 71_000.0, 5)
+        _assert_snapshots_close(
+            stream.snapshot(),
+            compute_snapshot_ohlcv("005930", BARS[:100] + [first_day, second_day]),
+        )
+
+    def test_add_bar_replaces_forming_bar_of_same_date(self) -> None:
+        stream = StreamingIndicators("005930")
+        stream.seed(BARS[:-1])
+        stream.update_tick(BARS[-1].close * 0.9, date=BARS[-1].date)
+        snap = stream.add_bar(BARS[-1])
+        assert stream.forming is None
+        assert stream.bar_count == len(BARS)
+        _assert_snapshots_close(snap, compute_snapshot_ohlcv("005930", BARS))
+
+    def test_close_session_commits_forming_bar(self) -> None:
+        stream = StreamingIndicators("005930")
+        stream.seed(BARS, last_bar_forming=True)
+        snap = stream.close_session()
+        assert stream.forming is None
+        assert stream.bar_count == len(BARS)
+        _assert_snapshots_close(snap, compute_snapshot_ohlcv("005930", BARS))
+
+    def test_state_round_trip_resumes_identically(self) -> None:
+        stream = StreamingIndicators("005930")
+        stream.seed(BARS[:150], last_bar_forming=True)
+        restored = StreamingIndicators.from_dict(json.loads(json.dumps(stream.to_dict())))
+
+        assert restored.forming == stream.forming
+        for bar in BARS[150:]:
+            _assert_snapshots_close(restored.add_bar(bar), stream.add_bar(bar))
+
+    def test_state_round_trip_during_warmup(self) -> None:
+        stream = StreamingIndicators("005930")
+        stream.seed(BARS[:10])
+        restored = StreamingIndicators.from_dict(json.loads(json.dumps(stream.to_dict())))
+
+        for bar in BARS[10:80]:
+            _assert_snapshots_close(restored.add_bar(bar), stream.add_bar(bar))
+
+    def test_unknown_state_version_rejected(self) -> None:
+        data = StreamingIndicators("005930").to_dict()
+        data["version"] = 99
+        with pytest.raises(ValueError):
+            StreamingIndicators.from_dict(data)
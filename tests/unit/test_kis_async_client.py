@@ -0,0 +1,173 @@
+"""Tests for the async KIS REST client against an in-process mock KIS server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from stock_manager.adapters.broker.kis.apis.domestic_stock.basic import inquire_current_price
+from stock_manager.adapters.broker.kis.async_client import (
+    AsyncKISRestClient,
+    BlockingKISClient,
+    http2_available,
+)
+from stock_manager.adapters.broker.kis.config import KISConfig
+from stock_manager.adapters.broker.kis.exceptions import KISAPIError, KISRateLimitError
+
+PRICE_PATH = "/uapi/domestic-stock/v1/quotations/inquire-price"
+
+
+class MockKISServer:
+    """Minimal KIS REST server: OAuth plus a scripted price endpoint."""
+
+    def __init__(self) -> None:
+        self.tokens_issued = 0
+        self.requests: list[httpx.Request] = []
+        self.scripted: list[httpx.Response] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/oauth2/tokenP":
+            self.tokens_issued += 1
+            return httpx.Response(
+                200,
+                json={"access_token": f"token-{self.tokens_issued}", "expires_in": 86400},
+            )
+        if request.headers.get("authorization") != f"Bearer token-{self.tokens_issued}":
+            return httpx.Response(401, json={"msg_cd": "EGW00123", "msg1": "token expired"})
+        if self.scripted:
+            return self.scripted.pop(0)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        params = {k.upper(): v for k, v in request.url.params.items()}
+        code = params.get("FID_INPUT_ISCD")
+        return httpx.Response(200, json={"rt_cd": "0", "output": {"stck_shrn_iscd": code}})
+
+
+def _config(**overrides) -> KISConfig:
+    values = dict(
+        use_mock=True,
+        mock_app_key=SecretStr("async-key"),
+        mock_secret=SecretStr("secret"),
+        mock_account_number="12345678",
+        token_cache_enabled=False,
+        request_rate_limit_per_sec=1000,
+        request_initial_backoff_ms=1,
+        request_backoff_multiplier=1.0,
+        _env_file=None,
+    )
+    values.update(overrides)
+    return KISConfig(**values)
+
+
+def _client(server: MockKISServer, **overrides) -> AsyncKISRestClient:
+    config = _config(**overrides)
+    http = httpx.AsyncClient(transport=httpx.MockTransport(server), base_url=config.api_base_url)
+    return AsyncKISRestClient(config, client=http)
+
+
+def _price_params(code: str) -> dict[str, str]:
+    return {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": code}
+
+
+class TestAsyncKISRestClient:
+    async def test_concurrent_requests_share_one_client(self):
+        server = MockKISServer()
+        async with _client(server) as client:
+            await client.authenticate()
+            codes = [f"{i:06d}" for i in range(50)]
+            results = await asyncio.gather(
+                *(client.make_request("GET", PRICE_PATH, params=_price_params(c)) for c in codes)
+            )
+        assert [r["output"]["stck_shrn_iscd"] for r in results] == codes
+        assert server.max_in_flight > 1
+        assert server.tokens_issued == 1
+
+    async def test_concurrent_auth_failures_refresh_token_once(self):
+        server = MockKISServer()
+        async with _client(server) as client:
+            await client.authenticate()
+            server.tokens_issued += 1  # server rotates: current token now rejected
+            results = await asyncio.gather(
+                *(client.make_request("GET", PRICE_PATH, params=_price_params("005930"))
+                  for _ in range(10))
+            )
+        assert len(results) == 10
+        assert server.tokens_issued == 3  # initial, rotation, one refresh
+
+    async def test_rate_limit_payload_is_retried(self):
+        server = MockKISServer()
+        server.scripted = [
+            httpx.Response(500, json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수"}),
+        ]
+        async with _client(server) as client:
+            await client.authenticate()
+            data = await client.make_request("GET", PRICE_PATH, params=_price_params("005930"))
+        assert data["rt_cd"] == "0"
+
+    async def test_rate_limit_raised_after_max_attempts(self):
+        server = MockKISServer()
+        server.scripted = [httpx.Response(429) for _ in range(3)]
+        async with _client(server) as client:
+            await client.authenticate()
+            with pytest.raises(KISRateLimitError):
+                await client.make_request("GET", PRICE_PATH, params=_price_params("005930"))
+
+    async def test_error_payload_raises_api_error(self):
+        server = MockKISServer()
+        server.scripted = [httpx.Response(200, json={"rt_cd": "1", "msg_cd": "X1", "msg1": "bad"})]
+        async with _client(server) as client:
+            await client.authenticate()
+            with pytest.raises(KISAPIError, match="bad"):
+                await client.make_request("GET", PRICE_PATH, params=_price_params("005930"))
+
+    async def test_absolute_foreign_origin_rejected(self):
+        async with _client(MockKISServer()) as client:
+            with pytest.raises(KISAPIError, match="Disallowed"):
+                await client.make_request("GET", "https://example.com/uapi/x")
+
+    def test_http2_requires_h2(self):
+        if http2_available():
+            pytest.skip("h2 installed")
+        with pytest.raises(ImportError, match="h2"):
+            AsyncKISRestClient(_config(), http2=True)
+
+
+class TestBlockingKISClient:
+    def test_existing_api_functions_work_through_facade(self):
+        server = MockKISServer()
+        with BlockingKISClient(_client(server)) as client:
+            client.authenticate()
+            result = inquire_current_price(client, "005930", is_paper_trading=True)
+            assert client.is_authenticated()
+
+        assert result["output"]["stck_shrn_iscd"] == "005930"
+        request = server.requests[-1]
+        assert request.headers["tr_id"] == "FHKST01010100"
+        assert json.loads(server.requests[0].content)["grant_type"] == "client_credentials"
+
+    def test_run_executes_batches_and_close_is_idempotent(self):
+        server = MockKISServer()
+        facade = BlockingKISClient(_client(server))
+        facade.authenticate()
+
+        async def fetch_all():
+            return await asyncio.gather(
+                *(facade.async_client.make_request("GET", PRICE_PATH, params=_price_params(c))
+                  for c in ("000001", "000002"))
+            )
+
+        batch = facade.run(fetch_all())
+        assert len(batch) == 2
+        facade.close()
+        facade.close()
+        with pytest.raises(RuntimeError):
+            facade.make_request("GET", PRICE_PATH)
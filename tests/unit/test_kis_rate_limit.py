@@ -0,0 +1,221 @@
+"""Tests for the KIS token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+
+import pytest
+from pydantic import SecretStr
+
+from stock_manager.adapters.broker.kis.config import KISConfig
+from stock_manager.adapters.broker.kis.rate_limit import (
+    ENDPOINT_ORDER,
+    ENDPOINT_OTHER,
+    ENDPOINT_QUOTATION,
+    FileTokenBucket,
+    KISRateLimiter,
+    RateBudget,
+    TokenBucket,
+    classify_endpoint,
+    shared_rate_limiter,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _config(**overrides) -> KISConfig:
+    values = dict(
+        use_mock=True,
+        mock_app_key=SecretStr("key-a"),
+        mock_secret=SecretStr("secret"),
+        mock_account_number="12345678",
+        _env_file=None,
+    )
+    values.update(overrides)
+    return KISConfig(**values)
+
+
+def _drain_file_bucket(path: str, count: int, results) -> None:
+    bucket = FileTokenBucket(RateBudget(rate=0.01, capacity=5), path)
+    results.put(sum(bucket.try_acquire() for _ in range(count)))
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(RateBudget(rate=10, capacity=3), clock=clock)
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert bucket.available == 0
+
+        clock.now += 0.25  # 2.5 tokens
+        assert bucket.available == 2
+        clock.now += 10
+        assert bucket.available == 3  # capped at capacity
+
+    def test_acquire_waits_for_deficit_only(self):
+        bucket = TokenBucket(RateBudget(rate=20, capacity=1))
+        assert bucket.try_acquire()
+        start = time.monotonic()
+        assert bucket.acquire(timeout=1.0)
+        assert 0.03 < time.monotonic() - start < 0.2
+
+    def test_acquire_timeout_takes_nothing(self):
+        bucket = TokenBucket(RateBudget(rate=1, capacity=1))
+        assert bucket.try_acquire()
+        start = time.monotonic()
+        assert bucket.acquire(timeout=0.05) is False
+        assert time.monotonic() - start < 0.05
+        assert bucket.available == 0
+
+    def test_waiters_served_in_arrival_order(self):
+        bucket = TokenBucket(RateBudget(rate=50, capacity=1))
+        assert bucket.try_acquire()
+        order: list[int] = []
+
+        def worker(i: int) -> None:
+            bucket.acquire()
+            order.append(i)
+
+        threads = []
+        for i in range(5):
+            t = threading.Thread(target=worker, args=(i,))
+            t.start()
+            threads.append(t)
+            time.sleep(0.005)
+        for t in threads:
+            t.join(timeout=2)
+        assert order == [0, 1, 2, 3, 4]
+
+    def test_try_acquire_does_not_jump_queue(self):
+        bucket = TokenBucket(RateBudget(rate=0.5, capacity=1))
+        assert bucket.try_acquire()
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(bucket.acquire(timeout=5)))
+        waiter.start()
+        time.sleep(0.02)
+        bucket.reset()  # refilled token belongs to the queued waiter
+        assert bucket.try_acquire() is False
+        waiter.join(timeout=2)
+        assert acquired == [True]
+
+    def test_invalid_budget_and_tokens(self):
+        with pytest.raises(ValueError):
+            RateBudget(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(RateBudget(rate=5, capacity=2)).acquire(tokens=3)
+
+
+class TestFileTokenBucket:
+    def test_state_shared_between_instances(self, tmp_path):
+        path = tmp_path / "global.bucket"
+        first = FileTokenBucket(RateBudget(rate=0.01, capacity=3), path)
+        second = FileTokenBucket(RateBudget(rate=0.01, capacity=3), path)
+        assert first.try_acquire() and first.try_acquire()
+        assert second.try_acquire() is True
+        assert second.try_acquire() is False
+        assert first.available == 0
+
+    def test_state_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "global.bucket")
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        procs = [ctx.Process(target=_drain_file_bucket, args=(path, 4, results)) for _ in range(2)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(timeout=30)
+        assert results.get(timeout=5) + results.get(timeout=5) == 5
+
+
+class TestKISRateLimiter:
+    def test_classify_endpoint(self):
+        assert classify_endpoint("/uapi/domestic-stock/v1/trading/order-cash") == ENDPOINT_ORDER
+        assert (
+            classify_endpoint("/uapi/domestic-stock/v1/quotations/inquire-price")
+            == ENDPOINT_QUOTATION
+        )
+        assert classify_endpoint("/uapi/domestic-stock/v1/trading/inquire-balance") == ENDPOINT_OTHER
+
+    def test_endpoint_budget_is_nested_in_global(self):
+        limiter = KISRateLimiter(
+            RateBudget(rate=0.01, capacity=3),
+            endpoint_budgets={ENDPOINT_ORDER: RateBudget(rate=0.01, capacity=1)},
+        )
+        order = "/uapi/domestic-stock/v1/trading/order-cash"
+        quote = "/uapi/domestic-stock/v1/quotations/inquire-price"
+        assert limiter.try_acquire(order) is True
+        assert limiter.try_acquire(order) is False  # order class exhausted
+        assert limiter.try_acquire(quote) is True
+        assert limiter.try_acquire(quote) is True
+        assert limiter.try_acquire(quote) is False  # global exhausted
+        assert limiter.available == 0
+
+    def test_tr_id_budget_overrides_endpoint_class(self):
+        limiter = KISRateLimiter(
+            RateBudget(rate=0.01, capacity=10),
+            endpoint_budgets={ENDPOINT_QUOTATION: RateBudget(rate=0.01, capacity=5)},
+            tr_id_budgets={"FHKST01010100": RateBudget(rate=0.01, capacity=1)},
+        )
+        path = "/uapi/domestic-stock/v1/quotations/inquire-price"
+        assert limiter.acquire(path, tr_id="FHKST01010100", timeout=0)
+        assert limiter.acquire(path, tr_id="FHKST01010100", timeout=0.01) is False
+        assert limiter.acquire(path, tr_id="FHKST03010100", timeout=0)
+
+    def test_global_timeout_releases_tr_id_token(self):
+        limiter = KISRateLimiter(
+            RateBudget(rate=0.01, capacity=1),
+            tr_id_budgets={"TTTC0802U": RateBudget(rate=0.01, capacity=1)},
+        )
+        path = "/uapi/domestic-stock/v1/trading/order-cash"
+        assert limiter.acquire(path, timeout=0)  # drains the global bucket
+        assert limiter.acquire(path, tr_id="TTTC0802U", timeout=0.01) is False
+        assert limiter.tr_id_buckets["TTTC0802U"].available == 1
+
+        limiter.global_bucket.reset()
+        assert limiter.try_acquire(path, tr_id="TTTC0802U") is True
+
+    def test_file_bucket_release(self, tmp_path):
+        bucket = FileTokenBucket(RateBudget(rate=0.01, capacity=2), tmp_path / "b.bucket")
+        assert bucket.acquire(2, timeout=0)
+        bucket.release()
+        assert bucket.available == 1
+
+    def test_tr_id_budgets_from_config(self):
+        limiter = shared_rate_limiter(
+            _config(request_tr_id_rate_limits_per_sec={"TTTC0802U": 1.0})
+        )
+        assert limiter.tr_id_buckets["TTTC0802U"].rate == 1.0
+        assert shared_rate_limiter(_config()) is not limiter
+
+    def test_shared_between_clients_on_same_key(self):
+        first = shared_rate_limiter(_config())
+        assert shared_rate_limiter(_config()) is first
+        assert shared_rate_limiter(_config(mock_app_key=SecretStr("key-b"))) is not first
+        assert shared_rate_limiter(_config(request_rate_limit_per_sec=3)) is not first
+        assert first.max_requests == 8
+
+    def test_client_uses_shared_limiter(self):
+        from stock_manager.adapters.broker.kis.client import KISRestClient
+
+        config = _config(request_order_rate_limit_per_sec=2)
+        first, second = KISRestClient(config), KISRestClient(config)
+        try:
+            assert first._request_rate_limiter is second._request_rate_limiter
+            assert ENDPOINT_ORDER in first._request_rate_limiter.endpoint_buckets
+        finally:
+            first.close()
+            second.close()
+
+    def test_state_dir_uses_file_buckets(self, tmp_path):
+        limiter = shared_rate_limiter(_config(request_rate_limit_state_dir=str(tmp_path)))
+        assert isinstance(limiter.global_bucket, FileTokenBucket)
+        assert limiter.try_acquire("/x")
+        assert len(list(tmp_path.glob("kis-paper-*-global.bucket"))) == 1
@@ -0,0 +1,193 @@
+"""Tests for KIS real-time caret frame decoding."""
+
+from __future__ import annotations
+
+import base64
+import importlib.util
+import json
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from stock_manager.adapters.broker.kis.apis.domestic_stock.realtime import TR_IDS
+from stock_manager.adapters.broker.kis.quote_board import QuoteBoard
+from stock_manager.adapters.broker.kis.realtime_decoder import (
+    LAYOUTS,
+    NOTICE_COLUMNS,
+    TRADE_COLUMNS,
+    RealtimeFrameDecoder,
+    is_caret_frame,
+    orderbook_columns,
+    split_records,
+)
+from stock_manager.adapters.broker.kis.websocket_client import KISWebSocketClient
+
+HAS_CRYPTOGRAPHY = importlib.util.find_spec("cryptography") is not None
+
+
+def _record(columns: tuple[str, ...], width: int | None = None, **values: str) -> list[str]:
+    fields = ["0"] * (width or len(columns))
+    for name, value in values.items():
+        fields[columns.index(name.upper())] = value
+    return fields
+
+
+def _frame(tr_id: str, *records: list[str], encrypted: str = "0") -> str:
+    data = "^".join(field for record in records for field in record)
+    return f"{encrypted}|{tr_id}|{len(records):03d}|{data}"
+
+
+def _client() -> tuple[KISWebSocketClient, QuoteBoard, list[Any], list[Any]]:
+    board = QuoteBoard()
+    client = KISWebSocketClient(
+        websocket_url="ws://test", websocket_app_factory=MagicMock(), quote_board=board
+    )
+    quotes: list[Any] = []
+    executions: list[Any] = []
+    client.register_quote_callback(quotes.append)
+    client.register_execution_callback(executions.append)
+    return client, board, quotes, executions
+
+
+def _notice(**values: str) -> list[str]:
+    base = dict(
+        oder_no="0000117057",
+        seln_byov_cls="02",
+        stck_shrn_iscd="005930",
+        cntg_qty="3",
+        cntg_unpr="70100",
+        rfus_yn="0",
+        cntg_yn="2",
+        oder_qty="10",
+    )
+    base.update(values)
+    return _record(NOTICE_COLUMNS, width=26, **base)
+
+
+class TestFrameDecoder:
+    def test_layouts_cover_real_and_paper_tr_ids(self):
+        assert LAYOUTS["H0STCNI9"].kind == "notice"
+        assert TR_IDS["H0STCNI0"]["paper"] == "H0STCNI9"
+        assert LAYOUTS["H0STASP0"].bid == 13
+        assert LAYOUTS["H0STOAA0"].bid == 12
+        assert "H0EWASP0" not in LAYOUTS
+        assert all(tr_id in LAYOUTS for tr_id in ("H0STCNT0", "H0NXCNT0", "H0UNASP0"))
+
+    def test_split_records(self):
+        assert split_records("a^b^c^d", 2) == [["a", "b"], ["c", "d"]]
+        with pytest.raises(ValueError):
+            split_records("a^b^c", 2)
+
+    def test_caret_detection(self):
+        assert is_caret_frame("0|H0STCNT0|001|x")
+        assert is_caret_frame("1|H0STCNI0|001|x")
+        assert not is_caret_frame('{"header": {}}')
+
+    def test_unsupported_and_malformed_frames_ignored(self):
+        decoder = RealtimeFrameDecoder()
+        assert decoder.decode("0|H0EWASP0|001|a^b") is None
+        assert decoder.decode("0|H0STCNT0|002|a^b^c") is None
+        assert decoder.decode("0|H0STCNT0") is None
+
+    def test_encrypted_frame_without_key_dropped(self):
+        decoder = RealtimeFrameDecoder()
+        assert decoder.decode(_frame("H0STCNI0", _notice(), encrypted="1")) is None
+
+
+class TestWebSocketFrames:
+    def test_multi_record_orderbook_frame(self):
+        client, board, quotes, _ = _client()
+        columns = orderbook_columns(10)
+        frame = _frame(
+            "H0STASP0",
+            _record(columns, 59, mksc_shrn_iscd="005930", askp1="75000", bidp1="74900",
+                    askp_rsqn1="120", bidp_rsqn1="100"),
+            _record(columns, 59, mksc_shrn_iscd="000660", askp1="0", bidp1="180000"),
+        )
+        client._on_message(None, frame)
+
+        assert [q.symbol for q in quotes] == ["005930", "000660"]
+        first = quotes[0]
+        assert (first.bid_price, first.ask_price) == (Decimal("74900"), Decimal("75000"))
+        assert (first.bid_quantity, first.ask_quantity) == (Decimal("100"), Decimal("120"))
+        assert first.raw_payload["tr_id"] == "H0STASP0"
+        assert quotes[1].ask_price is None  # empty level
+        assert board.get("000660").bid == Decimal("180000")
+
+    def test_trade_frame_updates_board(self):
+        client, board, _, executions = _client()
+        frame = _frame(
+            "H0STCNT0",
+            _record(TRADE_COLUMNS, mksc_shrn_iscd="005930", stck_prpr="74950",
+                    cntg_vol="7", acml_vol="1234", askp1="75000", bidp1="74900"),
+        )
+        client._on_message(None, frame)
+
+        quote = board.get("005930")
+        assert (quote.last, quote.volume, quote.ask) == (Decimal("74950"), 1234, Decimal("75000"))
+        assert executions[0].executed_quantity == Decimal("7")
+        assert executions[0].broker_order_id is None
+
+    def test_plain_notice_fill_dispatched_and_acks_skipped(self):
+        client, board, _, executions = _client()
+        client._on_message(
+            None,
+            _frame("H0STCNI9", _notice(), _notice(cntg_yn="1"), _notice(seln_byov_cls="01")),
+        )
+
+        assert [e.side for e in executions] == ["buy", "sell"]
+        event = executions[0]
+        assert event.broker_order_id == "0000117057"
+        assert (event.executed_price, event.executed_quantity) == (Decimal("70100"), Decimal("3"))
+        assert event.event_status == "filled"
+        assert board.get("005930") is None
+
+    def test_subscribe_ack_is_not_dispatched(self):
+        client, _, quotes, executions = _client()
+        ack = {
+            "header": {"tr_id": "H0STASP0", "tr_key": "005930", "encrypt": "N"},
+            "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": "SUBSCRIBE SUCCESS"},
+        }
+        client._on_message(None, json.dumps(ack))
+        assert quotes == [] and executions == []
+
+    @pytest.mark.skipif(HAS_CRYPTOGRAPHY, reason="cryptography installed")
+    def test_notice_key_without_cryptography_warns(self, caplog):
+        client, _, _, executions = _client()
+        ack = {
+            "header": {"tr_id": "H0STCNI0"},
+            "body": {
+                "rt_cd": "0",
+                "msg_cd": "OPSP0000",
+                "msg1": "SUBSCRIBE SUCCESS",
+                "output": {"key": "k" * 32, "iv": "i" * 16},
+            },
+        }
+        client._on_message(None, json.dumps(ack))
+        client._on_message(None, _frame("H0STCNI0", _notice(), encrypted="1"))
+
+        assert "cryptography" in caplog.text
+        assert executions == []
+
+    def test_encrypted_notice_decrypted(self):
+        pytest.importorskip("cryptography")
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        key, iv = "k" * 32, "i" * 16
+        plain = "^".join(_notice()).encode("utf-8")
+        padder = padding.PKCS7(128).padder()
+        padded = padder.update(plain) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(key.encode()), modes.CBC(iv.encode())).encryptor()
+        cipher_text = base64.b64encode(encryptor.update(padded) + encryptor.finalize()).decode()
+
+        client, _, _, executions = _client()
+        client._on_message(None, json.dumps({
+            "header": {"tr_id": "H0STCNI0"},
+            "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "output": {"key": key, "iv": iv}},
+        }))
+        client._on_message(None, f"1|H0STCNI0|001|{cipher_text}")
+
+        assert executions[0].executed_quantity == Decimal("3")
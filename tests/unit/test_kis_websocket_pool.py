@@ -0,0 +1,189 @@
+"""Tests for the sharded KIS WebSocket subscription manager."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from stock_manager.adapters.broker.kis.websocket_client import (
+    KISWebSocketClient,
+    KISWebSocketLifecycleEvent,
+)
+from stock_manager.adapters.broker.kis.websocket_pool import KISWebSocketPool
+
+
+class _App:
+    def __init__(self, url: str, *, on_open: Any, on_message: Any, on_error: Any,
+                 on_close: Any, header: list[str]) -> None:
+        self.on_open = on_open
+        self.header = header
+        self.sock = object()
+        self.sent: list[dict[str, Any]] = []
+        self.closed = False
+
+    def send(self, payload: str) -> None:
+        self.sent.append(json.loads(payload))
+
+    def close(self) -> None:
+        self.closed = True
+
+    def run_forever(self) -> None:
+        self.on_open(self)
+
+    def registrations(self, tr_type: str = "1") -> list[str]:
+        return [p["body"]["tr_key"] for p in self.sent if p["header"]["tr_type"] == tr_type]
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self.apps: list[_App] = []
+
+    def __call__(self, url: str, **kwargs: Any) -> _App:
+        app = _App(url, **kwargs)
+        self.apps.append(app)
+        return app
+
+
+def _pool(capacity: int = 3, max_sessions: int = 3, **kwargs: Any):
+    factory = _Factory()
+    pool = KISWebSocketPool(
+        websocket_url="ws://test",
+        is_paper_trading=True,
+        max_sessions=max_sessions,
+        max_subscriptions_per_session=capacity,
+        websocket_app_factory=factory,
+        **kwargs,
+    )
+    pool.connect(approval_key="approval-key", timeout_sec=1.0)
+    return pool, factory
+
+
+def _symbols(count: int) -> list[str]:
+    return [f"{i:06d}" for i in range(1, count + 1)]
+
+
+class TestKISWebSocketPool:
+    def test_shards_symbols_across_sessions(self):
+        pool, factory = _pool()
+        pool.subscribe_executions()
+        overflow = pool.subscribe_quotes(_symbols(7))
+
+        assert overflow == []
+        assert len(pool.sessions) == 3
+        loads = [item.subscriptions for item in pool.health()]
+        assert sum(loads) == 8 and max(loads) <= 3
+        sent = [key for app in factory.apps for key in app.registrations()]
+        assert sorted(k for k in sent if k != "ALL") == _symbols(7)
+        assert factory.apps[0].sent[0]["body"]["tr_id"] == "H0STCNI9"
+
+    def test_overflow_returned_when_all_sessions_full(self):
+        pool, _ = _pool(capacity=2, max_sessions=2)
+        assert pool.subscribe_quotes(_symbols(5)) == ["000005"]
+        assert pool.session_for("000005") is None
+
+    def test_resubscribe_is_incremental(self):
+        pool, factory = _pool(max_sessions=1)
+        pool.subscribe_quotes(["005930"])
+        pool.subscribe_quotes(["005930", "000660"])
+        assert factory.apps[0].registrations() == ["005930", "000660"]
+
+    def test_unsubscribe_drains_trailing_session(self):
+        pool, factory = _pool(capacity=3, max_sessions=3)
+        symbols = _symbols(7)
+        pool.subscribe_quotes(symbols)
+        assert len(pool.sessions) == 3
+
+        pool.unsubscribe_quotes(symbols[:3])
+
+        assert len(pool.sessions) == 2
+        assert factory.apps[2].closed is True
+        remaining = {s for session in pool.sessions for s in session.quote_subscriptions}
+        assert remaining == set(symbols[3:])
+        assert all(pool.session_for(s) in (0, 1) for s in symbols[3:])
+        released = [key for app in factory.apps for key in app.registrations("2")]
+        assert set(symbols[:3]) <= set(released)
+
+    def test_additional_sessions_use_approval_key_provider(self):
+        provider = MagicMock(side_effect=["key-1", "key-2"])
+        pool, factory = _pool(capacity=2, approval_key_provider=provider)
+        pool.subscribe_quotes(_symbols(5))
+
+        assert provider.call_count == 2
+        assert [app.header[0] for app in factory.apps] == [
+            "approval_key: approval-key",
+            "approval_key: key-1",
+            "approval_key: key-2",
+        ]
+
+    def test_lifecycle_events_carry_session_index(self):
+        pool, _ = _pool(capacity=2)
+        received: list[KISWebSocketLifecycleEvent] = []
+        pool.register_lifecycle_callback(received.append)
+        pool.subscribe_quotes(_symbols(3))
+
+        assert received[-1].session == 1
+        assert received[-1].status == "connected"
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            KISWebSocketPool(websocket_url="ws://test", max_subscriptions_per_session=1)
+
+
+class TestPacedReplay:
+    def test_replay_is_paced_off_the_socket_thread(self):
+        factory = _Factory()
+        client = KISWebSocketClient(
+            websocket_url="ws://test",
+            websocket_app_factory=factory,
+            subscription_interval_sec=0.01,
+        )
+        client.subscribe_quotes(_symbols(4))
+        client.connect(approval_key="approval-key", timeout_sec=1.0)
+
+        deadline = time.time() + 1.0
+        while time.time() < deadline and len(factory.apps[0].sent) < 4:
+            time.sleep(0.005)
+        assert factory.apps[0].registrations() == _symbols(4)
+
+
+class TestEngineIntegration:
+    def _engine(self, tmp_path, adapter):
+        from stock_manager.engine import TradingEngine
+        from stock_manager.trading import TradingConfig
+
+        return TradingEngine(
+            client=MagicMock(),
+            config=TradingConfig(market_hours_enabled=False, websocket_monitoring_enabled=True),
+            account_number="12345678",
+            state_path=tmp_path / "state.json",
+            broker_adapter=adapter,
+        )
+
+    def test_overflow_symbol_is_polled(self, tmp_path):
+        adapter = MagicMock()
+        adapter.subscribe_quotes.return_value = ["005930"]
+        engine = self._engine(tmp_path, adapter)
+        engine._price_monitor = MagicMock(is_running=True)
+
+        engine._ensure_symbol_monitoring("005930")
+
+        engine._price_monitor.add_symbol.assert_called_once_with("005930")
+
+    def test_status_reports_session_health(self, tmp_path):
+        adapter = MagicMock()
+        adapter.websocket_health.return_value = ({"session": 0, "connected": True},)
+        engine = self._engine(tmp_path, adapter)
+
+        assert engine.get_status().websocket_sessions == ({"session": 0, "connected": True},)
+
+    def test_released_symbol_is_unsubscribed(self, tmp_path):
+        adapter = MagicMock()
+        engine = self._engine(tmp_path, adapter)
+
+        engine._release_symbol_monitoring("005930")
+
+        adapter.unsubscribe_quotes.assert_called_once_with(symbols=["005930"])
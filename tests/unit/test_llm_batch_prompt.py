@@ -0,0 +1,234 @@
+"""Unit tests for cross-persona batched LLM verification."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from stock_manager.trading.consensus.aggregator import VoteAggregator
+from stock_manager.trading.consensus.evaluator import ConsensusEvaluator
+from stock_manager.trading.consensus.vote_parser import VoteParser
+from stock_manager.trading.llm.circuit_breaker import CircuitBreaker
+from stock_manager.trading.llm.config import InvocationCounter, LLMConfig
+from stock_manager.trading.llm.verdict_cache import LLMVerdictCache
+from stock_manager.trading.personas.buffett_persona import BuffettPersona
+from stock_manager.trading.personas.graham_persona import GrahamPersona
+from stock_manager.trading.personas.hybrid import HybridPersonaWrapper
+from stock_manager.trading.personas.hybrid_batch import BatchedLLMVerifier
+from stock_manager.trading.personas.lynch_persona import LynchPersona
+from stock_manager.trading.personas.models import MarketSnapshot, PersonaCategory, VoteAction
+
+BATCH_RESPONSE = """Panel review follows.
+
+### PERSONA: Graham
+ACTION: SELL
+CONVICTION: 0.6
+REASONING: margin of safety gone
+
+### PERSONA: Buffett
+ACTION: BUY
+CONVICTION: 0.9
+REASONING: durable moat
+
+### PERSONA: Lynch
+ACTION: HOLD
+CONVICTION: 0.5
+REASONING: growth fairly priced
+"""
+
+SNAPSHOT = MarketSnapshot(symbol="005930", current_price=Decimal("70000"), per=8.0, pbr=0.9)
+
+
+class TestVoteParserBatch:
+    def test_split_batch_keys_sections_by_casefolded_name(self) -> None:
+        sections = VoteParser.split_batch(BATCH_RESPONSE)
+
+        assert list(sections) == ["graham", "buffett", "lynch"]
+        assert sections["buffett"].startswith("ACTION: BUY")
+        assert "Panel review" not in sections["graham"]
+
+    def test_split_batch_sections_parse_individually(self) -> None:
+        sections = VoteParser.split_batch(BATCH_RESPONSE)
+        vote = VoteParser.parse(sections["graham"], "Graham", PersonaCategory.VALUE)
+
+        assert "fisher" not in sections
+        assert vote.action == VoteAction.SELL
+        assert vote.conviction == pytest.approx(0.6)
+
+
+class _FakePool:
+    """Worker pool stand-in answering each submission with *respond*."""
+
+    def __init__(self, respond) -> None:
+        self._respond = respond
+
+    def submit(self, prompt: str, system_prompt: str, **kwargs) -> Future:
+        future: Future = Future()
+        answer = self._respond(prompt=prompt, system_prompt=system_prompt, **kwargs)
+        if answer is not _HANG:
+            future.set_result(answer)
+        return future
+
+
+_HANG = object()
+
+
+class _AlwaysVerify(HybridPersonaWrapper):
+    def should_trigger_llm(self, vote) -> bool:
+        return True
+
+
+@pytest.fixture()
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Record batched and individual queries; batch answers with BATCH_RESPONSE."""
+    recorded: list[dict] = []
+
+    def _batch(**kwargs):
+        recorded.append(kwargs)
+        return BATCH_RESPONSE
+
+    def _individual(**kwargs):
+        recorded.append(kwargs)
+        return "ACTION: BUY\nCONVICTION: 0.7\nREASONING: individual"
+
+    monkeypatch.setattr(
+        "stock_manager.trading.personas.hybrid.load_persona_prompt",
+        lambda name: f"You are {name}.",
+    )
+    monkeypatch.setattr("stock_manager.trading.personas.hybrid_batch.sync_persona_query", _batch)
+    monkeypatch.setattr("stock_manager.trading.personas.hybrid.sync_persona_query", _individual)
+    monkeypatch.setattr(
+        "stock_manager.trading.personas.hybrid_batch.get_worker_pool",
+        lambda: _FakePool(_individual),
+    )
+    return recorded
+
+
+def _personas(
+    *bases, cache: LLMVerdictCache | None = None, config: LLMConfig | None = None
+) -> list[_AlwaysVerify]:
+    breaker = CircuitBreaker(failure_threshold=5, cooldown_sec=10.0)
+    counter = InvocationCounter()
+    return [
+        _AlwaysVerify(
+            base_persona=base,
+            circuit_breaker=breaker,
+            llm_config=config or LLMConfig(),
+            invocation_counter=counter,
+            verdict_cache=cache,
+        )
+        for base in bases
+    ]
+
+
+def _triggered(personas):
+    return [(p, p.screen_rule(SNAPSHOT)) for p in personas]
+
+
+class TestBatchedLLMVerifier:
+    def test_one_request_verifies_every_persona(self, calls: list[dict]) -> None:
+        personas = _personas(GrahamPersona(), BuffettPersona(), LynchPersona())
+        triggered = _triggered(personas)
+
+        votes = BatchedLLMVerifier().verify(SNAPSHOT, triggered)
+
+        assert len(calls) == 1
+        assert calls[0]["prompt"].count("## Valuation") == 1
+        assert personas[0]._invocation_counter.count == 1
+        expected = [
+            p.merge_votes(rule_vote, VoteParser.parse(section, p.name, p.category))
+            for (p, rule_vote), section in zip(
+                triggered, VoteParser.split_batch(BATCH_RESPONSE).values()
+            )
+        ]
+        assert votes == expected
+
+    def test_missing_section_falls_back_to_individual_query(
+        self, calls: list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        truncated = BATCH_RESPONSE.split("### PERSONA: Lynch")[0]
+        monkeypatch.setattr(
+            "stock_manager.trading.personas.hybrid_batch.sync_persona_query",
+            lambda **kwargs: calls.append(kwargs) or truncated,
+        )
+        personas = _personas(GrahamPersona(), BuffettPersona(), LynchPersona())
+
+        votes = BatchedLLMVerifier().verify(SNAPSHOT, _triggered(personas))
+
+        assert len(calls) == 2
+        assert calls[1]["system_prompt"] == "You are lynch."
+        assert "individual" in votes[2].reasoning
+
+    def test_fallback_queries_are_bounded_by_deadline(
+        self, calls: list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            "stock_manager.trading.personas.hybrid_batch.sync_persona_query",
+            lambda **kwargs: calls.append(kwargs) or "no sections here",
+        )
+        monkeypatch.setattr(
+            "stock_manager.trading.personas.hybrid_batch.get_worker_pool",
+            lambda: _FakePool(lambda **kwargs: calls.append(kwargs) or _HANG),
+        )
+        personas = _personas(
+            GrahamPersona(), BuffettPersona(), config=LLMConfig(deadline_sec=0.05)
+        )
+        triggered = _triggered(personas)
+
+        started = time.monotonic()
+        votes = BatchedLLMVerifier().verify(SNAPSHOT, triggered)
+
+        assert time.monotonic() - started < 1.0
+        assert [c["system_prompt"] for c in calls[1:]] == ["You are graham.", "You are buffett."]
+        assert votes == [
+            p.merge_votes(rule_vote, rule_vote) for p, rule_vote in triggered
+        ]
+
+    def test_batched_verdicts_are_reused_by_individual_mode(self, calls: list[dict]) -> None:
+        cache = LLMVerdictCache()
+        personas = _personas(GrahamPersona(), BuffettPersona(), cache=cache)
+        BatchedLLMVerifier().verify(SNAPSHOT, _triggered(personas))
+
+        vote = personas[1].evaluate(SNAPSHOT)
+
+        assert len(calls) == 1
+        assert vote.action == VoteAction.BUY
+        assert "durable moat" in vote.reasoning
+
+    def test_failed_request_keeps_rule_votes(
+        self, calls: list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            "stock_manager.trading.personas.hybrid_batch.sync_persona_query",
+            lambda **_kwargs: None,
+        )
+        personas = _personas(GrahamPersona(), BuffettPersona())
+        triggered = _triggered(personas)
+
+        votes = BatchedLLMVerifier().verify(SNAPSHOT, triggered)
+
+        assert votes == [rule_vote for _, rule_vote in triggered]
+        assert calls == []
+
+
+def test_evaluator_batches_hybrid_personas(calls: list[dict]) -> None:
+    personas = _personas(GrahamPersona(), BuffettPersona(), LynchPersona())
+    fetcher = Mock()
+    fetcher.fetch_snapshot.return_value = SNAPSHOT
+    evaluator = ConsensusEvaluator(
+        personas=personas,
+        advisory=None,
+        fetcher=fetcher,
+        aggregator=VoteAggregator(),
+        llm_batching=True,
+    )
+
+    result = evaluator.evaluate("005930")
+
+    assert len(calls) == 1
+    assert {v.persona_name for v in result.votes} == {"Graham", "Buffett", "Lynch"}
+    assert all(v.reasoning.startswith("[Hybrid]") for v in result.votes)
@@ -0,0 +1,160 @@
+"""Unit tests for the LLM verdict cache and its HybridPersona integration."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from stock_manager.trading.llm.circuit_breaker import CircuitBreaker
+from stock_manager.trading.llm.config import InvocationCounter, LLMConfig
+from stock_manager.trading.llm.verdict_cache import (
+    LLMVerdictCache,
+    canonicalize_prompt,
+    verdict_key,
+)
+from stock_manager.trading.personas.graham_persona import GrahamPersona
+from stock_manager.trading.personas.hybrid import HybridPersonaWrapper
+from stock_manager.trading.personas.models import MarketSnapshot, VoteAction
+
+RESPONSE = "ACTION: BUY\nCONVICTION: 0.8\nREASONING: cheap"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _key(prompt: str, **overrides: str) -> str:
+    params = dict(persona="Graham", model="m", system_prompt="sys", symbol="005930")
+    params.update(overrides)
+    return verdict_key(prompt=prompt, **params)
+
+
+class TestKey:
+    def test_numbers_are_bucketed_to_precision(self) -> None:
+        assert canonicalize_prompt("PER: 12.341 | Price 70040", 3) == "PER: 12.3 | Price 7e+04"
+        assert _key("Price 70040") == _key("Price 70010")
+        assert _key("Price 70040") != _key("Price 71040")
+
+    def test_identity_fields_change_the_key(self) -> None:
+        base = _key("p")
+        assert base != _key("p", persona="Buffett")
+        assert base != _key("p", model="other")
+        assert base != _key("p", system_prompt="changed")
+        assert base != _key("p", symbol="000660")
+
+
+class TestCache:
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = _Clock()
+        cache = LLMVerdictCache(ttl_sec=60.0, clock=clock)
+        cache.put("k", RESPONSE)
+
+        clock.now += 59
+        assert cache.get("k") == RESPONSE
+        clock.now += 1
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = LLMVerdictCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_persists_across_instances(self, tmp_path) -> None:
+        path = tmp_path / "verdicts.db"
+        clock = _Clock()
+        first = LLMVerdictCache(path, ttl_sec=60.0, clock=clock)
+        first.put("k", RESPONSE)
+        first.put("stale", RESPONSE)
+        first.close()
+
+        reopened = LLMVerdictCache(path, ttl_sec=60.0, clock=clock)
+        assert reopened.get("k") == RESPONSE
+        clock.now += 120
+        assert LLMVerdictCache(path, ttl_sec=60.0, clock=clock).get("k") is None
+
+    def test_from_config_disabled_by_zero_ttl(self) -> None:
+        assert LLMVerdictCache.from_config(LLMConfig(verdict_cache_ttl_sec=0)) is None
+        assert isinstance(LLMVerdictCache.from_config(LLMConfig()), LLMVerdictCache)
+
+
+class TestHybridPersonaCaching:
+    @pytest.fixture()
+    def calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        prompts: list[str] = []
+
+        def _query(**kwargs):
+            prompts.append(kwargs["prompt"])
+            return RESPONSE
+
+        monkeypatch.setattr(
+            "stock_manager.trading.personas.hybrid.load_persona_prompt",
+            lambda _name: "You are Graham.",
+        )
+        monkeypatch.setattr("stock_manager.trading.personas.hybrid.sync_persona_query", _query)
+        return prompts
+
+    @staticmethod
+    def _persona(counter: InvocationCounter, cache: LLMVerdictCache) -> HybridPersonaWrapper:
+        return HybridPersonaWrapper(
+            base_persona=GrahamPersona(),
+            circuit_breaker=CircuitBreaker(failure_threshold=5, cooldown_sec=10.0),
+            llm_config=LLMConfig(),
+            invocation_counter=counter,
+            verdict_cache=cache,
+        )
+
+    @staticmethod
+    def _snapshot(price: str) -> MarketSnapshot:
+        return MarketSnapshot(symbol="005930", current_price=Decimal(price), per=8.0, pbr=0.9)
+
+    def test_repeat_screen_reuses_verdict_until_inputs_move(self, calls: list[str]) -> None:
+        counter = InvocationCounter()
+        persona = self._persona(counter, LLMVerdictCache())
+
+        for price in ("70000", "70010", "75000"):
+            snapshot = self._snapshot(price)
+            vote = persona.screen_llm(snapshot, persona.screen_rule(snapshot))
+            assert vote.action == VoteAction.BUY
+
+        assert len(calls) == 2
+        assert counter.count == 2
+        assert (counter.cache_hits, counter.cache_misses) == (1, 2)
+        assert counter.cache_hit_rate == pytest.approx(1 / 3)
+
+    def test_cached_verdict_served_while_circuit_open(self, calls: list[str]) -> None:
+        persona = self._persona(InvocationCounter(), LLMVerdictCache())
+        snapshot = self._snapshot("70000")
+        rule_vote = persona.screen_rule(snapshot)
+        persona.screen_llm(snapshot, rule_vote)
+        for _ in range(5):
+            persona._circuit_breaker.record_failure()
+
+        assert persona.screen_llm(snapshot, rule_vote).action == VoteAction.BUY
+        assert len(calls) == 1
+
+    def test_unparseable_response_is_not_cached(
+        self, calls: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = LLMVerdictCache()
+        persona = self._persona(InvocationCounter(), cache)
+        monkeypatch.setattr(
+            "stock_manager.trading.personas.hybrid.sync_persona_query",
+            lambda **_kwargs: "no idea",
+        )
+        snapshot = self._snapshot("70000")
+
+        persona.screen_llm(snapshot, persona.screen_rule(snapshot))
+
+        assert len(cache) == 0
@@ -0,0 +1,106 @@
+"""Unit tests for the persistent LLM worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from stock_manager.trading.llm import client
+from stock_manager.trading.llm.circuit_breaker import CircuitBreaker, CircuitState
+from stock_manager.trading.llm.config import InvocationCounter
+from stock_manager.trading.llm.worker_pool import LLMUnavailableError, LLMWorkerPool
+
+
+class _Recorder:
+    """Async query double tracking peak concurrency and event-loop threads."""
+
+    def __init__(self, delay: float = 0.05, response: str | None = "ACTION: BUY") -> None:
+        self.delay = delay
+        self.response = response
+        self.active = 0
+        self.peak = 0
+        self.threads: set[int] = set()
+
+    async def __call__(self, prompt: str, system_prompt: str, **kwargs) -> str | None:
+        self.threads.add(threading.get_ident())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return self.response
+
+
+@pytest.fixture()
+def make_pool():
+    pools: list[LLMWorkerPool] = []
+
+    def _make(**kwargs) -> LLMWorkerPool:
+        pool = LLMWorkerPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    yield _make
+    for pool in pools:
+        pool.shutdown()
+
+
+def test_runs_queries_concurrently_on_one_loop_with_bounded_slots(make_pool) -> None:
+    recorder = _Recorder()
+    pool = make_pool(max_concurrency=3, query=recorder)
+
+    futures = [pool.submit(f"p{i}", "sys") for i in range(9)]
+
+    assert [f.result(timeout=5) for f in futures] == ["ACTION: BUY"] * 9
+    assert recorder.peak == 3
+    assert len(recorder.threads) == 1
+
+
+def test_deadline_cancels_query_and_records_failure(make_pool) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_sec=60.0)
+    pool = make_pool(query=_Recorder(delay=5.0), circuit_breaker=breaker)
+
+    assert pool.query("p", "sys", deadline_sec=0.05) is None
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(LLMUnavailableError):
+        pool.submit("p", "sys")
+
+
+def test_daily_limit_gates_submissions(make_pool) -> None:
+    counter = InvocationCounter()
+    pool = make_pool(query=_Recorder(delay=0), invocation_counter=counter, daily_invocation_limit=2)
+
+    pool.query("a", "sys")
+    pool.query("b", "sys")
+
+    assert counter.count == 2
+    with pytest.raises(LLMUnavailableError):
+        pool.submit("c", "sys")
+
+
+def test_shutdown_cancels_pending_queries(make_pool) -> None:
+    pool = make_pool(query=_Recorder(delay=5.0))
+    future = pool.submit("p", "sys")
+
+    pool.shutdown()
+
+    assert future.cancelled() or future.result(timeout=1) is None
+    assert not pool.running
+
+
+def test_sync_persona_query_reuses_shared_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    recorder = _Recorder(delay=0, response="ok")
+    monkeypatch.setattr(client, "async_persona_query_with_retry", recorder)
+
+    def _call_inside_running_loop() -> str | None:
+        async def _inner() -> str | None:
+            return client.sync_persona_query(prompt="p", system_prompt="s", max_retries=1)
+
+        return asyncio.run(_inner())
+
+    assert client.sync_persona_query(prompt="p", system_prompt="s") == "ok"
+    assert _call_inside_running_loop() == "ok"
+    assert len(recorder.threads) == 1
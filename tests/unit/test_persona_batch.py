@@ -0,0 +1,153 @@
+"""Parity tests: vectorized ``screen_batch`` vs. per-snapshot ``screen_rule``.
+
+NumPy is optional; these tests are skipped when it is not installed.
+"""
+from __future__ import annotations
+
+import importlib.util
+import random
+from decimal import Decimal
+
+import pytest
+
+from stock_manager.trading.personas import (
+    BuffettPersona,
+    DalioPersona,
+    FisherPersona,
+    GrahamPersona,
+    InvestorPersona,
+    LivermorePersona,
+    LynchPersona,
+    MarketSnapshot,
+    MungerPersona,
+    PersonaCategory,
+    PersonaVote,
+    SimonsPersona,
+    TempletonPersona,
+    VoteAction,
+)
+from stock_manager.trading.personas.snapshot_table import SnapshotTable
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+pytestmark = pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+
+BATCH_PERSONAS = [
+    GrahamPersona,
+    BuffettPersona,
+    LynchPersona,
+    DalioPersona,
+    MungerPersona,
+    TempletonPersona,
+    LivermorePersona,
+    FisherPersona,
+    SimonsPersona,
+]
+
+
+def _random_snapshot(rng: random.Random, index: int) -> MarketSnapshot:
+    def pick(*choices):
+        return rng.choice(choices)
+
+    def ratio(low: float, high: float) -> float:
+        return round(rng.uniform(low, high), 2)
+
+    def price(low: int, high: int) -> Decimal:
+        return Decimal(rng.randint(low, high))
+
+    current = price(0, 200_000)
+    low_52w = price(0, 150_000)
+    return MarketSnapshot(
+        symbol=f"{index:06d}",
+        sector=pick("", "unknown", "Tech", " Unknown ", "Bank"),
+        current_price=current,
+        volume=rng.randint(0, 5_000_000),
+        avg_volume_20d=pick(0, rng.randint(1, 3_000_000)),
+        market_cap=price(0, 10**12),
+        per=pick(0.0, -3.5, ratio(0, 60)),
+        pbr=pick(0.0, ratio(0, 6)),
+        eps=price(-5_000, 20_000),
+        bps=price(0, 100_000),
+        dividend_yield=ratio(0, 8),
+        roe=ratio(-20, 40),
+        current_ratio=ratio(0, 4),
+        debt_to_equity=pick(-0.1, ratio(0, 3)),
+        operating_margin=ratio(-10, 40),
+        net_margin=ratio(-10, 30),
+        free_cash_flow=price(-10**9, 10**10),
+        revenue_growth_yoy=ratio(-30, 60),
+        earnings_growth_yoy=pick(0.0, ratio(-50, 80)),
+        revenue_growth_3yr=pick(None, ratio(-10, 30)),
+        earnings_growth_3yr=pick(None, ratio(-10, 30)),
+        sma_20=pick(0.0, ratio(1, 200_000)),
+        sma_50=pick(0.0, ratio(1, 200_000)),
+        sma_200=pick(0.0, ratio(1, 200_000)),
+        rsi_14=ratio(0, 100),
+        macd_signal=ratio(-5, 5),
+        bollinger_position=ratio(-0.2, 1.2),
+        adx_14=ratio(0, 60),
+        atr_14=pick(0.0, ratio(0, 10_000)),
+        total_assets=pick(Decimal(0), price(1, 10**12)),
+        total_liabilities=price(0, 10**12),
+        current_assets=price(0, 10**11),
+        cash_and_equivalents=price(0, 10**11),
+        inventory=price(0, 10**10),
+        accounts_receivable=price(0, 10**11),
+        shares_outstanding=rng.randint(0, 10**9),
+        price_52w_high=pick(Decimal(0), low_52w + price(0, 100_000)),
+        price_52w_low=low_52w,
+        years_positive_earnings=rng.randint(0, 15),
+        years_dividends_paid=rng.randint(0, 25),
+        kospi_per=pick(None, ratio(5, 25)),
+        vkospi=pick(None, ratio(10, 120)),
+    )
+
+
+def _snapshots(count: int = 400, seed: int = 7) -> list[MarketSnapshot]:
+    rng = random.Random(seed)
+    return [MarketSnapshot(symbol="default")] + [
+        _random_snapshot(rng, i) for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("persona_cls", BATCH_PERSONAS, ids=lambda cls: cls.__name__)
+def test_screen_batch_matches_screen_rule(persona_cls) -> None:
+    persona = persona_cls()
+    snapshots = _snapshots()
+
+    batch = persona.screen_batch(SnapshotTable(snapshots))
+
+    assert batch == [persona.screen_rule(snapshot) for snapshot in snapshots]
+
+
+def test_table_caches_columns_and_maps_missing_values_to_nan() -> None:
+    table = SnapshotTable([MarketSnapshot(vkospi=21.5), MarketSnapshot()])
+
+    column = table["vkospi"]
+
+    assert column is table["vkospi"]
+    assert column[0] == 21.5
+    assert column[1] != column[1]
+    with pytest.raises(KeyError):
+        table["timestamp"]
+
+
+def test_default_screen_batch_loops_over_screen_rule() -> None:
+    class RowPersona(InvestorPersona):
+        name = "Row"
+        category = PersonaCategory.QUANTITATIVE
+
+        def screen_rule(self, snapshot: MarketSnapshot) -> PersonaVote:
+            return PersonaVote(
+                persona_name=self.name,
+                action=VoteAction.HOLD,
+                conviction=0.5,
+                reasoning=snapshot.symbol,
+                criteria_met={},
+                category=self.category,
+            )
+
+    snapshots = _snapshots(count=5)
+
+    batch = RowPersona().screen_batch(SnapshotTable(snapshots))
+
+    assert [vote.reasoning for vote in batch] == [s.symbol for s in snapshots]
@@ -0,0 +1,169 @@
+"""Unit tests for pipeline NDJSON log indexing and decision timelines."""
+
+import gzip
+import json
+from datetime import date
+from pathlib import Path
+
+from stock_manager.trading.logging.log_index import (
+    PipelineLogQuery,
+    build_decision_timeline,
+    build_index,
+    index_path,
+)
+
+
+def _write_day(log_dir: Path, day: str, records: list[dict], prefix: str = "pipeline") -> Path:
+    path = log_dir / f"{prefix}-{day}.ndjson"
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return path
+
+
+def _vote(symbol: str, persona: str, session: str = "s1") -> dict:
+    return {
+        "event": "agent_vote",
+        "symbol": symbol,
+        "persona_id": persona,
+        "action": "BUY",
+        "conviction": 0.8,
+        "session_id": session,
+        "timestamp": "t",
+    }
+
+
+def _consensus(symbol: str, passed: bool, session: str = "s1") -> dict:
+    return {
+        "event": "consensus_result",
+        "symbol": symbol,
+        "passed": passed,
+        "buy_count": 2,
+        "total_count": 2,
+        "session_id": session,
+        "timestamp": "t",
+    }
+
+
+class TestBuildIndex:
+    def test_indexes_offsets_and_writes_sidecar(self, tmp_path):
+        path = _write_day(tmp_path, "20260221", [_vote("005930", "a"), _vote("000660", "b")])
+
+        entries = build_index(path)
+
+        assert [e.symbol for e in entries] == ["005930", "000660"]
+        with open(path, "rb") as f:
+            f.seek(entries[1].offset)
+            assert json.loads(f.readline())["persona_id"] == "b"
+        assert index_path(path).exists()
+
+    def test_extends_index_when_file_grows(self, tmp_path):
+        path = _write_day(tmp_path, "20260221", [_vote("005930", "a")])
+        build_index(path)
+        _write_day(tmp_path, "20260221", [_vote("005930", "b")])
+
+        entries = build_index(path)
+
+        assert [e.offset for e in entries][0] == 0
+        assert len(entries) == 2
+
+    def test_skips_partial_trailing_line(self, tmp_path):
+        path = _write_day(tmp_path, "20260221", [_vote("005930", "a")])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"event": "agent_vote"')
+
+        assert len(build_index(path)) == 1
+
+    def test_rebuilds_when_file_shrinks(self, tmp_path):
+        path = _write_day(tmp_path, "20260221", [_vote("005930", "a"), _vote("005930", "b")])
+        build_index(path)
+        path.write_text(json.dumps(_vote("000660", "c")) + "\n", encoding="utf-8")
+
+        entries = build_index(path)
+
+        assert [e.symbol for e in entries] == ["000660"]
+
+
+class TestPipelineLogQuery:
+    def test_filters_by_symbol_event_and_date_range(self, tmp_path):
+        _write_day(tmp_path, "20260220", [_vote("005930", "old")])
+        _write_day(tmp_path, "20260221", [_vote("005930", "a"), _consensus("005930", True)])
+        _write_day(tmp_path, "20260222", [_vote("000660", "b"), _vote("005930", "c")])
+
+        query = PipelineLogQuery(tmp_path, prefix="pipeline")
+        records = list(
+            query.iter_events(
+                start=date(2026, 2, 21), symbol="005930", events=["agent_vote"]
+            )
+        )
+
+        assert [r["persona_id"] for r in records] == ["a", "c"]
+
+    def test_filters_by_prefix_and_session(self, tmp_path):
+        _write_day(tmp_path, "20260221", [_vote("005930", "a", session="s1")])
+        _write_day(tmp_path, "20260221", [_vote("005930", "b", session="s2")])
+        _write_day(tmp_path, "20260221", [_vote("005930", "x")], prefix="engine-runtime")
+
+        query = PipelineLogQuery(tmp_path, prefix="pipeline")
+
+        assert [r["persona_id"] for r in query.iter_events(session_id="s2")] == ["b"]
+        assert len(PipelineLogQuery(tmp_path).files()) == 2
+
+    def test_reads_gzipped_rolled_files(self, tmp_path):
+        with gzip.open(tmp_path / "pipeline-20260220.ndjson.gz", "wt", encoding="utf-8") as f:
+            f.write(json.dumps(_vote("005930", "gz")) + "\n")
+        _write_day(tmp_path, "20260221", [_vote("005930", "plain")])
+
+        records = list(PipelineLogQuery(tmp_path).iter_events(symbol="005930"))
+
+        assert [r["persona_id"] for r in records] == ["gz", "plain"]
+
+    def test_sessions_summary(self, tmp_path):
+        _write_day(
+            tmp_path,
+            "20260221",
+            [_vote("005930", "a", session="s1"), _vote("000660", "b", session="s1")],
+        )
+
+        summary = PipelineLogQuery(tmp_path).sessions()
+
+        assert summary["s1"]["events"] == 2
+        assert summary["s1"]["symbols"] == {"005930", "000660"}
+
+
+class TestDecisionTimeline:
+    def test_groups_votes_consensus_and_orders_into_cycles(self, tmp_path):
+        order = {
+            "event": "order_executed",
+            "symbol": "005930",
+            "order_id": "o1",
+            "session_id": "s1",
+            "timestamp": "t",
+        }
+        _write_day(
+            tmp_path,
+            "20260221",
+            [
+                _vote("005930", "a"),
+                _vote("005930", "b"),
+                _consensus("005930", False),
+                _vote("005930", "a"),
+                _consensus("005930", True),
+                order,
+                _vote("000660", "z"),
+            ],
+        )
+
+        cycles = PipelineLogQuery(tmp_path).decision_timeline("005930")
+
+        assert [c.passed for c in cycles] == [False, True]
+        assert [len(c.votes) for c in cycles] == [2, 1]
+        assert [a["order_id"] for a in cycles[1].actions] == ["o1"]
+
+    def test_new_session_starts_new_cycle(self):
+        cycles = build_decision_timeline(
+            [_vote("005930", "a", session="s1"), _vote("005930", "b", session="s2")]
+        )
+
+        assert [c.session_id for c in cycles] == ["s1", "s2"]
+        assert all(c.passed is None for c in cycles)
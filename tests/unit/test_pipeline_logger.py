@@ -473,3 +473,65 @@ class TestThreadSafety:
 
         records = _read_lines(_get_log_file(tmp_path))
         assert len(records) == 1
+
+
+class TestBufferedMode:
+    """Test the background-writer (buffered) mode."""
+
+    def test_flush_writes_queued_events(self, tmp_path):
+        """Queued events reach the daily file once flush() returns."""
+        logger = PipelineJsonLogger(tmp_path, buffered=True, flush_interval_sec=60.0)
+        try:
+            for i in range(50):
+                logger.log_agent_vote("005930", f"persona_{i}", "BUY", 0.5, "ok")
+            assert logger.flush(timeout=5.0)
+
+            records = _read_lines(_get_log_file(tmp_path))
+            assert [r["persona_id"] for r in records] == [f"persona_{i}" for i in range(50)]
+        finally:
+            logger.close()
+
+    def test_close_flushes_and_ignores_later_events(self, tmp_path):
+        """close() drains the queue; events logged afterwards are discarded."""
+        logger = PipelineJsonLogger(tmp_path, buffered=True)
+        logger.log_state_change("005930", "IDLE", "SCREENING", "before")
+        logger.close()
+        logger.log_state_change("005930", "SCREENING", "IDLE", "after")
+
+        records = _read_lines(_get_log_file(tmp_path))
+        assert [r["reason"] for r in records] == ["before"]
+
+    def test_full_queue_drops_and_counts_events(self, tmp_path):
+        """A full queue never blocks the caller."""
+        logger = PipelineJsonLogger(tmp_path, buffered=True, queue_size=1)
+        logger.close()
+        logger._closed = False  # writer gone: nothing drains the queue
+        logger.log_state_change("005930", "IDLE", "SCREENING", "queued")
+        logger.log_state_change("005930", "IDLE", "SCREENING", "dropped")
+        assert logger.dropped_events == 1
+
+    def test_rollover_switches_file_and_compresses_previous_day(self, tmp_path):
+        """Date rollover opens the next day's file and gzips the rolled one."""
+        import gzip
+
+        logger = PipelineJsonLogger(tmp_path, buffered=True, compress_rolled=True)
+        try:
+            for day in ("20260221", "20260222"):
+                with patch("stock_manager.trading.logging.pipeline_logger.datetime") as mock_dt:
+                    mock_dt.now.return_value.isoformat.return_value = f"{day}T10:00:00"
+                    mock_dt.now.return_value.strftime.return_value = day
+                    logger.log_state_change("005930", "IDLE", "SCREENING", day)
+                assert logger.flush(timeout=5.0)
+        finally:
+            logger.close()
+
+        rolled = tmp_path / "pipeline-20260221.ndjson.gz"
+        assert rolled.exists()
+        assert not (tmp_path / "pipeline-20260221.ndjson").exists()
+        with gzip.open(rolled, "rt", encoding="utf-8") as f:
+            assert json.loads(f.readline())["reason"] == "20260221"
+        assert _read_lines(tmp_path / "pipeline-20260222.ndjson")[0]["reason"] == "20260222"
+
+    def test_flush_is_noop_in_sync_mode(self, tmp_path):
+        """flush() returns True without a writer thread."""
+        assert PipelineJsonLogger(tmp_path).flush() is True
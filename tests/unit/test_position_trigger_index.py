@@ -0,0 +1,157 @@
+"""Tests for PositionManager's exit trigger index and async exit dispatch."""
+
+from __future__ import annotations
+
+import threading
+from decimal import Decimal
+
+import pytest
+
+from stock_manager.trading.models import Position
+from stock_manager.trading.positions import ExitDispatcher, PositionManager
+
+
+def _position(**overrides) -> Position:
+    values = dict(
+        symbol="005930",
+        quantity=10,
+        entry_price=Decimal("50000"),
+        stop_loss=Decimal("47500"),
+        take_profit=Decimal("55000"),
+    )
+    values.update(overrides)
+    return Position(**values)
+
+
+def _manager(**kwargs) -> tuple[PositionManager, list[tuple[str, str]]]:
+    events: list[tuple[str, str]] = []
+    manager = PositionManager(**kwargs)
+    manager.set_callbacks(
+        on_stop_loss=lambda symbol: events.append(("stop_loss", symbol)),
+        on_take_profit=lambda symbol: events.append(("take_profit", symbol)),
+    )
+    return manager, events
+
+
+class TestTriggerIndex:
+    def test_ticks_between_levels_skip_the_slow_path(self, monkeypatch):
+        manager, events = _manager()
+        manager.open_position(_position())
+        crossed = []
+        original = manager._on_threshold_crossed
+        monkeypatch.setattr(
+            manager,
+            "_on_threshold_crossed",
+            lambda symbol, price: (crossed.append(price), original(symbol, price)),
+        )
+
+        for price in ("49000", "52000", "54990"):
+            manager.update_price("005930", Decimal(price))
+        assert crossed == [] and events == []
+        assert manager.get_position("005930").unrealized_pnl == Decimal("49900")
+
+        manager.update_price("005930", Decimal("55000"))
+        assert events == [("take_profit", "005930")]
+
+    def test_reassigned_levels_are_picked_up(self):
+        manager, events = _manager()
+        manager.open_position(_position())
+        manager.get_position("005930").stop_loss = Decimal("49000")
+
+        manager.update_price("005930", Decimal("48900"))
+
+        assert events == [("stop_loss", "005930")]
+
+    def test_closed_position_is_dropped_from_index(self):
+        manager, events = _manager()
+        pos = _position()
+        manager.open_position(pos)
+        manager.close_position("005930")
+
+        manager.update_price("005930", Decimal("40000"))
+
+        assert events == []
+        assert pos.current_price is None
+
+
+class TestTrailingStop:
+    def test_stop_ratchets_with_high_water(self):
+        manager, events = _manager(trailing_stop_pct=Decimal("0.05"), exit_dispatch="sync")
+        manager.open_position(_position(stop_loss=None, take_profit=None))
+
+        manager.update_price("005930", Decimal("60000"))
+        manager.update_price("005930", Decimal("57100"))
+        assert events == []
+
+        manager.update_price("005930", Decimal("57000"))
+        assert events == [("stop_loss", "005930")]
+
+    def test_fixed_stop_still_applies_below_trail(self):
+        manager, events = _manager(trailing_stop_pct=0.5)
+        manager.open_position(_position())
+
+        manager.update_price("005930", Decimal("47000"))
+
+        assert events == [("stop_loss", "005930")]
+
+    @pytest.mark.parametrize("pct", [0, 1, -0.1])
+    def test_invalid_pct(self, pct):
+        with pytest.raises(ValueError):
+            PositionManager(trailing_stop_pct=pct)
+
+
+class TestAsyncDispatch:
+    def test_exit_runs_off_the_quote_thread(self):
+        manager = PositionManager(exit_dispatch="async")
+        release = threading.Event()
+        threads: list[str] = []
+
+        def on_stop_loss(symbol):
+            threads.append(threading.current_thread().name)
+            release.wait(1.0)
+
+        manager.set_callbacks(on_stop_loss=on_stop_loss)
+        manager.open_position(_position())
+
+        for _ in range(5):
+            manager.update_price("005930", Decimal("47000"))
+        release.set()
+
+        assert manager.wait_for_exits(timeout=1.0)
+        assert threads == ["position-exit-dispatcher"]
+        manager.shutdown()
+
+    def test_dispatcher_survives_callback_errors(self):
+        dispatcher = ExitDispatcher()
+        seen = []
+
+        def failing(symbol):
+            raise RuntimeError("boom")
+
+        assert dispatcher.submit("005930", "stop_loss", failing)
+        assert dispatcher.wait_idle(timeout=1.0)
+        assert dispatcher.submit("005930", "stop_loss", seen.append)
+        assert dispatcher.wait_idle(timeout=1.0)
+        assert seen == ["005930"]
+        dispatcher.stop()
+
+    def test_engine_wires_config(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        from stock_manager.engine import TradingEngine
+        from stock_manager.trading import TradingConfig
+
+        engine = TradingEngine(
+            client=MagicMock(),
+            config=TradingConfig(
+                market_hours_enabled=False,
+                trailing_stop_pct=Decimal("0.03"),
+                async_exit_dispatch=True,
+            ),
+            account_number="12345678",
+            state_path=tmp_path / "state.json",
+        )
+
+        manager = engine._position_manager
+        assert manager.exit_dispatch == "async"
+        assert manager.trailing_stop_pct == Decimal("0.03")
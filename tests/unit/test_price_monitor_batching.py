@@ -0,0 +1,161 @@
+"""Tests for PriceMonitor's batched multi-price polling mode."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from stock_manager.adapters.broker.kis.quote_board import QuoteBoard
+from stock_manager.adapters.broker.kis.rate_limit import KISRateLimiter, RateBudget
+from stock_manager.monitoring.price_monitor import PriceMonitor
+
+
+def _multprice_client() -> MagicMock:
+    client = MagicMock()
+
+    def make_request(method, path, params=None, headers=None, **kwargs):
+        rows = []
+        index = 1
+        while f"FID_INPUT_ISCD_{index}" in params:
+            code = params[f"FID_INPUT_ISCD_{index}"]
+            rows.append({
+                "inter_shrn_iscd": code,
+                "inter2_prpr": str(10000 + index),
+                "inter2_askp": str(10010 + index),
+                "inter2_bidp": str(9990 + index),
+                "acml_vol": "5",
+            })
+            index += 1
+        return {"rt_cd": "0", "output": rows}
+
+    client.make_request.side_effect = make_request
+    return client
+
+
+def _symbols(count: int) -> list[str]:
+    return [f"{i:06d}" for i in range(1, count + 1)]
+
+
+class TestBatchedPolling:
+    def test_symbols_grouped_into_multiprice_requests(self):
+        client = _multprice_client()
+        board = QuoteBoard()
+        monitor = PriceMonitor(client=client, interval=0.01, quote_board=board, batch_size=30)
+        received = []
+
+        def on_price(symbol, price):
+            received.append(symbol)
+            if len(received) == 45:
+                monitor._stop_event.set()
+
+        monitor._symbols = _symbols(45)
+        monitor._callback = on_price
+        monitor._poll_loop()
+
+        assert client.make_request.call_count == 2
+        call = client.make_request.call_args_list[0]
+        assert call.kwargs["path"].endswith("/intstock-multprice")
+        assert call.kwargs["headers"]["tr_id"] == "FHKST11300006"
+        assert sorted(received) == _symbols(45)
+        quote = board.get("000001")
+        assert (quote.last, quote.ask, quote.bid) == (
+            Decimal("10001"), Decimal("10011"), Decimal("9991")
+        )
+
+    def test_paper_trading_uses_single_price_requests(self):
+        monitor = PriceMonitor(client=MagicMock(), batch_size=30, is_paper_trading=True)
+        assert monitor.batched is False
+        assert PriceMonitor(client=MagicMock(), batch_size=99).batch_size == 30
+
+    def test_local_limiter_dropped_for_client_with_shared_budget(self):
+        client = MagicMock()
+        client.request_rate_limiter = KISRateLimiter(RateBudget(20))
+        monitor = PriceMonitor(client=client, rate_limiter=MagicMock())
+        assert monitor.rate_limiter is None
+
+    def test_failed_batch_leaves_symbols_due(self):
+        client = MagicMock()
+        client.make_request.return_value = {"rt_cd": "1", "msg1": "error"}
+        monitor = PriceMonitor(client=client, batch_size=10)
+        monitor._symbols = ["005930"]
+
+        monitor._poll_batch(["005930"])
+
+        assert monitor._due_symbols(now=1.0) == ["005930"]
+
+    def test_symbols_missing_from_response_are_not_retried_every_tick(self, caplog):
+        client = MagicMock()
+        client.make_request.return_value = {
+            "rt_cd": "0",
+            "output": [{"inter_shrn_iscd": "005930", "inter2_prpr": "70000"}],
+        }
+        monitor = PriceMonitor(client=client, interval=60.0, batch_size=10)
+        monitor._symbols = ["005930", "999999"]
+
+        monitor._poll_batch(["005930", "999999"])
+
+        assert set(monitor._last_polled) == {"005930", "999999"}
+        assert monitor._due_symbols(now=monitor._last_polled["999999"]) == []
+        assert "999999" in caplog.text
+
+
+class TestScheduling:
+    def test_urgent_symbols_polled_every_tick(self):
+        distances = {"005930": 0.01, "000660": 0.2}
+        monitor = PriceMonitor(
+            client=MagicMock(), interval=2.0, batch_size=30, trigger_distance=distances.get
+        )
+        monitor._symbols = ["000660", "005930"]
+        monitor._last_polled = {"005930": 100.0, "000660": 100.0}
+
+        assert monitor._due_symbols(now=100.5) == ["005930"]
+        assert monitor._due_symbols(now=102.0) == ["005930", "000660"]
+
+    def test_routine_symbols_ordered_by_staleness(self):
+        monitor = PriceMonitor(client=MagicMock(), interval=1.0, batch_size=30)
+        monitor._symbols = ["A", "B", "C"]
+        monitor._last_polled = {"A": 50.0, "B": 10.0}
+
+        assert monitor._due_symbols(now=60.0) == ["C", "B", "A"]
+
+    @pytest.mark.parametrize(
+        "available, expected",
+        [(10, 2.0), (5, 2.0), (0, 8.0)],
+    )
+    def test_interval_stretches_with_low_headroom(self, available, expected):
+        limiter = MagicMock(max_requests=10, available=available)
+        client = MagicMock(spec=["make_request"])
+        monitor = PriceMonitor(
+            client=client, interval=2.0, rate_limiter=limiter, batch_size=30, max_interval=8.0
+        )
+        assert monitor.current_interval() == pytest.approx(expected)
+
+
+class TestEngineTriggerDistance:
+    def test_distance_to_nearest_exit(self, tmp_path):
+        from stock_manager.engine import TradingEngine
+        from stock_manager.trading import TradingConfig
+        from stock_manager.trading.models import Position
+
+        engine = TradingEngine(
+            client=MagicMock(),
+            config=TradingConfig(market_hours_enabled=False, price_poll_batch_size=30),
+            account_number="12345678",
+            state_path=tmp_path / "state.json",
+        )
+        engine._position_manager.open_position(
+            Position(
+                symbol="005930",
+                quantity=1,
+                entry_price=Decimal("70000"),
+                current_price=Decimal("70000"),
+                stop_loss=Decimal("69300"),
+                take_profit=Decimal("77000"),
+            )
+        )
+
+        assert engine._exit_trigger_distance("005930") == pytest.approx(0.01)
+        assert engine._exit_trigger_distance("000660") is None
+        assert engine._price_monitor.batch_size == 30
@@ -0,0 +1,202 @@
+"""Tests for the shared real-time quote board and its writers/readers."""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from stock_manager.adapters.broker.kis.broker_adapter import KISBrokerAdapter
+from stock_manager.adapters.broker.kis.client import KISRestClient
+from stock_manager.adapters.broker.kis.quote_board import (
+    SOURCE_REST,
+    SOURCE_WEBSOCKET,
+    QuoteBoard,
+    get_quote_board,
+)
+from stock_manager.adapters.broker.kis.websocket_client import KISWebSocketClient
+from stock_manager.engine import TradingEngine
+from stock_manager.monitoring.price_monitor import PriceMonitor
+from stock_manager.trading import TradingConfig
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _board() -> tuple[QuoteBoard, _FakeClock]:
+    clock = _FakeClock()
+    return QuoteBoard(clock=clock), clock
+
+
+class TestQuoteBoard:
+    def test_partial_updates_merge(self):
+        board, _ = _board()
+        board.update("005930", last=Decimal("70000"), volume=10, source=SOURCE_REST)
+        board.update("005930", bid=Decimal("69900"), ask=Decimal("70100"))
+
+        quote = board.get("005930")
+        assert (quote.last, quote.bid, quote.ask, quote.volume) == (
+            Decimal("70000"),
+            Decimal("69900"),
+            Decimal("70100"),
+            10,
+        )
+        assert quote.source == SOURCE_REST
+
+    def test_freshness_bound(self):
+        board, clock = _board()
+        board.update("005930", last=Decimal("70000"))
+        clock.now += 5
+        assert board.price("005930", max_age=10) == Decimal("70000")
+        assert board.price("005930", max_age=1) is None
+        assert board.get("005930", max_age=1) is None
+
+    def test_stale_last_falls_back_to_fresh_book(self):
+        board, clock = _board()
+        board.update("005930", last=Decimal("70000"))
+        clock.now += 60
+        board.update("005930", bid=Decimal("70400"), ask=Decimal("70500"))
+        assert board.price("005930", max_age=1) == Decimal("70500")
+
+    def test_get_or_fetch_only_calls_rest_when_stale(self):
+        board, clock = _board()
+        fetch = MagicMock(return_value=71000)
+        assert board.get_or_fetch("005930", fetch, max_age=2) == Decimal("71000")
+        assert board.get_or_fetch("005930", fetch, max_age=2) == Decimal("71000")
+        assert fetch.call_count == 1
+        clock.now += 3
+        board.get_or_fetch("005930", fetch, max_age=2)
+        assert fetch.call_count == 2
+
+    def test_updates_without_prices_ignored(self):
+        board, _ = _board()
+        assert board.update("005930", volume=5) is None
+        assert board.update("", last=Decimal("1")) is None
+        assert len(board) == 0
+
+
+class TestQuoteBoardWriters:
+    def test_websocket_orderbook_and_trade_ticks(self):
+        board = QuoteBoard()
+        client = KISWebSocketClient(
+            websocket_url="ws://test",
+            websocket_app_factory=MagicMock(),
+            quote_board=board,
+        )
+        client._on_message(None, json.dumps({
+            "header": {"tr_id": "H0STASP0"},
+            "output": {"mksc_shrn_iscd": "005930", "bidp1": "74900", "askp1": "75000"},
+        }))
+        client._on_message(None, json.dumps({
+            "header": {"tr_id": "H0STCNT0"},
+            "output": {"mksc_shrn_iscd": "005930", "stck_prpr": "74950", "acml_vol": "1234"},
+        }))
+
+        quote = board.get("005930")
+        assert quote.bid == Decimal("74900")
+        assert quote.ask == Decimal("75000")
+        assert quote.last == Decimal("74950")
+        assert quote.volume == 1234
+        assert quote.source == SOURCE_WEBSOCKET
+
+    def test_execution_notice_does_not_touch_board(self):
+        board = QuoteBoard()
+        client = KISWebSocketClient(
+            websocket_url="ws://test", websocket_app_factory=MagicMock(), quote_board=board
+        )
+        client._on_message(None, json.dumps({
+            "header": {"tr_id": "H0STCNI9"},
+            "output": {"pdno": "005930", "odno": "1", "cntg_pr": "75100", "cntg_qty": "3"},
+        }))
+        assert board.get("005930") is None
+
+    def test_price_monitor_publishes_polls(self):
+        board = QuoteBoard()
+        client = MagicMock()
+        client.make_request.return_value = {
+            "rt_cd": "0",
+            "output": {"stck_prpr": "70000", "acml_vol": "99"},
+        }
+        monitor = PriceMonitor(client=client, interval=0.01, quote_board=board)
+        received = []
+
+        def on_price(symbol, price):
+            received.append((symbol, price))
+            monitor._stop_event.set()
+
+        monitor._symbols = ["005930"]
+        monitor._callback = on_price
+        monitor._poll_loop()
+
+        assert received == [("005930", Decimal("70000"))]
+        assert board.get("005930").volume == 99
+
+
+class TestQuoteBoardReaders:
+    def _engine(self, tmp_path, max_age):
+        client = MagicMock(spec=KISRestClient)
+        client.make_request.return_value = {"rt_cd": "0", "output": {"stck_prpr": "70000"}}
+        engine = TradingEngine(
+            client=client,
+            config=TradingConfig(market_hours_enabled=False, quote_board_max_age_sec=max_age),
+            account_number="12345678",
+            account_product_code="01",
+            state_path=tmp_path / "state.json",
+            is_paper_trading=True,
+        )
+        engine._quote_board = QuoteBoard()
+        return engine, client
+
+    def test_engine_prices_from_fresh_board(self, tmp_path):
+        engine, client = self._engine(tmp_path, max_age=5.0)
+        engine._quote_board.update("005930", ask=Decimal("71000"))
+
+        assert engine._get_current_price("005930") == 71000
+        client.make_request.assert_not_called()
+
+    def test_engine_falls_back_to_rest_and_records(self, tmp_path):
+        engine, client = self._engine(tmp_path, max_age=5.0)
+
+        assert engine._get_current_price("005930") == 70000
+        assert engine._get_current_price("005930") == 70000
+        client.make_request.assert_called_once()
+
+    def test_engine_board_disabled_by_default(self, tmp_path):
+        engine, client = self._engine(tmp_path, max_age=None)
+        engine._quote_board.update("005930", ask=Decimal("71000"))
+
+        assert engine._get_current_price("005930") == 70000
+        client.make_request.assert_called_once()
+
+    def test_engine_uses_process_board(self, tmp_path):
+        fresh = TradingEngine(
+            client=MagicMock(spec=KISRestClient),
+            config=TradingConfig(market_hours_enabled=False),
+            account_number="12345678",
+            state_path=tmp_path / "s2.json",
+        )
+        assert fresh._quote_board is get_quote_board()
+        assert fresh._price_monitor.quote_board is get_quote_board()
+
+    def test_adapter_serves_board_when_fresh(self, kis_config):
+        board = QuoteBoard()
+        rest = MagicMock(spec=KISRestClient)
+        rest.make_request.return_value = {"rt_cd": "0", "output": {"stck_prpr": "70000"}}
+        adapter = KISBrokerAdapter(
+            config=kis_config,
+            account_number="12345678",
+            rest_client=rest,
+            websocket_client=MagicMock(),
+            quote_board=board,
+        )
+
+        assert adapter.inquire_current_price("005930")["output"]["stck_prpr"] == "70000"
+        served = adapter.inquire_current_price("005930", max_age=5.0)
+        assert served["msg_cd"] == "QUOTE_BOARD"
+        assert served["output"]["stck_prpr"] == "70000"
+        assert rest.make_request.call_count == 1
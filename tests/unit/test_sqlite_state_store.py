@@ -0,0 +1,187 @@
+"""Tests for the typed SQLite state store."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from stock_manager.persistence.state import TradingState, save_state_atomic
+from stock_manager.storage.sqlite_backend import SCHEMA_VERSION, SQLiteStateBackend
+from stock_manager.trading.models import Order, OrderStatus, Position, PositionStatus
+
+
+def _position(symbol: str, quantity: int, status: PositionStatus = PositionStatus.OPEN) -> Position:
+    return Position(
+        symbol=symbol,
+        quantity=quantity,
+        entry_price=Decimal("70000.5"),
+        current_price=Decimal("71000"),
+        stop_loss=Decimal("65000"),
+        status=status,
+    )
+
+
+def _order(order_id: str, symbol: str, status: OrderStatus = OrderStatus.SUBMITTED) -> Order:
+    return Order(
+        order_id=order_id,
+        idempotency_key=f"idem-{order_id}",
+        symbol=symbol,
+        side="buy",
+        quantity=10,
+        price=70000,
+        status=status,
+        broker_order_id=f"B-{order_id}",
+    )
+
+
+@pytest.fixture()
+def store(tmp_path: Any) -> SQLiteStateBackend:
+    db = SQLiteStateBackend(db_path=tmp_path / "state.db")
+    yield db
+    db.close()
+
+
+class TestSchema:
+    def test_enables_wal_and_records_schema_version(self, store: SQLiteStateBackend) -> None:
+        conn = store._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+    def test_upgrades_legacy_key_value_database(self, tmp_path: Any) -> None:
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE state (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL DEFAULT (datetime('now')))"
+        )
+        conn.execute("INSERT INTO state (key, value) VALUES ('k', '\"v\"')")
+        conn.commit()
+        conn.close()
+
+        store = SQLiteStateBackend(db_path=path)
+        try:
+            assert store.get("k") == "v"
+            assert store.get_positions() == {}
+        finally:
+            store.close()
+
+    def test_rejects_unknown_synchronous_level(self, tmp_path: Any) -> None:
+        with pytest.raises(ValueError):
+            SQLiteStateBackend(db_path=tmp_path / "x.db", synchronous="SOMETIMES")
+
+
+class TestTypedTables:
+    def test_positions_round_trip_and_filter_by_status(self, store: SQLiteStateBackend) -> None:
+        store.upsert_positions(
+            {
+                "005930": _position("005930", 10),
+                "000660": _position("000660", 0, PositionStatus.CLOSED),
+            }
+        )
+
+        positions = store.get_positions()
+        assert positions["005930"].entry_price == Decimal("70000.5")
+        assert positions["005930"].stop_loss == Decimal("65000")
+        assert set(store.get_positions(status=PositionStatus.OPEN.value)) == {"005930"}
+
+        assert store.delete_position("005930") is True
+        assert store.delete_position("005930") is False
+
+    def test_orders_filter_by_symbol_and_status(self, store: SQLiteStateBackend) -> None:
+        store.upsert_orders(
+            {
+                "o1": _order("o1", "005930"),
+                "o2": _order("o2", "005930", OrderStatus.FILLED),
+                "o3": _order("o3", "000660"),
+            }
+        )
+
+        assert set(store.get_orders(symbol="005930")) == {"o1", "o2"}
+        submitted = store.get_orders(status=OrderStatus.SUBMITTED.value, symbol="005930")
+        assert list(submitted) == ["o1"]
+        assert submitted["o1"].broker_order_id == "B-o1"
+        assert submitted["o1"].status == OrderStatus.SUBMITTED
+
+    def test_fills_are_deduplicated_by_execution_key(self, store: SQLiteStateBackend) -> None:
+        assert store.record_fill(
+            symbol="005930", side="buy", quantity=5, price=Decimal("70100"), execution_key="x1"
+        )
+        assert not store.record_fill(
+            symbol="005930", side="buy", quantity=5, price=Decimal("70100"), execution_key="x1"
+        )
+
+        fills = store.get_fills("005930")
+        assert len(fills) == 1
+        assert fills[0]["price"] == Decimal("70100")
+
+    def test_realized_pnl_total_is_exact(self, store: SQLiteStateBackend) -> None:
+        earlier = datetime.now(timezone.utc) - timedelta(days=1)
+        store.record_realized_pnl(symbol="005930", quantity=1, pnl="0.1", realized_at=earlier)
+        store.record_realized_pnl(symbol="005930", quantity=1, pnl="0.2")
+        store.record_realized_pnl(symbol="000660", quantity=1, pnl="-5")
+
+        assert store.realized_pnl_total() == Decimal("-4.7")
+        assert store.realized_pnl_total(symbol="005930") == Decimal("0.3")
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+        assert store.realized_pnl_total(symbol="005930", since=since) == Decimal("0.2")
+
+
+class TestBatching:
+    def test_batch_rolls_back_every_write_on_error(self, store: SQLiteStateBackend) -> None:
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.set("a", 1)
+                store.upsert_positions({"005930": _position("005930", 10)})
+                raise RuntimeError("boom")
+
+        assert store.get("a") is None
+        assert store.get_positions() == {}
+
+    def test_other_threads_see_committed_batch(self, store: SQLiteStateBackend) -> None:
+        with store.batch():
+            store.set("a", 1)
+            store.set("b", 2)
+
+        seen: dict[str, Any] = {}
+        worker = threading.Thread(target=lambda: seen.update(a=store.get("a"), b=store.get("b")))
+        worker.start()
+        worker.join()
+
+        assert seen == {"a": 1, "b": 2}
+
+
+class TestTradingStateBridge:
+    def test_save_and_load_trading_state(self, store: SQLiteStateBackend) -> None:
+        assert store.load_trading_state() is None
+        state = TradingState(
+            positions={"005930": _position("005930", 10)},
+            pending_orders={"o1": _order("o1", "005930")},
+            risk_controls={"daily_kill_switch_active": True},
+            runtime_metadata={"processed_execution_keys": ["x1"]},
+        )
+
+        store.save_trading_state(state)
+        store.save_trading_state(TradingState(positions={"000660": _position("000660", 3)}))
+        store.save_trading_state(state)
+        loaded = store.load_trading_state()
+
+        assert loaded is not None
+        assert set(loaded.positions) == {"005930"}
+        assert set(loaded.pending_orders) == {"o1"}
+        assert loaded.risk_controls == {"daily_kill_switch_active": True}
+        assert loaded.runtime_metadata == {"processed_execution_keys": ["x1"]}
+
+    def test_migrate_from_json_runs_once(self, store: SQLiteStateBackend, tmp_path: Any) -> None:
+        json_path = tmp_path / "state.json"
+        save_state_atomic(TradingState(positions={"005930": _position("005930", 10)}), json_path)
+
+        assert store.migrate_from_json(json_path) is True
+        assert store.migrate_from_json(json_path) is False
+        assert store.get_positions()["005930"].quantity == 10
+
+    def test_migrate_from_missing_json(self, store: SQLiteStateBackend, tmp_path: Any) -> None:
+        assert store.migrate_from_json(tmp_path / "missing.json") is False
@@ -0,0 +1,185 @@
+"""Unit tests for the write-coalescing state journal."""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from stock_manager.persistence.journal import StateJournal, diff_state
+from stock_manager.persistence.state import (
+    TradingState,
+    _serialize_position,
+    journal_path,
+    load_state,
+    save_state_atomic,
+)
+from stock_manager.trading.models import Position, PositionStatus
+
+
+def _position(symbol: str, quantity: int) -> Position:
+    return Position(
+        symbol=symbol,
+        quantity=quantity,
+        entry_price=Decimal("70000"),
+        current_price=Decimal("71000"),
+        status=PositionStatus.OPEN,
+    )
+
+
+def _serialized(symbol: str, quantity: int) -> dict:
+    return _serialize_position(symbol, _position(symbol, quantity))
+
+
+def _journal_records(path):
+    with open(journal_path(path)) as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return tmp_path / "state.json"
+
+
+@pytest.fixture
+def journal(state_path):
+    journal = StateJournal(state_path, commit_window_sec=0.0, compact_every=1000)
+    journal.start(TradingState())
+    yield journal
+    journal.close()
+
+
+class TestDiffState:
+    def test_equal_states_produce_empty_record(self):
+        data = TradingState(positions={"005930": _position("005930", 10)}).to_dict()
+        assert diff_state(data, data) == {}
+
+    def test_records_changed_and_removed_keys_only(self):
+        before = TradingState(
+            positions={"005930": _position("005930", 10), "000660": _position("000660", 5)}
+        ).to_dict()
+        after = TradingState(
+            positions={"005930": _position("005930", 20), "035420": _position("035420", 1)}
+        ).to_dict()
+
+        record = diff_state(before, after)
+
+        assert set(record) == {"positions"}
+        assert record["positions"]["005930"]["quantity"] == 20
+        assert record["positions"]["035420"]["quantity"] == 1
+        assert record["positions"]["000660"] is None
+
+    def test_whole_sections_are_replaced(self):
+        before = TradingState(risk_controls={"kill_switch": False}).to_dict()
+        after = TradingState(risk_controls={"kill_switch": True}).to_dict()
+        assert diff_state(before, after) == {"risk_controls": {"kill_switch": True}}
+
+
+class TestStateJournal:
+    def test_flush_makes_submission_durable_and_replayable(self, journal, state_path):
+        state = TradingState(positions={"005930": _position("005930", 10)})
+
+        ticket = journal.submit(state.to_dict())
+        assert journal.flush(ticket, timeout=2.0)
+
+        loaded = load_state(state_path)
+        assert loaded is not None
+        assert loaded.positions["005930"].quantity == 10
+        assert loaded.journal_seq == journal.seq == 1
+
+    def test_burst_coalesces_into_one_record(self, state_path):
+        journal = StateJournal(state_path, commit_window_sec=0.2, compact_every=1000)
+        journal.start(TradingState())
+        try:
+            for quantity in range(1, 11):
+                journal.submit(
+                    TradingState(positions={"005930": _position("005930", quantity)}).to_dict()
+                )
+            assert journal.flush(timeout=2.0)
+
+            records = _journal_records(state_path)
+            assert len(records) == 1
+            assert records[0]["positions"]["005930"]["quantity"] == 10
+        finally:
+            journal.close()
+
+    def test_unchanged_state_appends_nothing(self, journal, state_path):
+        data = TradingState(positions={"005930": _position("005930", 10)}).to_dict()
+        journal.submit(data)
+        assert journal.flush(timeout=2.0)
+        journal.submit(dict(data))
+        assert journal.flush(timeout=2.0)
+
+        assert len(_journal_records(state_path)) == 1
+
+    def test_compaction_writes_snapshot_and_truncates_journal(self, state_path):
+        journal = StateJournal(state_path, commit_window_sec=0.0, compact_every=2)
+        journal.start(TradingState())
+        try:
+            for quantity in (1, 2):
+                journal.submit(
+                    TradingState(positions={"005930": _position("005930", quantity)}).to_dict()
+                )
+                assert journal.flush(timeout=2.0)
+
+            assert journal_path(state_path).read_text() == ""
+            with open(state_path) as f:
+                snapshot = json.load(f)
+            assert snapshot["journal_seq"] == 2
+            assert snapshot["positions"]["005930"]["quantity"] == 2
+        finally:
+            journal.close()
+
+    def test_close_compacts_pending_changes(self, journal, state_path):
+        journal.submit(TradingState(positions={"005930": _position("005930", 3)}).to_dict())
+        journal.close()
+
+        assert journal_path(state_path).read_text() == ""
+        loaded = load_state(state_path)
+        assert loaded is not None
+        assert loaded.positions["005930"].quantity == 3
+
+    def test_submit_requires_running_journal(self, state_path):
+        journal = StateJournal(state_path)
+        with pytest.raises(RuntimeError):
+            journal.submit(TradingState().to_dict())
+
+    def test_rejects_invalid_compact_every(self, state_path):
+        with pytest.raises(ValueError):
+            StateJournal(state_path, compact_every=0)
+
+
+class TestJournalReplay:
+    def test_replay_skips_records_already_in_snapshot(self, state_path):
+        save_state_atomic(
+            TradingState(positions={"005930": _position("005930", 7)}, journal_seq=2),
+            state_path,
+        )
+        stale = {"seq": 2, "positions": {"005930": None}}
+        fresh = {"seq": 3, "positions": {"000660": _serialized("000660", 4)}}
+        journal_path(state_path).write_text(json.dumps(stale) + "\n" + json.dumps(fresh) + "\n")
+
+        loaded = load_state(state_path)
+
+        assert loaded is not None
+        assert set(loaded.positions) == {"005930", "000660"}
+        assert loaded.journal_seq == 3
+
+    def test_replay_stops_at_torn_tail(self, state_path):
+        save_state_atomic(TradingState(), state_path)
+        good = {"seq": 1, "positions": {"005930": _serialized("005930", 1)}}
+        journal_path(state_path).write_text(json.dumps(good) + '\n{"seq": 2, "posit')
+
+        loaded = load_state(state_path)
+
+        assert loaded is not None
+        assert set(loaded.positions) == {"005930"}
+        assert loaded.journal_seq == 1
+
+    def test_load_from_journal_without_snapshot(self, state_path):
+        record = {"seq": 1, "positions": {"005930": _serialized("005930", 2)}}
+        journal_path(state_path).write_text(json.dumps(record) + "\n")
+
+        loaded = load_state(state_path)
+
+        assert loaded is not None
+        assert loaded.positions["005930"].quantity == 2